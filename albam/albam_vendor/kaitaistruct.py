@@ -1,6 +1,10 @@
+from collections.abc import MutableSequence
+from contextlib import contextmanager
 import itertools
+import mmap
 import sys
 import struct
+import threading
 from io import open, BytesIO, SEEK_CUR, SEEK_END  # noqa
 
 PY2 = sys.version_info[0] == 2
@@ -24,6 +28,26 @@ API_VERSION = (0, 11)
 # pylint: disable=useless-object-inheritance,super-with-arguments,consider-using-f-string
 
 
+# In trusted write mode `_check_element` calls are skipped: writers
+# building big collections validate the structure once at the end instead
+_trusted_write = False
+
+
+@contextmanager
+def trusted_write(enabled=True):
+    global _trusted_write
+    previous = _trusted_write
+    _trusted_write = enabled
+    try:
+        yield
+    finally:
+        _trusted_write = previous
+
+
+def is_trusted_write():
+    return _trusted_write
+
+
 class KaitaiStruct(object):
     def __init__(self, stream):
         self._io = stream
@@ -41,7 +65,13 @@ class KaitaiStruct(object):
     def from_file(cls, filename):
         f = open(filename, 'rb')
         try:
-            return cls(KaitaiStream(f))
+            try:
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty files can't be mapped
+                return cls(KaitaiStream(f))
+            f.close()
+            return cls(KaitaiBufferStream(buf))
         except Exception:
             # close file descriptor, then reraise the exception
             f.close()
@@ -49,7 +79,7 @@ class KaitaiStruct(object):
 
     @classmethod
     def from_bytes(cls, buf):
-        return cls(KaitaiStream(BytesIO(buf)))
+        return cls(KaitaiBufferStream(buf))
 
     @classmethod
     def from_io(cls, io):
@@ -69,6 +99,14 @@ class ReadWriteKaitaiStruct(KaitaiStruct):
         if io is not None:
             self._io = io
 
+    def _check_element(self):
+        """
+        `_check` for the elements of collections built in hot loops,
+        skipped in trusted write mode
+        """
+        if not _trusted_write:
+            self._check()
+
 
 class KaitaiStream(object):
     def __init__(self, io):
@@ -79,6 +117,8 @@ class KaitaiStream(object):
 
         self.write_back_handler = None
         self.child_streams = []
+        # lazy array elements seek the stream, read them one at a time
+        self._lazy_array_lock = threading.RLock()
 
         try:
             self._size = self.size()
@@ -450,6 +490,61 @@ class KaitaiStream(object):
 
     # endregion
 
+    # region Primitive arrays
+
+    # `read_array` and `write_array` handle a `repeat: expr` of a primitive
+    # type in a single struct call. `fmt` is the struct format of one
+    # element, with its byte order (e.g. '<H' for u2le)
+
+    @staticmethod
+    def array_format(fmt, n):
+        return "%s%d%s" % (fmt[0], n, fmt[1:])
+
+    def read_array(self, fmt, n):
+        fmt = KaitaiStream.array_format(fmt, n)
+        return list(struct.unpack(fmt, self.read_bytes(struct.calcsize(fmt))))
+
+    # endregion
+
+    # region Lazy arrays
+
+    def read_lazy_array(self, n, element_size, cls, *args):
+        """
+        Skip a `repeat: expr` of `n` elements of `element_size` bytes and
+        return a LazyArray that parses each one (`cls(*args)`) on access
+        """
+        start = self.pos()
+        if self.bits_left > 0:
+            # the first element would start with the bits left, read as usual
+            return [self._read_element(cls, args) for _ in range(n)]
+
+        end = start + n * element_size
+        if n > 0 and end > self.size():
+            raise EOFError(
+                "requested %d bytes, but only %d bytes available" %
+                (n * element_size, max(self.size() - start, 0))
+            )
+        self.seek(end)
+
+        def read_element(i):
+            # called with the lock held by the LazyArray
+            pos = self.pos()
+            self.seek(start + i * element_size)
+            try:
+                return self._read_element(cls, args)
+            finally:
+                self.seek(pos)
+
+        return LazyArray(n, read_element, self._lazy_array_lock)
+
+    @staticmethod
+    def _read_element(cls, args):
+        element = cls(*args)
+        element._read()
+        return element
+
+    # endregion
+
     # endregion
 
     # region Writing
@@ -687,6 +782,9 @@ class KaitaiStream(object):
         elif n > size:
             raise ValueError("writing %d bytes, but %d bytes were given" % (size, n))
 
+    def write_array(self, fmt, values):
+        self.write_bytes(struct.pack(KaitaiStream.array_format(fmt, len(values)), *values))
+
     # endregion
 
     # endregion
@@ -799,6 +897,238 @@ class KaitaiStream(object):
         self.write_back_handler.write_back(parent)
 
 
+def _buffer_stream_reader(packer):
+    size = packer.size
+    unpack_from = packer.unpack_from
+
+    def read(self):
+        self.bits_left = 0
+        self.bits = 0
+        pos = self._pos
+        try:
+            value = unpack_from(self._data, pos)[0]
+        except struct.error:
+            self._pos = max(pos, self._size)
+            raise EOFError(
+                "requested %d bytes, but only %d bytes available" %
+                (size, max(self._size - pos, 0))
+            )
+        self._pos = pos + size
+        return value
+
+    return read
+
+
+class KaitaiBufferStream(KaitaiStream):
+    """
+    Read-only stream over a buffer (bytes, bytearray, memoryview or mmap)
+    that doesn't copy it: numbers are unpacked in place with `unpack_from`
+    at a cursor, and `read_bytes` copies only the bytes requested
+    """
+
+    def __init__(self, buf):
+        self._source = buf
+        self._buf = memoryview(buf).cast("B")
+        # bytes and mmap slices are already bytes, others go through the view
+        self._copy = not isinstance(buf, (bytes, mmap.mmap))
+        self._data = self._buf if self._copy else buf
+        self._pos = 0
+        super(KaitaiBufferStream, self).__init__(None)
+
+    def close(self):
+        self._buf.release()
+        if isinstance(self._source, mmap.mmap):
+            self._source.close()
+
+    def _slice(self, start, end=None):
+        data = self._data[start:end]
+        return bytes(data) if self._copy else data
+
+    # region Stream positioning
+
+    def is_eof(self):
+        if self.bits_left > 0:
+            return False
+        return self._pos >= self._size
+
+    def seek(self, n):
+        self.align_to_byte()
+        if n < 0:
+            raise ValueError("negative seek position %d" % (n,))
+        self._pos = n
+
+    def pos(self):
+        return self._pos
+
+    def size(self):
+        return len(self._buf)
+
+    # endregion
+
+    # region Reading
+
+    read_s1 = _buffer_stream_reader(KaitaiStream.packer_s1)
+    read_s2be = _buffer_stream_reader(KaitaiStream.packer_s2be)
+    read_s4be = _buffer_stream_reader(KaitaiStream.packer_s4be)
+    read_s8be = _buffer_stream_reader(KaitaiStream.packer_s8be)
+    read_s2le = _buffer_stream_reader(KaitaiStream.packer_s2le)
+    read_s4le = _buffer_stream_reader(KaitaiStream.packer_s4le)
+    read_s8le = _buffer_stream_reader(KaitaiStream.packer_s8le)
+
+    read_u1 = _buffer_stream_reader(KaitaiStream.packer_u1)
+    read_u2be = _buffer_stream_reader(KaitaiStream.packer_u2be)
+    read_u4be = _buffer_stream_reader(KaitaiStream.packer_u4be)
+    read_u8be = _buffer_stream_reader(KaitaiStream.packer_u8be)
+    read_u2le = _buffer_stream_reader(KaitaiStream.packer_u2le)
+    read_u4le = _buffer_stream_reader(KaitaiStream.packer_u4le)
+    read_u8le = _buffer_stream_reader(KaitaiStream.packer_u8le)
+
+    read_f4be = _buffer_stream_reader(KaitaiStream.packer_f4be)
+    read_f8be = _buffer_stream_reader(KaitaiStream.packer_f8be)
+    read_f4le = _buffer_stream_reader(KaitaiStream.packer_f4le)
+    read_f8le = _buffer_stream_reader(KaitaiStream.packer_f8le)
+
+    def read_bytes(self, n):
+        self.bits_left = 0
+        self.bits = 0
+        return self._read_bytes_not_aligned(n)
+
+    def _read_bytes_not_aligned(self, n):
+        pos = self._pos
+        end = pos + n
+        if n < 0 or end > self._size:
+            self._raise_read_bytes_error(n)
+        self._pos = end
+        data = self._data[pos:end]
+        return bytes(data) if self._copy else data
+
+    def _raise_read_bytes_error(self, n):
+        if n < 0:
+            raise ValueError(
+                "requested invalid %d amount of bytes" %
+                (n,)
+            )
+        num_bytes_available = max(self._size - self._pos, 0)
+        if n > num_bytes_available:
+            self._pos = max(self._pos, self._size)
+            raise EOFError(
+                "requested %d bytes, but only %d bytes available" %
+                (n, num_bytes_available)
+            )
+
+    def read_bytes_full(self):
+        self.align_to_byte()
+        pos = min(self._pos, self._size)
+        self._pos = max(self._pos, self._size)
+        return self._slice(pos)
+
+    def read_bytes_term(self, term, include_term, consume_term, eos_error):
+        self.align_to_byte()
+        pos = min(self._pos, self._size)
+        end = self._find_byte(term, pos)
+        if end == -1:
+            self._pos = max(self._pos, self._size)
+            if eos_error:
+                raise Exception(
+                    "end of stream reached, but no terminator %d found" %
+                    (term,)
+                )
+            return self._slice(pos)
+        self._pos = end + 1 if consume_term else end
+        return self._slice(pos, end + 1 if include_term else end)
+
+    def _find_byte(self, value, start):
+        if not self._copy:
+            return self._data.find(KaitaiStream.byte_from_int(value), start)
+        end = self._slice(start).find(KaitaiStream.byte_from_int(value))
+        return -1 if end == -1 else start + end
+
+    def read_array(self, fmt, n):
+        self.bits_left = 0
+        self.bits = 0
+        if n == 0:
+            # as the loop it replaces, read nothing even past the end
+            return []
+        fmt = KaitaiStream.array_format(fmt, n)
+        size = struct.calcsize(fmt)
+        pos = self._pos
+        if size > self._size - pos:
+            self._raise_read_bytes_error(size)
+        self._pos = pos + size
+        return list(struct.unpack_from(fmt, self._data, pos))
+
+    def ensure_fixed_contents(self, expected):
+        actual = self._read_bytes_not_aligned(len(expected))
+        if actual != expected:
+            raise Exception(
+                "unexpected fixed contents: got %r, was waiting for %r" %
+                (actual, expected)
+            )
+        return actual
+
+    # endregion
+
+
+class LazyArray(MutableSequence):
+    """
+    List of the elements of a `repeat: expr`, each parsed the first time
+    it's accessed. Changing its length parses all the remaining ones.
+    Elements are parsed holding `lock`, the one of the stream they're
+    read from, so arrays of a stream can be accessed from several threads
+    """
+    _NOT_READ = object()
+
+    def __init__(self, n, read_element, lock=None):
+        self._items = [LazyArray._NOT_READ] * n
+        self._read_element = read_element
+        self._lock = lock or threading.RLock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self._items)))]
+        item = self._items[i]
+        if item is LazyArray._NOT_READ:
+            i = i + len(self._items) if i < 0 else i
+            with self._lock:
+                # another thread may have read it while waiting
+                item = self._items[i]
+                if item is LazyArray._NOT_READ:
+                    item = self._items[i] = self._read_element(i)
+        return item
+
+    def __iter__(self):
+        for i in range(len(self._items)):
+            yield self[i]
+
+    def __setitem__(self, i, value):
+        if isinstance(i, slice):
+            self._read_all()
+        self._items[i] = value
+
+    def __delitem__(self, i):
+        self._read_all()
+        del self._items[i]
+
+    def insert(self, i, value):
+        self._read_all()
+        self._items.insert(i, value)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, LazyArray)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def _read_all(self):
+        for i in range(len(self._items)):
+            self[i]
+
+
 class KaitaiStructError(Exception):
     """Common ancestor for all error originating from Kaitai Struct usage.
     Stores KSY source path, pointing to an element supposedly guilty of
@@ -10,6 +10,7 @@ class AlbamAsset(bpy.types.PropertyGroup):
     original_bytes: bpy.props.StringProperty(subtype="BYTE_STRING")  # noqa: F821
     relative_path: bpy.props.StringProperty()
     extension: bpy.props.StringProperty()
+    content_hash: bpy.props.StringProperty()  # crc32 of original_bytes, set for imported textures
 
 
 @blender_registry.register_blender_type
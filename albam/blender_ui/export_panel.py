@@ -1,7 +1,9 @@
 import time
 import os
 import bpy
+from kaitaistruct import trusted_write
 
+from albam.lib.export_cache import export_session
 from albam.registry import blender_registry
 from albam.vfs import (
     ALBAM_OT_VirtualFileSystemSaveFileBase,
@@ -27,6 +29,16 @@ class AlbamExportSettings(bpy.types.PropertyGroup):
     no_vf_grouping: bpy.props.BoolProperty(
         default=False)  # dd weapons and armor requires it
     force_max_num_weights: bpy.props.BoolProperty(default=False)
+    strips_vertex_cache: bpy.props.BoolProperty(default=True)
+    optimize_vertex_cache: bpy.props.BoolProperty(default=False)
+    split_bone_palettes: bpy.props.BoolProperty(default=False)
+    weld_vertices: bpy.props.BoolProperty(default=False)
+    trusted_write: bpy.props.BoolProperty(default=False)
+    use_export_cache: bpy.props.BoolProperty(default=True)
+    export_workers: bpy.props.IntProperty(
+        default=4, min=1, max=64,
+        description="Number of threads used to serialize meshes, textures and collisions",
+    )
     algorithm: bpy.props.EnumProperty(
         name="Algorithm Choice",
         description="BVH Construction Algorithm.",  # noqa: F722
@@ -174,6 +186,9 @@ class ALBAM_PT_ExportSection(bpy.types.Panel):
         row = self.layout.row()
         row.operator("albam.export", text="Export")
         row.operator("wm.export_options", icon="OPTIONS", text="")
+        row = self.layout.row()
+        row.operator("albam.export_all", text="Export all").only_selected = False
+        row.operator("albam.export_all", text="Export selected").only_selected = True
 
 
 @blender_registry.register_blender_type
@@ -194,6 +209,19 @@ class ALBAM_WM_OT_ExportOptions(bpy.types.Operator):
                     "force_lod255",
                     text="Set LOD ID = 255 (always visible) for exported meshes")
         layout.prop(export_settings, "export_bones", text="Export edited bones")
+        layout.prop(export_settings, "strips_vertex_cache",
+                    text="Optimize triangle strips for vertex cache")
+        layout.prop(export_settings, "optimize_vertex_cache",
+                    text="Optimize triangle lists for vertex cache and reorder vertices")
+        layout.prop(export_settings, "weld_vertices",
+                    text="Weld vertices identical once exported")
+        layout.prop(export_settings, "trusted_write",
+                    text="Skip per element checks, validate the file layout once")
+        layout.prop(export_settings, "split_bone_palettes",
+                    text="Split meshes over the bone palette limit")
+        layout.prop(export_settings, "use_export_cache",
+                    text="Reuse unchanged meshes and textures from previous exports")
+        layout.prop(export_settings, "export_workers", text="Serialization threads")
         layout.label(text="Dragon's Dogma export hacks")
         layout.prop(export_settings, "no_vf_grouping",
                     text="Don't group meshes by vertex format")
@@ -291,7 +319,8 @@ class ALBAM_OT_Export(bpy.types.Operator):
         app_id = asset.app_id
         export_function = blender_registry.export_registry[(
             asset.app_id, asset.extension)]
-        vfiles = export_function(item.bl_object)
+        with trusted_write(context.scene.albam.export_settings.trusted_write):
+            vfiles = export_function(item.bl_object)
 
         root_id = f"{app_id}-{bl_obj.name}-{round(time.time())}"
         vfile_root = VirtualFileData(app_id, root_id)
@@ -321,6 +350,69 @@ class ALBAM_OT_Export(bpy.types.Operator):
         return item
 
 
+@blender_registry.register_blender_type
+class ALBAM_OT_ExportAll(bpy.types.Operator):
+    """Export all items, or the ones whose object is selected"""
+    bl_idname = "albam.export_all"
+    bl_label = "Export all items"
+
+    only_selected: bpy.props.BoolProperty(default=False)
+
+    def execute(self, context):  # pragma: no cover
+        items = self.get_items(context, self.only_selected)
+        active_object = bpy.context.active_object
+        if active_object:
+            bpy.ops.object.mode_set(mode='OBJECT')
+        failed = self._execute(context, items)
+        if failed:
+            names = ", ".join(item.display_name for item in failed)
+            self.report({"WARNING"}, f"{len(failed)}/{len(items)} items failed to export: {names}")
+        else:
+            self.report({"INFO"}, f"{len(items)} items exported")
+        return {"FINISHED"}
+
+    @staticmethod
+    def _execute(context, items):
+        timings = []
+        failed = []
+        start = time.perf_counter()
+        # textures shared by the items are serialized once
+        with export_session():
+            for item in items:
+                item_start = time.perf_counter()
+                try:
+                    ALBAM_OT_Export._execute(context, item)
+                except Exception as err:
+                    print(f"[{item.display_name}] error exporting: {err}")
+                    failed.append(item)
+                    continue
+                timings.append((item.display_name, time.perf_counter() - item_start))
+        total_time = time.perf_counter() - start
+
+        for name, item_time in timings:
+            print(f"[{name}] exported in {item_time:.3f}s")
+        print(f"{len(timings)}/{len(items)} items exported in {total_time:.3f}s")
+        return failed
+
+    @classmethod
+    def poll(cls, context):
+        return bool(cls.get_items(context))
+
+    @staticmethod
+    def get_items(context, only_selected=False):
+        items = []
+        for item in context.scene.albam.exportable.file_list:
+            if not item.bl_object or item.is_bl_object_missing:
+                continue
+            albam_asset = item.bl_object.albam_asset
+            if (albam_asset.app_id, albam_asset.extension) not in blender_registry.exportable_extensions:
+                continue
+            if only_selected and not item.bl_object.select_get():
+                continue
+            items.append(item)
+        return items
+
+
 @blender_registry.register_blender_type
 class ALBAM_OT_Pack(bpy.types.Operator):
     """Save resources as a new archive"""
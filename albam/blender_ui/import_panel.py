@@ -1,8 +1,10 @@
 import os
+import time
 
 import bpy
 
 from albam.apps import APPS
+from albam.lib.import_cache import import_cache
 from albam.registry import blender_registry
 from albam.vfs import ALBAM_OT_VirtualFileSystemCollapseToggle
 
@@ -51,6 +53,10 @@ class AlbamApps(bpy.types.PropertyGroup):
 @blender_registry.register_blender_prop_albam(name="import_settings")
 class AlbamImportSettings(bpy.types.PropertyGroup):
     import_only_main_lods: bpy.props.BoolProperty(default=True)
+    decode_workers: bpy.props.IntProperty(
+        default=4, min=1, max=64,
+        description="Number of threads used to decode mesh buffers before building them in Blender",
+    )
 
 
 @blender_registry.register_blender_type
@@ -109,12 +115,64 @@ class ALBAM_OT_Import(bpy.types.Operator):
         return item
 
 
+@blender_registry.register_blender_type
+class ALBAM_OT_BatchImport(bpy.types.Operator):
+    """Import all the items checked in the virtual file system"""
+    bl_idname = "albam.import_vfile_batch"
+    bl_label = "import checked items"
+
+    def execute(self, context):  # pragma: no cover
+        try:
+            self._execute(context)
+        except Exception:
+            bpy.ops.albam.error_handler_popup("INVOKE_DEFAULT")
+        return {"FINISHED"}
+
+    @staticmethod
+    def _execute(context):
+        items = ALBAM_OT_BatchImport.get_batch_items(context)
+        failed = []
+        start = time.perf_counter()
+        # mrl files shared by the items are parsed once
+        with import_cache():
+            for item in items:
+                try:
+                    ALBAM_OT_Import._execute(item, context)
+                except Exception as err:
+                    print(f"[{item.display_name}] error importing: {err}")
+                    failed.append(item)
+        elapsed = time.perf_counter() - start
+        print(f"Batch import: {len(items) - len(failed)}/{len(items)} files in {elapsed:.2f}s "
+              f"({len(items) / max(elapsed, 1e-6):.2f} files/sec)")
+        return failed
+
+    @classmethod
+    def poll(cls, context):
+        return any(item.is_batch_selected for item in context.scene.albam.vfs.file_list)
+
+    @staticmethod
+    def get_batch_items(context):
+        importable = blender_registry.importable_extensions
+        poll_funcs = blender_registry.import_operator_poll_funcs
+        items = []
+        for item in context.scene.albam.vfs.file_list:
+            if not item.is_batch_selected or (item.app_id, item.extension) not in importable:
+                continue
+            # same checks as importing the item alone, e.g. lmt needs an armature
+            custom_poll_func = poll_funcs.get(item.extension)
+            if custom_poll_func and not custom_poll_func(ALBAM_OT_Import, context):
+                continue
+            items.append(item)
+        return items
+
+
 class ALBAM_UL_VirtualFileSystemUIBase:
     EXPAND_ICONS = {
         False: "TRIA_RIGHT",
         True: "TRIA_DOWN",
     }
     collapse_toggle_operator_cls = None
+    show_batch_selection = False
 
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
         for _ in range(item.tree_node.depth):
@@ -138,6 +196,8 @@ class ALBAM_UL_VirtualFileSystemUIBase:
         op.button_index = index
 
         layout.column().label(text=item.display_name)
+        if self.show_batch_selection and not item.is_expandable:
+            layout.prop(item, "is_batch_selected", text="")
 
     def filter_items(self, context, data, propname):
         filtered_items = []
@@ -179,6 +239,7 @@ class ALBAM_UL_VirtualFileSystemUIBase:
 @blender_registry.register_blender_type
 class ALBAM_UL_VirtualFileSystemUI(ALBAM_UL_VirtualFileSystemUIBase, bpy.types.UIList):
     collapse_toggle_operator_cls = ALBAM_OT_VirtualFileSystemCollapseToggle
+    show_batch_selection = True
 
 
 @blender_registry.register_blender_type
@@ -363,6 +424,7 @@ class ALBAM_PT_ImportButton(bpy.types.Panel):
         self.layout.separator()
         row = self.layout.row()
         row.operator("albam.import_vfile", text="Import")
+        row.operator("albam.import_vfile_batch", text="Import Checked")
         row.operator("wm.import_options", icon="OPTIONS", text="")
         self.layout.row()
 
@@ -380,6 +442,7 @@ class ALBAM_WM_OT_ImportOptions(bpy.types.Operator):
         import_settings = context.scene.albam.import_settings
         layout = self.layout
         layout.prop(import_settings, "import_only_main_lods", text="Import main LODs only")
+        layout.prop(import_settings, "decode_workers", text="Decoding threads")
 
     def invoke(self, context, event):
         return context.window_manager.invoke_props_dialog(self)
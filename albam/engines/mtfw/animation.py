@@ -3,7 +3,7 @@ import io
 import struct
 
 import bpy
-from kaitaistruct import KaitaiStream
+from kaitaistruct import KaitaiBufferStream
 from mathutils import Matrix
 
 from albam.registry import blender_registry
@@ -22,7 +22,7 @@ ROOT_BONE_NAME = '0'
 @blender_registry.register_import_function(app_id="re5", extension='lmt', file_category="ANIMATION")
 def load_lmt(file_item, context):
     lmt_bytes = file_item.get_bytes()
-    lmt = Lmt(KaitaiStream(io.BytesIO(lmt_bytes)))
+    lmt = Lmt(KaitaiBufferStream(lmt_bytes))
     armature = context.scene.albam.import_options_lmt.armature
     mapping = _create_bone_mapping(armature)
 
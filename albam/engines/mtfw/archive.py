@@ -19,8 +19,11 @@ from albam.blender_ui.tools import show_message_box
 @blender_registry.register_archive_loader(app_id="dd", extension="arc")
 def arc_loader(vfile, context=None):  # XXX context DEPRECATED
     arc = ArcWrapper(file_path=vfile.absolute_path)
-    for file_entry in arc.get_file_entries():
-        yield file_entry.file_path_with_ext
+    try:
+        for file_entry in arc.get_file_entries():
+            yield file_entry.file_path_with_ext
+    finally:
+        arc.close()
 
 
 @blender_registry.register_archive_accessor(app_id="re0", extension="arc")
@@ -42,7 +45,10 @@ def arc_accessor(vfile, context):
         file_type = EXTENSION_TO_FILE_ID[ext]
     except KeyError:
         file_type = int(ext)
-    file_bytes = arc.get_file(path_no_ext, file_type)
+    try:
+        file_bytes = arc.get_file(path_no_ext, file_type)
+    finally:
+        arc.close()
 
     return file_bytes
 
@@ -55,6 +61,10 @@ class ArcWrapper:
         self.parsed = Arc.from_file(file_path)
         self.parsed._read()
 
+    def close(self):
+        # the arc is memory mapped, release it instead of waiting for the gc
+        self.parsed.close()
+
     def get_file_entries_by_type(self, file_type):
         filtered = []
         for fe in self.parsed.file_entries:
@@ -170,7 +180,7 @@ def _serialize_arc(exported):
         file_entry.flags = 2
         file_entry.offset = file_offset
         file_entry.raw_data = fe.raw_data
-        file_entry._check()
+        file_entry._check_element()
         arc.file_entries.append(file_entry)
         file_offset += file_entry.zsize
 
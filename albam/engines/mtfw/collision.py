@@ -1,6 +1,6 @@
 import bpy
 import bmesh
-from kaitaistruct import KaitaiStream
+from kaitaistruct import ConsistencyError, KaitaiStream
 import colorsys
 import numpy as np
 from mathutils import Vector
@@ -16,6 +16,7 @@ from albam.lib.primitive_geometry import EPS, Tri
 import albam.lib.primitive_geometry as geo
 import albam.lib.bvh_construction as bvh
 import albam.lib.common_op as common
+from albam.lib.misc import map_in_pool
 
 SBC_CLASS_MAPPER = {
     49: Sbc156,
@@ -465,8 +466,10 @@ def export_sbc(bl_obj):
     app_id = asset.app_id
     Sbc = APPID_SBC_CLASS_MAPPER[app_id]
 
+    # only the header of the original file is copied, the rest is rebuilt
     src_sbc = Sbc.from_bytes(asset.original_bytes)
-    src_sbc._read()
+    src_sbc.header = Sbc.SbcHeader(src_sbc._io, src_sbc, src_sbc._root)
+    src_sbc.header._read()
     dst_sbc = Sbc()
 
     meshes = [c for c in bl_obj.children_recursive if c.type == "MESH"]
@@ -476,8 +479,6 @@ def export_sbc(bl_obj):
     export_settings = bpy.context.scene.albam.export_settings
     vertList = []
     trisList = []
-    quadList = []
-    sbcsList = []
     mesh_metadata = []
     errors = []
     options = {"clusteringFunction": CLUSTERING[export_settings.algorithm],
@@ -494,30 +495,97 @@ def export_sbc(bl_obj):
             vertices, tris = mesh_to_tri(mesh)
         except TriangulationRequiredError:
             errors.append("%s requires triangulating." % mesh.name)
-        # pairs, bvhc
-        quads, sbc = bvh.primitive_to_sbc(tris, **options)
+            continue
         vertList.append(vertices)
         trisList.append(tris)  # tris primitive objects not faces
-        quadList.append(quads)
-        sbcsList.append(sbc)
         mesh_metadata.append({"indexID": custom_props.index_id})
     for clone in mesh_clones:
         common.delete_ob(clone)
     if errors:
         print(errors)
         raise ExportingFailedError
+    # pairs, bvhc. Blender data is already read, the trees are built in a thread pool
+    workers = export_settings.export_workers
+    trees = map_in_pool(lambda tris: bvh.primitive_to_sbc(tris, **options), trisList, workers)
+    quadList = [quads for quads, _ in trees]
+    sbcsList = [sbc for _, sbc in trees]
     parent_tree = bvh.trees_to_sbc_col(sbcsList, **options)
     final_size, serialized = build_sbc(bl_obj, src_sbc, dst_sbc, vertList, trisList, quadList, sbcsList,
-                                       links, parent_tree, mesh_metadata, app_id)
+                                       links, parent_tree, mesh_metadata, app_id, workers)
     stream = KaitaiStream(BytesIO(bytearray(final_size)))
     dst_sbc._check()
+    _check_sbc_layout(dst_sbc)
     dst_sbc._write(stream)
     sbc_vf = VirtualFileData(app_id, asset.relative_path, data_bytes=stream.to_byte_array())
     vfiles.append(sbc_vf)
     return vfiles
 
 
-def build_sbc(bl_obj, src_sbc, dst_sbc, verts, tris, quads, sbcs, links, parent_tree, mesh_metadata, app_id):
+def _check_sbc_layout(sbc):
+    """
+    Validate the counts in the header of a SBC to write and the indices of
+    its faces, pairs and bounding volume nodes, in place of the checks of
+    every element skipped in trusted write mode
+    """
+    header = sbc.header
+    counts = (
+        ("sbc_info", sbc.sbc_info, header.object_count),
+        ("sbc_bvhc", sbc.sbc_bvhc, header.object_count),
+        ("faces", sbc.faces, header.face_count),
+        ("vertices", sbc.vertices, header.vertex_count),
+        ("collision_types", sbc.collision_types, header.stage_count),
+        ("pairs_collections", sbc.pairs_collections, header.pair_count),
+    )
+    for name, array, count in counts:
+        if len(array) != count:
+            raise ConsistencyError(name, len(array), count)
+
+    for info, bvhc in zip(sbc.sbc_info, sbc.sbc_bvhc):
+        ranges = (
+            ("info faces end", info.faces_start + info.face_count, header.face_count),
+            ("info vertices end", info.vertex_start + info.vertex_count, header.vertex_count),
+            ("info pairs end", info.pairs_start + info.pairs_count, header.pair_count),
+        )
+        for name, end, count in ranges:
+            if end > count:
+                raise ConsistencyError(name, end, count)
+        # indices are relative to the object
+        for face in sbc.faces[info.faces_start:info.faces_start + info.face_count]:
+            if len(face.vert) != 3 or max(face.vert) >= info.vertex_count:
+                raise ConsistencyError("face vertex indices", list(face.vert), info.vertex_count)
+        for pair in sbc.pairs_collections[info.pairs_start:info.pairs_start + info.pairs_count]:
+            # face_02 is 0xFFFF for a single triangle
+            if pair.face_01 >= info.face_count or info.face_count <= pair.face_02 != 0xFFFF:
+                raise ConsistencyError("pair face indices", (pair.face_01, pair.face_02), info.face_count)
+        _check_bvhc_nodes(bvhc, info.pairs_count)
+    _check_bvhc_nodes(sbc.bvh, header.object_count)
+
+
+def _check_bvhc_nodes(bvhc, num_primitives):
+    """
+    Each child of a node is another node, a primitive (a face pair, or an
+    object for the top level hierarchy) or empty, flagged in `node_type`
+    """
+    if len(bvhc.nodes) != bvhc.node_count:
+        raise ConsistencyError("bvh nodes", len(bvhc.nodes), bvhc.node_count)
+    for node_index, node in enumerate(bvhc.nodes):
+        if len(node.node_type) != 4 or len(node.node_id) != 4:
+            raise ConsistencyError("bvh node children", (len(node.node_type), len(node.node_id)), 4)
+        type_mask = node.node_type[0]
+        for child, child_id in enumerate(node.node_id):
+            is_node = type_mask >> child & 1
+            is_primitive = type_mask >> (child + 4) & 1
+            if is_node and is_primitive:
+                raise ConsistencyError("bvh node child type", type_mask, child)
+            # nodes are numbered depth first, children after their parent
+            if is_node and not node_index < child_id < bvhc.node_count:
+                raise ConsistencyError("bvh node child index", child_id, (node_index, bvhc.node_count))
+            if is_primitive and child_id >= num_primitives:
+                raise ConsistencyError("bvh primitive index", child_id, num_primitives)
+
+
+def build_sbc(bl_obj, src_sbc, dst_sbc, verts, tris, quads, sbcs, links, parent_tree, mesh_metadata, app_id,
+              workers=1):
     def tally(x):
         return sum(map(len, x))
     # headerData = formHeader(len(verts), tally(verts), tally(tris), tally(
@@ -526,22 +594,22 @@ def build_sbc(bl_obj, src_sbc, dst_sbc, verts, tris, quads, sbcs, links, parent_
                      tally(verts), parent_tree, tally(sbcs + [parent_tree]))
     # header = buildHeader(headerData)
     # cBVH = list(map(buildCollision,sbcs))
-    dst_sbc.sbc_bvhc = [_serialize_bvhc(dst_sbc, sbc) for sbc in sbcs]
+    dst_sbc.sbc_bvhc = map_in_pool(lambda sbc: _serialize_bvhc(dst_sbc, sbc), sbcs, workers)
 
     # cBVHCollision = buildCollision(parentTree)
     dst_sbc.bvh = _serialize_bvhc(dst_sbc, parent_tree)
 
     # faceCollection = list(map(buildFaces, tris))
-    dst_sbc.faces = build_faces(dst_sbc, tris)
+    dst_sbc.faces = build_faces(dst_sbc, tris, workers)
 
     # vertexCollection = list(map(buildVertices, verts))
-    dst_sbc.vertices = build_vertices(dst_sbc, verts)
+    dst_sbc.vertices = build_vertices(dst_sbc, verts, workers)
 
     # collisionTypes = list(map(buildTypes, links))
     dst_sbc.collision_types = [_serialize_col_types(dst_sbc, link, app_id) for link in links]
 
     # pairCollection = list(map(buildPairs, quads))
-    dst_sbc.pairs_collections = build_pairs(dst_sbc, quads)
+    dst_sbc.pairs_collections = build_pairs(dst_sbc, quads, workers)
     # dst_sbc.pairs_collections = _serialize_pairs(dst_sbc, quads)
 
     # infoCollection = buildInfo(
@@ -644,17 +712,17 @@ def _serialize_bvhc(dst_sbc, bvhc_data):
         aabb.y = max_aabb["yArray"]
         aabb.z = max_aabb["zArray"]
         bvh_node.max_aabb = aabb
-        bvh_node._check()
+        bvh_node._check_element()
         bvh_nodes.append(bvh_node)
     bvh_col.nodes = bvh_nodes
     bvh_col._check()
     return bvh_col
 
 
-def build_faces(dst_sbc, tris):
+def build_faces(dst_sbc, tris, workers=1):
     stris = []
-    for t in tris:
-        stris.extend(_serialize_faces(dst_sbc, t))
+    for faces in map_in_pool(lambda t: _serialize_faces(dst_sbc, t), tris, workers):
+        stris.extend(faces)
     return stris
 
 
@@ -671,15 +739,15 @@ def _serialize_faces(dst_sbc, face_data):
         face.adjacent = face_raw["adjacent"]
         face.nulls_01 = face_raw["null2"]
         face.nulls_02 = face_raw["null3"]
-        face._check()
+        face._check_element()
         faces.append(face)
     return faces
 
 
-def build_vertices(dst_sbc, verts):
+def build_vertices(dst_sbc, verts, workers=1):
     svertices = []
-    for v in verts:
-        svertices.extend(_serialize_vertices(dst_sbc, v))
+    for vertices in map_in_pool(lambda v: _serialize_vertices(dst_sbc, v), verts, workers):
+        svertices.extend(vertices)
     print("Vertices", len(svertices))
     return svertices
 
@@ -693,15 +761,15 @@ def _serialize_vertices(dst_sbc, vertex_data):
         dst_vertex.y = vertex_raw["y"]
         dst_vertex.z = vertex_raw["z"]
         dst_vertex.w = vertex_raw["w"]
-        dst_vertex._check()
+        dst_vertex._check_element()
         vertices.append(dst_vertex)
     return vertices
 
 
-def build_pairs(dst_sbc, quads):
+def build_pairs(dst_sbc, quads, workers=1):
     spairs = []
-    for p in quads:
-        spairs.extend(_serialize_pairs(dst_sbc, p))
+    for pairs in map_in_pool(lambda p: _serialize_pairs(dst_sbc, p), quads, workers):
+        spairs.extend(pairs)
     return spairs
 
 
@@ -728,7 +796,7 @@ def _serialize_pairs(dst_sbc, pairs_data):
         pair.face_02 = pair_raw["face2"]
         pair.quad_order = pair_raw["quadOrder"]
         pair.type = pair_raw["type"]
-        pair._check()
+        pair._check_element()
         pairs.append(pair)
     return pairs
 
@@ -753,7 +821,7 @@ def _serialize_infos(dst_sbc, faces, vertices, stages, pairs, sbcs, sbcC, metada
         info.vertex_count = len(v)
         info.index_id = int(m["indexID"])  # something wrong
         info.nulls_02 = [0, 0]
-        info._check()
+        info._check_element()
         f0 += len(f)
         v0 += len(v)
         p0 += len(p)
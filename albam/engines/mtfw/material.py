@@ -4,10 +4,11 @@ import io
 import re
 
 import bpy
-from kaitaistruct import KaitaiStream
+from kaitaistruct import KaitaiBufferStream, KaitaiStream
 
 from albam.exceptions import AlbamCheckFailure
 from albam.lib.blender import get_bl_materials, ShaderGroupCompat
+from albam.lib.import_cache import get_import_cache
 from albam.registry import blender_registry
 from albam.vfs import VirtualFileData
 from .defines import get_shader_objects
@@ -1143,13 +1144,20 @@ def _infer_mrl(context, mod_vfile, app_id):
     base = str(mod_vfile.relative_path_windows_no_ext)
     suffixes = [".mrl", "_0.mrl", "_1.mrl", "_2.mrl", "_3.mrl"]
     mrl = None
+    mrl_cache = get_import_cache("mrl")
 
     for suffix in suffixes:
         try:
             mrl_vfile = vfs.get_vfile(app_id, base + suffix)
             mrl_bytes = mrl_vfile.get_bytes()
-            mrl = Mrl(app_id, KaitaiStream(io.BytesIO(mrl_bytes)))
-            mrl._read()
+            cache_key = (app_id, base + suffix, crc32(mrl_bytes))
+            if mrl_cache is not None and cache_key in mrl_cache:
+                mrl = mrl_cache[cache_key]
+            else:
+                mrl = Mrl(app_id, KaitaiBufferStream(mrl_bytes))
+                mrl._read()
+                if mrl_cache is not None:
+                    mrl_cache[cache_key] = mrl
             assert mrl.materials and mrl.textures
             break
         except KeyError:
@@ -1,33 +1,40 @@
 from binascii import crc32
-from collections import namedtuple, OrderedDict
+from collections import deque, namedtuple, OrderedDict
 import ctypes
 from itertools import chain
 from io import BytesIO
-from struct import pack, unpack
 import math
-try:
-    from math import dist as get_dist
-except ImportError:
-    from albam.lib.blender import get_dist
+import time
 
+import bmesh
 import bpy
-from kaitaistruct import KaitaiStream
+from kaitaistruct import ConsistencyError, KaitaiStream
 from mathutils import Matrix
 import numpy as np
 
 from albam.apps import get_app_description
 from albam.lib.blender import (
-    get_bone_indices_and_weights_per_vertex,
-    get_mesh_vertex_groups,
+    add_vertex_group_weights,
+    get_bone_indices_and_weights_arrays,
+    get_bounds_per_group,
+    get_loop_vertex_indices,
+    get_mesh_fingerprint,
     get_model_bounding_box,
     get_model_bounding_sphere,
-    get_normals_per_vertex,
-    get_tangents_per_vertex,
-    get_uvs_per_vertex,
+    get_normals_array,
+    get_tangents_array,
+    get_triangles_array,
+    get_uvs_array,
+    get_vertex_cache_stats,
+    get_vertex_groups_arrays,
+    get_vertices_array,
+    optimize_vertex_cache,
+    reorder_vertices_by_first_use,
     strip_triangles_to_triangles_list,
-    triangles_list_to_triangles_strip,
+    triangles_to_strip,
 )
-from albam.lib.misc import chunks
+from albam.lib.export_cache import get_export_cache, get_fingerprint, is_export_cached
+from albam.lib.misc import chunks, map_in_pool
 from albam.lib.export_checks import check_all_objects_have_materials
 from albam.registry import blender_registry
 from albam.vfs import VirtualFileData
@@ -288,9 +295,176 @@ BBOX_AFFECTED = [
     0xD877801B,
 ]
 
+# Numpy equivalents of the kaitai types used in vertex declarations,
+# see structs/mod-156.ksy and structs/mod-21.ksy
+_VEC3 = ("<f4", (3,))
+_VEC3_S2 = ("<i2", (3,))
+_VEC4_S2 = ("<i2", (4,))
+_VEC3_U1 = ("u1", (3,))
+_VEC4_U1 = ("u1", (4,))
+_VEC2_HALF_FLOAT = ("<f2", (2,))
+
+
+def _vertex_dtype(*fields):
+    return np.dtype([(name,) + field_type for name, field_type in fields])
+
+
+VERTEX_FORMATS_DTYPES = {
+    # mod 156, keyed by material vtype
+    0x0: _vertex_dtype(
+        ("position", _VEC4_S2), ("bone_indices", ("u1", (4,))), ("weight_values", ("u1", (4,))),
+        ("normal", _VEC4_U1), ("tangent", _VEC4_U1), ("uv", _VEC2_HALF_FLOAT), ("uv2", _VEC2_HALF_FLOAT)),
+    0x1: _vertex_dtype(
+        ("position", _VEC4_S2), ("bone_indices", ("u1", (8,))), ("weight_values", ("u1", (8,))),
+        ("normal", _VEC4_U1), ("uv", _VEC2_HALF_FLOAT)),
+    0x2: _vertex_dtype(
+        ("position", _VEC3), ("normal", _VEC4_U1), ("tangent", _VEC4_U1),
+        ("uv", _VEC2_HALF_FLOAT), ("uv2", _VEC2_HALF_FLOAT), ("uv3", _VEC2_HALF_FLOAT)),
+    0x3: _vertex_dtype(
+        ("position", _VEC3), ("normal", _VEC4_U1), ("tangent", _VEC4_U1),
+        ("uv", _VEC2_HALF_FLOAT), ("uv2", _VEC2_HALF_FLOAT), ("rgba", _VEC4_U1)),
+    # mod 21x, keyed by vertex_format
+    0x4325a03e: _vertex_dtype(  # IANonSkinTBN_4M
+        ("position", _VEC3), ("normal", _VEC3_U1), ("occlusion", ("u1", ())), ("tangent", _VEC4_U1),
+        ("uv", _VEC2_HALF_FLOAT), ("uv2", _VEC2_HALF_FLOAT),
+        ("morph_position", ("<i2", (4, 3))), ("morph_normal", ("u1", (4, 3)))),
+    0x2f55c03d: _vertex_dtype(  # IASkinOTB_4WT_4M
+        ("position", _VEC4_S2), ("normal", _VEC3_U1), ("occlusion", ("u1", ())), ("tangent", _VEC4_U1),
+        ("bone_indices", ("u1", (4,))), ("uv", _VEC2_HALF_FLOAT), ("weight_values", ("<f2", (2,))),
+        ("morph_position", ("<i2", (4, 3))), ("morph_normal", ("u1", (4, 3)))),
+    0xa14e003c: _vertex_dtype(  # IANonSkinBCA
+        ("position", _VEC3), ("normal", _VEC4_U1), ("uv", _VEC2_HALF_FLOAT), ("uv2", _VEC2_HALF_FLOAT),
+        ("rgba", _VEC4_U1)),
+    0x2082f03b: _vertex_dtype(  # IANonSkinBLA
+        ("position", _VEC3), ("normal", _VEC4_U1), ("uv", _VEC2_HALF_FLOAT), ("uv2", _VEC2_HALF_FLOAT),
+        ("uv3", _VEC2_HALF_FLOAT)),
+    0xc66fa03a: _vertex_dtype(  # IANonSkinBA
+        ("position", _VEC3), ("normal", _VEC4_U1), ("uv", _VEC2_HALF_FLOAT), ("uv2", _VEC2_HALF_FLOAT)),
+    0xd1a47038: _vertex_dtype(  # IANonSkinBL
+        ("position", _VEC3), ("normal", _VEC4_U1), ("uv", _VEC2_HALF_FLOAT), ("uv2", _VEC2_HALF_FLOAT)),
+    0x207d6037: _vertex_dtype(  # IANonSkinBC
+        ("position", _VEC3), ("normal", _VEC4_U1), ("uv", _VEC2_HALF_FLOAT), ("rgba", _VEC4_U1)),
+    0xa7d7d036: _vertex_dtype(  # IANonSkinB
+        ("position", _VEC3), ("normal", _VEC4_U1), ("uv", _VEC2_HALF_FLOAT)),
+    0x37a4e035: _vertex_dtype(  # IANonSkinTBNLA
+        ("position", _VEC3), ("normal", _VEC3_U1), ("occlusion", ("u1", ())), ("tangent", _VEC4_U1),
+        ("uv", _VEC2_HALF_FLOAT), ("uv2", _VEC2_HALF_FLOAT), ("uv3", _VEC2_HALF_FLOAT),
+        ("uv4", _VEC2_HALF_FLOAT)),
+    0xb6681034: _vertex_dtype(  # IANonSkinTBNCA
+        ("position", _VEC3), ("normal", _VEC3_U1), ("occlusion", ("u1", ())), ("tangent", _VEC4_U1),
+        ("uv", _VEC2_HALF_FLOAT), ("uv2", _VEC2_HALF_FLOAT), ("rgba", _VEC4_U1), ("uv3", _VEC2_HALF_FLOAT)),
+    0x9399c033: _vertex_dtype(  # IANonSkinTBCA
+        ("position", _VEC3), ("normal", _VEC3_U1), ("occlusion", ("u1", ())), ("tangent", _VEC4_U1),
+        ("uv", _VEC2_HALF_FLOAT), ("uv2", _VEC2_HALF_FLOAT), ("rgba", _VEC4_U1)),
+    0x12553032: _vertex_dtype(  # IANonSkinTBLA
+        ("position", _VEC3), ("normal", _VEC3_U1), ("occlusion", ("u1", ())), ("tangent", _VEC4_U1),
+        ("uv", _VEC2_HALF_FLOAT), ("uv2", _VEC2_HALF_FLOAT), ("uv3", _VEC2_HALF_FLOAT)),
+    0x747d1031: _vertex_dtype(  # IANonSkinTBNA
+        ("position", _VEC3), ("normal", _VEC3_U1), ("occlusion", ("u1", ())), ("tangent", _VEC4_U1),
+        ("uv", _VEC2_HALF_FLOAT), ("uv2", _VEC2_HALF_FLOAT), ("uv3", _VEC2_HALF_FLOAT)),
+    0x63b6c02f: _vertex_dtype(  # IANonSkinTBNL
+        ("position", _VEC3), ("normal", _VEC3_U1), ("vertex_alpha", ("u1", ())), ("tangent", _VEC4_U1),
+        ("uv", _VEC2_HALF_FLOAT), ("uv2", _VEC2_HALF_FLOAT), ("uv3", _VEC2_HALF_FLOAT),
+        ("occlusion", ("<u4", ()))),
+    0x926fd02e: _vertex_dtype(  # IANonSkinTBNC
+        ("position", _VEC3), ("normal", _VEC3_U1), ("occlusion", ("u1", ())), ("tangent", _VEC4_U1),
+        ("uv", _VEC2_HALF_FLOAT), ("uv2", _VEC2_HALF_FLOAT), ("rgba", _VEC4_U1)),
+    0xafa6302d: _vertex_dtype(  # IANonSkinTBA
+        ("position", _VEC3), ("normal", _VEC3_U1), ("occlusion", ("u1", ())), ("tangent", _VEC4_U1),
+        ("uv", _VEC2_HALF_FLOAT), ("uv2", _VEC2_HALF_FLOAT)),
+    0x5e7f202c: _vertex_dtype(  # IANonSkinTBN
+        ("position", _VEC3), ("normal", _VEC3_U1), ("occlusion", ("u1", ())), ("tangent", _VEC4_U1),
+        ("uv", _VEC2_HALF_FLOAT), ("uv2", _VEC2_HALF_FLOAT)),
+    0xb86de02a: _vertex_dtype(  # IANonSkinTBL
+        ("position", _VEC3), ("normal", _VEC3_U1), ("vertex_alpha", ("u1", ())), ("tangent", _VEC4_U1),
+        ("uv", _VEC2_HALF_FLOAT), ("uv2", _VEC2_HALF_FLOAT), ("occlusion", ("<u4", ()))),
+    0x49b4f029: _vertex_dtype(  # IANonSkinTBC
+        ("position", _VEC3), ("normal", _VEC3_U1), ("occlusion", ("u1", ())), ("tangent", _VEC4_U1),
+        ("uv", _VEC2_HALF_FLOAT), ("rgba", _VEC4_U1)),
+    0xd8297028: _vertex_dtype(  # IANonSkinTB
+        ("position", _VEC3), ("normal", _VEC3_U1), ("occlusion", ("u1", ())), ("tangent", _VEC4_U1),
+        ("uv", _VEC2_HALF_FLOAT)),
+    0xcbcf7027: _vertex_dtype(  # IASkinTBNLA8wt
+        ("position", _VEC4_S2), ("normal", _VEC3_U1), ("occlusion", ("u1", ())),
+        ("weight_values", ("u1", (4,))), ("bone_indices", ("u1", (8,))), ("uv", _VEC2_HALF_FLOAT),
+        ("weight_values2", ("<f2", (2,))), ("tangent", _VEC4_U1), ("uv2", _VEC2_HALF_FLOAT),
+        ("uv3", _VEC2_HALF_FLOAT), ("uv4", _VEC2_HALF_FLOAT)),
+    0xd84e3026: _vertex_dtype(  # IASkinTBC8wt
+        ("position", _VEC4_S2), ("normal", _VEC3_U1), ("occlusion", ("u1", ())),
+        ("weight_values", ("u1", (4,))), ("bone_indices", ("u1", (8,))), ("uv", _VEC2_HALF_FLOAT),
+        ("weight_values2", ("<f2", (2,))), ("tangent", _VEC4_U1), ("rgba", _VEC4_U1)),
+    0x75c3e025: _vertex_dtype(  # IASkinTBN8wt
+        ("position", _VEC4_S2), ("normal", _VEC3_U1), ("occlusion", ("u1", ())),
+        ("weight_values", ("u1", (4,))), ("bone_indices", ("u1", (8,))), ("uv", _VEC2_HALF_FLOAT),
+        ("weight_values2", ("<f2", (2,))), ("tangent", _VEC4_U1), ("uv2", _VEC2_HALF_FLOAT)),
+    0xbb424024: _vertex_dtype(  # IASkinTB8wt
+        ("position", _VEC4_S2), ("normal", _VEC3_U1), ("occlusion", ("u1", ())),
+        ("weight_values", ("u1", (4,))), ("bone_indices", ("u1", (8,))), ("uv", _VEC2_HALF_FLOAT),
+        ("weight_values2", ("<f2", (2,))), ("tangent", _VEC4_U1)),
+    0x64593023: _vertex_dtype(  # IASkinTBNLA4wt
+        ("position", _VEC4_S2), ("normal", _VEC3_U1), ("occlusion", ("u1", ())), ("tangent", _VEC4_U1),
+        ("bone_indices", ("u1", (4,))), ("uv", _VEC2_HALF_FLOAT), ("weight_values", ("<f2", (2,))),
+        ("uv2", _VEC2_HALF_FLOAT), ("uv3", _VEC2_HALF_FLOAT), ("uv4", _VEC2_HALF_FLOAT)),
+    0x77d87022: _vertex_dtype(  # IASkinTBC4wt
+        ("position", _VEC4_S2), ("normal", _VEC3_U1), ("occlusion", ("u1", ())), ("tangent", _VEC4_U1),
+        ("bone_indices", ("u1", (4,))), ("uv", _VEC2_HALF_FLOAT), ("weight_values", ("<f2", (2,))),
+        ("rgba", _VEC4_U1)),
+    0xda55a021: _vertex_dtype(  # IASkinTBN4wt
+        ("position", _VEC4_S2), ("normal", _VEC3_U1), ("occlusion", ("u1", ())), ("tangent", _VEC4_U1),
+        ("bone_indices", ("u1", (4,))), ("uv", _VEC2_HALF_FLOAT), ("weight_values", ("<f2", (2,))),
+        ("uv2", _VEC2_HALF_FLOAT)),
+    0x14d40020: _vertex_dtype(  # IASkinTB4wt
+        ("position", _VEC4_S2), ("normal", _VEC3_U1), ("occlusion", ("u1", ())), ("tangent", _VEC4_U1),
+        ("bone_indices", ("u1", (4,))), ("uv", _VEC2_HALF_FLOAT), ("weight_values", ("<f2", (2,)))),
+    0xb392101f: _vertex_dtype(  # IASkinTBNLA2wt
+        ("position", _VEC4_S2), ("normal", _VEC3_U1), ("occlusion", ("u1", ())), ("tangent", _VEC4_U1),
+        ("bone_indices", ("<f2", (2,))), ("uv", _VEC2_HALF_FLOAT), ("uv2", _VEC2_HALF_FLOAT),
+        ("uv3", _VEC2_HALF_FLOAT), ("uv4", _VEC2_HALF_FLOAT)),
+    0xa013501e: _vertex_dtype(  # IASkinTBC2wt
+        ("position", _VEC4_S2), ("normal", _VEC3_U1), ("occlusion", ("u1", ())), ("tangent", _VEC4_U1),
+        ("uv", _VEC2_HALF_FLOAT), ("bone_indices", ("<f2", (2,))), ("rgba", _VEC4_U1)),
+    0xd9e801d: _vertex_dtype(  # IASkinTBN2wt
+        ("position", _VEC4_S2), ("normal", _VEC3_U1), ("occlusion", ("u1", ())), ("tangent", _VEC4_U1),
+        ("bone_indices", ("<f2", (2,))), ("uv", _VEC2_HALF_FLOAT)),
+    0xc31f201c: _vertex_dtype(  # IASkinTB2wt
+        ("position", _VEC4_S2), ("normal", _VEC3_U1), ("occlusion", ("u1", ())), ("tangent", _VEC4_U1),
+        ("uv", _VEC2_HALF_FLOAT), ("bone_indices", ("<f2", (2,)))),
+    0xd877801b: _vertex_dtype(  # IASkinTBNLA1wt
+        ("position", _VEC3_S2), ("bone_indices", ("<u2", (1,))), ("normal", _VEC3_U1),
+        ("occlusion", ("u1", ())), ("tangent", _VEC4_U1), ("uv", _VEC2_HALF_FLOAT),
+        ("uv2", _VEC2_HALF_FLOAT), ("uv3", _VEC2_HALF_FLOAT), ("uv4", _VEC2_HALF_FLOAT)),
+    0xcbf6c01a: _vertex_dtype(  # IASkinTBC1wt
+        ("position", _VEC3_S2), ("bone_indices", ("<u2", (1,))), ("normal", _VEC3_U1),
+        ("occlusion", ("u1", ())), ("tangent", _VEC4_U1), ("uv", _VEC2_HALF_FLOAT), ("rgba", _VEC4_U1)),
+    0x667b1019: _vertex_dtype(  # IASkinTBN1wt
+        ("position", _VEC3_S2), ("bone_indices", ("<u2", (1,))), ("normal", _VEC3_U1),
+        ("occlusion", ("u1", ())), ("tangent", _VEC4_U1), ("uv", _VEC2_HALF_FLOAT),
+        ("uv2", _VEC2_HALF_FLOAT)),
+    0xa8fab018: _vertex_dtype(  # IASkinTB1wt
+        ("position", _VEC3_S2), ("bone_indices", ("<u2", (1,))), ("normal", _VEC3_U1),
+        ("occlusion", ("u1", ())), ("tangent", _VEC4_U1), ("uv", _VEC2_HALF_FLOAT)),
+    0xa320c016: _vertex_dtype(  # IASkinBridge8wt
+        ("position", _VEC4_S2), ("bone_indices", ("u1", (8,))), ("weight_values", ("u1", (8,))),
+        ("normal", _VEC4_U1)),
+    0xcb68015: _vertex_dtype(  # IASkinBridge4wt
+        ("position", _VEC4_S2), ("bone_indices", ("u1", (4,))), ("weight_values", ("u1", (4,))),
+        ("normal", _VEC4_U1)),
+    0xdb7da014: _vertex_dtype(  # IASkinBridge2wt
+        ("position", _VEC4_S2), ("normal", _VEC4_U1), ("bone_indices", ("u1", (4,)))),
+    0xb0983013: _vertex_dtype(  # IASkinBridge1wt
+        ("position", _VEC3_S2), ("bone_indices", ("<u2", (1,))), ("normal", _VEC4_U1)),
+}
+VERTEX_FORMATS_DTYPES[0x4] = VERTEX_FORMATS_DTYPES[0x0]  # placeholder shape
+VERTEX_FORMATS_DTYPES[0x5] = VERTEX_FORMATS_DTYPES[0x0]  # placeholder skin_col
+
 VERSIONS_USE_BONE_PALETTES = {156}
+MAX_BONE_PALETTE_SIZE = 32
 VERSIONS_BONES_BBOX_AFFECTED = {210, 211, 212}
 VERSIONS_USE_TRISTRIPS = {156, 212}
+# FIFO post-transform cache the triangle strips are optimized for
+STRIPS_VERTEX_CACHE_SIZE = 16
+# and triangle lists, when optimized
+TRIANGLES_VERTEX_CACHE_SIZE = 32
 MAIN_LODS = {
     "re0": [1, 255],
     "re1": [1, 255],
@@ -346,9 +520,7 @@ def build_blender_model(file_list_item, context):
     mod_version = mod_bytes[4]
     assert mod_version in MOD_CLASS_MAPPER, f"Unsupported version: {mod_version}"
 
-    ModCls = MOD_CLASS_MAPPER[mod_version]
-    mod = ModCls.from_bytes(mod_bytes)
-    mod._read()
+    mod = parse_mod(mod_bytes, raw_buffers=True)
 
     import_settings = context.scene.albam.import_settings
 
@@ -360,17 +532,34 @@ def build_blender_model(file_list_item, context):
     materials = build_blender_materials(
         file_list_item, context, mod, bl_object_name)
     imported_lods = MAIN_LODS.get(app_id)
-
-    for i, mesh in enumerate(mod.meshes_data.meshes):
-        if import_settings.import_only_main_lods and mesh.level_of_detail not in imported_lods:
+    meshes = [
+        (i, mesh) for i, mesh in enumerate(mod.meshes_data.meshes)
+        if not import_settings.import_only_main_lods or mesh.level_of_detail in imported_lods
+    ]
+    # the bone palettes used by the decoding threads are parsed on access,
+    # read them all here instead of one at a time under the stream lock
+    if mod.header.num_bones and mod.header.version in VERSIONS_USE_BONE_PALETTES:
+        list(mod.bones_data.bone_palettes)
+
+    start = time.perf_counter()
+    decoded_meshes, bytes_decoded, bytes_requested = _decode_meshes(
+        mod_bytes, mod, [mesh for _, mesh in meshes], bbox_data,
+        mod_version in VERSIONS_USE_TRISTRIPS, import_settings.decode_workers,
+    )
+    decode_time = time.perf_counter() - start
+    print(f"[{bl_object_name}] vertex bytes decoded: {bytes_decoded}, requested by meshes: "
+          f"{bytes_requested}, vertex buffer size: {mod.header.size_vertex_buffer}")
+
+    start = time.perf_counter()
+    for (i, mesh), decoded_mesh in zip(meshes, decoded_meshes):
+        if isinstance(decoded_mesh, Exception):
+            print(f"[{bl_object_name}] error decoding mesh {i} {decoded_mesh}")
             continue
         try:
             name = f"{bl_object_name}_{str(i).zfill(4)}"
             material_hash = _get_material_hash(mod, mesh)
 
-            bl_mesh_ob = build_blender_mesh(
-                app_id, mod, mesh, name, bbox_data, mod_version in VERSIONS_USE_TRISTRIPS
-            )
+            bl_mesh_ob = build_blender_mesh(app_id, mesh, name, decoded_mesh)
             bl_mesh_ob.parent = bl_object
             if skeleton:
                 modifier = bl_mesh_ob.modifiers.new(
@@ -386,6 +575,9 @@ def build_blender_model(file_list_item, context):
         except Exception as err:
             print(f"[{bl_object_name}] error building mesh {i} {err}")
             continue
+    build_time = time.perf_counter() - start
+    print(f"[{bl_object_name}] {len(meshes)} meshes decoded in {decode_time:.3f}s "
+          f"({import_settings.decode_workers} workers), built in {build_time:.3f}s")
 
     bl_object.albam_asset.original_bytes = mod_bytes
     bl_object.albam_asset.app_id = app_id
@@ -400,46 +592,181 @@ def build_blender_model(file_list_item, context):
     return bl_object
 
 
-def build_blender_mesh(app_id, mod, mesh, name, bbox_data, use_tri_strips=False):
-    me_ob = bpy.data.meshes.new(name)
-    ob = bpy.data.objects.new(name, me_ob)
+def parse_mod(mod_bytes, raw_buffers=False):
+    """
+    Parse a mod file. With `raw_buffers`, `mesh.vertices` and `mesh.indices`
+    of each mesh are numpy arrays viewing the file bytes instead of lists of
+    kaitai objects, so no Python object is created per vertex or index.
+    Buffers running past the end of the file are left as kaitai attributes,
+    for `_decode_meshes` to report that mesh alone.
+    Headers, bones, groups, materials and meshes are parsed as usual
+    """
+    ModCls = MOD_CLASS_MAPPER[mod_bytes[4]]
+    mod = ModCls.from_bytes(mod_bytes)
+    mod._read()
+    if not raw_buffers or not mod.meshes_data:
+        return mod
+
+    for mesh in mod.meshes_data.meshes:
+        if _is_index_buffer_in_range(mod_bytes, mod, mesh):
+            mesh.indices = _read_indices(mod_bytes, mod, mesh)
+        vertex_region = _get_vertex_region(mod, mesh)
+        if vertex_region is not None and _is_vertex_region_in_range(mod_bytes, vertex_region):
+            mesh.vertices = _read_vertices(mod_bytes, mod, mesh)
+    return mod
+
+
+DecodedMesh = namedtuple("DecodedMesh", ("vertices", "indices", "weights_per_bone"))
+
+
+def _decode_meshes(mod_bytes, mod, meshes, bbox_data, use_tri_strips, workers=1):
+    """
+    Decode the buffers of several meshes, in a thread pool if `workers` > 1.
+    Only numpy is involved, no bpy. Vertex buffer regions shared by several
+    meshes are decoded once and each mesh takes a slice of them.
+    A mesh that fails to decode gets its exception in place of the
+    DecodedMesh. Meshes whose vertices run past the end of the file are
+    left out of the shared regions, so they fail alone, as the ones
+    whose indices do.
+    Return the decoded meshes and the number of vertex bytes
+    decoded and requested by the meshes
+    """
+    mesh_regions = [_get_vertex_region(mod, mesh) for mesh in meshes]
+    spans = {}
+    bytes_requested = 0
+    for i, region in enumerate(mesh_regions):
+        if region is None:
+            continue
+        if not _is_vertex_region_in_range(mod_bytes, region):
+            mesh_regions[i] = _VERTEX_REGION_OUT_OF_RANGE
+            continue
+        key, first, count = region
+        start, stop = spans.get(key, (first, first + count))
+        spans[key] = (min(start, first), max(stop, first + count))
+        bytes_requested += count * key[2]
+    bytes_decoded = sum((stop - start) * key[2] for key, (start, stop) in spans.items())
+
+    def decode_region(key):
+        vertex_format, region_offset, stride = key
+        start, stop = spans[key]
+        try:
+            vertices = np.frombuffer(
+                mod_bytes, dtype=VERTEX_FORMATS_DTYPES[vertex_format],
+                count=stop - start, offset=region_offset + start * stride)
+            return _decode_vertices(mod, vertex_format, vertices, bbox_data)
+        except Exception as err:
+            return err
+
+    keys = list(spans)
+    decoded_regions = dict(zip(keys, map_in_pool(decode_region, keys, workers)))
+
+    def decode(mesh_and_region):
+        mesh, region = mesh_and_region
+        try:
+            if region is None:
+                raise ValueError(f"Unsupported vertex format: {hex(_get_vertex_format(mod, mesh))}")
+            if region is _VERTEX_REGION_OUT_OF_RANGE:
+                offset, num_vertices = _get_vertex_buffer_range(mod, mesh)
+                raise ValueError(
+                    f"Vertices out of range: {num_vertices} vertices of stride {mesh.vertex_stride} "
+                    f"at offset {offset}, file size {len(mod_bytes)}")
+            if not _is_index_buffer_in_range(mod_bytes, mod, mesh):
+                # checked before reading `mesh.indices`, the kaitai stream isn't thread safe
+                offset, num_indices = _get_index_buffer_range(mod, mesh)
+                raise ValueError(
+                    f"Indices out of range: {num_indices} indices at offset {offset}, "
+                    f"file size {len(mod_bytes)}")
+            key, first, count = region
+            decoded = decoded_regions[key]
+            if isinstance(decoded, Exception):
+                raise decoded
+            start = first - spans[key][0]
+            decoded = _slice_decoded_vertices(decoded, start, start + count)
+            return _decode_mesh(mod, mesh, decoded, use_tri_strips)
+        except Exception as err:
+            return err
+
+    decoded_meshes = map_in_pool(decode, list(zip(meshes, mesh_regions)), workers)
+    return decoded_meshes, bytes_decoded, bytes_requested
+
+
+def _get_vertex_region(mod, mesh):
+    """
+    Return the key of the vertex buffer region a mesh reads from, the index
+    of its first vertex in that region and its number of vertices.
+    Meshes with the same key share the region. None for unsupported formats
+    """
+    vertex_format = _get_vertex_format(mod, mesh)
+    if vertex_format not in VERTEX_FORMATS_DTYPES:
+        return None
+    offset, num_vertices = _get_vertex_buffer_range(mod, mesh)
+    stride = mesh.vertex_stride
+    region_offset = mod.header.offset_vertex_buffer + mesh.vertex_offset
+    if VERTEX_FORMATS_DTYPES[vertex_format].itemsize != stride:
+        # vertices are read back to back from the first one, can't be shared
+        region_offset = offset
+    return (vertex_format, region_offset, stride), (offset - region_offset) // stride, num_vertices
+
+
+_VERTEX_REGION_OUT_OF_RANGE = object()
+
+
+def _is_in_range(mod_bytes, offset, count, itemsize):
+    return count >= 0 and 0 <= offset and offset + count * itemsize <= len(mod_bytes)
+
+
+def _is_vertex_region_in_range(mod_bytes, region):
+    (vertex_format, region_offset, stride), first, count = region
+    return _is_in_range(
+        mod_bytes, region_offset + first * stride, count, VERTEX_FORMATS_DTYPES[vertex_format].itemsize)
+
+
+def _is_index_buffer_in_range(mod_bytes, mod, mesh):
+    offset, num_indices = _get_index_buffer_range(mod, mesh)
+    return _is_in_range(mod_bytes, offset, num_indices, 2)
 
-    locations = []
-    normals = []
-    uvs_1 = []
-    uvs_2 = []
-    uvs_3 = []
-    uvs_4 = []
-    vertex_colors = []
-    weights_per_bone = {}
-
-    for vertex_index, vertex in enumerate(mesh.vertices):
-        _process_locations(mod.header.version, mesh, vertex, locations, bbox_data)
-        _process_normals(vertex, normals)
-        _process_uvs(vertex, uvs_1, uvs_2, uvs_3, uvs_4)
-        _process_vertex_colors(mod.header.version, vertex, vertex_colors)
-        _process_weights(mod, mesh, vertex, vertex_index, weights_per_bone)
-
-    indices = strip_triangles_to_triangles_list(
-        mesh.indices) if use_tri_strips else mesh.indices
-
-    if min(indices) >= mesh.min_index:  # backwards compability workaround
+
+def _slice_decoded_vertices(decoded, start, stop):
+    return DecodedVertices(*(
+        [uv[start:stop] for uv in value] if isinstance(value, list)
+        else None if value is None else value[start:stop]
+        for value in decoded
+    ))
+
+
+def _decode_mesh(mod, mesh, decoded, use_tri_strips=False):
+    indices = mesh.indices.astype(np.int64)
+    if use_tri_strips:
+        indices = strip_triangles_to_triangles_list(indices)
+
+    if indices.min() >= mesh.min_index:  # backwards compability workaround
         # convert indices for this mesh only, so they start at zero
-        indices = [tri_idx - mesh.min_index for tri_idx in indices]
+        indices -= mesh.min_index
     # Blender crashes with corrrupt indices
-    assert min(indices) >= 0, "Bad face indices"
+    assert indices.min() >= 0, "Bad face indices"
     # Blender crashes with an empty sequence
-    assert locations, "No vertices could be processed"
+    assert len(decoded.locations), "No vertices could be processed"
 
-    me_ob.from_pydata(locations, [], chunks(indices, 3))
+    bone_indices = decoded.bone_indices
+    if bone_indices is not None and mod.header.version in VERSIONS_USE_BONE_PALETTES:
+        bone_indices = _get_bone_palette_lookup(mod, mesh)[bone_indices]
+    weights_per_bone = _get_weights_per_bone(bone_indices, decoded.weights)
+    return DecodedMesh(decoded, indices, weights_per_bone)
+
+
+def build_blender_mesh(app_id, mesh, name, decoded_mesh):
+    me_ob = bpy.data.meshes.new(name)
+    ob = bpy.data.objects.new(name, me_ob)
+    decoded = decoded_mesh.vertices
 
-    _build_normals(me_ob, normals)
-    _build_uvs(me_ob, uvs_1, "uv1")
-    _build_uvs(me_ob, uvs_2, "uv2")
-    _build_uvs(me_ob, uvs_3, "uv3")
-    _build_uvs(me_ob, uvs_4, "uv4")
-    _build_vertex_colors(me_ob, vertex_colors, "vc")
-    _build_weights(ob, weights_per_bone)
+    me_ob.from_pydata(decoded.locations, [], chunks(decoded_mesh.indices.tolist(), 3))
+
+    _build_normals(me_ob, decoded.normals)
+    loop_vertex_indices = get_loop_vertex_indices(me_ob)
+    for uv_index, uvs in enumerate(decoded.uvs, 1):
+        _build_uvs(me_ob, uvs, loop_vertex_indices, f"uv{uv_index}")
+    _build_vertex_colors(me_ob, decoded.vertex_colors, loop_vertex_indices, "vc")
+    _build_weights(ob, decoded_mesh.weights_per_bone)
 
     custom_properties = me_ob.albam_custom_properties.get_custom_properties_for_appid(
         app_id)
@@ -450,177 +777,199 @@ def build_blender_mesh(app_id, mod, mesh, name, bbox_data, use_tri_strips=False)
     return ob
 
 
-def _process_locations(mod_version, mesh, vertex, vertices_out, bbox_data):
-    x = vertex.position.x
-    y = vertex.position.y
-    z = vertex.position.z
+def _get_vertex_format(mod, mesh):
+    if mod.header.version == 156:
+        return mod.materials_data.materials[mesh.idx_material].vtype
+    return mesh.vertex_format
 
-    w = getattr(vertex.position, "w", None)
-    if w is not None and mod_version == 156:
-        x = x / 32767 * bbox_data.width + bbox_data.min_x
-        y = y / 32767 * bbox_data.height + bbox_data.min_y
-        z = z / 32767 * bbox_data.depth + bbox_data.min_z
 
-    elif (w is not None and mod_version in (210, 211, 212)) or (
-            mod_version in (210, 211, 212) and mesh.vertex_format in BBOX_AFFECTED):
-        x = x / 32767 * bbox_data.dimension + bbox_data.min_x
-        y = y / 32767 * bbox_data.dimension + bbox_data.min_y
-        z = z / 32767 * bbox_data.dimension + bbox_data.min_z
+def _get_vertex_buffer_range(mod, mesh):
+    """
+    Return the offset in the file and number of vertices
+    of a mesh, same as `mesh.vertices` in the ksy
+    """
+    if mod.header.version == 156:
+        offset = mod.header.offset_vertex_buffer + (mesh.min_index * mesh.vertex_stride) + mesh.vertex_offset
+        if mesh.min_index > mesh.vertex_position_2:
+            num_vertices = mesh.max_index - mesh.min_index + 1
+        else:
+            num_vertices = mesh.num_vertices
+    else:
+        offset = (mod.header.offset_vertex_buffer + mesh.vertex_offset +
+                  (mesh.vertex_position * mesh.vertex_stride))
+        num_vertices = mesh.num_vertices
+    return offset, num_vertices
 
-    # Y-up to z-up and cm to m
-    vertices_out.append((x * 0.01, -z * 0.01, y * 0.01))
 
+def _get_index_buffer_range(mod, mesh):
+    """
+    Return the offset in the file and number of indices
+    of a mesh, same as `mesh.indices` in the ksy
+    """
+    offset = mod.header.offset_index_buffer + (mesh.face_offset * 2) + (mesh.face_position * 2)
+    return offset, mesh.num_indices
 
-def _process_normals(vertex, normals_out):
-    if not hasattr(vertex, "normal"):
-        return
-    # from [0, 255] o [-1, 1]
-    x = ((vertex.normal.x / 255) * 2) - 1
-    y = ((vertex.normal.y / 255) * 2) - 1
-    z = ((vertex.normal.z / 255) * 2) - 1
-    # y up to z up
-    normals_out.append((x, -z, y))
 
+def _read_indices(mod_bytes, mod, mesh):
+    offset, num_indices = _get_index_buffer_range(mod, mesh)
+    return np.frombuffer(mod_bytes, dtype="<u2", count=num_indices, offset=offset)
 
-def _process_uvs(vertex, uvs_1_out, uvs_2_out, uvs_3_out, uvs_4_out):
-    if not hasattr(vertex, "uv"):
-        return
-    u = unpack("e", bytes(vertex.uv.u))[0]
-    v = unpack("e", bytes(vertex.uv.v))[0]
-    uvs_1_out.extend((u, 1 - v))
 
-    if not hasattr(vertex, "uv2"):
-        return
-    u = unpack("e", bytes(vertex.uv2.u))[0]
-    v = unpack("e", bytes(vertex.uv2.v))[0]
-    uvs_2_out.extend((u, 1 - v))
+def _read_vertices(mod_bytes, mod, mesh):
+    """
+    Return a structured array viewing the vertices of the mesh,
+    without creating kaitai objects for each vertex
+    """
+    dtype = VERTEX_FORMATS_DTYPES[_get_vertex_format(mod, mesh)]
+    offset, num_vertices = _get_vertex_buffer_range(mod, mesh)
+    return np.frombuffer(mod_bytes, dtype=dtype, count=num_vertices, offset=offset)
 
-    if not hasattr(vertex, "uv3"):
-        return
-    u = unpack("e", bytes(vertex.uv3.u))[0]
-    v = unpack("e", bytes(vertex.uv3.v))[0]
-    uvs_3_out.extend((u, 1 - v))
 
-    if not hasattr(vertex, "uv4"):
-        return
-    u = unpack("e", bytes(vertex.uv4.u))[0]
-    v = unpack("e", bytes(vertex.uv4.v))[0]
-    uvs_4_out.extend((u, 1 - v))
+DecodedVertices = namedtuple(
+    "DecodedVertices", ("locations", "normals", "uvs", "vertex_colors", "bone_indices", "weights"))
 
 
-def _process_vertex_colors(mod_version, vertex, rgba_out):
-    if not hasattr(vertex, "rgba"):
-        return
-    b = vertex.rgba.x / 225
-    g = vertex.rgba.y / 225
-    r = vertex.rgba.z / 255
-    a = vertex.rgba.w / 255
-    rgba_out.append((r, g, b, a))
+def _decode_vertices(mod, vertex_format, vertices, bbox_data):
+    mod_version = mod.header.version
+    fields = vertices.dtype.names
 
+    xyz = vertices["position"][:, :3].astype(np.float64)
+    has_w = vertices["position"].shape[1] == 4
+    if has_w and mod_version == 156:
+        xyz = xyz / 32767 * (bbox_data.width, bbox_data.height, bbox_data.depth)
+        xyz += (bbox_data.min_x, bbox_data.min_y, bbox_data.min_z)
+    elif mod_version in (210, 211, 212) and (has_w or vertex_format in BBOX_AFFECTED):
+        xyz = xyz / 32767 * bbox_data.dimension
+        xyz += (bbox_data.min_x, bbox_data.min_y, bbox_data.min_z)
+    # Y-up to z-up and cm to m
+    locations = np.column_stack((xyz[:, 0] * 0.01, -xyz[:, 2] * 0.01, xyz[:, 1] * 0.01))
 
-def _process_weights(mod, mesh, vertex, vertex_index, weights_per_bone):
-    if not hasattr(vertex, "bone_indices"):
-        return
-    bone_indices = _get_bone_indices(mod, mesh, vertex.bone_indices)
-    weights = _get_weights(mod, mesh, vertex)
+    normals = None
+    if "normal" in fields:
+        # from [0, 255] o [-1, 1]
+        n = ((vertices["normal"][:, :3] / 255) * 2) - 1
+        # y up to z up
+        normals = np.column_stack((n[:, 0], -n[:, 2], n[:, 1]))
 
-    for bi, bone_index in enumerate(bone_indices):
-        weight = weights[bi]
-        if not weight:
-            continue
-        bone_data = weights_per_bone.setdefault(bone_index, [])
-        bone_data.append((vertex_index, weights[bi]))
+    uvs = []
+    for uv_name in ("uv", "uv2", "uv3", "uv4"):
+        if uv_name not in fields:
+            break
+        uv = vertices[uv_name].astype(np.float64)
+        uvs.append(np.column_stack((uv[:, 0], 1 - uv[:, 1])))
 
-    return weights_per_bone
+    vertex_colors = None
+    if "rgba" in fields:
+        rgba = vertices["rgba"]
+        vertex_colors = np.column_stack(
+            (rgba[:, 2] / 255, rgba[:, 1] / 225, rgba[:, 0] / 225, rgba[:, 3] / 255))
 
+    bone_indices, weights = _decode_weights(mod, vertex_format, vertices)
 
-def _get_bone_indices(mod, mesh, bone_indices):
-    mapped_bone_indices = []
+    return DecodedVertices(locations, normals, uvs, vertex_colors, bone_indices, weights)
 
-    if mod.header.version in VERSIONS_USE_BONE_PALETTES:
-        bone_palette = mod.bones_data.bone_palettes[mesh.idx_bone_palette]
-        for bi, bone_index in enumerate(bone_indices):
-            if bone_index >= bone_palette.unk_01:
-                real_bone_index = mod.bones_data.bone_map[bone_index]
-            else:
-                try:
-                    real_bone_index = mod.bones_data.bone_palettes[
-                        mesh.idx_bone_palette].indices[bone_index]
-                except IndexError:
-                    # Behaviour not observed in original files so far
-                    real_bone_index = bone_index
-            mapped_bone_indices.append(real_bone_index)
-    elif mesh.vertex_format in (
-        0xC31F201C,
-        0xB392101F,
-    ):
-        b1 = int(unpack("e", bone_indices[0])[0])
-        b2 = int(unpack("e", bone_indices[1])[0])
-        mapped_bone_indices.extend((b1, b2))
-    elif mesh.vertex_format == 0xdb7da014:
-        b1 = bone_indices[0]
-        b2 = bone_indices[2]
-        mapped_bone_indices.extend((b1, b2))
-    else:
-        mapped_bone_indices = bone_indices
 
-    return mapped_bone_indices
+def _decode_weights(mod, vertex_format, vertices):
+    """
+    Return two (num_vertices, num_influences) arrays with
+    the bone indices and weights of each vertex. Bone indices
+    are not mapped through bone palettes yet
+    """
+    if "bone_indices" not in vertices.dtype.names:
+        return None, None
+    bone_indices = vertices["bone_indices"]
+    weights = _get_weights(mod, vertex_format, vertices)
+    if weights is None:
+        return None, None
+
+    if vertex_format == 0xdb7da014 and mod.header.version != 156:
+        bone_indices = bone_indices[:, [0, 2]]
+    # half-float bone indices are truncated, like int()
+    return bone_indices.astype(np.int64), weights
+
+
+def _get_bone_palette_lookup(mod, mesh):
+    bone_palette = mod.bones_data.bone_palettes[mesh.idx_bone_palette]
+    lookup = np.frombuffer(mod.bones_data.bone_map, dtype=np.uint8).astype(np.int64)
+    for bone_index in range(min(bone_palette.unk_01, len(lookup))):
+        try:
+            lookup[bone_index] = bone_palette.indices[bone_index]
+        except IndexError:
+            # Behaviour not observed in original files so far
+            lookup[bone_index] = bone_index
+    return lookup
 
 
-def _get_weights(mod, mesh, vertex):
-    if mod.header.version == 156 or mesh.vertex_format in (0xCB68015, 0xa320c016):
-        return tuple([w / 255 for w in vertex.weight_values])
+def _get_weights(mod, vertex_format, vertices):
+    num_bones = vertices["bone_indices"].shape[1]
+    if mod.header.version == 156 or vertex_format in (0xCB68015, 0xa320c016):
+        return vertices["weight_values"] / 255
 
     # Assuming all vertex formats share this pattern.
     # TODO: verify
-    if len(vertex.bone_indices) == 1:
-        return (1.0,)
+    if num_bones == 1:
+        return np.ones((len(vertices), 1))
+
+    w1 = vertices["position"][:, 3] / 32767
     # 2w
-    elif mesh.vertex_format in (
+    if vertex_format in (
         0xC31F201C,
         0xDB7DA014,
         0xb392101f,
     ):
-        w1 = vertex.position.w / 32767
-        w2 = 1.0 - w1
-        return (w1, w2)
+        return np.column_stack((w1, 1.0 - w1))
     # 4w
-    elif mesh.vertex_format in (
+    elif vertex_format in (
         0x14D40020,
         0x2F55C03D,
         0x64593023,
         0xDA55A021,
         0x77D87022,
     ):
-        w1 = vertex.position.w / 32767
-        w2 = unpack("e", bytes(vertex.weight_values[0]))[0]
-        w3 = unpack("e", bytes(vertex.weight_values[1]))[0]
-        w4 = round(1.0 - w1 - w2 - w3, 3)
-        return (w1, w2, w3, w4)
+        w2, w3 = vertices["weight_values"].astype(np.float64).T
+        w4 = np.round(1.0 - w1 - w2 - w3, 3)
+        return np.column_stack((w1, w2, w3, w4))
     # 8w
-    elif mesh.vertex_format in (
+    elif vertex_format in (
         0x75C3E025,
         0xCBCF7027,
         0xBB424024,
         0xD84E3026,
     ):
-        w1 = vertex.position.w / 32767
-        w2 = vertex.weight_values[0] / 255
-        w3 = vertex.weight_values[1] / 255
-        w4 = vertex.weight_values[2] / 255
-        w5 = vertex.weight_values[3] / 255
-        w6 = unpack("e", bytes(vertex.weight_values2[0]))[0]
-        w7 = unpack("e", bytes(vertex.weight_values2[1]))[0]
+        w2, w3, w4, w5 = (vertices["weight_values"] / 255).T
+        w6, w7 = vertices["weight_values2"].astype(np.float64).T
         w8 = 1.0 - w1 - w2 - w3 - w4 - w5 - w6 - w7
-        return (w1, w2, w3, w4, w5, w6, w7, w8)
-    else:
-        print(
-            f"Can't get weights for vertex_format '{hex(mesh.vertex_format)}'")
-        return (0, 0, 0, 0)
+        return np.column_stack((w1, w2, w3, w4, w5, w6, w7, w8))
+    print(
+        f"Can't get weights for vertex_format '{hex(vertex_format)}'")
+    return None
+
+
+def _get_weights_per_bone(bone_indices, weights):
+    """
+    Group non-zero influences by bone index, in order of appearance:
+    {bone_index: (vertex_indices, weights)}
+    """
+    if bone_indices is None:
+        return {}
+    mask = weights != 0
+    vertex_indices = np.nonzero(mask)[0]
+    bones = bone_indices[mask]
+    values = weights[mask]
+
+    order = np.argsort(bones, kind="stable")
+    unique_bones, starts = np.unique(bones[order], return_index=True)
+    groups = np.split(order, starts[1:])
+    first_seen = np.argsort([group[0] for group in groups])
+
+    return {
+        int(unique_bones[i]): (vertex_indices[groups[i]], values[groups[i]])
+        for i in first_seen
+    }
 
 
 def _build_normals(bl_mesh, normals):
-    if not normals:
+    if normals is None:
         return
     try:
         bl_mesh.create_normals_split()
@@ -643,35 +992,28 @@ def _build_normals(bl_mesh, normals):
         pass
 
 
-def _build_uvs(bl_mesh, uvs, name="uv"):
-    if not uvs:
+def _build_uvs(bl_mesh, uvs, loop_vertex_indices, name="uv"):
+    if uvs is None:
         return
     uv_layer = bl_mesh.uv_layers.new(name=name)
-    per_loop_list = []
-    for loop in bl_mesh.loops:
-        offset = loop.vertex_index * 2
-        per_loop_list.extend((uvs[offset], uvs[offset + 1]))
-    uv_layer.data.foreach_set("uv", per_loop_list)
+    per_loop_uvs = uvs[loop_vertex_indices].astype(np.float32)
+    uv_layer.data.foreach_set("uv", per_loop_uvs.ravel())
 
 
-def _build_vertex_colors(bl_mesh, vertex_colors, name="imported_colors"):
-    if len(vertex_colors) > 0:
-        bl_mesh.vertex_colors.new(name=name)
-        color_layer = bl_mesh.vertex_colors[name]
-        for poly in bl_mesh.polygons:
-            for loop_index in poly.loop_indices:
-                loop = bl_mesh.loops[loop_index]
-                if vertex_colors[loop.vertex_index]:
-                    color_layer.data[loop_index].color = vertex_colors[loop.vertex_index]
+def _build_vertex_colors(bl_mesh, vertex_colors, loop_vertex_indices, name="imported_colors"):
+    if vertex_colors is None:
+        return
+    color_attribute = bl_mesh.color_attributes.new(name, "BYTE_COLOR", "CORNER")
+    per_loop_colors = vertex_colors[loop_vertex_indices].astype(np.float32)
+    color_attribute.data.foreach_set("color_srgb", per_loop_colors.ravel())
 
 
 def _build_weights(bl_obj, weights_per_bone):
     if not weights_per_bone:
         return
-    for bone_index, data in weights_per_bone.items():
+    for bone_index, (vertex_indices, weight_values) in weights_per_bone.items():
         vg = bl_obj.vertex_groups.new(name=str(bone_index))
-        for vertex_index, weight_value in data:
-            vg.add((vertex_index,), weight_value, "ADD")
+        add_vertex_group_weights(vg, vertex_indices, weight_values)
 
 
 def build_blender_armature(mod, armature_name, bbox_data):
@@ -681,8 +1023,8 @@ def build_blender_armature(mod, armature_name, bbox_data):
 
     if bpy.context.mode != "OBJECT":
         bpy.ops.object.mode_set(mode="OBJECT")
-    for i in bpy.context.scene.objects:
-        i.select_set(False)
+    for ob in bpy.context.selected_objects:
+        ob.select_set(False)
     bpy.context.collection.objects.link(armature_ob)
     bpy.context.view_layer.objects.active = armature_ob
     armature_ob.select_set(True)
@@ -690,6 +1032,9 @@ def build_blender_armature(mod, armature_name, bbox_data):
 
     blender_bones = []
     scale = 0.01
+    heads = _get_bone_heads(mod, bbox_data) * scale
+    # y up to z up
+    heads = np.column_stack((heads[:, 0], -heads[:, 2], heads[:, 1])).tolist()
     # TODO: do it at blender level
     # non_deform_bone_indices = get_non_deform_bone_indices(mod)
     for i, bone in enumerate(mod.bones_data.bones_hierarchy):
@@ -697,10 +1042,9 @@ def build_blender_armature(mod, armature_name, bbox_data):
         valid_parent = bone.idx_parent < 255
         blender_bone.parent = blender_bones[bone.idx_parent] if valid_parent else None
         # blender_bone.use_deform = False if i in non_deform_bone_indices else True
-        m = mod.bones_data.inverse_bind_matrices[i]
-        head = _transform_inverse_bind_matrix(mod, m, bbox_data)
-        blender_bone.head = [head[0] * scale, -head[2] * scale, head[1] * scale]
-        blender_bone.tail = [head[0] * scale, -head[2] * scale, (head[1] * scale) + 0.01]
+        head = heads[i]
+        blender_bone.head = head
+        blender_bone.tail = [head[0], head[1], head[2] + 0.01]
         blender_bone['mtfw.anim_retarget'] = str(bone.idx_anim_map)
         blender_bones.append(blender_bone)
 
@@ -708,32 +1052,73 @@ def build_blender_armature(mod, armature_name, bbox_data):
     return armature_ob
 
 
-def _transform_inverse_bind_matrix(mod, matrix, bbox_data):
-    m = matrix
-    bl_matrix = Matrix((
-        (m.row_1.x, m.row_1.y, m.row_1.z, m.row_1.w),
-        (m.row_2.x, m.row_2.y, m.row_2.z, m.row_2.w),
-        (m.row_3.x, m.row_3.y, m.row_3.z, m.row_3.w),
-        (m.row_4.x, m.row_4.y, m.row_4.z, m.row_4.w),
-    )).transposed()  # directx to opengl style
+def _get_bone_heads(mod, bbox_data):
+    """
+    Return a (num_bones, 3) array with the head of each bone,
+    computed from the inverse bind matrices of all bones at once
+    """
+    matrices = np.array([
+        [(r.x, r.y, r.z, r.w) for r in (m.row_1, m.row_2, m.row_3, m.row_4)]
+        for m in mod.bones_data.inverse_bind_matrices
+    ], dtype=np.float64).reshape(-1, 4, 4)
+    matrices = matrices.transpose(0, 2, 1)  # directx to opengl style
 
     if mod.header.version in VERSIONS_BONES_BBOX_AFFECTED:
-        # bbox-space to global-space
-        scale_matrix = Matrix.Scale(bbox_data.dimension, 4)
-        # create a translation matrix that doesn't affect scale component
-        translation_matrix = (
-            Matrix.Translation((bbox_data.min_x, bbox_data.min_y, bbox_data.min_z)) - Matrix.Scale(1, 4)
-        )
-        rot_x, rot_y, rot_z = bl_matrix.to_euler("XYZ")
-        rotation_matrix = (
-            Matrix.Rotation(rot_x, 4, "X")
-            @ Matrix.Rotation(rot_y, 4, "Y")
-            @ Matrix.Rotation(rot_z, 4, "Z")
-        )
+        rotations = _euler_xyz_rotations(_matrices_to_euler_xyz(matrices))
+        # bbox-space to global-space:
+        # matrix @ scale.inverted() @ rotation.inverted() - translation
+        matrices[:, :, :3] /= bbox_data.dimension
+        matrices[:, :, :3] = matrices[:, :, :3] @ rotations.transpose(0, 2, 1)
+        matrices[:, :3, 3] -= (bbox_data.min_x, bbox_data.min_y, bbox_data.min_z)
 
-        bl_matrix = ((bl_matrix @ scale_matrix.inverted()) @ rotation_matrix.inverted()) - translation_matrix
+    return np.linalg.inv(matrices)[:, :3, 3]
 
-    return bl_matrix.inverted().to_translation()
+
+def _matrices_to_euler_xyz(matrices):
+    """
+    Same as mathutils `Matrix.to_euler("XYZ")` for a stack of matrices
+    """
+    m = matrices[:, :3, :3]
+    m = m / np.linalg.norm(m, axis=1, keepdims=True)
+    cy = np.hypot(m[:, 0, 0], m[:, 1, 0])
+    euler_1 = np.column_stack((
+        np.arctan2(m[:, 2, 1], m[:, 2, 2]),
+        np.arctan2(-m[:, 2, 0], cy),
+        np.arctan2(m[:, 1, 0], m[:, 0, 0]),
+    ))
+    euler_2 = np.column_stack((
+        np.arctan2(-m[:, 2, 1], -m[:, 2, 2]),
+        np.arctan2(-m[:, 2, 0], -cy),
+        np.arctan2(-m[:, 1, 0], -m[:, 0, 0]),
+    ))
+    singular = cy <= 16 * np.finfo(np.float32).eps
+    euler_1[singular, 0] = np.arctan2(-m[singular, 1, 2], m[singular, 1, 1])
+    euler_1[singular, 2] = 0
+    euler_2[singular] = euler_1[singular]
+    # pick the solution with the smallest rotations
+    use_2 = np.abs(euler_1).sum(axis=1) > np.abs(euler_2).sum(axis=1)
+    return np.where(use_2[:, None], euler_2, euler_1)
+
+
+def _euler_xyz_rotations(eulers):
+    """
+    Return the 3x3 matrices X @ Y @ Z rotating by each euler angle
+    """
+    cos, sin = np.cos(eulers), np.sin(eulers)
+    ones, zeros = np.ones(len(eulers)), np.zeros(len(eulers))
+    rot_x = np.stack((
+        ones, zeros, zeros,
+        zeros, cos[:, 0], -sin[:, 0],
+        zeros, sin[:, 0], cos[:, 0]), axis=1).reshape(-1, 3, 3)
+    rot_y = np.stack((
+        cos[:, 1], zeros, sin[:, 1],
+        zeros, ones, zeros,
+        -sin[:, 1], zeros, cos[:, 1]), axis=1).reshape(-1, 3, 3)
+    rot_z = np.stack((
+        cos[:, 2], -sin[:, 2], zeros,
+        sin[:, 2], cos[:, 2], zeros,
+        zeros, zeros, ones), axis=1).reshape(-1, 3, 3)
+    return rot_x @ rot_y @ rot_z
 
 
 def _create_bbox_data(mod):
@@ -802,6 +1187,7 @@ def export_mod(bl_obj):
     Mod = APPID_CLASS_MAPPER[app_id]
     vfiles = []
 
+    # arrays are parsed on access, so only the parts copied below are read
     src_mod = Mod.from_bytes(asset.original_bytes)
     src_mod._read()
     dst_mod = Mod()
@@ -810,16 +1196,22 @@ def export_mod(bl_obj):
     if export_settings.export_visible:
         bl_meshes = [mesh for mesh in bl_meshes if mesh.visible_get()]
 
-    _serialize_top_level_mod(bl_meshes, src_mod, dst_mod)
-    _init_mod_header(bl_obj, src_mod, dst_mod)
-
-    bone_palettes = _create_bone_palettes(src_mod, bl_obj, bl_meshes)
-    dst_mod.bones_data = _serialize_bones_data(bl_obj, bl_meshes, src_mod, dst_mod, bone_palettes)
-    dst_mod.groups = _serialize_groups(src_mod, dst_mod)
-    materials_map, mrl, vtextures = serialize_materials_data(asset, bl_meshes, src_mod, dst_mod)
-
-    meshes_data, vertex_buffer, vertex_buffer_2, index_buffer = (
-        _serialize_meshes_data(bl_obj, bl_meshes, src_mod, dst_mod, materials_map, bone_palettes))
+    temporary_meshes = []
+    if export_settings.split_bone_palettes and src_mod.header.version in VERSIONS_USE_BONE_PALETTES:
+        bl_meshes, temporary_meshes = _split_meshes_over_bone_limit(bl_obj, bl_meshes)
+    try:
+        _serialize_top_level_mod(bl_meshes, src_mod, dst_mod)
+        _init_mod_header(bl_obj, src_mod, dst_mod)
+
+        bone_palettes = _create_bone_palettes(src_mod, bl_obj, bl_meshes)
+        dst_mod.bones_data = _serialize_bones_data(bl_obj, bl_meshes, src_mod, dst_mod, bone_palettes)
+        dst_mod.groups = _serialize_groups(src_mod, dst_mod)
+        materials_map, mrl, vtextures = serialize_materials_data(asset, bl_meshes, src_mod, dst_mod)
+
+        meshes_data, vertex_buffer, vertex_buffer_2, index_buffer = (
+            _serialize_meshes_data(bl_obj, bl_meshes, src_mod, dst_mod, materials_map, bone_palettes))
+    finally:
+        _remove_temporary_meshes(temporary_meshes)
     dst_mod.header.num_vertices = sum(m.num_vertices for m in meshes_data.meshes)
     dst_mod.meshes_data = meshes_data
     dst_mod.vertex_buffer = vertex_buffer
@@ -856,6 +1248,7 @@ def export_mod(bl_obj):
     dst_mod.header.size_file = final_size
     stream = KaitaiStream(BytesIO(bytearray(final_size)))
     dst_mod._check()
+    _check_mod_layout(dst_mod)
     dst_mod._write(stream)
 
     mod_vf = VirtualFileData(app_id, asset.relative_path, data_bytes=stream.to_byte_array())
@@ -866,6 +1259,35 @@ def export_mod(bl_obj):
     return vfiles
 
 
+def _check_mod_layout(mod):
+    """
+    Validate the sections and mesh buffers of a MOD to write fit in the file,
+    in place of the checks of every element skipped in trusted write mode
+    """
+    header = mod.header
+    offsets = [
+        header.offset_bones_data,
+        header.offset_groups,
+        header.offset_materials_data,
+        header.offset_meshes_data,
+        header.offset_vertex_buffer,
+        header.offset_vertex_buffer_2,
+        header.offset_index_buffer,
+        header.size_file,
+    ]
+    if offsets != sorted(offsets):
+        raise ConsistencyError("section offsets", offsets, sorted(offsets))
+    vertex_buffer_end = header.offset_vertex_buffer + header.size_vertex_buffer
+    for mesh in mod.meshes_data.meshes:
+        offset, num_vertices = _get_vertex_buffer_range(mod, mesh)
+        vertices_end = offset + num_vertices * mesh.vertex_stride
+        if vertices_end > vertex_buffer_end:
+            raise ConsistencyError("mesh vertices end", vertices_end, vertex_buffer_end)
+        offset, num_indices = _get_index_buffer_range(mod, mesh)
+        if offset + num_indices * 2 > header.size_file:
+            raise ConsistencyError("mesh indices end", offset + num_indices * 2, header.size_file)
+
+
 def _init_mod_header(bl_obj, src_mod, dst_mod):
     dst_mod_header = dst_mod.ModHeader(_parent=dst_mod, _root=dst_mod._root)
     dst_mod_header.__dict__.update(dict(
@@ -978,7 +1400,7 @@ def _serialize_bones_data(bl_obj, bl_meshes, src_mod, dst_mod, bone_palettes=Non
                 bp = bp + [0] * padding
             bone_palette.indices = bp
             bones_data.bone_palettes.append(bone_palette)
-            bone_palette._check()
+            bone_palette._check_element()
 
     for i in range(dst_mod.header.num_bones):
         src_bone = src_mod.bones_data.bones_hierarchy[i]
@@ -1202,62 +1624,228 @@ def _normalize_uv(uv_x, uv_y):
 
 
 def _get_vertex_colors(blender_mesh):
+    """
+    Return the colors of the first color layer as a V×4 array of
+    bytes in rgba order, vertices without color are zeroed
+    """
     mesh = blender_mesh.data
-    colors = {}
+    colors = np.zeros((len(mesh.vertices), 4))
     try:
         color_layer = mesh.vertex_colors[0]
     except IndexError:
         return colors
-    mesh_loops = {li: loop.vertex_index for li, loop in enumerate(mesh.loops)}
-    vtx_colors = {mesh_loops[li]: data.color for li,
-                  data in color_layer.data.items()}
-    for idx, color in vtx_colors.items():
-        b = round(color[0] * 255)
-        g = round(color[1] * 255)
-        r = round(color[2] * 255)
-        a = round(color[3] * 255)
-        colors[idx] = (r, g, b, a)
+    colors_per_loop = np.empty(len(color_layer.data) * 4, dtype=np.float32)
+    color_layer.data.foreach_get("color", colors_per_loop)
+    # the last loop of a vertex sets its color
+    loop_vertex_indices = get_loop_vertex_indices(mesh)[::-1]
+    vertex_indices, last_loops = np.unique(loop_vertex_indices, return_index=True)
+    bgra = colors_per_loop.reshape(-1, 4)[::-1][last_loops].astype(np.float64)
+    colors[vertex_indices] = np.round(bgra * 255)[:, [2, 1, 0, 3]]
     return colors
 
 
 def _create_bone_palettes(src_mod, bl_armature, bl_meshes):
     if src_mod.header.version != 156:
         return {}
-    bone_palette_dicts = []
-    MAX_BONE_PALETTE_SIZE = 32
-
-    bone_palette = {'mesh_indices': set(), 'bone_indices': set()}
-    for i, mesh in enumerate(bl_meshes):
-
-        mesh_vertex_groups = get_mesh_vertex_groups(mesh)
-        bone_indices = {
-            bl_armature.pose.bones.find(mesh.vertex_groups[vgi].name)
-            for vgi, vertices in mesh_vertex_groups.items() if vertices
-        }
-        bone_indices = {bi for bi in bone_indices if bi != -1}
-
-        # TODO: check at export time for all meshes
-        msg = f"Mesh {mesh.name} is influenced by more than 32 bones, which is not supported"
-        assert len(bone_indices) <= MAX_BONE_PALETTE_SIZE, msg
-
-        current = bone_palette['bone_indices']
-        potential = current.union(bone_indices)
-        if len(potential) > MAX_BONE_PALETTE_SIZE:
-            bone_palette_dicts.append(bone_palette)
-            bone_palette = {'mesh_indices': {i},
-                            'bone_indices': set(bone_indices)}
-        else:
-            bone_palette['mesh_indices'].add(i)
-            bone_palette['bone_indices'].update(bone_indices)
+    bone_sets = [_get_mesh_bone_indices(bl_armature, mesh) for mesh in bl_meshes]
+    for mesh, bone_indices in zip(bl_meshes, bone_sets):
+        if len(bone_indices) > MAX_BONE_PALETTE_SIZE:
+            raise AlbamCheckFailure(
+                f"Mesh {mesh.name} is influenced by more than {MAX_BONE_PALETTE_SIZE} bones, "
+                "which is not supported",
+                details=f"Object: {mesh.name}, bones: {len(bone_indices)}",
+                solution="Enable 'Split meshes over the bone palette limit' in the export options "
+                         "or separate the mesh in parts"
+            )
 
-    bone_palette_dicts.append(bone_palette)
+    bone_palettes = _plan_bone_palettes(bone_sets)
+    num_greedy = len(_plan_bone_palettes_greedy(bone_sets))
+    print(f"[{bl_armature.name}] bone palettes: {len(bone_palettes)} (greedy: {num_greedy})")
 
-    final = OrderedDict([(frozenset(bp['mesh_indices']), sorted(bp['bone_indices']))
-                        for bp in bone_palette_dicts])
+    final = OrderedDict([(frozenset(mesh_indices), sorted(bone_indices))
+                        for mesh_indices, bone_indices in bone_palettes])
 
     return final
 
 
+def _get_mesh_bone_indices(bl_armature, bl_mesh):
+    """
+    Return the set of armature bone indices with a non-zero weight in any
+    vertex of the mesh
+    """
+    _, bone_indices, weights = _get_vertex_groups_bone_arrays(bl_armature, bl_mesh)
+    bone_indices = np.unique(bone_indices[weights != 0])
+    return frozenset(bone_indices[bone_indices != -1].tolist())
+
+
+def _get_vertex_groups_bone_arrays(bl_armature, bl_mesh):
+    """
+    Like `get_vertex_groups_arrays`, with vertex groups mapped to the
+    index of the pose bone of the same name, -1 if there's none
+    """
+    vertex_indices, group_indices, weights = get_vertex_groups_arrays(bl_mesh)
+    group_to_bone = np.array(
+        [bl_armature.pose.bones.find(vg.name) for vg in bl_mesh.vertex_groups] or [-1], dtype=np.int32)
+    return vertex_indices, group_to_bone[group_indices], weights
+
+
+def _plan_bone_palettes_greedy(bone_sets, max_size=MAX_BONE_PALETTE_SIZE):
+    """
+    Baseline packing: fill palettes with meshes in their original order,
+    starting a new one when the current is full
+    """
+    palettes = [(set(), set())]
+    for i, bone_indices in enumerate(bone_sets):
+        mesh_indices, palette = palettes[-1]
+        if len(palette | bone_indices) > max_size:
+            palettes.append(({i}, set(bone_indices)))
+        else:
+            mesh_indices.add(i)
+            palette.update(bone_indices)
+    return palettes
+
+
+def _plan_bone_palettes(bone_sets, max_size=MAX_BONE_PALETTE_SIZE):
+    """
+    Pack the bone sets of the meshes in as few palettes of `max_size` bones as
+    possible. Meshes are placed first fit decreasing by number of bones, each
+    one in the palette it shares most bones with; palettes that still fit
+    together are merged afterwards. Never returns more palettes than the
+    greedy baseline
+    """
+    palettes = []
+    order = sorted(range(len(bone_sets)), key=lambda i: len(bone_sets[i]), reverse=True)
+    for i in order:
+        bone_indices = bone_sets[i]
+        best = None
+        best_key = None
+        for palette in palettes:
+            union_size = len(palette[1] | bone_indices)
+            if union_size > max_size:
+                continue
+            key = (len(palette[1] & bone_indices), -union_size)
+            if best_key is None or key > best_key:
+                best, best_key = palette, key
+        if best is None:
+            palettes.append(({i}, set(bone_indices)))
+        else:
+            best[0].add(i)
+            best[1].update(bone_indices)
+
+    merged = True
+    while merged:
+        merged = False
+        for a in range(len(palettes)):
+            for b in range(a + 1, len(palettes)):
+                if len(palettes[a][1] | palettes[b][1]) <= max_size:
+                    palettes[a][0].update(palettes[b][0])
+                    palettes[a][1].update(palettes[b][1])
+                    del palettes[b]
+                    merged = True
+                    break
+            if merged:
+                break
+
+    greedy = _plan_bone_palettes_greedy(bone_sets, max_size)
+    if not palettes or len(greedy) < len(palettes):
+        return greedy
+    return palettes
+
+
+def _split_meshes_over_bone_limit(bl_armature, bl_meshes, max_size=MAX_BONE_PALETTE_SIZE):
+    """
+    Replace the meshes influenced by more than `max_size` bones with temporary
+    copies, each one holding a cluster of faces that fits in a bone palette.
+    Return the new list of meshes and the temporary objects created, to be
+    removed after the export
+    """
+    meshes = []
+    temporary = []
+    for bl_mesh in bl_meshes:
+        if len(_get_mesh_bone_indices(bl_armature, bl_mesh)) <= max_size:
+            meshes.append(bl_mesh)
+            continue
+        face_clusters = _cluster_faces_by_bones(
+            [p.vertices[:] for p in bl_mesh.data.polygons],
+            _get_vertices_bone_indices(bl_armature, bl_mesh),
+            max_size)
+        for ci, faces in enumerate(face_clusters):
+            part = bl_mesh.copy()
+            part.data = bl_mesh.data.copy()
+            part.name = f"{bl_mesh.name}.part{ci}"
+            keep = set(faces)
+            bm = bmesh.new()
+            bm.from_mesh(part.data)
+            bm.faces.ensure_lookup_table()
+            bmesh.ops.delete(bm, geom=[f for f in bm.faces if f.index not in keep], context="FACES")
+            bmesh.ops.delete(bm, geom=[v for v in bm.verts if not v.link_faces], context="VERTS")
+            bm.to_mesh(part.data)
+            bm.free()
+            meshes.append(part)
+            temporary.append(part)
+        print(f"[{bl_armature.name}] {bl_mesh.name} split in {len(face_clusters)} parts "
+              "to fit the bone palettes")
+    return meshes, temporary
+
+
+def _remove_temporary_meshes(bl_meshes):
+    for bl_mesh in bl_meshes:
+        data = bl_mesh.data
+        bpy.data.objects.remove(bl_mesh)
+        bpy.data.meshes.remove(data)
+
+
+def _get_vertices_bone_indices(bl_armature, bl_mesh):
+    """
+    Return a list with the set of bone indices influencing each vertex
+    """
+    vertex_indices, bone_indices, weights = _get_vertex_groups_bone_arrays(bl_armature, bl_mesh)
+    used = (weights != 0) & (bone_indices != -1)
+    vertices_bones = [set() for _ in range(len(bl_mesh.data.vertices))]
+    for vi, bi in zip(vertex_indices[used].tolist(), bone_indices[used].tolist()):
+        vertices_bones[vi].add(bi)
+    return vertices_bones
+
+
+def _cluster_faces_by_bones(faces, vertices_bones, max_size=MAX_BONE_PALETTE_SIZE):
+    """
+    Group faces in clusters influenced by up to `max_size` bones, growing each
+    cluster through the faces that share vertices with it
+    """
+    vertex_faces = [[] for _ in vertices_bones]
+    for fi, face in enumerate(faces):
+        for vi in face:
+            vertex_faces[vi].append(fi)
+    faces_bones = [frozenset().union(*(vertices_bones[vi] for vi in face)) for face in faces]
+
+    clusters = []
+    face_cluster = [-1] * len(faces)
+    for seed in range(len(faces)):
+        if face_cluster[seed] != -1:
+            continue
+        ci = len(clusters)
+        cluster = [seed]
+        cluster_bones = set(faces_bones[seed])
+        face_cluster[seed] = ci
+        rejected = set()
+        queue = deque((seed,))
+        while queue:
+            for vi in faces[queue.popleft()]:
+                for fi in vertex_faces[vi]:
+                    if face_cluster[fi] != -1 or fi in rejected:
+                        continue
+                    # the cluster bones only grow, a face that doesn't fit never will
+                    if len(cluster_bones | faces_bones[fi]) > max_size:
+                        rejected.add(fi)
+                        continue
+                    cluster_bones.update(faces_bones[fi])
+                    face_cluster[fi] = ci
+                    cluster.append(fi)
+                    queue.append(fi)
+        clusters.append(cluster)
+    return clusters
+
+
 def _serialize_groups(src_mod, dst_mod):
     groups = []
     for i in range(dst_mod.header.num_groups):
@@ -1278,24 +1866,6 @@ def _serialize_groups(src_mod, dst_mod):
     return groups
 
 
-def _check_weights(weights, max_weights):
-    _weights = []
-    i = max_weights - 4
-    weights.extend([0] * (max_weights - len(weights)))
-    if max_weights in [1, 2]:
-        return weights
-    _weights.append(round(weights[0] * 32767) / 32767)
-    if max_weights == 8:
-        _weights.append(round(weights[1] * 255) / 255)
-        _weights.append(round(weights[2] * 255) / 255)
-        _weights.append(round(weights[3] * 255) / 255)
-        _weights.append(round(weights[4] * 255) / 255)
-    _weights.append(unpack("e", pack("e", weights[i + 1]))[0])
-    _weights.append(unpack("e", pack("e", weights[i + 2]))[0])
-    _weights.append(weights[i + 3])
-    return _weights
-
-
 def _check_armature(bl_mesh):
     for modifier in bl_mesh.modifiers:
         if modifier.type == 'ARMATURE' and modifier.object:
@@ -1316,6 +1886,10 @@ def _serialize_meshes_data(bl_obj, bl_meshes, src_mod, dst_mod, materials_map, b
     index_buffer = bytearray()
     bbox_data = _create_bbox_data(dst_mod)
     use_strips = dst_mod.header.version in VERSIONS_USE_TRISTRIPS
+    strips_vertex_cache_size = STRIPS_VERTEX_CACHE_SIZE if export_settings.strips_vertex_cache else 0
+    num_strip_indices = 0
+    num_degenerate_triangles = 0
+    num_cached_meshes = 0
 
     current_vertex_position = 0
     current_vertex_offset = 0
@@ -1328,44 +1902,61 @@ def _serialize_meshes_data(bl_obj, bl_meshes, src_mod, dst_mod, materials_map, b
     face_position = 0
     face_offset = 0  # unused for now
 
+    mesh_bone_palettes = [_get_mesh_bone_palette(bone_palettes, mi) for mi in range(len(bl_meshes))]
+    export_options = (strips_vertex_cache_size if use_strips else None,
+                      export_settings.optimize_vertex_cache, export_settings.weld_vertices)
+    # Blender data is read here, in the main thread, and the meshes
+    # not reused from the export cache are serialized in a thread pool
+    meshes_buffers = [None] * len(bl_meshes)
+    fingerprints = {}
+    pending_meshes = []
+    for mesh_index, bl_mesh in enumerate(bl_meshes):
+        mesh_bone_palette = mesh_bone_palettes[mesh_index][1]
+        if export_settings.use_export_cache:
+            cache_slot = bl_mesh.name_full
+            fingerprint = get_fingerprint(
+                get_mesh_fingerprint(bl_mesh, app_id), dst_mod.header.version, dst_mod.header.num_bones,
+                mesh_bone_palette, bbox_data, *export_options)
+            if is_export_cached("mod_mesh", cache_slot, fingerprint):
+                meshes_buffers[mesh_index] = get_export_cache("mod_mesh")[cache_slot][1]
+                num_cached_meshes += 1
+                continue
+            fingerprints[mesh_index] = fingerprint
+        mesh_export_data = _gather_mesh_export_data(app_id, bl_mesh, dst_mod, *export_options[:2])
+        pending_meshes.append((
+            mesh_index, (app_id, mesh_export_data, mesh_bone_palette, dst_mod, bbox_data, *export_options)))
+
+    serialized_meshes = map_in_pool(
+        lambda export_args: _export_mesh(*export_args),
+        [export_args for _, export_args in pending_meshes], export_settings.export_workers)
+    for (mesh_index, _), mesh_buffers in zip(pending_meshes, serialized_meshes):
+        meshes_buffers[mesh_index] = mesh_buffers
+        if export_settings.use_export_cache:
+            get_export_cache("mod_mesh")[bl_meshes[mesh_index].name_full] = (
+                fingerprints[mesh_index], mesh_buffers)
+
     for mesh_index, bl_mesh in enumerate(bl_meshes):
         face_padding = 0 if app_id not in ["re5", "dd"] else 2
         mesh = dst_mod.Mesh(_parent=meshes_data, _root=meshes_data._root)
         mesh.indices__to_write = False
         mesh.vertices__to_write = False
         mesh.vertices2__to_write = False
-        mesh_bone_palette = None
-        mesh_bone_palette_index = None
-        if bone_palettes:
-            mesh_bone_palette = None
-            for bpi, (meshes_indices, bp) in enumerate(bone_palettes.items()):
-                if mesh_index in meshes_indices:
-                    mesh_bone_palette_index = bpi
-                    mesh_bone_palette = bp
-                    break
-            else:
-                raise ValueError(
-                    f"Mesh {mesh_index} doesn't have a bone_palette")
+        mesh_bone_palette_index = mesh_bone_palettes[mesh_index][0]
+        (triangles, vertices, vertices2, vertex_format,
+         vertex_stride, vertex_stride_2, max_bones_per_vertex) = meshes_buffers[mesh_index]
+        if use_strips:
+            num_strip_indices += len(triangles)
+            num_degenerate_triangles += max(len(triangles) - 2 - len(bl_mesh.data.polygons), 0)
 
-        vertices, vertices2, vertex_format, vertex_stride, vertex_stride_2, max_bones_per_vertex = (
-            _export_vertices(app_id, bl_mesh, mesh,
-                             mesh_bone_palette, dst_mod, bbox_data)
-        )
-        vertex_buffer.extend(vertices.to_byte_array())
+        vertex_buffer.extend(vertices)
         if vertices2:
-            vertex_buffer_2.extend(vertices2.to_byte_array())
+            vertex_buffer_2.extend(vertices2)
         if vertex_format != current_vertex_format or export_settings.no_vf_grouping:
             current_vertex_offset = vertex_offset_accumulated
             current_vertex_offset_2 = vertex_offset_2_accumulated
             current_vertex_position = 0
             current_vertex_format = vertex_format
 
-        if use_strips:
-            triangles = triangles_list_to_triangles_strip(bl_mesh)
-        else:
-            triangles = list(chain.from_iterable(
-                p.vertices for p in bl_mesh.data.polygons))
-
         triangles = [e + current_vertex_position for e in triangles]
         num_indices = len(triangles)
         if app_id in ["re5", "dd"]:
@@ -1378,7 +1969,7 @@ def _serialize_meshes_data(bl_obj, bl_meshes, src_mod, dst_mod, materials_map, b
 
         triangles_ctypes = (ctypes.c_ushort * len(triangles))(*triangles)
         index_buffer.extend(triangles_ctypes)
-        num_vertices = len(bl_mesh.data.vertices)
+        num_vertices = len(vertices) // vertex_stride
 
         # Beware of vertex_format being a string type, overriden below
         custom_properties = bl_mesh.data.albam_custom_properties.get_custom_properties_for_appid(
@@ -1419,7 +2010,7 @@ def _serialize_meshes_data(bl_obj, bl_meshes, src_mod, dst_mod, materials_map, b
             mesh.reserved2 = 0
             mesh.connective = 0
 
-        mesh._check()
+        mesh._check_element()
         meshes_data.meshes.append(mesh)
         mesh_weight_bounds = _calculate_weight_bounds(
             bl_obj, bl_mesh, dst_mod, meshes_data)
@@ -1437,45 +2028,163 @@ def _serialize_meshes_data(bl_obj, bl_meshes, src_mod, dst_mod, materials_map, b
     else:
         dst_mod.num_weight_bounds = len(meshes_data.weight_bounds)
 
+    if use_strips:
+        print(f"[{bl_obj.name}] triangle strips: {num_strip_indices} indices, "
+              f"{num_degenerate_triangles} degenerate triangles")
+    if export_settings.use_export_cache:
+        print(f"[{bl_obj.name}] meshes reused from the export cache: "
+              f"{num_cached_meshes}/{len(bl_meshes)}")
     meshes_data._check()
     return meshes_data, vertex_buffer, vertex_buffer_2, index_buffer
 
 
-def _export_vertices(app_id, bl_mesh, mesh, mesh_bone_palette, dst_mod, bbox_data):
+def _get_mesh_bone_palette(bone_palettes, mesh_index):
+    """
+    Return the index of the bone palette of a mesh and the palette,
+    or None for both when the model has no bone palettes
+    """
+    if not bone_palettes:
+        return None, None
+    for bpi, (meshes_indices, bp) in enumerate(bone_palettes.items()):
+        if mesh_index in meshes_indices:
+            return bpi, bp
+    raise ValueError(
+        f"Mesh {mesh_index} doesn't have a bone_palette")
+
+
+MeshExportData = namedtuple("MeshExportData", (
+    "name", "triangles", "is_triangulated", "locations", "normals", "tangents", "uvs", "vertex_colors",
+    "num_influences", "bone_indices", "weight_values", "vertex_format", "skin_function", "has_armature",
+))
+
+
+def _gather_mesh_export_data(app_id, bl_mesh, dst_mod, strips_vertex_cache_size=None,
+                             optimize_vertex_cache=False):
+    """
+    Read from `bl_mesh` everything `_export_mesh` needs, so the
+    serialization doesn't touch bpy and can run outside of the main thread.
+    Triangles are a F×3 array when they are reordered, otherwise the
+    vertex indices of the polygons
+    """
+    mesh = bl_mesh.data
+    is_triangulated = len(mesh.loops) == len(mesh.polygons) * 3
+    if strips_vertex_cache_size is not None or (optimize_vertex_cache and is_triangulated):
+        triangles = get_triangles_array(mesh)
+    else:
+        triangles = list(chain.from_iterable(p.vertices for p in mesh.polygons))
+
+    locations = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", locations)
+    skin_function = None
+    if dst_mod.header.version == 156:
+        albam_custom_props = bl_mesh.material_slots[0].material.albam_custom_properties
+        mod_156_material_props = albam_custom_props.get_custom_properties_for_appid(app_id)
+        vertex_format = mod_156_material_props.vtype
+        skin_function = mod_156_material_props.func_skin
+    else:
+        custom_properties = mesh.albam_custom_properties.get_custom_properties_for_appid(app_id)
+        vertex_format = getattr(custom_properties, "vertex_format")
+
+    return MeshExportData(
+        bl_mesh.name,
+        triangles,
+        is_triangulated,
+        locations.reshape(-1, 3),
+        get_normals_array(mesh),
+        get_tangents_array(mesh),
+        [get_uvs_array(bl_mesh, layer_index) for layer_index in range(4)],
+        _get_vertex_colors(bl_mesh),
+        *get_bone_indices_and_weights_arrays(bl_mesh),
+        vertex_format,
+        skin_function,
+        _check_armature(bl_mesh),
+    )
+
+
+def _export_mesh(app_id, mesh_data, mesh_bone_palette, dst_mod, bbox_data,
+                 strips_vertex_cache_size=None, optimize_vertex_cache=False, weld_vertices=False):
+    """
+    Serialize the indices and vertices gathered by `_gather_mesh_export_data`,
+    as triangle strips when `strips_vertex_cache_size` is not None. Returns
+    the indices, relative to the mesh, followed by the output of `_export_vertices`
+    """
+    vertex_order = None
+    triangles = mesh_data.triangles
+    if strips_vertex_cache_size is not None:
+        triangles = triangles_to_strip(triangles, strips_vertex_cache_size)
+    elif optimize_vertex_cache:
+        triangles, vertex_order = _optimize_triangles_list(mesh_data)
+
+    vertices, vertices_2, *vertices_data = _export_vertices(
+        app_id, mesh_data, mesh_bone_palette, dst_mod, bbox_data, vertex_order)
+    if weld_vertices:
+        vertex_stride, vertex_stride_2 = vertices_data[1:3]
+        num_vertices = len(vertices) // vertex_stride
+        triangles, vertices, vertices_2 = _weld_vertices(
+            triangles, vertices, vertices_2, vertex_stride, vertex_stride_2)
+        num_welded = num_vertices - len(vertices) // vertex_stride
+        print(f"[{mesh_data.name}] welded vertices: {num_welded} of {num_vertices}")
+    return (triangles, vertices, vertices_2, *vertices_data)
+
+
+def _weld_vertices(indices, vertices, vertices_2, vertex_stride, vertex_stride_2):
+    """
+    Merge the vertices whose serialized bytes, in both vertex buffers, are
+    identical and point the indices to the merged ones. Vertices keep the
+    order of their first occurrence
+    """
+    rows = np.frombuffer(vertices, dtype=np.uint8).reshape(-1, vertex_stride)
+    if vertices_2:
+        rows = np.hstack((rows, np.frombuffer(vertices_2, dtype=np.uint8).reshape(-1, vertex_stride_2)))
+    rows = np.ascontiguousarray(rows)
+    keys = rows.view(np.dtype((np.void, rows.shape[1]))).ravel()
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    order = np.argsort(first)
+    new_index = np.empty_like(order)
+    new_index[order] = np.arange(len(order))
+    kept = first[order]
+
+    indices = new_index[inverse.ravel()][np.asarray(indices, dtype=np.int64)].tolist()
+    vertices = rows[kept, :vertex_stride].tobytes()
+    if vertices_2:
+        vertices_2 = rows[kept, vertex_stride:].tobytes()
+    return indices, vertices, vertices_2
+
+
+def _export_vertices(app_id, mesh_data, mesh_bone_palette, dst_mod, bbox_data, vertex_order=None):
+    """
+    Serialize the vertices of a mesh, gathered by `_gather_mesh_export_data`,
+    filling a structured array of the vertex format in bulk, instead of writing
+    a kaitai struct per vertex.
+    `vertex_order` optionally gives the blender vertex written at each position
+    """
     SCALE = 100
-    uvs_per_vertex = get_uvs_per_vertex(bl_mesh, 0)
-    uvs_per_vertex_2 = get_uvs_per_vertex(bl_mesh, 1)
-    uvs_per_vertex_3 = get_uvs_per_vertex(bl_mesh, 2)
-    uvs_per_vertex_4 = get_uvs_per_vertex(bl_mesh, 3)
-    color_per_vertex = _get_vertex_colors(bl_mesh)
-    weights_per_vertex = get_bone_indices_and_weights_per_vertex(bl_mesh)
-    max_bones_per_vertex = max({len(data) for data in weights_per_vertex.values()}, default=0)
-    normals = get_normals_per_vertex(bl_mesh.data)
-    tangents = get_tangents_per_vertex(bl_mesh.data)
-    vtx_stream_2 = None
+    uvs, uvs_2, uvs_3, uvs_4 = mesh_data.uvs
+    vertex_colors = mesh_data.vertex_colors
+    num_influences = mesh_data.num_influences
+    bone_indices = mesh_data.bone_indices
+    weight_values = mesh_data.weight_values
+    max_bones_per_vertex = int(num_influences.max(initial=0))
+    normals = mesh_data.normals
+    tangents = mesh_data.tangents
+    vertices_2 = None
     vtx_stride_2 = 0
     has_vertex_buffer_2 = False
     has_bones = bool(dst_mod.header.num_bones)
 
-    albam_custom_props = bl_mesh.material_slots[0].material.albam_custom_properties
-    mod_156_material_props = albam_custom_props.get_custom_properties_for_appid(app_id)
-
-    vertex_count = len(bl_mesh.data.vertices)
+    vertex_count = len(mesh_data.locations)
     if dst_mod.header.version == 156:
-        vertex_format = int(mod_156_material_props.vtype, 16)
-        skin_function = int(mod_156_material_props.func_skin, 16)
+        vertex_format = int(mesh_data.vertex_format, 16)
+        skin_function = int(mesh_data.skin_function, 16)
         if vertex_format == 0x1 and skin_function == 0x4:
             has_vertex_buffer_2 = True
             vtx_stride_2 = 8
-            VertexBuff2Cls = Mod156.Vertex28
-        VertexCls = VERTEX_FORMATS_MAPPER[vertex_format]
         vtx_stride = 32
         # vertex_format = max_bones_per_vertex
 
     elif dst_mod.header.version in (210, 211, 212):
-        custom_properties = bl_mesh.data.albam_custom_properties.get_custom_properties_for_appid(app_id)
         try:
-            stored_vertex_format = int(getattr(custom_properties, "vertex_format"), 16)
+            stored_vertex_format = int(mesh_data.vertex_format, 16)
         except (TypeError, ValueError):
             stored_vertex_format = None
         default_vertex_format = DEFAULT_VERTEX_FORMAT_SKIN if has_bones else DEFAULT_VERTEX_FORMAT_NONSKIN
@@ -1491,430 +2200,362 @@ def _export_vertices(app_id, bl_mesh, mesh, mesh_bone_palette, dst_mod, bbox_dat
         max_bones_per_vertex = MAX_BONES
     weight_half_float = (dst_mod.header.version in (210, 211, 212) and
                          vertex_format not in VERTEX_FORMATS_BRIDGE)
-    weights_per_vertex = _process_weights_for_export(
-        weights_per_vertex, max_bones_per_vertex=MAX_BONES, half_float=weight_half_float)
-    vtx_stream = KaitaiStream(
-        BytesIO(bytearray(vtx_stride * vertex_count)))
-    if has_vertex_buffer_2:
-        vtx_stream_2 = KaitaiStream(
-            BytesIO(bytearray(8 * vertex_count)))
-    bytes_empty = b'\x00\x00'
-    for vertex_index, vertex in enumerate(bl_mesh.data.vertices):
-        vertex_struct = VertexCls(_parent=mesh, _root=mesh._root)
-        if has_vertex_buffer_2:
-            vertex_struct_2 = VertexBuff2Cls(_parent=mesh, _root=mesh._root)
-            vertex_struct_2.occlusion = dst_mod.Vec4U1(
-                _parent=vertex_struct_2, _root=vertex_struct_2._root)
-            vertex_struct_2.tangent = dst_mod.Vec4U1(
-                _parent=vertex_struct_2, _root=vertex_struct_2._root)
-            vertex_struct_2.occlusion.x = 255
-            vertex_struct_2.occlusion.y = 255
-            vertex_struct_2.occlusion.z = 255
-            vertex_struct_2.occlusion.w = 255
-
-            # Tangents
-            t = tangents.get(vertex_index, (0, 0, 0))
-            try:
-                vertex_struct_2.tangent.x = round(((t[0] * 0.5) + 0.5) * 255)
-                vertex_struct_2.tangent.y = round(((t[2] * 0.5) + 0.5) * 255)
-                vertex_struct_2.tangent.z = round(((t[1] * -0.5) + 0.5) * 255)
-                vertex_struct_2.tangent.w = 254
-            except ValueError:
-                vertex_struct_2.tangent.x = 0
-                vertex_struct_2.tangent.y = 0
-                vertex_struct_2.tangent.z = 0
-                vertex_struct_2.tangent.w = 254
-        # Position types
-        if has_bones:
-            if MAX_BONES == 1:
-                vertex_struct.position = dst_mod.Vec3S2(
-                    _parent=vertex_struct, _root=vertex_struct._root)
-            else:
-                vertex_struct.position = dst_mod.Vec4S2(
-                    _parent=vertex_struct, _root=vertex_struct._root)
-        else:
-            vertex_struct.position = dst_mod.Vec3(
-                _parent=vertex_struct, _root=vertex_struct._root)
-        # Normals types
-        if dst_mod.header.version == 156 or vertex_format in VERTEX_FORMATS_NORMAL4:
-            vertex_struct.normal = dst_mod.Vec4U1(
-                _parent=vertex_struct, _root=vertex_struct._root)
-        else:
-            vertex_struct.normal = dst_mod.Vec3U1(
-                _parent=vertex_struct, _root=vertex_struct._root)
-            vertex_struct.occlusion = 254
-        # Tangets
+    num_influences, bone_indices, weight_values = _process_weights_for_export(
+        num_influences, bone_indices, weight_values,
+        max_bones_per_vertex=MAX_BONES, half_float=weight_half_float)
+
+    # Position types
+    if has_bones:
+        position_type = _VEC3_S2 if MAX_BONES == 1 else _VEC4_S2
+    else:
+        position_type = _VEC3
+    # Normals types
+    normal_4 = dst_mod.header.version == 156 or vertex_format in VERTEX_FORMATS_NORMAL4
+    normal_type = _VEC4_U1 if normal_4 else _VEC3_U1
+    vertex_dtype = _get_export_vertex_dtype(vertex_format, position_type, normal_type)
+    vertices = np.zeros(vertex_count, dtype=vertex_dtype)
+    fields = vertices.dtype.names
+
+    # Set Position
+    locations = mesh_data.locations.astype(np.float64) * SCALE
+    xyz = np.column_stack((locations[:, 0], locations[:, 2], -locations[:, 1]))  # z-up to y-up
+    if has_bones:
+        xyz = _apply_bbox_transforms(xyz, dst_mod, bbox_data)
+        vertices["position"][:, :3] = _check_vertex_values(xyz, "position", np.int16)
+        if position_type is _VEC4_S2:
+            vertices["position"][:, 3] = 32767  # might be changed later
+    else:
+        vertices["position"] = xyz
+    # Set Normals, from [-1, 1] to [0, 255], and clipping bad blender normals
+    vertices["normal"][:, :3] = np.clip(_vectors_to_u1(normals), 0, 255)
+    if normal_4:
+        vertices["normal"][:, 3] = 255  # is this occlusion as well?
+    elif "occlusion" in fields:
+        vertices["occlusion"] = 254
+    # Tangents
+    if vertex_format in VERTEX_FORMATS_TANGENT or has_vertex_buffer_2:
+        if tangents is None:
+            tangents = np.zeros((vertex_count, 3))
+        tangents = _vectors_to_u1(tangents)
+        tangents = np.column_stack((_check_vertex_values(tangents, "tangent", np.uint8),
+                                    np.full(vertex_count, 254)))
         if vertex_format in VERTEX_FORMATS_TANGENT:
-            vertex_struct.tangent = dst_mod.Vec4U1(
-                _parent=vertex_struct, _root=vertex_struct._root)
-            # Tangents
-            t = tangents.get(vertex_index, (0, 0, 0))
-            try:
-                vertex_struct.tangent.x = round(((t[0] * 0.5) + 0.5) * 255)
-                vertex_struct.tangent.y = round(((t[2] * 0.5) + 0.5) * 255)
-                vertex_struct.tangent.z = round(((t[1] * -0.5) + 0.5) * 255)
-                vertex_struct.tangent.w = 254
-            except ValueError:
-                vertex_struct.tangent.x = 0
-                vertex_struct.tangent.y = 0
-                vertex_struct.tangent.z = 0
-                vertex_struct.tangent.w = 254
-        # UV
-        if vertex_format not in VERTEX_FORMATS_BRIDGE:
-            vertex_struct.uv = dst_mod.Vec2HalfFloat(
-                _parent=vertex_struct, _root=vertex_struct._root)
-            uv_x, uv_y = uvs_per_vertex.get(vertex_index, (0, 0))
-            uv_x, uv_y = _normalize_uv(uv_x, uv_y)
-            vertex_struct.uv.u = pack('e', uv_x)
-            vertex_struct.uv.v = pack('e', uv_y)
-        # UV2
-        if vertex_format in VERTEX_FORMATS_UV2:
-            vertex_struct.uv2 = dst_mod.Vec2HalfFloat(
-                _parent=vertex_struct, _root=vertex_struct._root)
-            if uvs_per_vertex_2:
-                uv_x, uv_y = uvs_per_vertex_2.get(vertex_index, (0, 0))
-                uv_x, uv_y = _normalize_uv(uv_x, uv_y)
-                vertex_struct.uv2.u = pack('e', uv_x)
-                vertex_struct.uv2.v = pack('e', uv_y)
-            else:
-                vertex_struct.uv2.u = bytes_empty
-                vertex_struct.uv2.v = bytes_empty
-        # UV3
-        if vertex_format in VERTEX_FORMATS_UV3:
-            vertex_struct.uv3 = dst_mod.Vec2HalfFloat(
-                _parent=vertex_struct, _root=vertex_struct._root)
-            if uvs_per_vertex_3:
-                uv_x, uv_y = uvs_per_vertex_3.get(vertex_index, (0, 0))
-                uv_x, uv_y = _normalize_uv(uv_x, uv_y)
-                vertex_struct.uv3.u = pack('e', uv_x)
-                vertex_struct.uv3.v = pack('e', uv_y)
-            else:
-                vertex_struct.uv3.u = bytes_empty
-                vertex_struct.uv3.v = bytes_empty
-        # UV4
-        if vertex_format in VERTEX_FORMATS_UV4:
-            vertex_struct.uv4 = dst_mod.Vec2HalfFloat(
-                _parent=vertex_struct, _root=vertex_struct._root)
-            if uvs_per_vertex_4:
-                uv_x, uv_y = uvs_per_vertex_4.get(vertex_index, (0, 0))
-                uv_x, uv_y = _normalize_uv(uv_x, uv_y)
-                vertex_struct.uv4.u = pack('e', uv_x)
-                vertex_struct.uv4.v = pack('e', uv_y)
-            else:
-                vertex_struct.uv4.u = bytes_empty
-                vertex_struct.uv4.v = bytes_empty
-        # Vertex colors
-        if vertex_format in VERTEX_FORMATS_RGBA:
-            vertex_struct.rgba = dst_mod.Vec4U1(_parent=vertex_struct, _root=vertex_struct._root)
-            c = color_per_vertex.get(vertex_index, (0, 0, 0, 0))
-            vertex_struct.rgba.x = c[0]
-            vertex_struct.rgba.y = c[1]
-            vertex_struct.rgba.z = c[2]
-            vertex_struct.rgba.w = c[3]
-        # Vertex Alpha
-        if vertex_format in VERTEX_FORMATS_VERTEX_ALPHA:
-            vertex_struct.vertex_alpha = 255
-        # Set Position
-        xyz = (vertex.co[0] * SCALE, vertex.co[1] * SCALE, vertex.co[2] * SCALE)
-        xyz = (xyz[0], xyz[2], -xyz[1])  # z-up to y-up
-        xyz = _apply_bbox_transforms(
-            xyz, dst_mod, bbox_data) if has_bones else xyz
-        vertex_struct.position.x = xyz[0]
-        vertex_struct.position.y = xyz[1]
-        vertex_struct.position.z = xyz[2]
-        vertex_struct.position.w = 32767  # might be changed later
-        # Set Normals
-        norms = normals.get(vertex_index, (0, 0, 0))
-        try:
-            # from [-1, 1] to [0, 255], and clipping bad blender normals
-            vertex_struct.normal.x = max(
-                0, min(255, round(((norms[0] * 0.5) + 0.5) * 255)))
-            vertex_struct.normal.y = max(
-                0, min(255, round(((norms[2] * 0.5) + 0.5) * 255)))
-            vertex_struct.normal.z = max(
-                0, min(255, round(((norms[1] * -0.5) + 0.5) * 255)))
-        except ValueError as err:
-            if "cannot convert float NaN to integer" in str(err):
-                vertex_struct.normal.x = 0
-                vertex_struct.normal.y = 0
-                vertex_struct.normal.z = 0
-            else:
-                raise
-        # Set Weights
-        if dst_mod.header.version == 156 or vertex_format in VERTEX_FORMATS_NORMAL4:
-            vertex_struct.normal.w = 255  # is this occlusion as well?
-        if has_bones:
-            if not _check_armature(bl_mesh):
-                raise AlbamCheckFailure(
-                    "The mesh object has no Armature modifier",
-                    details=f"Object: {bl_mesh.name}",
-                    solution="Please add Armature modifier and set imported skeleton as Object"
-                )
-            # applying bounding box constraints
-            weights_data = weights_per_vertex.get(vertex_index, [])  # bone index , weight value hfloat
-            weight_values = [w for _, w in weights_data]
-            if not weight_values:
-                raise AlbamCheckFailure(
-                    "The mesh object has one or more vertices with zero skin weights",
-                    details=f"Object: {bl_mesh.name}",
-                    solution="Please move a root bone in Pose mode to detect vertices that stand still"
-                    " and use weight paint brush to fix them"
-                )
-
-            weight_values.extend([0] * (MAX_BONES - len(weight_values)))  # add nulls if less than bone limit
-            if mesh_bone_palette:
-                bone_indices = [mesh_bone_palette.index(
-                    bone_index) for bone_index, _ in weights_data]
-            else:
-                bone_indices = [bi for bi, _ in weights_data]
-            # minmics ingame files pattern if vertex has less than max_bones_per_vertex influences
-            bone_indices.extend([bone_indices[0]] * (max_bones_per_vertex - len(bone_indices)))
-            # fill other empty bone indices in vertex format range with 0
-            bone_indices.extend([0] * (MAX_BONES - len(bone_indices)))
-            if vertex_format == 0xdb7da014:  # very strange bridge format
-                bone_indices.insert(1, 128)
-                bone_indices.insert(3, 128)
-            vertex_struct.bone_indices = bone_indices
-            if dst_mod.header.version != 156 and vertex_format not in VERTEX_FORMATS_BRIDGE:
-                match MAX_BONES:
-                    case 2:
-                        vertex_struct.bone_indices = [
-                            pack('e', bone_indices[0]), pack('e', bone_indices[1])]
-                        vertex_struct.position.w = round(weight_values[0] * 32767)
-                    case 4:
-                        vertex_struct.position.w = round(weight_values[0] * 32767)
-                        vertex_struct.weight_values = [0, 0]
-                        vertex_struct.weight_values[0] = pack("e", weight_values[1])
-                        vertex_struct.weight_values[1] = pack("e", weight_values[2])
-                    case 8:
-                        vertex_struct.position.w = round(weight_values[0] * 32767)
-                        vertex_struct.weight_values = [0, 0, 0, 0]
-                        vertex_struct.weight_values[0] = round(weight_values[1] * 255)
-                        vertex_struct.weight_values[1] = round(weight_values[2] * 255)
-                        vertex_struct.weight_values[2] = round(weight_values[3] * 255)
-                        vertex_struct.weight_values[3] = round(weight_values[4] * 255)
-                        vertex_struct.weight_values2 = [0, 0]
-                        vertex_struct.weight_values2[0] = pack("e", weight_values[5])
-                        vertex_struct.weight_values2[1] = pack("e", weight_values[6])
+            vertices["tangent"] = tangents
+        if has_vertex_buffer_2:
+            vertex_2_dtype = _vertex_dtype(("occlusion", _VEC4_U1), ("tangent", _VEC4_U1))
+            vertices_2 = np.zeros(vertex_count, dtype=vertex_2_dtype)
+            vertices_2["occlusion"] = 255
+            vertices_2["tangent"] = tangents
+    # UVs
+    if vertex_format not in VERTEX_FORMATS_BRIDGE:
+        if uvs is None:
+            uvs = np.zeros((vertex_count, 2))
+        vertices["uv"] = _uvs_to_half_float(uvs)
+    extra_uvs = (
+        ("uv2", VERTEX_FORMATS_UV2, uvs_2),
+        ("uv3", VERTEX_FORMATS_UV3, uvs_3),
+        ("uv4", VERTEX_FORMATS_UV4, uvs_4),
+    )
+    for field, uv_vertex_formats, layer_uvs in extra_uvs:
+        # left zeroed without uv layer
+        if vertex_format in uv_vertex_formats and layer_uvs is not None:
+            vertices[field] = _uvs_to_half_float(layer_uvs)
+    # Vertex colors
+    if vertex_format in VERTEX_FORMATS_RGBA:
+        vertices["rgba"] = _check_vertex_values(vertex_colors, "rgba", np.uint8)
+    # Vertex Alpha
+    if vertex_format in VERTEX_FORMATS_VERTEX_ALPHA:
+        vertices["vertex_alpha"] = 255
+    # Set Weights
+    if has_bones and vertex_count:
+        if not mesh_data.has_armature:
+            raise AlbamCheckFailure(
+                "The mesh object has no Armature modifier",
+                details=f"Object: {mesh_data.name}",
+                solution="Please add Armature modifier and set imported skeleton as Object"
+            )
+        if not num_influences.all():
+            raise AlbamCheckFailure(
+                "The mesh object has one or more vertices with zero skin weights",
+                details=f"Object: {mesh_data.name}",
+                solution="Please move a root bone in Pose mode to detect vertices that stand still"
+                " and use weight paint brush to fix them"
+            )
+        if mesh_bone_palette:
+            bone_indices = _map_to_bone_palette(bone_indices, num_influences, mesh_bone_palette)
+        # minmics ingame files pattern if vertex has less than max_bones_per_vertex influences
+        # and fill other empty bone indices in vertex format range with 0
+        columns = np.arange(MAX_BONES)
+        bone_indices = np.where(
+            columns < num_influences[:, None], bone_indices,
+            np.where(columns < max_bones_per_vertex, bone_indices[:, :1], 0))
+        if vertex_format == 0xdb7da014:  # very strange bridge format
+            bone_indices = np.insert(bone_indices, [1, 2], 128, axis=1)
+        if "bone_indices" in fields:
+            field_type = vertices.dtype["bone_indices"].base
+            if field_type.kind == "f":
+                vertices["bone_indices"] = _to_half_float(bone_indices)
             else:
-                vertex_struct.weight_values = weight_values
+                vertices["bone_indices"] = _check_vertex_values(bone_indices, "bone_indices", field_type)
+        if dst_mod.header.version != 156 and vertex_format not in VERTEX_FORMATS_BRIDGE:
+            if MAX_BONES in (2, 4, 8):
+                vertices["position"][:, 3] = np.round(weight_values[:, 0] * 32767)
+            if MAX_BONES == 4 and "weight_values" in fields:
+                vertices["weight_values"] = _to_half_float(weight_values[:, 1:3])
+            elif MAX_BONES == 8 and "weight_values" in fields:
+                vertices["weight_values"] = _check_vertex_values(
+                    np.round(weight_values[:, 1:5] * 255), "weight_values", np.uint8)
+                vertices["weight_values2"] = _to_half_float(weight_values[:, 5:7])
+        elif "weight_values" in fields:
+            vertices["weight_values"] = _check_vertex_values(weight_values, "weight_values", np.uint8)
+
+    if vertex_order is not None:
+        vertices = vertices[vertex_order]
         if has_vertex_buffer_2:
-            vertex_struct_2._check()
-            vertex_struct_2._write(vtx_stream_2)
-        vertex_struct._check()
-        vertex_struct._write(vtx_stream)
+            vertices_2 = vertices_2[vertex_order]
+    vertices_bytes = _vertices_to_bytes(vertices, vtx_stride)
+    vertices_2_bytes = _vertices_to_bytes(vertices_2, vtx_stride_2) if has_vertex_buffer_2 else None
 
-    return vtx_stream, vtx_stream_2, vertex_format, vtx_stride, vtx_stride_2, max_bones_per_vertex
+    return vertices_bytes, vertices_2_bytes, vertex_format, vtx_stride, vtx_stride_2, max_bones_per_vertex
 
 
-def _apply_bbox_transforms(xyz_tuple, dst_mod, bbox_data):
-    x, y, z = xyz_tuple
+def _optimize_triangles_list(mesh_data):
+    """
+    Reorder the triangles of a mesh for the post-transform vertex cache and
+    its vertices in first use order, returning the indices and the vertex order
+    """
+    if not mesh_data.is_triangulated:
+        print(f"[{mesh_data.name}] not triangulated, vertex cache optimization skipped")
+        return mesh_data.triangles, None
+    triangles, vertex_order, stats = _optimize_triangles(mesh_data.triangles, len(mesh_data.locations))
+    (acmr, atvr), (optimized_acmr, optimized_atvr) = stats
+    if vertex_order is None:
+        print(f"[{mesh_data.name}] ACMR {acmr:.3f} not improved ({optimized_acmr:.3f}), original order kept")
+    else:
+        print(f"[{mesh_data.name}] ACMR {acmr:.3f} -> {optimized_acmr:.3f}, "
+              f"ATVR {atvr:.3f} -> {optimized_atvr:.3f}")
+    return triangles.ravel().tolist(), vertex_order
 
-    if dst_mod.header.version == 156:
 
-        x -= dst_mod.bbox_min.x
-        x /= (dst_mod.bbox_max.x - dst_mod.bbox_min.x)
-        x *= 32767
+def _optimize_triangles(triangles, vertex_count):
+    """
+    Reorder a (num_triangles, 3) array for the post-transform vertex cache
+    and the vertices in first use order. The heuristic doesn't always lower
+    the ACMR of meshes already in a good order, those are returned unchanged
+    with None as vertex order. Also return the (ACMR, ATVR) before and
+    after optimizing
+    """
+    stats = get_vertex_cache_stats(triangles, TRIANGLES_VERTEX_CACHE_SIZE)
+    optimized = optimize_vertex_cache(triangles, TRIANGLES_VERTEX_CACHE_SIZE)
+    optimized, vertex_order = reorder_vertices_by_first_use(optimized, vertex_count)
+    optimized_stats = get_vertex_cache_stats(optimized, TRIANGLES_VERTEX_CACHE_SIZE)
+    if optimized_stats[0] >= stats[0]:
+        return triangles, None, (stats, optimized_stats)
+    return optimized, vertex_order, (stats, optimized_stats)
 
-        y -= dst_mod.bbox_min.y
-        y /= (dst_mod.bbox_max.y - dst_mod.bbox_min.y) or 1
-        y *= 32767
 
-        z -= dst_mod.bbox_min.z
-        z /= (dst_mod.bbox_max.z - dst_mod.bbox_min.z) or 1
-        z *= 32767
+def _get_export_vertex_dtype(vertex_format, position_type, normal_type):
+    """
+    Layout of the vertices written for `vertex_format`, with the position
+    and normal types picked by the exporter
+    """
+    dtype = VERTEX_FORMATS_DTYPES[vertex_format]
+    field_types = {"position": position_type, "normal": normal_type}
+    return _vertex_dtype(*(
+        (name, field_types.get(name, (dtype[name].base.str, dtype[name].shape)))
+        for name in dtype.names
+    ))
 
-    elif dst_mod.header.version in (210, 211, 212):
-        x -= bbox_data.min_x
-        x /= bbox_data.dimension
-        x *= 32767
 
-        y -= bbox_data.min_y
-        y /= bbox_data.dimension
-        y *= 32767
+def _vertices_to_bytes(vertices, vertex_stride):
+    """
+    Vertices are written one after the other and the buffer is
+    sized by the stride of the format
+    """
+    size = vertex_stride * len(vertices)
+    if vertices.nbytes > size:
+        raise EOFError(
+            f"[{size}] requested to write {vertices.nbytes} bytes, but only {size} bytes left in the stream")
+    return vertices.tobytes().ljust(size, b"\x00")
 
-        z -= bbox_data.min_z
-        z /= bbox_data.dimension
-        z *= 32767
 
-    return (round(x), round(y), round(z))
+def _map_to_bone_palette(bone_indices, num_influences, bone_palette):
+    bone_palette = np.asarray(bone_palette, dtype=np.int64)
+    lookup = np.full(max(bone_palette.max(), bone_indices.max()) + 1, -1, dtype=np.int64)
+    lookup[bone_palette] = np.arange(len(bone_palette))
+    palette_indices = lookup[bone_indices]
+    missing = (np.arange(bone_indices.shape[1]) < num_influences[:, None]) & (palette_indices == -1)
+    if missing.any():
+        raise ValueError(f"{bone_indices[missing][0]} is not in the bone palette")
+    return palette_indices
 
 
-def _process_weights_for_export(weights_per_vertex, max_bones_per_vertex=4, half_float=False):
+def _vectors_to_u1(vectors):
     """
-    Given a dict `weights_per_vertex` with vertex_indices as keys and
-    a list of tuples (bone_index, weight_value), iterate over values
-    and process them to make them mtframework friendly:
-    1) Limit bone weights: keep only up to `max_bones` elements, discarding the pairs that have the
-       lowest inflUENCE. This is actually a limitation in albam for lack of
-       understanding on how the engine treats vertices with more than 4 bone influencing it
-    2) Normalize weights: make all weights sum up 1
-    3) float to byte: convert the (-1.0, 1.0) to (0, 255)
+    From [-1, 1] to [0, 255] and z-up to y-up, vectors
+    with NaN components are zeroed
     """
-    # TODO: move to mtframework.utils
-    new_weights_per_vertex = {}
-    limit = max_bones_per_vertex
-    for vertex_index, influence_list in weights_per_vertex.items():
-        # limit max bones
-        if len(influence_list) > limit:
-            influence_list = sorted(
-                influence_list, key=lambda t: t[1])[-limit:]
-
-        weight_data = {t[0]: t[1] for t in influence_list}
-        wd_sorted = {k: v for k, v in sorted(weight_data.items(), key=lambda item: item[1], reverse=True)}
-        bone_indices = [bi for bi in wd_sorted.keys()]
-        weights = [w for w in wd_sorted.values()]
-        # normalize
-        total_weight = sum(weights)
-        if total_weight:
-            weights = [round((w / total_weight), 4) for w in weights]
-        if half_float:
-            weights = _check_weights(weights, limit)
-        else:
-            # can't have zero values
-            weights = [round(w * 255) or 1 for w in weights]
-            # correct precision
-            if not weights:
-                # XXX vertex_position_2 research, beware
-                continue
-            excess = sum(weights) - 255
-            if excess:
-                max_index, _ = max(enumerate(weights), key=lambda p: p[1])
-                weights[max_index] -= excess
+    vectors = np.asarray(vectors, dtype=np.float64)
+    vectors = np.column_stack((vectors[:, 0], vectors[:, 2], vectors[:, 1] * -1))
+    vectors = np.round(((vectors * 0.5) + 0.5) * 255)
+    vectors[np.isnan(vectors).any(axis=1)] = 0
+    return vectors
 
-        new_weights_per_vertex[vertex_index] = list(zip(bone_indices, weights))
 
-    return new_weights_per_vertex
+def _uvs_to_half_float(uvs):
+    """Same as `_normalize_uv` for all the uvs, as half floats"""
+    uvs = np.asarray(uvs, dtype=np.float64)
+    uvs = np.column_stack((uvs[:, 0], (uvs[:, 1] * -1) + 1))
+    uvs += 0.0  # -0.0 to 0.0
+    return _to_half_float(uvs)
 
 
-def _calculate_weight_bounds(bl_obj, bl_mesh, dst_mod, meshes_data):
-    unsorted_weight_bounds = []
-    if bl_obj.type != "ARMATURE":
-        weight_bound = _set_static_mesh_weight_bounds(
-            dst_mod, bl_mesh, meshes_data)
-        unsorted_weight_bounds.append(weight_bound)
-    else:
-        mesh_vertex_groups = get_mesh_vertex_groups(bl_mesh)
-        for vg in bl_mesh.vertex_groups:
-            weight_bound = _calculate_vertex_group_weight_bound(
-                mesh_vertex_groups, bl_obj, vg, dst_mod, meshes_data
-            )
-            if weight_bound:
-                unsorted_weight_bounds.append(weight_bound)
-    return sorted(unsorted_weight_bounds, key=lambda x: x.bone_id)
+def _to_half_float(values):
+    with np.errstate(over="ignore"):
+        half_floats = values.astype("<f2")
+    if (np.isinf(half_floats) & np.isfinite(values)).any():
+        raise OverflowError("float too large to pack with e format")
+    return half_floats
 
 
-def _set_static_mesh_weight_bounds(dst_mod, bl_mesh_ob, meshes_data):
-    bl_mesh = bl_mesh_ob.data
-    wb = dst_mod.WeightBound(_parent=meshes_data, _root=meshes_data._root)
-    bsphere = dst_mod.Vec4(_parent=wb, _root=wb._root)
+def _check_vertex_values(values, name, dtype):
+    """Fail like struct.pack does with values that don't fit in `dtype`"""
+    info = np.iinfo(dtype)
+    out_of_range = values.size and (values.min() < info.min or values.max() > info.max)
+    if out_of_range or not np.isfinite(values).all():
+        raise ValueError(f"Vertex {name} out of range, must be {info.min} <= number <= {info.max}")
+    return values
 
-    bbox_min = dst_mod.Vec4(_parent=wb, _root=wb._root)
-    min_x = min((v.co[0] for v in bl_mesh.vertices))
-    min_y = min((v.co[1] for v in bl_mesh.vertices))
-    min_z = min((v.co[2] for v in bl_mesh.vertices))
-    bbox_min.w = 0
 
-    bbox_max = dst_mod.Vec4(_parent=wb, _root=wb._root)
-    max_x = max((v.co[0] for v in bl_mesh.vertices))
-    max_y = max((v.co[1] for v in bl_mesh.vertices))
-    max_z = max((v.co[2] for v in bl_mesh.vertices))
+def _apply_bbox_transforms(xyz, dst_mod, bbox_data):
+    xyz = np.array(xyz, dtype=np.float64)
 
-    length_x = (max_x - min_x) / 2
-    length_y = (max_y - min_y) / 2
-    length_z = (max_z - min_z) / 2
-
-    center_x = (min_x + max_x) / 2
-    center_y = (min_y + max_y) / 2
-    center_z = (min_z + max_z) / 2
-    center = (center_x, center_y, center_z)
-    radius = max(map(lambda vertex: get_dist(
-        center, vertex.co[:]), bl_mesh.vertices))
-    bsphere_export = (center_x * 100, center_z * 100, -
-                      center_y * 100, radius * 100)
+    if dst_mod.header.version == 156:
+        bbox_min = np.array((dst_mod.bbox_min.x, dst_mod.bbox_min.y, dst_mod.bbox_min.z))
+        width = dst_mod.bbox_max.x - dst_mod.bbox_min.x
+        if not width:
+            raise ZeroDivisionError("float division by zero")
+        height = (dst_mod.bbox_max.y - dst_mod.bbox_min.y) or 1
+        depth = (dst_mod.bbox_max.z - dst_mod.bbox_min.z) or 1
+        xyz -= bbox_min
+        xyz /= (width, height, depth)
+        xyz *= 32767
 
-    bsphere.x = center_x * 100
-    bsphere.y = center_z * 100
-    bsphere.z = -center_y * 100
-    bsphere.w = radius * 100
+    elif dst_mod.header.version in (210, 211, 212):
+        xyz -= (bbox_data.min_x, bbox_data.min_y, bbox_data.min_z)
+        xyz /= bbox_data.dimension
+        xyz *= 32767
 
-    # bbox_min_export = (min_x * 100, min_z * 100, -max_y * 100, 0.0)
-    bbox_min.x = min_x * 100
-    bbox_min.y = min_z * 100
-    bbox_min.z = -max_y * 100
-    bbox_min.w = 0.0
+    return np.round(xyz)
 
-    # bbox_max_export = (max_x * 100, max_z * 100, -min_y * 100, 0.0)
-    bbox_max.x = max_x * 100
-    bbox_max.y = max_z * 100
-    bbox_max.z = -min_y * 100
-    bbox_max.w = 0.0
 
-    oabb = dst_mod.Matrix4x4(_parent=wb, _root=wb._root)
-    oabb.row_1 = dst_mod.Vec4(_parent=oabb, _root=oabb._root)
-    oabb.row_2 = dst_mod.Vec4(_parent=oabb, _root=oabb._root)
-    oabb.row_3 = dst_mod.Vec4(_parent=oabb, _root=oabb._root)
-    oabb.row_4 = dst_mod.Vec4(_parent=oabb, _root=oabb._root)
-    oabb.row_1.x = 1
-    oabb.row_1.y = 0
-    oabb.row_1.z = 0
-    oabb.row_1.w = 0
-    oabb.row_2.x = 0
-    oabb.row_2.y = 1
-    oabb.row_2.z = 0
-    oabb.row_2.w = 0
-    oabb.row_3.x = 0
-    oabb.row_3.y = 0
-    oabb.row_3.z = 1
-    oabb.row_3.w = 0
-    # TODO: dimension/length is wrongly calculated in vertex groups?
-    oabb.row_4.x = bsphere_export[0]
-    oabb.row_4.y = bsphere_export[1]
-    oabb.row_4.z = bsphere_export[2]
-    oabb.row_4.w = 1
+def _process_weights_for_export(num_influences, bone_indices, weights,
+                                max_bones_per_vertex=4, half_float=False):
+    """
+    Given the arrays of `get_bone_indices_and_weights_arrays`, with the number
+    of influences, bone indices and weights of each vertex, process them
+    to make them mtframework friendly:
+    1) Limit bone weights: keep only up to `max_bones` elements, discarding the pairs that have the
+       lowest inflUENCE. This is actually a limitation in albam for lack of
+       understanding on how the engine treats vertices with more than 4 bone influencing it
+    2) Normalize weights: make all weights sum up 1
+    3) float to byte: convert the (-1.0, 1.0) to (0, 255), or to the precision of the half floats
+       and shorts of 21x vertex formats
+    Return the same arrays with `max_bones_per_vertex` columns, influences sorted by weight
+    """
+    limit = max_bones_per_vertex
+    vertex_count = len(num_influences)
+    num_columns = max(bone_indices.shape[1], limit)
+    bone_indices = _pad_columns(bone_indices, num_columns)
+    weights = _pad_columns(np.ascontiguousarray(weights, dtype=np.float32), num_columns)
+
+    # limit max bones, with ties resolved as a stable sort would: positive floats
+    # sort like their bits, which leave room for the column as tie-breaker
+    columns = np.arange(num_columns)
+    shift = num_columns.bit_length()
+    weight_keys = weights.view(np.uint32).astype(np.int64) << shift
+    kept = np.argpartition(weight_keys | columns, num_columns - limit, axis=1)[:, num_columns - limit:]
+    kept_keys = np.take_along_axis(weight_keys, kept, axis=1) | (num_columns - kept)
+    kept = np.take_along_axis(kept, np.argsort(-kept_keys, axis=1), axis=1)
+    bone_indices = np.take_along_axis(bone_indices, kept, axis=1)
+    weights = np.take_along_axis(weights, kept, axis=1).astype(np.float64)
+    num_influences = np.minimum(num_influences, limit)
+
+    # normalize, adding weights up in order like sum() does
+    total_weight = np.zeros(vertex_count)
+    for column in weights.T:
+        total_weight = total_weight + column
+    has_weight = total_weight != 0
+    weights[has_weight] = _round_decimals(weights[has_weight] / total_weight[has_weight, None], 4)
+
+    if half_float:
+        if limit not in (1, 2):
+            weights[:, 0] = np.rint(weights[:, 0] * 32767) / 32767
+            if limit == 8:
+                weights[:, 1:5] = np.rint(weights[:, 1:5] * 255) / 255
+            i = limit - 4
+            weights[:, i + 1:i + 3] = weights[:, i + 1:i + 3].astype(np.float16)
+    else:
+        used = columns[:limit] < num_influences[:, None]
+        weights = np.where(used, np.rint(weights * 255), 0)
+        # can't have zero values
+        weights[used & (weights == 0)] = 1
+        # correct precision, on the heaviest weight
+        excess = weights.sum(axis=1) - 255
+        rows = np.flatnonzero((num_influences > 0) & (excess != 0))
+        weights[rows, np.argmax(weights[rows], axis=1)] -= excess[rows]
 
-    oabb_dimension = dst_mod.Vec4(_parent=wb, _root=wb._root)
-    # TODO: dimension/length is wrongly calculated in vertex groups?
-    oabb_dimension.x = length_x * 100
-    oabb_dimension.y = length_z * 100
-    oabb_dimension.z = length_y * 100
-    oabb_dimension.w = 0
+    return num_influences, bone_indices, weights
 
-    unk_01 = dst_mod.Vec3(_parent=wb, _root=wb._root)
-    unk_01.x = 0.0
-    unk_01.y = 0.0
-    unk_01.z = 0.0
 
-    wb.bone_id = 255  # since it's static
-    wb.unk_01 = unk_01
-    wb.bsphere = bsphere
-    wb.bbox_min = bbox_min
-    wb.bbox_max = bbox_max
-    wb.oabb = oabb
-    wb.oabb_dimension = oabb_dimension
+def _pad_columns(array, num_columns):
+    return np.pad(array, ((0, 0), (0, num_columns - array.shape[1])))
 
-    wb._check()
-    return wb
 
+def _round_decimals(values, decimals):
+    """
+    Same as python's `round(value, decimals)` for each value, which rounds
+    the exact decimal value. Near ties are left to `round`
+    """
+    scaled = values * 10 ** decimals
+    rounded = np.rint(scaled)
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    result = rounded / 10 ** decimals
+    result[near_tie] = [round(value, decimals) for value in values[near_tie].tolist()]
+    return result
 
-def _calculate_vertex_group_weight_bound(mesh_vertex_groups, armature, vertex_group, dst_mod, meshes_data):
-    vertices_in_group = mesh_vertex_groups.get(vertex_group.index)
-    if not vertices_in_group:
-        return
 
-    bone_index = armature.pose.bones.find(vertex_group.name)
-    pose_bone = armature.pose.bones[bone_index]
-    pose_bone_matrix = Matrix.Translation(pose_bone.head).inverted()
+def _calculate_weight_bounds(bl_obj, bl_mesh, dst_mod, meshes_data):
+    positions = get_vertices_array(bl_mesh.data)
+    if bl_obj.type != "ARMATURE":
+        _, bbox_min, bbox_max, radius = get_bounds_per_group(
+            positions, np.zeros(len(positions), dtype=np.int32))
+        return [_build_weight_bound(dst_mod, meshes_data, 255, bbox_min[0], bbox_max[0], radius[0])]
+
+    # sparse vertex -> vertex group matrix, in coordinate format
+    vertex_indices, bone_indices, _ = _get_vertex_groups_bone_arrays(bl_obj, bl_mesh)
+    vertex_indices = vertex_indices[bone_indices != -1]
+    bone_indices = bone_indices[bone_indices != -1]
+
+    # vertices to the space of the bones, with stacked inverted bone matrices
+    heads = np.empty(len(bl_obj.pose.bones) * 3, dtype=np.float32)
+    bl_obj.pose.bones.foreach_get("head", heads)
+    bone_matrices = np.tile(np.eye(4, dtype=np.float32), (len(bl_obj.pose.bones), 1, 1))
+    bone_matrices[:, :3, 3] = -heads.reshape(-1, 3)
+    matrices = bone_matrices[bone_indices]
+    positions = np.einsum("nij,nj->ni", matrices[:, :3, :3], positions[vertex_indices]) + matrices[:, :3, 3]
+
+    bone_ids, bbox_min, bbox_max, radius = get_bounds_per_group(positions, bone_indices)
+    return [
+        _build_weight_bound(dst_mod, meshes_data, bone_id, bbox_min[i], bbox_max[i], radius[i])
+        for i, bone_id in enumerate(bone_ids.tolist())
+    ]
 
-    vertices_in_group_bone_space = [
-        pose_bone_matrix @ v.co for v in vertices_in_group]
 
-    min_x = min((v[0] for v in vertices_in_group_bone_space))
-    min_y = min((v[1] for v in vertices_in_group_bone_space))
-    min_z = min((v[2] for v in vertices_in_group_bone_space))
-    max_x = max((v[0] for v in vertices_in_group_bone_space))
-    max_y = max((v[1] for v in vertices_in_group_bone_space))
-    max_z = max((v[2] for v in vertices_in_group_bone_space))
+def _build_weight_bound(dst_mod, meshes_data, bone_id, bbox_min, bbox_max, radius):
+    min_x, min_y, min_z = bbox_min.tolist()
+    max_x, max_y, max_z = bbox_max.tolist()
+    radius = float(radius)
 
     length_x = (max_x - min_x) / 2
     length_y = (max_y - min_y) / 2
@@ -1923,9 +2564,6 @@ def _calculate_vertex_group_weight_bound(mesh_vertex_groups, armature, vertex_gr
     center_x = (min_x + max_x) / 2
     center_y = (min_y + max_y) / 2
     center_z = (min_z + max_z) / 2
-    center = (center_x, center_y, center_z)
-    radius = max(map(lambda vertex: get_dist(
-        center, vertex[:]), vertices_in_group_bone_space))
     bsphere_export = (center_x * 100, center_z * 100, -
                       center_y * 100, radius * 100)
 
@@ -1945,6 +2583,7 @@ def _calculate_vertex_group_weight_bound(mesh_vertex_groups, armature, vertex_gr
         bsphere_export[0], bsphere_export[1], bsphere_export[2], 1
     ]
 
+    # TODO: dimension/length is wrongly calculated in vertex groups?
     oabb_dimension_export = (
         length_x * 100, length_z * 100, length_y * 100, 0.0)
 
@@ -2001,7 +2640,7 @@ def _calculate_vertex_group_weight_bound(mesh_vertex_groups, armature, vertex_gr
     unk_01.y = 0.0
     unk_01.z = 0.0
 
-    wb.bone_id = bone_index
+    wb.bone_id = bone_id
     wb.unk_01 = unk_01
     wb.bsphere = bsphere
     wb.bbox_min = bbox_min
@@ -2009,7 +2648,7 @@ def _calculate_vertex_group_weight_bound(mesh_vertex_groups, armature, vertex_gr
     wb.oabb = oabb
     wb.oabb_dimension = oabb_dimension
 
-    wb._check()
+    wb._check_element()
     return wb
 
 
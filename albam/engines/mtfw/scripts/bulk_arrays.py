@@ -0,0 +1,80 @@
+"""
+Post-process parsers generated by kaitai-struct-compiler so `repeat: expr`
+arrays of primitive types are read and written with a single
+`read_array` / `write_array` call instead of one call per element.
+Run it on the generated files after compiling the ksy files, e.g.:
+
+    python bulk_arrays.py albam/engines/mtfw/structs/*.py
+"""
+import re
+import sys
+
+STRUCT_FORMATS = {
+    "s1": "b", "u1": "B",
+    "s2": "h", "u2": "H",
+    "s4": "i", "u4": "I",
+    "s8": "q", "u8": "Q",
+    "f4": "f", "f8": "d",
+}
+
+PRIMITIVE = r"(?P<type>[suf][1248])(?P<endian>be|le)?"
+
+# self.x = []
+# for i in range(n):
+#     self.x.append(self._io.read_u2le())
+READ_LOOP = re.compile(
+    r"^(?P<indent> *)(?P<target>self\.\w+) = \[\]\n"
+    r"(?P=indent)for i in range\((?P<count>.+)\):\n"
+    r"(?P=indent)    (?P=target)\.append\(self\._io\.read_" + PRIMITIVE + r"\(\)\)\n"
+    r"(?!(?P=indent)    \S)",
+    re.MULTILINE,
+)
+
+# for i in range(len(self.x)):
+#     pass
+#     self._io.write_u2le(self.x[i])
+WRITE_LOOP = re.compile(
+    r"^(?P<indent> *)for i in range\(len\(self\.\w+\)\):\n"
+    r"(?P=indent)    pass\n"
+    r"(?P=indent)    self\._io\.write_" + PRIMITIVE + r"\((?P<target>self\.\w+)\[i\]\)\n"
+    r"(?!(?P=indent)    \S)",
+    re.MULTILINE,
+)
+
+
+def _get_format(match):
+    byte_order = ">" if match.group("endian") == "be" else "<"
+    return byte_order + STRUCT_FORMATS[match.group("type")]
+
+
+def _replace_read(match):
+    return '{indent}{target} = self._io.read_array("{fmt}", {count})\n'.format(
+        indent=match.group("indent"),
+        target=match.group("target"),
+        fmt=_get_format(match),
+        count=match.group("count"),
+    )
+
+
+def _replace_write(match):
+    return '{indent}self._io.write_array("{fmt}", {target})\n'.format(
+        indent=match.group("indent"),
+        target=match.group("target"),
+        fmt=_get_format(match),
+    )
+
+
+def bulk_arrays(source):
+    source, num_reads = READ_LOOP.subn(_replace_read, source)
+    source, num_writes = WRITE_LOOP.subn(_replace_write, source)
+    return source, num_reads, num_writes
+
+
+if __name__ == "__main__":
+    for filepath in sys.argv[1:]:
+        with open(filepath) as f:
+            source = f.read()
+        source, num_reads, num_writes = bulk_arrays(source)
+        with open(filepath, "w") as w:
+            w.write(source)
+        print(f"{filepath}: {num_reads} reads, {num_writes} writes")
@@ -0,0 +1,182 @@
+"""
+Post-process parsers generated by kaitai-struct-compiler so `repeat: expr`
+arrays of fixed size types are parsed on access with `read_lazy_array`:
+the parent only skips them, and each element is read the first time
+it's used. A type is considered fixed size when its `_read` only has
+reads of a known size (no switches, conditions or variable repeats).
+Run it on the generated files after compiling the ksy files, e.g.:
+
+    python lazy_arrays.py albam/engines/mtfw/structs/*.py
+"""
+import re
+import struct
+import sys
+
+CLASS_DEF = re.compile(r"^(?P<indent> *)class (?P<name>\w+)\(", re.MULTILINE)
+
+# self.x = []
+# for i in range(n):
+#     _t_x = Parser.Element(self._io, self, self._root)
+#     _t_x._read()
+#     self.x.append(_t_x)
+READ_LOOP = re.compile(
+    r"^(?P<indent> *)self\.(?P<name>\w+) = \[\]\n"
+    r"(?P=indent)for i in range\((?P<count>.+)\):\n"
+    r"(?P=indent)    _t_(?P=name) = (?P<cls>[\w.]+)\((?P<args>[^()]*)\)\n"
+    r"(?P=indent)    _t_(?P=name)\._read\(\)\n"
+    r"(?P=indent)    self\.(?P=name)\.append\(_t_(?P=name)\)\n"
+    r"(?!(?P=indent)    \S)",
+    re.MULTILINE,
+)
+
+ENUM = r"(?:KaitaiStream\.resolve_enum\([\w.]+, )?"
+READ_PRIMITIVE = re.compile(
+    r"self\.\w+ = " + ENUM + r"self\._io\.read_[suf](?P<size>[1248])(?:be|le)?\(\)\)?$")
+READ_BITS = re.compile(
+    r"self\.\w+ = " + ENUM + r"self\._io\.read_bits_int_(?:be|le)\((?P<bits>\d+)\)\)?(?: != 0)?$")
+READ_ARRAY = re.compile(r"self\.\w+ = self\._io\.read_array\(\"[<>](?P<fmt>\w)\", (?P<count>\d+)\)$")
+READ_BYTES = re.compile(r"self\.\w+ = self\._io\.read_bytes\((?P<size>\d+)\)$")
+READ_STRUCT = re.compile(r"self\.(?P<name>\w+) = (?P<cls>[\w.]+)\([^()]*\)$")
+READ_STRUCT_LOOP = re.compile(r"for i in range\((?P<count>\d+)\):$")
+VALIDATION = re.compile(r"if not \(?self\.\w+ == .*:$")
+
+
+def _get_classes(source):
+    """
+    Return the qualified name (e.g. `Mrl.Material`) and the `_read` body
+    lines of each generated class
+    """
+    matches = list(CLASS_DEF.finditer(source))
+    classes = {}
+    path = []
+    for i, match in enumerate(matches):
+        indent = len(match.group("indent"))
+        path = [p for p in path if p[0] < indent] + [(indent, match.group("name"))]
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(source)
+        lines = source[match.end():end].split("\n")
+        body = None
+        for line in lines:
+            if body is None:
+                if line == " " * (indent + 4) + "def _read(self):":
+                    body = []
+                continue
+            if line.strip() and not line.startswith(" " * (indent + 8)):
+                break
+            if line.strip():
+                body.append(line.strip())
+        classes[".".join(name for _, name in path)] = body
+    return classes
+
+
+def get_fixed_sizes(source):
+    """
+    Map the qualified name of each generated class to its size in bytes,
+    for the classes that always read the same amount of bytes
+    """
+    classes = _get_classes(source)
+    sizes = {}
+
+    def get_size(name, visiting=()):
+        if name in sizes:
+            return sizes[name]
+        body = classes.get(name)
+        if body is None or name in visiting:
+            return None
+        size = _get_body_size(body, lambda cls: get_size(cls, visiting + (name,)))
+        sizes[name] = size
+        return size
+
+    for name in classes:
+        get_size(name)
+    return {name: size for name, size in sizes.items() if size is not None}
+
+
+def _get_body_size(body, get_size):
+    num_bytes = 0
+    num_bits = 0
+    i = 0
+    while i < len(body):
+        line = body[i]
+        match = READ_BITS.match(line)
+        if match:
+            num_bits += int(match.group("bits"))
+            i += 1
+            continue
+        # any byte aligned read drops the bits left of the current byte
+        num_bytes += (num_bits + 7) // 8
+        num_bits = 0
+        size = None
+        match = (
+            READ_PRIMITIVE.match(line) or READ_ARRAY.match(line) or READ_BYTES.match(line)
+        )
+        struct_match = READ_STRUCT.match(line)
+        if match and "fmt" in match.groupdict():
+            size = struct.calcsize("<" + match.group("fmt")) * int(match.group("count"))
+        elif match:
+            size = int(match.group("size"))
+        elif line == "self._io.align_to_byte()":
+            size = 0
+        elif VALIDATION.match(line) and i + 1 < len(body) and body[i + 1].startswith("raise "):
+            size = 0
+            i += 1
+        elif struct_match and body[i + 1:i + 2] == [f"self.{struct_match.group('name')}._read()"]:
+            size = get_size(struct_match.group("cls"))
+            i += 1
+        elif READ_STRUCT_LOOP.match(body[i + 1] if i + 1 < len(body) else "") and len(body) > i + 4:
+            # fixed repeat of a struct, as in READ_LOOP with a literal count
+            loop = "\n".join(body[i:i + 5])
+            match = re.match(
+                r"self\.(?P<name>\w+) = \[\]\nfor i in range\((?P<count>\d+)\):\n"
+                r"_t_(?P=name) = (?P<cls>[\w.]+)\([^()]*\)\n_t_(?P=name)\._read\(\)\n"
+                r"self\.(?P=name)\.append\(_t_(?P=name)\)$", loop)
+            if match:
+                element_size = get_size(match.group("cls"))
+                if element_size is not None:
+                    size = element_size * int(match.group("count"))
+                i += 4
+        if size is None:
+            return None
+        num_bytes += size
+        i += 1
+    if num_bits % 8:
+        # the next element would start with the bits left
+        return None
+    return num_bytes + num_bits // 8
+
+
+def lazy_arrays(source):
+    """
+    Return the source with the fixed size arrays read lazily,
+    and the number of arrays replaced
+    """
+    sizes = get_fixed_sizes(source)
+    num_arrays = 0
+
+    def _replace_read(match):
+        nonlocal num_arrays
+        size = sizes.get(match.group("cls"))
+        # arrays with a literal count are small fixed parts of their parent
+        if size is None or match.group("count").isdigit():
+            return match.group(0)
+        num_arrays += 1
+        return "{indent}self.{name} = self._io.read_lazy_array({count}, {size}, {cls}, {args})\n".format(
+            indent=match.group("indent"),
+            name=match.group("name"),
+            count=match.group("count"),
+            size=size,
+            cls=match.group("cls"),
+            args=match.group("args"),
+        )
+
+    source = READ_LOOP.sub(_replace_read, source)
+    return source, num_arrays
+
+
+if __name__ == "__main__":
+    for filepath in sys.argv[1:]:
+        with open(filepath) as f:
+            source = f.read()
+        source, num_arrays = lazy_arrays(source)
+        with open(filepath, "w") as w:
+            w.write(source)
+        print(f"{filepath}: {num_arrays} lazy arrays")
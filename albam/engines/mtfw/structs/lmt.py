@@ -82,19 +82,13 @@ class Lmt(KaitaiStruct):
             self.ofs_frame = self._io.read_u4le()
             self.num_tracks = self._io.read_u4le()
             self.num_frames = self._io.read_u4le()
-            self.unk_01 = []
-            for i in range(9):
-                self.unk_01.append(self._io.read_f4le())
+            self.unk_01 = self._io.read_array("<f", 9)
 
-            self.unk_02 = []
-            for i in range(16):
-                self.unk_02.append(self._io.read_u4le())
+            self.unk_02 = self._io.read_array("<I", 16)
 
             self.count_01 = self._io.read_u4le()
             self.ofs_buffer_01 = self._io.read_u4le()
-            self.sfx = []
-            for i in range(32):
-                self.sfx.append(self._io.read_u2le())
+            self.sfx = self._io.read_array("<H", 32)
 
             self.count_02 = self._io.read_u4le()
             self.ofs_buffer_02 = self._io.read_u4le()
@@ -169,9 +163,7 @@ class Lmt(KaitaiStruct):
             self.unk_01 = self._io.read_f4le()
             self.len_data = self._io.read_u4le()
             self.ofs_data = self._io.read_u4le()
-            self.unk_reference_data = []
-            for i in range(4):
-                self.unk_reference_data.append(self._io.read_f4le())
+            self.unk_reference_data = self._io.read_array("<f", 4)
 
 
         @property
@@ -194,9 +186,7 @@ class Lmt(KaitaiStruct):
             self._read()
 
         def _read(self):
-            self.unk_00 = []
-            for i in range(8):
-                self.unk_00.append(self._io.read_f4le())
+            self.unk_00 = self._io.read_array("<f", 8)
 
 
 
@@ -247,9 +237,7 @@ class Lmt(KaitaiStruct):
             self.weight = self._io.read_f4le()
             self.len_data = self._io.read_u4le()
             self.ofs_data = self._io.read_u4le()
-            self.unk_reference_data = []
-            for i in range(4):
-                self.unk_reference_data.append(self._io.read_f4le())
+            self.unk_reference_data = self._io.read_array("<f", 4)
 
             self.ofs_floats = Lmt.OfsFloatBuff(self._io, self, self._root)
 
@@ -277,9 +265,7 @@ class Lmt(KaitaiStruct):
             self.num_tracks = self._io.read_u4le()
             self.num_frames = self._io.read_u4le()
             self.loop_frame = self._io.read_u4le()
-            self.unk_floats = []
-            for i in range(8):
-                self.unk_floats.append(self._io.read_f4le())
+            self.unk_floats = self._io.read_array("<f", 8)
 
             self.unk_00 = self._io.read_u4le()
             self.ofs_buffer_1 = self._io.read_u4le()
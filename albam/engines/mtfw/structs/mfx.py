@@ -110,9 +110,7 @@ class Mfx(KaitaiStruct):
             self.base_off = self._io.read_bits_int_le(9)
             self.instancing = self._io.read_bits_int_le(1) != 0
             self._io.align_to_byte()
-            self.unk_02 = []
-            for i in range(5):
-                self.unk_02.append(self._io.read_u4le())
+            self.unk_02 = self._io.read_array("<I", 5)
 
 
         @property
@@ -136,9 +134,7 @@ class Mfx(KaitaiStruct):
 
         def _read(self):
             self.offset_name = self._io.read_u4le()
-            self.unk_00 = []
-            for i in range(2):
-                self.unk_00.append(self._io.read_u2le())
+            self.unk_00 = self._io.read_array("<H", 2)
 
             self.base_off = self._io.read_bits_int_le(4)
             self.count = self._io.read_bits_int_le(4)
@@ -43,23 +43,11 @@ class Mod156(ReadWriteKaitaiStruct):
         self.model_info._read()
         self.rcn_header = Mod156.RcnHeader(self._io, self, self._root)
         self.rcn_header._read()
-        self.rcn_tables = []
-        for i in range(self.rcn_header.num_tbl):
-            _t_rcn_tables = Mod156.RcnTable(self._io, self, self._root)
-            _t_rcn_tables._read()
-            self.rcn_tables.append(_t_rcn_tables)
+        self.rcn_tables = self._io.read_lazy_array(self.rcn_header.num_tbl, 4, Mod156.RcnTable, self._io, self, self._root)
 
-        self.rcn_vertices = []
-        for i in range(self.rcn_header.num_vtx):
-            _t_rcn_vertices = Mod156.RcnVertex(self._io, self, self._root)
-            _t_rcn_vertices._read()
-            self.rcn_vertices.append(_t_rcn_vertices)
+        self.rcn_vertices = self._io.read_lazy_array(self.rcn_header.num_vtx, 16, Mod156.RcnVertex, self._io, self, self._root)
 
-        self.rcn_trianlges = []
-        for i in range(self.rcn_header.num_tri):
-            _t_rcn_trianlges = Mod156.RcnTriangle(self._io, self, self._root)
-            _t_rcn_trianlges._read()
-            self.rcn_trianlges.append(_t_rcn_trianlges)
+        self.rcn_trianlges = self._io.read_lazy_array(self.rcn_header.num_tri, 8, Mod156.RcnTriangle, self._io, self, self._root)
 
 
 
@@ -239,9 +227,7 @@ class Mod156(ReadWriteKaitaiStruct):
 
         def _read(self):
             self.unk_01 = self._io.read_u4le()
-            self.indices = []
-            for i in range(32):
-                self.indices.append(self._io.read_u1())
+            self.indices = self._io.read_array("<B", 32)
 
 
 
@@ -255,9 +241,7 @@ class Mod156(ReadWriteKaitaiStruct):
         def _write__seq(self, io=None):
             super(Mod156.BonePalette, self)._write__seq(io)
             self._io.write_u4le(self.unk_01)
-            for i in range(len(self.indices)):
-                pass
-                self._io.write_u1(self.indices[i])
+            self._io.write_array("<B", self.indices)
 
 
 
@@ -397,13 +381,9 @@ class Mod156(ReadWriteKaitaiStruct):
         def _read(self):
             self.position = Mod156.Vec4S2(self._io, self, self._root)
             self.position._read()
-            self.bone_indices = []
-            for i in range(4):
-                self.bone_indices.append(self._io.read_u1())
+            self.bone_indices = self._io.read_array("<B", 4)
 
-            self.weight_values = []
-            for i in range(4):
-                self.weight_values.append(self._io.read_u1())
+            self.weight_values = self._io.read_array("<B", 4)
 
             self.normal = Mod156.Vec4U1(self._io, self, self._root)
             self.normal._read()
@@ -433,13 +413,9 @@ class Mod156(ReadWriteKaitaiStruct):
         def _write__seq(self, io=None):
             super(Mod156.VfSkin, self)._write__seq(io)
             self.position._write__seq(self._io)
-            for i in range(len(self.bone_indices)):
-                pass
-                self._io.write_u1(self.bone_indices[i])
+            self._io.write_array("<B", self.bone_indices)
 
-            for i in range(len(self.weight_values)):
-                pass
-                self._io.write_u1(self.weight_values[i])
+            self._io.write_array("<B", self.weight_values)
 
             self.normal._write__seq(self._io)
             self.tangent._write__seq(self._io)
@@ -787,18 +763,10 @@ class Mod156(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.meshes = []
-            for i in range(self._root.header.num_meshes):
-                _t_meshes = Mod156.Mesh(self._io, self, self._root)
-                _t_meshes._read()
-                self.meshes.append(_t_meshes)
+            self.meshes = self._io.read_lazy_array(self._root.header.num_meshes, 52, Mod156.Mesh, self._io, self, self._root)
 
             self.num_weight_bounds = self._io.read_u4le()
-            self.weight_bounds = []
-            for i in range(self.num_weight_bounds):
-                _t_weight_bounds = Mod156.WeightBound(self._io, self, self._root)
-                _t_weight_bounds._read()
-                self.weight_bounds.append(_t_weight_bounds)
+            self.weight_bounds = self._io.read_lazy_array(self.num_weight_bounds, 144, Mod156.WeightBound, self._io, self, self._root)
 
 
 
@@ -1012,9 +980,7 @@ class Mod156(ReadWriteKaitaiStruct):
 
             _pos = self._io.pos()
             self._io.seek(((self._root.header.offset_index_buffer + (self.face_offset * 2)) + (self.face_position * 2)))
-            self._m_indices = []
-            for i in range(self.num_indices):
-                self._m_indices.append(self._io.read_u2le())
+            self._m_indices = self._io.read_array("<H", self.num_indices)
 
             self._io.seek(_pos)
             return getattr(self, '_m_indices', None)
@@ -1027,9 +993,7 @@ class Mod156(ReadWriteKaitaiStruct):
             self._should_write_indices = False
             _pos = self._io.pos()
             self._io.seek(((self._root.header.offset_index_buffer + (self.face_offset * 2)) + (self.face_position * 2)))
-            for i in range(len(self._m_indices)):
-                pass
-                self._io.write_u2le(self.indices[i])
+            self._io.write_array("<H", self.indices)
 
             self._io.seek(_pos)
 
@@ -1308,25 +1272,17 @@ class Mod156(ReadWriteKaitaiStruct):
             self.detailmap = self._io.read_u4le()
             self.occlusionmap = self._io.read_u4le()
             self.transparency = self._io.read_f4le()
-            self.fresnel_factor = []
-            for i in range(4):
-                self.fresnel_factor.append(self._io.read_f4le())
+            self.fresnel_factor = self._io.read_array("<f", 4)
 
-            self.lightmap_factor = []
-            for i in range(4):
-                self.lightmap_factor.append(self._io.read_f4le())
+            self.lightmap_factor = self._io.read_array("<f", 4)
 
-            self.detail_factor = []
-            for i in range(4):
-                self.detail_factor.append(self._io.read_f4le())
+            self.detail_factor = self._io.read_array("<f", 4)
 
             self.reserved1 = self._io.read_u4le()
             self.reserved2 = self._io.read_u4le()
             self.lightblendmap = self._io.read_u4le()
             self.shadowblendmap = self._io.read_u4le()
-            self.parallax_factor = []
-            for i in range(2):
-                self.parallax_factor.append(self._io.read_f4le())
+            self.parallax_factor = self._io.read_array("<f", 2)
 
             self.flip_binormal = self._io.read_f4le()
             self.heightmap_occ = self._io.read_f4le()
@@ -1384,25 +1340,17 @@ class Mod156(ReadWriteKaitaiStruct):
             self._io.write_u4le(self.detailmap)
             self._io.write_u4le(self.occlusionmap)
             self._io.write_f4le(self.transparency)
-            for i in range(len(self.fresnel_factor)):
-                pass
-                self._io.write_f4le(self.fresnel_factor[i])
+            self._io.write_array("<f", self.fresnel_factor)
 
-            for i in range(len(self.lightmap_factor)):
-                pass
-                self._io.write_f4le(self.lightmap_factor[i])
+            self._io.write_array("<f", self.lightmap_factor)
 
-            for i in range(len(self.detail_factor)):
-                pass
-                self._io.write_f4le(self.detail_factor[i])
+            self._io.write_array("<f", self.detail_factor)
 
             self._io.write_u4le(self.reserved1)
             self._io.write_u4le(self.reserved2)
             self._io.write_u4le(self.lightblendmap)
             self._io.write_u4le(self.shadowblendmap)
-            for i in range(len(self.parallax_factor)):
-                pass
-                self._io.write_f4le(self.parallax_factor[i])
+            self._io.write_array("<f", self.parallax_factor)
 
             self._io.write_f4le(self.flip_binormal)
             self._io.write_f4le(self.heightmap_occ)
@@ -1679,11 +1627,7 @@ class Mod156(ReadWriteKaitaiStruct):
             for i in range(self._root.header.num_textures):
                 self.textures.append((KaitaiStream.bytes_terminate(self._io.read_bytes(64), 0, False)).decode("ASCII"))
 
-            self.materials = []
-            for i in range(self._root.header.num_materials):
-                _t_materials = Mod156.Material(self._io, self, self._root)
-                _t_materials._read()
-                self.materials.append(_t_materials)
+            self.materials = self._io.read_lazy_array(self._root.header.num_materials, 160, Mod156.Material, self._io, self, self._root)
 
 
 
@@ -1780,13 +1724,9 @@ class Mod156(ReadWriteKaitaiStruct):
         def _read(self):
             self.position = Mod156.Vec4S2(self._io, self, self._root)
             self.position._read()
-            self.bone_indices = []
-            for i in range(8):
-                self.bone_indices.append(self._io.read_u1())
+            self.bone_indices = self._io.read_array("<B", 8)
 
-            self.weight_values = []
-            for i in range(8):
-                self.weight_values.append(self._io.read_u1())
+            self.weight_values = self._io.read_array("<B", 8)
 
             self.normal = Mod156.Vec4U1(self._io, self, self._root)
             self.normal._read()
@@ -1810,13 +1750,9 @@ class Mod156(ReadWriteKaitaiStruct):
         def _write__seq(self, io=None):
             super(Mod156.VfSkinEx, self)._write__seq(io)
             self.position._write__seq(self._io)
-            for i in range(len(self.bone_indices)):
-                pass
-                self._io.write_u1(self.bone_indices[i])
+            self._io.write_array("<B", self.bone_indices)
 
-            for i in range(len(self.weight_values)):
-                pass
-                self._io.write_u1(self.weight_values[i])
+            self._io.write_array("<B", self.weight_values)
 
             self.normal._write__seq(self._io)
             self.uv._write__seq(self._io)
@@ -1855,33 +1791,17 @@ class Mod156(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.bones_hierarchy = []
-            for i in range(self._root.header.num_bones):
-                _t_bones_hierarchy = Mod156.Bone(self._io, self, self._root)
-                _t_bones_hierarchy._read()
-                self.bones_hierarchy.append(_t_bones_hierarchy)
-
-            self.parent_space_matrices = []
-            for i in range(self._root.header.num_bones):
-                _t_parent_space_matrices = Mod156.Matrix4x4(self._io, self, self._root)
-                _t_parent_space_matrices._read()
-                self.parent_space_matrices.append(_t_parent_space_matrices)
-
-            self.inverse_bind_matrices = []
-            for i in range(self._root.header.num_bones):
-                _t_inverse_bind_matrices = Mod156.Matrix4x4(self._io, self, self._root)
-                _t_inverse_bind_matrices._read()
-                self.inverse_bind_matrices.append(_t_inverse_bind_matrices)
+            self.bones_hierarchy = self._io.read_lazy_array(self._root.header.num_bones, 24, Mod156.Bone, self._io, self, self._root)
+
+            self.parent_space_matrices = self._io.read_lazy_array(self._root.header.num_bones, 64, Mod156.Matrix4x4, self._io, self, self._root)
+
+            self.inverse_bind_matrices = self._io.read_lazy_array(self._root.header.num_bones, 64, Mod156.Matrix4x4, self._io, self, self._root)
 
             if (self._root.header.num_bones != 0):
                 pass
                 self.bone_map = self._io.read_bytes(256)
 
-            self.bone_palettes = []
-            for i in range(self._root.header.num_bone_palettes):
-                _t_bone_palettes = Mod156.BonePalette(self._io, self, self._root)
-                _t_bone_palettes._read()
-                self.bone_palettes.append(_t_bone_palettes)
+            self.bone_palettes = self._io.read_lazy_array(self._root.header.num_bone_palettes, 36, Mod156.BonePalette, self._io, self, self._root)
 
 
 
@@ -2108,9 +2028,7 @@ class Mod156(ReadWriteKaitaiStruct):
 
         def _read(self):
             self.group_index = self._io.read_u4le()
-            self.reserved = []
-            for i in range(3):
-                self.reserved.append(self._io.read_u4le())
+            self.reserved = self._io.read_array("<I", 3)
 
             self.pos = Mod156.Vec3(self._io, self, self._root)
             self.pos._read()
@@ -2128,9 +2046,7 @@ class Mod156(ReadWriteKaitaiStruct):
         def _write__seq(self, io=None):
             super(Mod156.Group, self)._write__seq(io)
             self._io.write_u4le(self.group_index)
-            for i in range(len(self.reserved)):
-                pass
-                self._io.write_u4le(self.reserved[i])
+            self._io.write_array("<I", self.reserved)
 
             self.pos._write__seq(self._io)
             self._io.write_f4le(self.radius)
@@ -2431,11 +2347,7 @@ class Mod156(ReadWriteKaitaiStruct):
 
         _pos = self._io.pos()
         self._io.seek(self.header.offset_groups)
-        self._m_groups = []
-        for i in range(self.header.num_groups):
-            _t__m_groups = Mod156.Group(self._io, self, self._root)
-            _t__m_groups._read()
-            self._m_groups.append(_t__m_groups)
+        self._m_groups = self._io.read_lazy_array(self.header.num_groups, 32, Mod156.Group, self._io, self, self._root)
 
         self._io.seek(_pos)
         return getattr(self, '_m_groups', None)
@@ -390,9 +390,7 @@ class Mod21(ReadWriteKaitaiStruct):
         def _read(self):
             self.position = Mod21.Vec3S2(self._io, self, self._root)
             self.position._read()
-            self.bone_indices = []
-            for i in range(1):
-                self.bone_indices.append(self._io.read_u2le())
+            self.bone_indices = self._io.read_array("<H", 1)
 
             self.normal = Mod21.Vec3U1(self._io, self, self._root)
             self.normal._read()
@@ -417,9 +415,7 @@ class Mod21(ReadWriteKaitaiStruct):
         def _write__seq(self, io=None):
             super(Mod21.VertexA8fa, self)._write__seq(io)
             self.position._write__seq(self._io)
-            for i in range(len(self.bone_indices)):
-                pass
-                self._io.write_u2le(self.bone_indices[i])
+            self._io.write_array("<H", self.bone_indices)
 
             self.normal._write__seq(self._io)
             self._io.write_u1(self.occlusion)
@@ -498,9 +494,7 @@ class Mod21(ReadWriteKaitaiStruct):
         def _read(self):
             self.position = Mod21.Vec3S2(self._io, self, self._root)
             self.position._read()
-            self.bone_indices = []
-            for i in range(1):
-                self.bone_indices.append(self._io.read_u2le())
+            self.bone_indices = self._io.read_array("<H", 1)
 
             self.normal = Mod21.Vec4U1(self._io, self, self._root)
             self.normal._read()
@@ -518,9 +512,7 @@ class Mod21(ReadWriteKaitaiStruct):
         def _write__seq(self, io=None):
             super(Mod21.VertexB098, self)._write__seq(io)
             self.position._write__seq(self._io)
-            for i in range(len(self.bone_indices)):
-                pass
-                self._io.write_u2le(self.bone_indices[i])
+            self._io.write_array("<H", self.bone_indices)
 
             self.normal._write__seq(self._io)
 
@@ -706,13 +698,9 @@ class Mod21(ReadWriteKaitaiStruct):
             self.normal = Mod21.Vec3U1(self._io, self, self._root)
             self.normal._read()
             self.occlusion = self._io.read_u1()
-            self.weight_values = []
-            for i in range(4):
-                self.weight_values.append(self._io.read_u1())
+            self.weight_values = self._io.read_array("<B", 4)
 
-            self.bone_indices = []
-            for i in range(8):
-                self.bone_indices.append(self._io.read_u1())
+            self.bone_indices = self._io.read_array("<B", 8)
 
             self.uv = Mod21.Vec2HalfFloat(self._io, self, self._root)
             self.uv._read()
@@ -746,13 +734,9 @@ class Mod21(ReadWriteKaitaiStruct):
             self.position._write__seq(self._io)
             self.normal._write__seq(self._io)
             self._io.write_u1(self.occlusion)
-            for i in range(len(self.weight_values)):
-                pass
-                self._io.write_u1(self.weight_values[i])
+            self._io.write_array("<B", self.weight_values)
 
-            for i in range(len(self.bone_indices)):
-                pass
-                self._io.write_u1(self.bone_indices[i])
+            self._io.write_array("<B", self.bone_indices)
 
             self.uv._write__seq(self._io)
             for i in range(len(self.weight_values2)):
@@ -818,9 +802,7 @@ class Mod21(ReadWriteKaitaiStruct):
         def _read(self):
             self.position = Mod21.Vec3S2(self._io, self, self._root)
             self.position._read()
-            self.bone_indices = []
-            for i in range(1):
-                self.bone_indices.append(self._io.read_u2le())
+            self.bone_indices = self._io.read_array("<H", 1)
 
             self.normal = Mod21.Vec3U1(self._io, self, self._root)
             self.normal._read()
@@ -854,9 +836,7 @@ class Mod21(ReadWriteKaitaiStruct):
         def _write__seq(self, io=None):
             super(Mod21.VertexD877, self)._write__seq(io)
             self.position._write__seq(self._io)
-            for i in range(len(self.bone_indices)):
-                pass
-                self._io.write_u2le(self.bone_indices[i])
+            self._io.write_array("<H", self.bone_indices)
 
             self.normal._write__seq(self._io)
             self._io.write_u1(self.occlusion)
@@ -926,13 +906,9 @@ class Mod21(ReadWriteKaitaiStruct):
             self.normal = Mod21.Vec3U1(self._io, self, self._root)
             self.normal._read()
             self.occlusion = self._io.read_u1()
-            self.weight_values = []
-            for i in range(4):
-                self.weight_values.append(self._io.read_u1())
+            self.weight_values = self._io.read_array("<B", 4)
 
-            self.bone_indices = []
-            for i in range(8):
-                self.bone_indices.append(self._io.read_u1())
+            self.bone_indices = self._io.read_array("<B", 8)
 
             self.uv = Mod21.Vec2HalfFloat(self._io, self, self._root)
             self.uv._read()
@@ -969,13 +945,9 @@ class Mod21(ReadWriteKaitaiStruct):
             self.position._write__seq(self._io)
             self.normal._write__seq(self._io)
             self._io.write_u1(self.occlusion)
-            for i in range(len(self.weight_values)):
-                pass
-                self._io.write_u1(self.weight_values[i])
+            self._io.write_array("<B", self.weight_values)
 
-            for i in range(len(self.bone_indices)):
-                pass
-                self._io.write_u1(self.bone_indices[i])
+            self._io.write_array("<B", self.bone_indices)
 
             self.uv._write__seq(self._io)
             for i in range(len(self.weight_values2)):
@@ -1051,9 +1023,7 @@ class Mod21(ReadWriteKaitaiStruct):
             self.occlusion = self._io.read_u1()
             self.tangent = Mod21.Vec4U1(self._io, self, self._root)
             self.tangent._read()
-            self.bone_indices = []
-            for i in range(4):
-                self.bone_indices.append(self._io.read_u1())
+            self.bone_indices = self._io.read_array("<B", 4)
 
             self.uv = Mod21.Vec2HalfFloat(self._io, self, self._root)
             self.uv._read()
@@ -1092,9 +1062,7 @@ class Mod21(ReadWriteKaitaiStruct):
             self.normal._write__seq(self._io)
             self._io.write_u1(self.occlusion)
             self.tangent._write__seq(self._io)
-            for i in range(len(self.bone_indices)):
-                pass
-                self._io.write_u1(self.bone_indices[i])
+            self._io.write_array("<B", self.bone_indices)
 
             self.uv._write__seq(self._io)
             for i in range(len(self.weight_values)):
@@ -1250,9 +1218,7 @@ class Mod21(ReadWriteKaitaiStruct):
         def _read(self):
             self.position = Mod21.Vec3S2(self._io, self, self._root)
             self.position._read()
-            self.bone_indices = []
-            for i in range(1):
-                self.bone_indices.append(self._io.read_u2le())
+            self.bone_indices = self._io.read_array("<H", 1)
 
             self.normal = Mod21.Vec3U1(self._io, self, self._root)
             self.normal._read()
@@ -1280,9 +1246,7 @@ class Mod21(ReadWriteKaitaiStruct):
         def _write__seq(self, io=None):
             super(Mod21.Vertex667b, self)._write__seq(io)
             self.position._write__seq(self._io)
-            for i in range(len(self.bone_indices)):
-                pass
-                self._io.write_u2le(self.bone_indices[i])
+            self._io.write_array("<H", self.bone_indices)
 
             self.normal._write__seq(self._io)
             self._io.write_u1(self.occlusion)
@@ -1344,9 +1308,7 @@ class Mod21(ReadWriteKaitaiStruct):
             self.occlusion = self._io.read_u1()
             self.tangent = Mod21.Vec4U1(self._io, self, self._root)
             self.tangent._read()
-            self.bone_indices = []
-            for i in range(4):
-                self.bone_indices.append(self._io.read_u1())
+            self.bone_indices = self._io.read_array("<B", 4)
 
             self.uv = Mod21.Vec2HalfFloat(self._io, self, self._root)
             self.uv._read()
@@ -1379,9 +1341,7 @@ class Mod21(ReadWriteKaitaiStruct):
             self.normal._write__seq(self._io)
             self._io.write_u1(self.occlusion)
             self.tangent._write__seq(self._io)
-            for i in range(len(self.bone_indices)):
-                pass
-                self._io.write_u1(self.bone_indices[i])
+            self._io.write_array("<B", self.bone_indices)
 
             self.uv._write__seq(self._io)
             for i in range(len(self.weight_values)):
@@ -1919,9 +1879,7 @@ class Mod21(ReadWriteKaitaiStruct):
             self.occlusion = self._io.read_u1()
             self.tangent = Mod21.Vec4U1(self._io, self, self._root)
             self.tangent._read()
-            self.bone_indices = []
-            for i in range(4):
-                self.bone_indices.append(self._io.read_u1())
+            self.bone_indices = self._io.read_array("<B", 4)
 
             self.uv = Mod21.Vec2HalfFloat(self._io, self, self._root)
             self.uv._read()
@@ -1975,9 +1933,7 @@ class Mod21(ReadWriteKaitaiStruct):
             self.normal._write__seq(self._io)
             self._io.write_u1(self.occlusion)
             self.tangent._write__seq(self._io)
-            for i in range(len(self.bone_indices)):
-                pass
-                self._io.write_u1(self.bone_indices[i])
+            self._io.write_array("<B", self.bone_indices)
 
             self.uv._write__seq(self._io)
             for i in range(len(self.weight_values)):
@@ -2287,13 +2243,9 @@ class Mod21(ReadWriteKaitaiStruct):
             self.normal = Mod21.Vec3U1(self._io, self, self._root)
             self.normal._read()
             self.occlusion = self._io.read_u1()
-            self.weight_values = []
-            for i in range(4):
-                self.weight_values.append(self._io.read_u1())
+            self.weight_values = self._io.read_array("<B", 4)
 
-            self.bone_indices = []
-            for i in range(8):
-                self.bone_indices.append(self._io.read_u1())
+            self.bone_indices = self._io.read_array("<B", 8)
 
             self.uv = Mod21.Vec2HalfFloat(self._io, self, self._root)
             self.uv._read()
@@ -2330,13 +2282,9 @@ class Mod21(ReadWriteKaitaiStruct):
             self.position._write__seq(self._io)
             self.normal._write__seq(self._io)
             self._io.write_u1(self.occlusion)
-            for i in range(len(self.weight_values)):
-                pass
-                self._io.write_u1(self.weight_values[i])
+            self._io.write_array("<B", self.weight_values)
 
-            for i in range(len(self.bone_indices)):
-                pass
-                self._io.write_u1(self.bone_indices[i])
+            self._io.write_array("<B", self.bone_indices)
 
             self.uv._write__seq(self._io)
             for i in range(len(self.weight_values2)):
@@ -2407,9 +2355,7 @@ class Mod21(ReadWriteKaitaiStruct):
         def _read(self):
             self.position = Mod21.Vec3S2(self._io, self, self._root)
             self.position._read()
-            self.bone_indices = []
-            for i in range(1):
-                self.bone_indices.append(self._io.read_u2le())
+            self.bone_indices = self._io.read_array("<H", 1)
 
             self.normal = Mod21.Vec3U1(self._io, self, self._root)
             self.normal._read()
@@ -2437,9 +2383,7 @@ class Mod21(ReadWriteKaitaiStruct):
         def _write__seq(self, io=None):
             super(Mod21.VertexCbf6, self)._write__seq(io)
             self.position._write__seq(self._io)
-            for i in range(len(self.bone_indices)):
-                pass
-                self._io.write_u2le(self.bone_indices[i])
+            self._io.write_array("<H", self.bone_indices)
 
             self.normal._write__seq(self._io)
             self._io.write_u1(self.occlusion)
@@ -2523,21 +2467,13 @@ class Mod21(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.meshes = []
-            for i in range(self._root.header.num_meshes):
-                _t_meshes = Mod21.Mesh(self._io, self, self._root)
-                _t_meshes._read()
-                self.meshes.append(_t_meshes)
+            self.meshes = self._io.read_lazy_array(self._root.header.num_meshes, 48, Mod21.Mesh, self._io, self, self._root)
 
             if (self._root.header.version == 211):
                 pass
                 self.num_weight_bounds = self._io.read_u4le()
 
-            self.weight_bounds = []
-            for i in range((self._root.num_weight_bounds if  (((self._root.header.version == 210)) or ((self._root.header.version == 212)))  else self.num_weight_bounds)):
-                _t_weight_bounds = Mod21.WeightBound(self._io, self, self._root)
-                _t_weight_bounds._read()
-                self.weight_bounds.append(_t_weight_bounds)
+            self.weight_bounds = self._io.read_lazy_array((self._root.num_weight_bounds if  (((self._root.header.version == 210)) or ((self._root.header.version == 212)))  else self.num_weight_bounds), 144, Mod21.WeightBound, self._io, self, self._root)
 
 
 
@@ -2712,9 +2648,7 @@ class Mod21(ReadWriteKaitaiStruct):
             self.occlusion = self._io.read_u1()
             self.tangent = Mod21.Vec4U1(self._io, self, self._root)
             self.tangent._read()
-            self.bone_indices = []
-            for i in range(4):
-                self.bone_indices.append(self._io.read_u1())
+            self.bone_indices = self._io.read_array("<B", 4)
 
             self.uv = Mod21.Vec2HalfFloat(self._io, self, self._root)
             self.uv._read()
@@ -2744,9 +2678,7 @@ class Mod21(ReadWriteKaitaiStruct):
             self.normal._write__seq(self._io)
             self._io.write_u1(self.occlusion)
             self.tangent._write__seq(self._io)
-            for i in range(len(self.bone_indices)):
-                pass
-                self._io.write_u1(self.bone_indices[i])
+            self._io.write_array("<B", self.bone_indices)
 
             self.uv._write__seq(self._io)
             for i in range(len(self.weight_values)):
@@ -3023,9 +2955,7 @@ class Mod21(ReadWriteKaitaiStruct):
 
             _pos = self._io.pos()
             self._io.seek(((self._root.header.offset_index_buffer + (self.face_offset * 2)) + (self.face_position * 2)))
-            self._m_indices = []
-            for i in range(self.num_indices):
-                self._m_indices.append(self._io.read_u2le())
+            self._m_indices = self._io.read_array("<H", self.num_indices)
 
             self._io.seek(_pos)
             return getattr(self, '_m_indices', None)
@@ -3038,9 +2968,7 @@ class Mod21(ReadWriteKaitaiStruct):
             self._should_write_indices = False
             _pos = self._io.pos()
             self._io.seek(((self._root.header.offset_index_buffer + (self.face_offset * 2)) + (self.face_position * 2)))
-            for i in range(len(self._m_indices)):
-                pass
-                self._io.write_u2le(self.indices[i])
+            self._io.write_array("<H", self.indices)
 
             self._io.seek(_pos)
 
@@ -4027,9 +3955,7 @@ class Mod21(ReadWriteKaitaiStruct):
             self.position._read()
             self.normal = Mod21.Vec4U1(self._io, self, self._root)
             self.normal._read()
-            self.bone_indices = []
-            for i in range(4):
-                self.bone_indices.append(self._io.read_u1())
+            self.bone_indices = self._io.read_array("<B", 4)
 
 
 
@@ -4046,9 +3972,7 @@ class Mod21(ReadWriteKaitaiStruct):
             super(Mod21.VertexDb7d, self)._write__seq(io)
             self.position._write__seq(self._io)
             self.normal._write__seq(self._io)
-            for i in range(len(self.bone_indices)):
-                pass
-                self._io.write_u1(self.bone_indices[i])
+            self._io.write_array("<B", self.bone_indices)
 
 
 
@@ -4226,9 +4150,7 @@ class Mod21(ReadWriteKaitaiStruct):
         def _read(self):
             self.unk_01 = self._io.read_u2le()
             self.unk_02 = self._io.read_u2le()
-            self.unk_floats = []
-            for i in range(30):
-                self.unk_floats.append(self._io.read_f4le())
+            self.unk_floats = self._io.read_array("<f", 30)
 
 
 
@@ -4243,9 +4165,7 @@ class Mod21(ReadWriteKaitaiStruct):
             super(Mod21.Material, self)._write__seq(io)
             self._io.write_u2le(self.unk_01)
             self._io.write_u2le(self.unk_02)
-            for i in range(len(self.unk_floats)):
-                pass
-                self._io.write_f4le(self.unk_floats[i])
+            self._io.write_array("<f", self.unk_floats)
 
 
 
@@ -4438,13 +4358,9 @@ class Mod21(ReadWriteKaitaiStruct):
         def _read(self):
             self.position = Mod21.Vec4S2(self._io, self, self._root)
             self.position._read()
-            self.bone_indices = []
-            for i in range(8):
-                self.bone_indices.append(self._io.read_u1())
+            self.bone_indices = self._io.read_array("<B", 8)
 
-            self.weight_values = []
-            for i in range(8):
-                self.weight_values.append(self._io.read_u1())
+            self.weight_values = self._io.read_array("<B", 8)
 
             self.normal = Mod21.Vec4U1(self._io, self, self._root)
             self.normal._read()
@@ -4465,13 +4381,9 @@ class Mod21(ReadWriteKaitaiStruct):
         def _write__seq(self, io=None):
             super(Mod21.VertexA320, self)._write__seq(io)
             self.position._write__seq(self._io)
-            for i in range(len(self.bone_indices)):
-                pass
-                self._io.write_u1(self.bone_indices[i])
+            self._io.write_array("<B", self.bone_indices)
 
-            for i in range(len(self.weight_values)):
-                pass
-                self._io.write_u1(self.weight_values[i])
+            self._io.write_array("<B", self.weight_values)
 
             self.normal._write__seq(self._io)
 
@@ -4551,9 +4463,7 @@ class Mod21(ReadWriteKaitaiStruct):
 
             if (self._root.header.version == 211):
                 pass
-                self.material_hashes = []
-                for i in range(self._root.header.num_materials):
-                    self.material_hashes.append(self._io.read_u4le())
+                self.material_hashes = self._io.read_array("<I", self._root.header.num_materials)
 
 
 
@@ -4585,9 +4495,7 @@ class Mod21(ReadWriteKaitaiStruct):
 
             if (self._root.header.version == 211):
                 pass
-                for i in range(len(self.material_hashes)):
-                    pass
-                    self._io.write_u4le(self.material_hashes[i])
+                self._io.write_array("<I", self.material_hashes)
 
 
 
@@ -4638,13 +4546,9 @@ class Mod21(ReadWriteKaitaiStruct):
             self.normal = Mod21.Vec3U1(self._io, self, self._root)
             self.normal._read()
             self.occlusion = self._io.read_u1()
-            self.weight_values = []
-            for i in range(4):
-                self.weight_values.append(self._io.read_u1())
+            self.weight_values = self._io.read_array("<B", 4)
 
-            self.bone_indices = []
-            for i in range(8):
-                self.bone_indices.append(self._io.read_u1())
+            self.bone_indices = self._io.read_array("<B", 8)
 
             self.uv = Mod21.Vec2HalfFloat(self._io, self, self._root)
             self.uv._read()
@@ -4687,13 +4591,9 @@ class Mod21(ReadWriteKaitaiStruct):
             self.position._write__seq(self._io)
             self.normal._write__seq(self._io)
             self._io.write_u1(self.occlusion)
-            for i in range(len(self.weight_values)):
-                pass
-                self._io.write_u1(self.weight_values[i])
+            self._io.write_array("<B", self.weight_values)
 
-            for i in range(len(self.bone_indices)):
-                pass
-                self._io.write_u1(self.bone_indices[i])
+            self._io.write_array("<B", self.bone_indices)
 
             self.uv._write__seq(self._io)
             for i in range(len(self.weight_values2)):
@@ -4772,23 +4672,11 @@ class Mod21(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.bones_hierarchy = []
-            for i in range(self._root.header.num_bones):
-                _t_bones_hierarchy = Mod21.Bone(self._io, self, self._root)
-                _t_bones_hierarchy._read()
-                self.bones_hierarchy.append(_t_bones_hierarchy)
-
-            self.parent_space_matrices = []
-            for i in range(self._root.header.num_bones):
-                _t_parent_space_matrices = Mod21.Matrix4x4(self._io, self, self._root)
-                _t_parent_space_matrices._read()
-                self.parent_space_matrices.append(_t_parent_space_matrices)
-
-            self.inverse_bind_matrices = []
-            for i in range(self._root.header.num_bones):
-                _t_inverse_bind_matrices = Mod21.Matrix4x4(self._io, self, self._root)
-                _t_inverse_bind_matrices._read()
-                self.inverse_bind_matrices.append(_t_inverse_bind_matrices)
+            self.bones_hierarchy = self._io.read_lazy_array(self._root.header.num_bones, 24, Mod21.Bone, self._io, self, self._root)
+
+            self.parent_space_matrices = self._io.read_lazy_array(self._root.header.num_bones, 64, Mod21.Matrix4x4, self._io, self, self._root)
+
+            self.inverse_bind_matrices = self._io.read_lazy_array(self._root.header.num_bones, 64, Mod21.Matrix4x4, self._io, self, self._root)
 
             if (self._root.header.num_bones != 0):
                 pass
@@ -5064,9 +4952,7 @@ class Mod21(ReadWriteKaitaiStruct):
 
         def _read(self):
             self.group_index = self._io.read_u4le()
-            self.reserved = []
-            for i in range(3):
-                self.reserved.append(self._io.read_u4le())
+            self.reserved = self._io.read_array("<I", 3)
 
             self.pos = Mod21.Vec3(self._io, self, self._root)
             self.pos._read()
@@ -5084,9 +4970,7 @@ class Mod21(ReadWriteKaitaiStruct):
         def _write__seq(self, io=None):
             super(Mod21.Group, self)._write__seq(io)
             self._io.write_u4le(self.group_index)
-            for i in range(len(self.reserved)):
-                pass
-                self._io.write_u4le(self.reserved[i])
+            self._io.write_array("<I", self.reserved)
 
             self.pos._write__seq(self._io)
             self._io.write_f4le(self.radius)
@@ -5197,13 +5081,9 @@ class Mod21(ReadWriteKaitaiStruct):
         def _read(self):
             self.position = Mod21.Vec4S2(self._io, self, self._root)
             self.position._read()
-            self.bone_indices = []
-            for i in range(4):
-                self.bone_indices.append(self._io.read_u1())
+            self.bone_indices = self._io.read_array("<B", 4)
 
-            self.weight_values = []
-            for i in range(4):
-                self.weight_values.append(self._io.read_u1())
+            self.weight_values = self._io.read_array("<B", 4)
 
             self.normal = Mod21.Vec4U1(self._io, self, self._root)
             self.normal._read()
@@ -5224,13 +5104,9 @@ class Mod21(ReadWriteKaitaiStruct):
         def _write__seq(self, io=None):
             super(Mod21.VertexCb68, self)._write__seq(io)
             self.position._write__seq(self._io)
-            for i in range(len(self.bone_indices)):
-                pass
-                self._io.write_u1(self.bone_indices[i])
+            self._io.write_array("<B", self.bone_indices)
 
-            for i in range(len(self.weight_values)):
-                pass
-                self._io.write_u1(self.weight_values[i])
+            self._io.write_array("<B", self.weight_values)
 
             self.normal._write__seq(self._io)
 
@@ -5362,9 +5238,7 @@ class Mod21(ReadWriteKaitaiStruct):
             self.occlusion = self._io.read_u1()
             self.tangent = Mod21.Vec4U1(self._io, self, self._root)
             self.tangent._read()
-            self.bone_indices = []
-            for i in range(4):
-                self.bone_indices.append(self._io.read_u1())
+            self.bone_indices = self._io.read_array("<B", 4)
 
             self.uv = Mod21.Vec2HalfFloat(self._io, self, self._root)
             self.uv._read()
@@ -5397,9 +5271,7 @@ class Mod21(ReadWriteKaitaiStruct):
             self.normal._write__seq(self._io)
             self._io.write_u1(self.occlusion)
             self.tangent._write__seq(self._io)
-            for i in range(len(self.bone_indices)):
-                pass
-                self._io.write_u1(self.bone_indices[i])
+            self._io.write_array("<B", self.bone_indices)
 
             self.uv._write__seq(self._io)
             for i in range(len(self.weight_values)):
@@ -5670,11 +5542,7 @@ class Mod21(ReadWriteKaitaiStruct):
 
         _pos = self._io.pos()
         self._io.seek(self.header.offset_groups)
-        self._m_groups = []
-        for i in range(self.header.num_groups):
-            _t__m_groups = Mod21.Group(self._io, self, self._root)
-            _t__m_groups._read()
-            self._m_groups.append(_t__m_groups)
+        self._m_groups = self._io.read_lazy_array(self.header.num_groups, 32, Mod21.Group, self._io, self, self._root)
 
         self._io.seek(_pos)
         return getattr(self, '_m_groups', None)
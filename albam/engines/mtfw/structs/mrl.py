@@ -3037,11 +3037,7 @@ class Mrl(ReadWriteKaitaiStruct):
             _t_textures._read()
             self.textures.append(_t_textures)
 
-        self.materials = []
-        for i in range(self.num_materials):
-            _t_materials = Mrl.Material(self._io, self, self._root)
-            _t_materials._read()
-            self.materials.append(_t_materials)
+        self.materials = self._io.read_lazy_array(self.num_materials, 60, Mrl.Material, self._io, self, self._root)
 
 
 
@@ -3108,15 +3104,9 @@ class Mrl(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.header = []
-            for i in range(4):
-                self.header.append(self._io.read_u1())
+            self.header = self._io.read_array("<B", 4)
 
-            self.values = []
-            for i in range(self._parent.info.num_entry):
-                _t_values = Mrl.AnimType1(self._io, self, self._root)
-                _t_values._read()
-                self.values.append(_t_values)
+            self.values = self._io.read_lazy_array(self._parent.info.num_entry, 20, Mrl.AnimType1, self._io, self, self._root)
 
 
 
@@ -3133,9 +3123,7 @@ class Mrl(ReadWriteKaitaiStruct):
 
         def _write__seq(self, io=None):
             super(Mrl.AnimSubEntry1, self)._write__seq(io)
-            for i in range(len(self.header)):
-                pass
-                self._io.write_u1(self.header[i])
+            self._io.write_array("<B", self.header)
 
             for i in range(len(self.values)):
                 pass
@@ -3321,13 +3309,9 @@ class Mrl(ReadWriteKaitaiStruct):
 
         def _read(self):
             self.f_alpha_clip_threshold = self._io.read_f4le()
-            self.f_albedo_color = []
-            for i in range(3):
-                self.f_albedo_color.append(self._io.read_f4le())
+            self.f_albedo_color = self._io.read_array("<f", 3)
 
-            self.f_albedo_blend_color = []
-            for i in range(4):
-                self.f_albedo_blend_color.append(self._io.read_f4le())
+            self.f_albedo_blend_color = self._io.read_array("<f", 4)
 
             self.f_detail_normal_power = self._io.read_f4le()
             self.f_detail_normal_uv_scale = self._io.read_f4le()
@@ -3338,77 +3322,45 @@ class Mrl(ReadWriteKaitaiStruct):
             self.f_parallax_factor = self._io.read_f4le()
             self.f_parallax_self_occlusion = self._io.read_f4le()
             self.f_parallax_min_sample = self._io.read_f4le()
-            self.f_parallax_max_sample = []
-            for i in range(3):
-                self.f_parallax_max_sample.append(self._io.read_f4le())
+            self.f_parallax_max_sample = self._io.read_array("<f", 3)
 
-            self.f_light_map_color = []
-            for i in range(4):
-                self.f_light_map_color.append(self._io.read_f4le())
+            self.f_light_map_color = self._io.read_array("<f", 4)
 
-            self.f_thin_map_color = []
-            for i in range(3):
-                self.f_thin_map_color.append(self._io.read_f4le())
+            self.f_thin_map_color = self._io.read_array("<f", 3)
 
             self.f_thin_scattering = self._io.read_f4le()
-            self.f_screen_uv_scale = []
-            for i in range(2):
-                self.f_screen_uv_scale.append(self._io.read_f4le())
+            self.f_screen_uv_scale = self._io.read_array("<f", 2)
 
-            self.f_screen_uv_offset = []
-            for i in range(2):
-                self.f_screen_uv_offset.append(self._io.read_f4le())
+            self.f_screen_uv_offset = self._io.read_array("<f", 2)
 
-            self.f_indirect_offset = []
-            for i in range(2):
-                self.f_indirect_offset.append(self._io.read_f4le())
+            self.f_indirect_offset = self._io.read_array("<f", 2)
 
-            self.f_indirect_scale = []
-            for i in range(2):
-                self.f_indirect_scale.append(self._io.read_f4le())
+            self.f_indirect_scale = self._io.read_array("<f", 2)
 
             self.f_fresnel_schlick = self._io.read_f4le()
-            self.f_fresnel_schlick_rgb = []
-            for i in range(3):
-                self.f_fresnel_schlick_rgb.append(self._io.read_f4le())
+            self.f_fresnel_schlick_rgb = self._io.read_array("<f", 3)
 
-            self.f_specular_color = []
-            for i in range(3):
-                self.f_specular_color.append(self._io.read_f4le())
+            self.f_specular_color = self._io.read_array("<f", 3)
 
             self.f_shininess = self._io.read_f4le()
-            self.f_emission_color = []
-            for i in range(3):
-                self.f_emission_color.append(self._io.read_f4le())
+            self.f_emission_color = self._io.read_array("<f", 3)
 
             self.f_emission_threshold = self._io.read_f4le()
-            self.f_constant_color = []
-            for i in range(4):
-                self.f_constant_color.append(self._io.read_f4le())
+            self.f_constant_color = self._io.read_array("<f", 4)
 
             self.f_roughness = self._io.read_f4le()
-            self.f_roughness_rgb = []
-            for i in range(3):
-                self.f_roughness_rgb.append(self._io.read_f4le())
+            self.f_roughness_rgb = self._io.read_array("<f", 3)
 
-            self.f_anisotoropic_direction = []
-            for i in range(3):
-                self.f_anisotoropic_direction.append(self._io.read_f4le())
+            self.f_anisotoropic_direction = self._io.read_array("<f", 3)
 
             self.f_smoothness = self._io.read_f4le()
-            self.f_anistropic_uv = []
-            for i in range(2):
-                self.f_anistropic_uv.append(self._io.read_f4le())
+            self.f_anistropic_uv = self._io.read_array("<f", 2)
 
             self.f_primary_expo = self._io.read_f4le()
             self.f_secondary_expo = self._io.read_f4le()
-            self.f_primary_color = []
-            for i in range(4):
-                self.f_primary_color.append(self._io.read_f4le())
+            self.f_primary_color = self._io.read_array("<f", 4)
 
-            self.f_secondary_color = []
-            for i in range(4):
-                self.f_secondary_color.append(self._io.read_f4le())
+            self.f_secondary_color = self._io.read_array("<f", 4)
 
 
 
@@ -3473,13 +3425,9 @@ class Mrl(ReadWriteKaitaiStruct):
         def _write__seq(self, io=None):
             super(Mrl.CbGlobals1, self)._write__seq(io)
             self._io.write_f4le(self.f_alpha_clip_threshold)
-            for i in range(len(self.f_albedo_color)):
-                pass
-                self._io.write_f4le(self.f_albedo_color[i])
+            self._io.write_array("<f", self.f_albedo_color)
 
-            for i in range(len(self.f_albedo_blend_color)):
-                pass
-                self._io.write_f4le(self.f_albedo_blend_color[i])
+            self._io.write_array("<f", self.f_albedo_blend_color)
 
             self._io.write_f4le(self.f_detail_normal_power)
             self._io.write_f4le(self.f_detail_normal_uv_scale)
@@ -3490,77 +3438,45 @@ class Mrl(ReadWriteKaitaiStruct):
             self._io.write_f4le(self.f_parallax_factor)
             self._io.write_f4le(self.f_parallax_self_occlusion)
             self._io.write_f4le(self.f_parallax_min_sample)
-            for i in range(len(self.f_parallax_max_sample)):
-                pass
-                self._io.write_f4le(self.f_parallax_max_sample[i])
+            self._io.write_array("<f", self.f_parallax_max_sample)
 
-            for i in range(len(self.f_light_map_color)):
-                pass
-                self._io.write_f4le(self.f_light_map_color[i])
+            self._io.write_array("<f", self.f_light_map_color)
 
-            for i in range(len(self.f_thin_map_color)):
-                pass
-                self._io.write_f4le(self.f_thin_map_color[i])
+            self._io.write_array("<f", self.f_thin_map_color)
 
             self._io.write_f4le(self.f_thin_scattering)
-            for i in range(len(self.f_screen_uv_scale)):
-                pass
-                self._io.write_f4le(self.f_screen_uv_scale[i])
+            self._io.write_array("<f", self.f_screen_uv_scale)
 
-            for i in range(len(self.f_screen_uv_offset)):
-                pass
-                self._io.write_f4le(self.f_screen_uv_offset[i])
+            self._io.write_array("<f", self.f_screen_uv_offset)
 
-            for i in range(len(self.f_indirect_offset)):
-                pass
-                self._io.write_f4le(self.f_indirect_offset[i])
+            self._io.write_array("<f", self.f_indirect_offset)
 
-            for i in range(len(self.f_indirect_scale)):
-                pass
-                self._io.write_f4le(self.f_indirect_scale[i])
+            self._io.write_array("<f", self.f_indirect_scale)
 
             self._io.write_f4le(self.f_fresnel_schlick)
-            for i in range(len(self.f_fresnel_schlick_rgb)):
-                pass
-                self._io.write_f4le(self.f_fresnel_schlick_rgb[i])
+            self._io.write_array("<f", self.f_fresnel_schlick_rgb)
 
-            for i in range(len(self.f_specular_color)):
-                pass
-                self._io.write_f4le(self.f_specular_color[i])
+            self._io.write_array("<f", self.f_specular_color)
 
             self._io.write_f4le(self.f_shininess)
-            for i in range(len(self.f_emission_color)):
-                pass
-                self._io.write_f4le(self.f_emission_color[i])
+            self._io.write_array("<f", self.f_emission_color)
 
             self._io.write_f4le(self.f_emission_threshold)
-            for i in range(len(self.f_constant_color)):
-                pass
-                self._io.write_f4le(self.f_constant_color[i])
+            self._io.write_array("<f", self.f_constant_color)
 
             self._io.write_f4le(self.f_roughness)
-            for i in range(len(self.f_roughness_rgb)):
-                pass
-                self._io.write_f4le(self.f_roughness_rgb[i])
+            self._io.write_array("<f", self.f_roughness_rgb)
 
-            for i in range(len(self.f_anisotoropic_direction)):
-                pass
-                self._io.write_f4le(self.f_anisotoropic_direction[i])
+            self._io.write_array("<f", self.f_anisotoropic_direction)
 
             self._io.write_f4le(self.f_smoothness)
-            for i in range(len(self.f_anistropic_uv)):
-                pass
-                self._io.write_f4le(self.f_anistropic_uv[i])
+            self._io.write_array("<f", self.f_anistropic_uv)
 
             self._io.write_f4le(self.f_primary_expo)
             self._io.write_f4le(self.f_secondary_expo)
-            for i in range(len(self.f_primary_color)):
-                pass
-                self._io.write_f4le(self.f_primary_color[i])
+            self._io.write_array("<f", self.f_primary_color)
 
-            for i in range(len(self.f_secondary_color)):
-                pass
-                self._io.write_f4le(self.f_secondary_color[i])
+            self._io.write_array("<f", self.f_secondary_color)
 
 
 
@@ -3675,13 +3591,9 @@ class Mrl(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.header = []
-            for i in range(12):
-                self.header.append(self._io.read_u1())
+            self.header = self._io.read_array("<B", 12)
 
-            self.values = []
-            for i in range((8 * self._parent.info.num_entry)):
-                self.values.append(self._io.read_u1())
+            self.values = self._io.read_array("<B", (8 * self._parent.info.num_entry))
 
 
 
@@ -3697,13 +3609,9 @@ class Mrl(ReadWriteKaitaiStruct):
 
         def _write__seq(self, io=None):
             super(Mrl.AnimSubEntry5, self)._write__seq(io)
-            for i in range(len(self.header)):
-                pass
-                self._io.write_u1(self.header[i])
+            self._io.write_array("<B", self.header)
 
-            for i in range(len(self.values)):
-                pass
-                self._io.write_u1(self.values[i])
+            self._io.write_array("<B", self.values)
 
 
 
@@ -4051,9 +3959,7 @@ class Mrl(ReadWriteKaitaiStruct):
 
         def _read(self):
             self.unk_00 = self._io.read_u4le()
-            self.unk_01 = []
-            for i in range(19):
-                self.unk_01.append(self._io.read_f4le())
+            self.unk_01 = self._io.read_array("<f", 19)
 
 
 
@@ -4067,9 +3973,7 @@ class Mrl(ReadWriteKaitaiStruct):
         def _write__seq(self, io=None):
             super(Mrl.AnimType4, self)._write__seq(io)
             self._io.write_u4le(self.unk_00)
-            for i in range(len(self.unk_01)):
-                pass
-                self._io.write_f4le(self.unk_01[i])
+            self._io.write_array("<f", self.unk_01)
 
 
 
@@ -4409,9 +4313,7 @@ class Mrl(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.f_specular_blend_color = []
-            for i in range(4):
-                self.f_specular_blend_color.append(self._io.read_f4le())
+            self.f_specular_blend_color = self._io.read_array("<f", 4)
 
 
 
@@ -4424,9 +4326,7 @@ class Mrl(ReadWriteKaitaiStruct):
 
         def _write__seq(self, io=None):
             super(Mrl.CbSpecularBlend1, self)._write__seq(io)
-            for i in range(len(self.f_specular_blend_color)):
-                pass
-                self._io.write_f4le(self.f_specular_blend_color[i])
+            self._io.write_array("<f", self.f_specular_blend_color)
 
 
 
@@ -4456,27 +4356,17 @@ class Mrl(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.f_diffuse_color = []
-            for i in range(3):
-                self.f_diffuse_color.append(self._io.read_f4le())
+            self.f_diffuse_color = self._io.read_array("<f", 3)
 
             self.f_transparency = self._io.read_f4le()
-            self.f_reflective_color = []
-            for i in range(3):
-                self.f_reflective_color.append(self._io.read_f4le())
+            self.f_reflective_color = self._io.read_array("<f", 3)
 
             self.f_transparency_volume = self._io.read_f4le()
-            self.f_uv_transform = []
-            for i in range(8):
-                self.f_uv_transform.append(self._io.read_f4le())
+            self.f_uv_transform = self._io.read_array("<f", 8)
 
-            self.f_uv_transform2 = []
-            for i in range(8):
-                self.f_uv_transform2.append(self._io.read_f4le())
+            self.f_uv_transform2 = self._io.read_array("<f", 8)
 
-            self.f_uv_transform3 = []
-            for i in range(8):
-                self.f_uv_transform3.append(self._io.read_f4le())
+            self.f_uv_transform3 = self._io.read_array("<f", 8)
 
 
 
@@ -4501,27 +4391,17 @@ class Mrl(ReadWriteKaitaiStruct):
 
         def _write__seq(self, io=None):
             super(Mrl.CbMaterial1, self)._write__seq(io)
-            for i in range(len(self.f_diffuse_color)):
-                pass
-                self._io.write_f4le(self.f_diffuse_color[i])
+            self._io.write_array("<f", self.f_diffuse_color)
 
             self._io.write_f4le(self.f_transparency)
-            for i in range(len(self.f_reflective_color)):
-                pass
-                self._io.write_f4le(self.f_reflective_color[i])
+            self._io.write_array("<f", self.f_reflective_color)
 
             self._io.write_f4le(self.f_transparency_volume)
-            for i in range(len(self.f_uv_transform)):
-                pass
-                self._io.write_f4le(self.f_uv_transform[i])
+            self._io.write_array("<f", self.f_uv_transform)
 
-            for i in range(len(self.f_uv_transform2)):
-                pass
-                self._io.write_f4le(self.f_uv_transform2[i])
+            self._io.write_array("<f", self.f_uv_transform2)
 
-            for i in range(len(self.f_uv_transform3)):
-                pass
-                self._io.write_f4le(self.f_uv_transform3[i])
+            self._io.write_array("<f", self.f_uv_transform3)
 
 
 
@@ -4573,9 +4453,7 @@ class Mrl(ReadWriteKaitaiStruct):
         def _read(self):
             self.f_app_water_reflect_scale = self._io.read_f4le()
             self.f_app_shadow_light_scale = self._io.read_f4le()
-            self.padding = []
-            for i in range(2):
-                self.padding.append(self._io.read_f4le())
+            self.padding = self._io.read_array("<f", 2)
 
 
 
@@ -4590,9 +4468,7 @@ class Mrl(ReadWriteKaitaiStruct):
             super(Mrl.CbAppReflect1, self)._write__seq(io)
             self._io.write_f4le(self.f_app_water_reflect_scale)
             self._io.write_f4le(self.f_app_shadow_light_scale)
-            for i in range(len(self.padding)):
-                pass
-                self._io.write_f4le(self.padding[i])
+            self._io.write_array("<f", self.padding)
 
 
 
@@ -4710,14 +4586,10 @@ class Mrl(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.f_albedo_color = []
-            for i in range(3):
-                self.f_albedo_color.append(self._io.read_f4le())
+            self.f_albedo_color = self._io.read_array("<f", 3)
 
             self.padding_1 = self._io.read_f4le()
-            self.f_albedo_blend_color = []
-            for i in range(4):
-                self.f_albedo_blend_color.append(self._io.read_f4le())
+            self.f_albedo_blend_color = self._io.read_array("<f", 4)
 
             self.f_detail_normal_power = self._io.read_f4le()
             self.f_detail_normal_uv_scale = self._io.read_f4le()
@@ -4729,72 +4601,44 @@ class Mrl(ReadWriteKaitaiStruct):
             self.f_parallax_self_occlusion = self._io.read_f4le()
             self.f_parallax_min_sample = self._io.read_f4le()
             self.f_parallax_max_sample = self._io.read_f4le()
-            self.padding_2 = []
-            for i in range(2):
-                self.padding_2.append(self._io.read_f4le())
+            self.padding_2 = self._io.read_array("<f", 2)
 
-            self.f_light_map_color = []
-            for i in range(3):
-                self.f_light_map_color.append(self._io.read_f4le())
+            self.f_light_map_color = self._io.read_array("<f", 3)
 
             self.padding_3 = self._io.read_f4le()
-            self.f_thin_map_color = []
-            for i in range(3):
-                self.f_thin_map_color.append(self._io.read_f4le())
+            self.f_thin_map_color = self._io.read_array("<f", 3)
 
             self.f_thin_scattering = self._io.read_f4le()
-            self.f_indirect_offset = []
-            for i in range(2):
-                self.f_indirect_offset.append(self._io.read_f4le())
+            self.f_indirect_offset = self._io.read_array("<f", 2)
 
-            self.f_indirect_scale = []
-            for i in range(2):
-                self.f_indirect_scale.append(self._io.read_f4le())
+            self.f_indirect_scale = self._io.read_array("<f", 2)
 
             self.f_fresnel_schlick = self._io.read_f4le()
-            self.f_fresnel_schlick_rgb = []
-            for i in range(3):
-                self.f_fresnel_schlick_rgb.append(self._io.read_f4le())
+            self.f_fresnel_schlick_rgb = self._io.read_array("<f", 3)
 
-            self.f_specular_color = []
-            for i in range(3):
-                self.f_specular_color.append(self._io.read_f4le())
+            self.f_specular_color = self._io.read_array("<f", 3)
 
             self.f_shininess = self._io.read_f4le()
-            self.f_emission_color = []
-            for i in range(3):
-                self.f_emission_color.append(self._io.read_f4le())
+            self.f_emission_color = self._io.read_array("<f", 3)
 
             self.f_alpha_clip_threshold = self._io.read_f4le()
             self.f_roughness = self._io.read_f4le()
-            self.f_roughness_rgb = []
-            for i in range(3):
-                self.f_roughness_rgb.append(self._io.read_f4le())
+            self.f_roughness_rgb = self._io.read_array("<f", 3)
 
-            self.f_anisotoropic_direction = []
-            for i in range(3):
-                self.f_anisotoropic_direction.append(self._io.read_f4le())
+            self.f_anisotoropic_direction = self._io.read_array("<f", 3)
 
             self.f_smoothness = self._io.read_f4le()
-            self.f_anistropic_uv = []
-            for i in range(2):
-                self.f_anistropic_uv.append(self._io.read_f4le())
+            self.f_anistropic_uv = self._io.read_array("<f", 2)
 
             self.f_primary_expo = self._io.read_f4le()
             self.f_secondary_expo = self._io.read_f4le()
-            self.f_primary_color = []
-            for i in range(3):
-                self.f_primary_color.append(self._io.read_f4le())
+            self.f_primary_color = self._io.read_array("<f", 3)
 
             self.padding_4 = self._io.read_f4le()
-            self.f_secondary_color = []
-            for i in range(3):
-                self.f_secondary_color.append(self._io.read_f4le())
+            self.f_secondary_color = self._io.read_array("<f", 3)
 
             self.padding_5 = self._io.read_f4le()
-            self.xyzw_sepalate = []
-            for i in range(16):
-                self.xyzw_sepalate.append(self._io.read_f4le())
+            self.xyzw_sepalate = self._io.read_array("<f", 16)
 
 
 
@@ -4852,14 +4696,10 @@ class Mrl(ReadWriteKaitaiStruct):
 
         def _write__seq(self, io=None):
             super(Mrl.CbGlobals4, self)._write__seq(io)
-            for i in range(len(self.f_albedo_color)):
-                pass
-                self._io.write_f4le(self.f_albedo_color[i])
+            self._io.write_array("<f", self.f_albedo_color)
 
             self._io.write_f4le(self.padding_1)
-            for i in range(len(self.f_albedo_blend_color)):
-                pass
-                self._io.write_f4le(self.f_albedo_blend_color[i])
+            self._io.write_array("<f", self.f_albedo_blend_color)
 
             self._io.write_f4le(self.f_detail_normal_power)
             self._io.write_f4le(self.f_detail_normal_uv_scale)
@@ -4871,72 +4711,44 @@ class Mrl(ReadWriteKaitaiStruct):
             self._io.write_f4le(self.f_parallax_self_occlusion)
             self._io.write_f4le(self.f_parallax_min_sample)
             self._io.write_f4le(self.f_parallax_max_sample)
-            for i in range(len(self.padding_2)):
-                pass
-                self._io.write_f4le(self.padding_2[i])
+            self._io.write_array("<f", self.padding_2)
 
-            for i in range(len(self.f_light_map_color)):
-                pass
-                self._io.write_f4le(self.f_light_map_color[i])
+            self._io.write_array("<f", self.f_light_map_color)
 
             self._io.write_f4le(self.padding_3)
-            for i in range(len(self.f_thin_map_color)):
-                pass
-                self._io.write_f4le(self.f_thin_map_color[i])
+            self._io.write_array("<f", self.f_thin_map_color)
 
             self._io.write_f4le(self.f_thin_scattering)
-            for i in range(len(self.f_indirect_offset)):
-                pass
-                self._io.write_f4le(self.f_indirect_offset[i])
+            self._io.write_array("<f", self.f_indirect_offset)
 
-            for i in range(len(self.f_indirect_scale)):
-                pass
-                self._io.write_f4le(self.f_indirect_scale[i])
+            self._io.write_array("<f", self.f_indirect_scale)
 
             self._io.write_f4le(self.f_fresnel_schlick)
-            for i in range(len(self.f_fresnel_schlick_rgb)):
-                pass
-                self._io.write_f4le(self.f_fresnel_schlick_rgb[i])
+            self._io.write_array("<f", self.f_fresnel_schlick_rgb)
 
-            for i in range(len(self.f_specular_color)):
-                pass
-                self._io.write_f4le(self.f_specular_color[i])
+            self._io.write_array("<f", self.f_specular_color)
 
             self._io.write_f4le(self.f_shininess)
-            for i in range(len(self.f_emission_color)):
-                pass
-                self._io.write_f4le(self.f_emission_color[i])
+            self._io.write_array("<f", self.f_emission_color)
 
             self._io.write_f4le(self.f_alpha_clip_threshold)
             self._io.write_f4le(self.f_roughness)
-            for i in range(len(self.f_roughness_rgb)):
-                pass
-                self._io.write_f4le(self.f_roughness_rgb[i])
+            self._io.write_array("<f", self.f_roughness_rgb)
 
-            for i in range(len(self.f_anisotoropic_direction)):
-                pass
-                self._io.write_f4le(self.f_anisotoropic_direction[i])
+            self._io.write_array("<f", self.f_anisotoropic_direction)
 
             self._io.write_f4le(self.f_smoothness)
-            for i in range(len(self.f_anistropic_uv)):
-                pass
-                self._io.write_f4le(self.f_anistropic_uv[i])
+            self._io.write_array("<f", self.f_anistropic_uv)
 
             self._io.write_f4le(self.f_primary_expo)
             self._io.write_f4le(self.f_secondary_expo)
-            for i in range(len(self.f_primary_color)):
-                pass
-                self._io.write_f4le(self.f_primary_color[i])
+            self._io.write_array("<f", self.f_primary_color)
 
             self._io.write_f4le(self.padding_4)
-            for i in range(len(self.f_secondary_color)):
-                pass
-                self._io.write_f4le(self.f_secondary_color[i])
+            self._io.write_array("<f", self.f_secondary_color)
 
             self._io.write_f4le(self.padding_5)
-            for i in range(len(self.xyzw_sepalate)):
-                pass
-                self._io.write_f4le(self.xyzw_sepalate[i])
+            self._io.write_array("<f", self.xyzw_sepalate)
 
 
 
@@ -5041,9 +4853,7 @@ class Mrl(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.f_b_blend_map_color = []
-            for i in range(3):
-                self.f_b_blend_map_color.append(self._io.read_f4le())
+            self.f_b_blend_map_color = self._io.read_array("<f", 3)
 
             self.f_b_alpha_clip_threshold = self._io.read_f4le()
             self.f_b_blend_alpha_threshold = self._io.read_f4le()
@@ -5051,9 +4861,7 @@ class Mrl(ReadWriteKaitaiStruct):
             self.f_b_specular_blend_rate = self._io.read_f4le()
             self.f_b_albedo_blend_rate = self._io.read_f4le()
             self.f_b_albedo_blend_rate2 = self._io.read_f4le()
-            self.padding = []
-            for i in range(3):
-                self.padding.append(self._io.read_f4le())
+            self.padding = self._io.read_array("<f", 3)
 
 
 
@@ -5069,9 +4877,7 @@ class Mrl(ReadWriteKaitaiStruct):
 
         def _write__seq(self, io=None):
             super(Mrl.CbBurnCommon1, self)._write__seq(io)
-            for i in range(len(self.f_b_blend_map_color)):
-                pass
-                self._io.write_f4le(self.f_b_blend_map_color[i])
+            self._io.write_array("<f", self.f_b_blend_map_color)
 
             self._io.write_f4le(self.f_b_alpha_clip_threshold)
             self._io.write_f4le(self.f_b_blend_alpha_threshold)
@@ -5079,9 +4885,7 @@ class Mrl(ReadWriteKaitaiStruct):
             self._io.write_f4le(self.f_b_specular_blend_rate)
             self._io.write_f4le(self.f_b_albedo_blend_rate)
             self._io.write_f4le(self.f_b_albedo_blend_rate2)
-            for i in range(len(self.padding)):
-                pass
-                self._io.write_f4le(self.padding[i])
+            self._io.write_array("<f", self.padding)
 
 
 
@@ -5177,15 +4981,9 @@ class Mrl(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.header = []
-            for i in range(4):
-                self.header.append(self._io.read_u1())
+            self.header = self._io.read_array("<B", 4)
 
-            self.values = []
-            for i in range(self._parent.info.num_entry):
-                _t_values = Mrl.AnimType0(self._io, self, self._root)
-                _t_values._read()
-                self.values.append(_t_values)
+            self.values = self._io.read_lazy_array(self._parent.info.num_entry, 8, Mrl.AnimType0, self._io, self, self._root)
 
 
 
@@ -5202,9 +5000,7 @@ class Mrl(ReadWriteKaitaiStruct):
 
         def _write__seq(self, io=None):
             super(Mrl.AnimSubEntry0, self)._write__seq(io)
-            for i in range(len(self.header)):
-                pass
-                self._io.write_u1(self.header[i])
+            self._io.write_array("<B", self.header)
 
             for i in range(len(self.values)):
                 pass
@@ -5413,19 +5209,13 @@ class Mrl(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.f_uv_rotation_center = []
-            for i in range(2):
-                self.f_uv_rotation_center.append(self._io.read_f4le())
+            self.f_uv_rotation_center = self._io.read_array("<f", 2)
 
             self.f_uv_rotation_angle = self._io.read_f4le()
             self.padding = self._io.read_f4le()
-            self.f_uv_rotation_offset = []
-            for i in range(2):
-                self.f_uv_rotation_offset.append(self._io.read_f4le())
+            self.f_uv_rotation_offset = self._io.read_array("<f", 2)
 
-            self.f_uv_rotation_scale = []
-            for i in range(2):
-                self.f_uv_rotation_scale.append(self._io.read_f4le())
+            self.f_uv_rotation_scale = self._io.read_array("<f", 2)
 
 
 
@@ -5444,19 +5234,13 @@ class Mrl(ReadWriteKaitaiStruct):
 
         def _write__seq(self, io=None):
             super(Mrl.CbUvRotationOffset1, self)._write__seq(io)
-            for i in range(len(self.f_uv_rotation_center)):
-                pass
-                self._io.write_f4le(self.f_uv_rotation_center[i])
+            self._io.write_array("<f", self.f_uv_rotation_center)
 
             self._io.write_f4le(self.f_uv_rotation_angle)
             self._io.write_f4le(self.padding)
-            for i in range(len(self.f_uv_rotation_offset)):
-                pass
-                self._io.write_f4le(self.f_uv_rotation_offset[i])
+            self._io.write_array("<f", self.f_uv_rotation_offset)
 
-            for i in range(len(self.f_uv_rotation_scale)):
-                pass
-                self._io.write_f4le(self.f_uv_rotation_scale[i])
+            self._io.write_array("<f", self.f_uv_rotation_scale)
 
 
 
@@ -5590,9 +5374,7 @@ class Mrl(ReadWriteKaitaiStruct):
             self.f_vtx_disp_rcn = self._io.read_f4le()
             self.f_vtx_disp_tilt_u = self._io.read_f4le()
             self.f_vtx_disp_tilt_v = self._io.read_f4le()
-            self.filler = []
-            for i in range(2):
-                self.filler.append(self._io.read_f4le())
+            self.filler = self._io.read_array("<f", 2)
 
 
 
@@ -5611,9 +5393,7 @@ class Mrl(ReadWriteKaitaiStruct):
             self._io.write_f4le(self.f_vtx_disp_rcn)
             self._io.write_f4le(self.f_vtx_disp_tilt_u)
             self._io.write_f4le(self.f_vtx_disp_tilt_v)
-            for i in range(len(self.filler)):
-                pass
-                self._io.write_f4le(self.filler[i])
+            self._io.write_array("<f", self.filler)
 
 
 
@@ -5643,13 +5423,9 @@ class Mrl(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.header = []
-            for i in range(36):
-                self.header.append(self._io.read_u1())
+            self.header = self._io.read_array("<B", 36)
 
-            self.values = []
-            for i in range((24 * (self._parent.info.num_entry - 1))):
-                self.values.append(self._io.read_u1())
+            self.values = self._io.read_array("<B", (24 * (self._parent.info.num_entry - 1)))
 
 
 
@@ -5665,13 +5441,9 @@ class Mrl(ReadWriteKaitaiStruct):
 
         def _write__seq(self, io=None):
             super(Mrl.AnimSubEntry7, self)._write__seq(io)
-            for i in range(len(self.header)):
-                pass
-                self._io.write_u1(self.header[i])
+            self._io.write_array("<B", self.header)
 
-            for i in range(len(self.values)):
-                pass
-                self._io.write_u1(self.values[i])
+            self._io.write_array("<B", self.values)
 
 
 
@@ -5836,9 +5608,7 @@ class Mrl(ReadWriteKaitaiStruct):
             self.unk_02 = self._io.read_u4le()
             self.unk_03 = self._io.read_u4le()
             self.texture_path = (self._io.read_bytes_term(0, False, True, True)).decode("ASCII")
-            self.filler = []
-            for i in range(((64 - len(self.texture_path)) - 1)):
-                self.filler.append(self._io.read_u1())
+            self.filler = self._io.read_array("<B", ((64 - len(self.texture_path)) - 1))
 
 
 
@@ -5856,9 +5626,7 @@ class Mrl(ReadWriteKaitaiStruct):
             self._io.write_u4le(self.unk_03)
             self._io.write_bytes((self.texture_path).encode(u"ASCII"))
             self._io.write_u1(0)
-            for i in range(len(self.filler)):
-                pass
-                self._io.write_u1(self.filler[i])
+            self._io.write_array("<B", self.filler)
 
 
 
@@ -5951,14 +5719,10 @@ class Mrl(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.f_albedo_color = []
-            for i in range(3):
-                self.f_albedo_color.append(self._io.read_f4le())
+            self.f_albedo_color = self._io.read_array("<f", 3)
 
             self.padding_1 = self._io.read_f4le()
-            self.f_albedo_blend_color = []
-            for i in range(4):
-                self.f_albedo_blend_color.append(self._io.read_f4le())
+            self.f_albedo_blend_color = self._io.read_array("<f", 4)
 
             self.f_detail_normal_power = self._io.read_f4le()
             self.f_detail_normal_uv_scale = self._io.read_f4le()
@@ -5970,94 +5734,56 @@ class Mrl(ReadWriteKaitaiStruct):
             self.f_parallax_self_occlusion = self._io.read_f4le()
             self.f_parallax_min_sample = self._io.read_f4le()
             self.f_parallax_max_sample = self._io.read_f4le()
-            self.padding_2 = []
-            for i in range(2):
-                self.padding_2.append(self._io.read_f4le())
+            self.padding_2 = self._io.read_array("<f", 2)
 
-            self.f_light_map_color = []
-            for i in range(3):
-                self.f_light_map_color.append(self._io.read_f4le())
+            self.f_light_map_color = self._io.read_array("<f", 3)
 
             self.padding_3 = self._io.read_f4le()
-            self.f_thin_map_color = []
-            for i in range(3):
-                self.f_thin_map_color.append(self._io.read_f4le())
+            self.f_thin_map_color = self._io.read_array("<f", 3)
 
             self.f_thin_scattering = self._io.read_f4le()
-            self.f_indirect_offset = []
-            for i in range(2):
-                self.f_indirect_offset.append(self._io.read_f4le())
+            self.f_indirect_offset = self._io.read_array("<f", 2)
 
-            self.f_indirect_scale = []
-            for i in range(2):
-                self.f_indirect_scale.append(self._io.read_f4le())
+            self.f_indirect_scale = self._io.read_array("<f", 2)
 
             self.f_fresnel_schlick = self._io.read_f4le()
-            self.f_fresnel_schlick_rgb = []
-            for i in range(3):
-                self.f_fresnel_schlick_rgb.append(self._io.read_f4le())
+            self.f_fresnel_schlick_rgb = self._io.read_array("<f", 3)
 
-            self.f_specular_color = []
-            for i in range(3):
-                self.f_specular_color.append(self._io.read_f4le())
+            self.f_specular_color = self._io.read_array("<f", 3)
 
             self.f_shininess = self._io.read_f4le()
-            self.f_emission_color = []
-            for i in range(3):
-                self.f_emission_color.append(self._io.read_f4le())
+            self.f_emission_color = self._io.read_array("<f", 3)
 
             self.f_alpha_clip_threshold = self._io.read_f4le()
             self.f_primary_expo = self._io.read_f4le()
             self.f_secondary_expo = self._io.read_f4le()
-            self.padding_4 = []
-            for i in range(2):
-                self.padding_4.append(self._io.read_f4le())
+            self.padding_4 = self._io.read_array("<f", 2)
 
-            self.f_primary_color = []
-            for i in range(3):
-                self.f_primary_color.append(self._io.read_f4le())
+            self.f_primary_color = self._io.read_array("<f", 3)
 
             self.padding_5 = self._io.read_f4le()
-            self.f_secondary_color = []
-            for i in range(3):
-                self.f_secondary_color.append(self._io.read_f4le())
+            self.f_secondary_color = self._io.read_array("<f", 3)
 
             self.padding_6 = self._io.read_f4le()
-            self.f_albedo_color_2 = []
-            for i in range(3):
-                self.f_albedo_color_2.append(self._io.read_f4le())
+            self.f_albedo_color_2 = self._io.read_array("<f", 3)
 
             self.padding_7 = self._io.read_f4le()
-            self.f_specular_color_2 = []
-            for i in range(3):
-                self.f_specular_color_2.append(self._io.read_f4le())
+            self.f_specular_color_2 = self._io.read_array("<f", 3)
 
             self.f_fresnel_schlick_2 = self._io.read_f4le()
             self.f_shininess_2 = self._io.read_f4le()
-            self.padding_8 = []
-            for i in range(3):
-                self.padding_8.append(self._io.read_f4le())
+            self.padding_8 = self._io.read_array("<f", 3)
 
-            self.f_transparency_clip_threshold = []
-            for i in range(4):
-                self.f_transparency_clip_threshold.append(self._io.read_f4le())
+            self.f_transparency_clip_threshold = self._io.read_array("<f", 4)
 
             self.f_blend_uv = self._io.read_f4le()
-            self.padding_9 = []
-            for i in range(3):
-                self.padding_9.append(self._io.read_f4le())
+            self.padding_9 = self._io.read_array("<f", 3)
 
-            self.f_albedo_blend2_color = []
-            for i in range(4):
-                self.f_albedo_blend2_color.append(self._io.read_f4le())
+            self.f_albedo_blend2_color = self._io.read_array("<f", 4)
 
-            self.f_detail_normalu_vscale = []
-            for i in range(2):
-                self.f_detail_normalu_vscale.append(self._io.read_f4le())
+            self.f_detail_normalu_vscale = self._io.read_array("<f", 2)
 
-            self.padding_10 = []
-            for i in range(2):
-                self.padding_10.append(self._io.read_f4le())
+            self.padding_10 = self._io.read_array("<f", 2)
 
 
 
@@ -6130,14 +5856,10 @@ class Mrl(ReadWriteKaitaiStruct):
 
         def _write__seq(self, io=None):
             super(Mrl.CbGlobals3, self)._write__seq(io)
-            for i in range(len(self.f_albedo_color)):
-                pass
-                self._io.write_f4le(self.f_albedo_color[i])
+            self._io.write_array("<f", self.f_albedo_color)
 
             self._io.write_f4le(self.padding_1)
-            for i in range(len(self.f_albedo_blend_color)):
-                pass
-                self._io.write_f4le(self.f_albedo_blend_color[i])
+            self._io.write_array("<f", self.f_albedo_blend_color)
 
             self._io.write_f4le(self.f_detail_normal_power)
             self._io.write_f4le(self.f_detail_normal_uv_scale)
@@ -6149,94 +5871,56 @@ class Mrl(ReadWriteKaitaiStruct):
             self._io.write_f4le(self.f_parallax_self_occlusion)
             self._io.write_f4le(self.f_parallax_min_sample)
             self._io.write_f4le(self.f_parallax_max_sample)
-            for i in range(len(self.padding_2)):
-                pass
-                self._io.write_f4le(self.padding_2[i])
+            self._io.write_array("<f", self.padding_2)
 
-            for i in range(len(self.f_light_map_color)):
-                pass
-                self._io.write_f4le(self.f_light_map_color[i])
+            self._io.write_array("<f", self.f_light_map_color)
 
             self._io.write_f4le(self.padding_3)
-            for i in range(len(self.f_thin_map_color)):
-                pass
-                self._io.write_f4le(self.f_thin_map_color[i])
+            self._io.write_array("<f", self.f_thin_map_color)
 
             self._io.write_f4le(self.f_thin_scattering)
-            for i in range(len(self.f_indirect_offset)):
-                pass
-                self._io.write_f4le(self.f_indirect_offset[i])
+            self._io.write_array("<f", self.f_indirect_offset)
 
-            for i in range(len(self.f_indirect_scale)):
-                pass
-                self._io.write_f4le(self.f_indirect_scale[i])
+            self._io.write_array("<f", self.f_indirect_scale)
 
             self._io.write_f4le(self.f_fresnel_schlick)
-            for i in range(len(self.f_fresnel_schlick_rgb)):
-                pass
-                self._io.write_f4le(self.f_fresnel_schlick_rgb[i])
+            self._io.write_array("<f", self.f_fresnel_schlick_rgb)
 
-            for i in range(len(self.f_specular_color)):
-                pass
-                self._io.write_f4le(self.f_specular_color[i])
+            self._io.write_array("<f", self.f_specular_color)
 
             self._io.write_f4le(self.f_shininess)
-            for i in range(len(self.f_emission_color)):
-                pass
-                self._io.write_f4le(self.f_emission_color[i])
+            self._io.write_array("<f", self.f_emission_color)
 
             self._io.write_f4le(self.f_alpha_clip_threshold)
             self._io.write_f4le(self.f_primary_expo)
             self._io.write_f4le(self.f_secondary_expo)
-            for i in range(len(self.padding_4)):
-                pass
-                self._io.write_f4le(self.padding_4[i])
+            self._io.write_array("<f", self.padding_4)
 
-            for i in range(len(self.f_primary_color)):
-                pass
-                self._io.write_f4le(self.f_primary_color[i])
+            self._io.write_array("<f", self.f_primary_color)
 
             self._io.write_f4le(self.padding_5)
-            for i in range(len(self.f_secondary_color)):
-                pass
-                self._io.write_f4le(self.f_secondary_color[i])
+            self._io.write_array("<f", self.f_secondary_color)
 
             self._io.write_f4le(self.padding_6)
-            for i in range(len(self.f_albedo_color_2)):
-                pass
-                self._io.write_f4le(self.f_albedo_color_2[i])
+            self._io.write_array("<f", self.f_albedo_color_2)
 
             self._io.write_f4le(self.padding_7)
-            for i in range(len(self.f_specular_color_2)):
-                pass
-                self._io.write_f4le(self.f_specular_color_2[i])
+            self._io.write_array("<f", self.f_specular_color_2)
 
             self._io.write_f4le(self.f_fresnel_schlick_2)
             self._io.write_f4le(self.f_shininess_2)
-            for i in range(len(self.padding_8)):
-                pass
-                self._io.write_f4le(self.padding_8[i])
+            self._io.write_array("<f", self.padding_8)
 
-            for i in range(len(self.f_transparency_clip_threshold)):
-                pass
-                self._io.write_f4le(self.f_transparency_clip_threshold[i])
+            self._io.write_array("<f", self.f_transparency_clip_threshold)
 
             self._io.write_f4le(self.f_blend_uv)
-            for i in range(len(self.padding_9)):
-                pass
-                self._io.write_f4le(self.padding_9[i])
+            self._io.write_array("<f", self.padding_9)
 
-            for i in range(len(self.f_albedo_blend2_color)):
-                pass
-                self._io.write_f4le(self.f_albedo_blend2_color[i])
+            self._io.write_array("<f", self.f_albedo_blend2_color)
 
-            for i in range(len(self.f_detail_normalu_vscale)):
-                pass
-                self._io.write_f4le(self.f_detail_normalu_vscale[i])
+            self._io.write_array("<f", self.f_detail_normalu_vscale)
 
-            for i in range(len(self.padding_10)):
-                pass
-                self._io.write_f4le(self.padding_10[i])
+            self._io.write_array("<f", self.padding_10)
 
 
 
@@ -6391,9 +6075,7 @@ class Mrl(ReadWriteKaitaiStruct):
         def _read(self):
             self.f_distortion_factor = self._io.read_f4le()
             self.f_distortion_blend = self._io.read_f4le()
-            self.filler = []
-            for i in range(2):
-                self.filler.append(self._io.read_f4le())
+            self.filler = self._io.read_array("<f", 2)
 
 
 
@@ -6408,9 +6090,7 @@ class Mrl(ReadWriteKaitaiStruct):
             super(Mrl.CbDistortion, self)._write__seq(io)
             self._io.write_f4le(self.f_distortion_factor)
             self._io.write_f4le(self.f_distortion_blend)
-            for i in range(len(self.filler)):
-                pass
-                self._io.write_f4le(self.filler[i])
+            self._io.write_array("<f", self.filler)
 
 
 
@@ -6518,29 +6198,17 @@ class Mrl(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.f_color_mask_threshold = []
-            for i in range(4):
-                self.f_color_mask_threshold.append(self._io.read_f4le())
+            self.f_color_mask_threshold = self._io.read_array("<f", 4)
 
-            self.f_color_mask_offset = []
-            for i in range(4):
-                self.f_color_mask_offset.append(self._io.read_f4le())
+            self.f_color_mask_offset = self._io.read_array("<f", 4)
 
-            self.f_clip_threshold = []
-            for i in range(4):
-                self.f_clip_threshold.append(self._io.read_f4le())
+            self.f_clip_threshold = self._io.read_array("<f", 4)
 
-            self.f_color_mask_color = []
-            for i in range(4):
-                self.f_color_mask_color.append(self._io.read_f4le())
+            self.f_color_mask_color = self._io.read_array("<f", 4)
 
-            self.f_color_mask2_threshold = []
-            for i in range(4):
-                self.f_color_mask2_threshold.append(self._io.read_f4le())
+            self.f_color_mask2_threshold = self._io.read_array("<f", 4)
 
-            self.f_color_mask2_color = []
-            for i in range(4):
-                self.f_color_mask2_color.append(self._io.read_f4le())
+            self.f_color_mask2_color = self._io.read_array("<f", 4)
 
 
 
@@ -6568,29 +6236,17 @@ class Mrl(ReadWriteKaitaiStruct):
 
         def _write__seq(self, io=None):
             super(Mrl.CbColorMask1, self)._write__seq(io)
-            for i in range(len(self.f_color_mask_threshold)):
-                pass
-                self._io.write_f4le(self.f_color_mask_threshold[i])
+            self._io.write_array("<f", self.f_color_mask_threshold)
 
-            for i in range(len(self.f_color_mask_offset)):
-                pass
-                self._io.write_f4le(self.f_color_mask_offset[i])
+            self._io.write_array("<f", self.f_color_mask_offset)
 
-            for i in range(len(self.f_clip_threshold)):
-                pass
-                self._io.write_f4le(self.f_clip_threshold[i])
+            self._io.write_array("<f", self.f_clip_threshold)
 
-            for i in range(len(self.f_color_mask_color)):
-                pass
-                self._io.write_f4le(self.f_color_mask_color[i])
+            self._io.write_array("<f", self.f_color_mask_color)
 
-            for i in range(len(self.f_color_mask2_threshold)):
-                pass
-                self._io.write_f4le(self.f_color_mask2_threshold[i])
+            self._io.write_array("<f", self.f_color_mask2_threshold)
 
-            for i in range(len(self.f_color_mask2_color)):
-                pass
-                self._io.write_f4le(self.f_color_mask2_color[i])
+            self._io.write_array("<f", self.f_color_mask2_color)
 
 
 
@@ -6645,13 +6301,9 @@ class Mrl(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.unk_00 = []
-            for i in range(2):
-                self.unk_00.append(self._io.read_u4le())
+            self.unk_00 = self._io.read_array("<I", 2)
 
-            self.unk_01 = []
-            for i in range(4):
-                self.unk_01.append(self._io.read_f4le())
+            self.unk_01 = self._io.read_array("<f", 4)
 
 
 
@@ -6667,13 +6319,9 @@ class Mrl(ReadWriteKaitaiStruct):
 
         def _write__seq(self, io=None):
             super(Mrl.AnimType6, self)._write__seq(io)
-            for i in range(len(self.unk_00)):
-                pass
-                self._io.write_u4le(self.unk_00[i])
+            self._io.write_array("<I", self.unk_00)
 
-            for i in range(len(self.unk_01)):
-                pass
-                self._io.write_f4le(self.unk_01[i])
+            self._io.write_array("<f", self.unk_01)
 
 
 
@@ -6888,19 +6536,11 @@ class Mrl(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.header = []
-            for i in range(4):
-                self.header.append(self._io.read_u1())
+            self.header = self._io.read_array("<B", 4)
 
-            self.values = []
-            for i in range(self._parent.info.num_entry):
-                _t_values = Mrl.AnimType4(self._io, self, self._root)
-                _t_values._read()
-                self.values.append(_t_values)
+            self.values = self._io.read_lazy_array(self._parent.info.num_entry, 80, Mrl.AnimType4, self._io, self, self._root)
 
-            self.hash = []
-            for i in range(self._parent.info.num_entry):
-                self.hash.append(self._io.read_u4le())
+            self.hash = self._io.read_array("<I", self._parent.info.num_entry)
 
 
 
@@ -6920,17 +6560,13 @@ class Mrl(ReadWriteKaitaiStruct):
 
         def _write__seq(self, io=None):
             super(Mrl.AnimSubEntry4, self)._write__seq(io)
-            for i in range(len(self.header)):
-                pass
-                self._io.write_u1(self.header[i])
+            self._io.write_array("<B", self.header)
 
             for i in range(len(self.values)):
                 pass
                 self.values[i]._write__seq(self._io)
 
-            for i in range(len(self.hash)):
-                pass
-                self._io.write_u4le(self.hash[i])
+            self._io.write_array("<I", self.hash)
 
 
 
@@ -7053,9 +6689,7 @@ class Mrl(ReadWriteKaitaiStruct):
 
         def _read(self):
             self.f_dd_material_inner_correct_offset = self._io.read_f4le()
-            self.padding = []
-            for i in range(3):
-                self.padding.append(self._io.read_f4le())
+            self.padding = self._io.read_array("<f", 3)
 
 
 
@@ -7069,9 +6703,7 @@ class Mrl(ReadWriteKaitaiStruct):
         def _write__seq(self, io=None):
             super(Mrl.CbDdMaterialParamInnerCorrect1, self)._write__seq(io)
             self._io.write_f4le(self.f_dd_material_inner_correct_offset)
-            for i in range(len(self.padding)):
-                pass
-                self._io.write_f4le(self.padding[i])
+            self._io.write_array("<f", self.padding)
 
 
 
@@ -7190,13 +6822,9 @@ class Mrl(ReadWriteKaitaiStruct):
 
         def _read(self):
             self.f_alpha_clip_threshold = self._io.read_f4le()
-            self.f_albedo_color = []
-            for i in range(3):
-                self.f_albedo_color.append(self._io.read_f4le())
+            self.f_albedo_color = self._io.read_array("<f", 3)
 
-            self.f_albedo_blend_color = []
-            for i in range(4):
-                self.f_albedo_blend_color.append(self._io.read_f4le())
+            self.f_albedo_blend_color = self._io.read_array("<f", 4)
 
             self.f_detail_normal_power = self._io.read_f4le()
             self.f_detail_normal_uv_scale = self._io.read_f4le()
@@ -7207,131 +6835,73 @@ class Mrl(ReadWriteKaitaiStruct):
             self.f_parallax_factor = self._io.read_f4le()
             self.f_parallax_self_occlusion = self._io.read_f4le()
             self.f_parallax_min_sample = self._io.read_f4le()
-            self.f_parallax_max_sample = []
-            for i in range(3):
-                self.f_parallax_max_sample.append(self._io.read_f4le())
+            self.f_parallax_max_sample = self._io.read_array("<f", 3)
 
-            self.f_light_map_color = []
-            for i in range(4):
-                self.f_light_map_color.append(self._io.read_f4le())
+            self.f_light_map_color = self._io.read_array("<f", 4)
 
-            self.f_thin_map_color = []
-            for i in range(3):
-                self.f_thin_map_color.append(self._io.read_f4le())
+            self.f_thin_map_color = self._io.read_array("<f", 3)
 
             self.f_thin_scattering = self._io.read_f4le()
-            self.f_screen_uv_scale = []
-            for i in range(2):
-                self.f_screen_uv_scale.append(self._io.read_f4le())
+            self.f_screen_uv_scale = self._io.read_array("<f", 2)
 
-            self.f_screen_uv_offset = []
-            for i in range(2):
-                self.f_screen_uv_offset.append(self._io.read_f4le())
+            self.f_screen_uv_offset = self._io.read_array("<f", 2)
 
-            self.f_indirect_offset = []
-            for i in range(2):
-                self.f_indirect_offset.append(self._io.read_f4le())
+            self.f_indirect_offset = self._io.read_array("<f", 2)
 
-            self.f_indirect_scale = []
-            for i in range(2):
-                self.f_indirect_scale.append(self._io.read_f4le())
+            self.f_indirect_scale = self._io.read_array("<f", 2)
 
             self.f_fresnel_schlick = self._io.read_f4le()
-            self.f_fresnel_schlick_rgb = []
-            for i in range(3):
-                self.f_fresnel_schlick_rgb.append(self._io.read_f4le())
+            self.f_fresnel_schlick_rgb = self._io.read_array("<f", 3)
 
-            self.f_specular_color = []
-            for i in range(3):
-                self.f_specular_color.append(self._io.read_f4le())
+            self.f_specular_color = self._io.read_array("<f", 3)
 
             self.f_shininess = self._io.read_f4le()
-            self.f_emission_color = []
-            for i in range(3):
-                self.f_emission_color.append(self._io.read_f4le())
+            self.f_emission_color = self._io.read_array("<f", 3)
 
             self.f_emission_threshold = self._io.read_f4le()
-            self.f_constant_color = []
-            for i in range(4):
-                self.f_constant_color.append(self._io.read_f4le())
+            self.f_constant_color = self._io.read_array("<f", 4)
 
             self.f_roughness = self._io.read_f4le()
-            self.f_roughness_rgb = []
-            for i in range(3):
-                self.f_roughness_rgb.append(self._io.read_f4le())
+            self.f_roughness_rgb = self._io.read_array("<f", 3)
 
-            self.f_anisotoropic_direction = []
-            for i in range(3):
-                self.f_anisotoropic_direction.append(self._io.read_f4le())
+            self.f_anisotoropic_direction = self._io.read_array("<f", 3)
 
             self.f_smoothness = self._io.read_f4le()
-            self.f_anistropic_uv = []
-            for i in range(2):
-                self.f_anistropic_uv.append(self._io.read_f4le())
+            self.f_anistropic_uv = self._io.read_array("<f", 2)
 
             self.f_primary_expo = self._io.read_f4le()
             self.f_secondary_expo = self._io.read_f4le()
-            self.f_primary_color = []
-            for i in range(4):
-                self.f_primary_color.append(self._io.read_f4le())
+            self.f_primary_color = self._io.read_array("<f", 4)
 
-            self.f_secondary_color = []
-            for i in range(4):
-                self.f_secondary_color.append(self._io.read_f4le())
+            self.f_secondary_color = self._io.read_array("<f", 4)
 
-            self.f_albedo_color2 = []
-            for i in range(4):
-                self.f_albedo_color2.append(self._io.read_f4le())
+            self.f_albedo_color2 = self._io.read_array("<f", 4)
 
-            self.f_specular_color2 = []
-            for i in range(3):
-                self.f_specular_color2.append(self._io.read_f4le())
+            self.f_specular_color2 = self._io.read_array("<f", 3)
 
             self.f_fresnel_schlick2 = self._io.read_f4le()
-            self.f_shininess2 = []
-            for i in range(4):
-                self.f_shininess2.append(self._io.read_f4le())
+            self.f_shininess2 = self._io.read_array("<f", 4)
 
-            self.f_transparency_clip_threshold = []
-            for i in range(4):
-                self.f_transparency_clip_threshold.append(self._io.read_f4le())
+            self.f_transparency_clip_threshold = self._io.read_array("<f", 4)
 
             self.f_blend_uv = self._io.read_f4le()
-            self.f_normal_power = []
-            for i in range(3):
-                self.f_normal_power.append(self._io.read_f4le())
+            self.f_normal_power = self._io.read_array("<f", 3)
 
-            self.f_albedo_blend2_color = []
-            for i in range(4):
-                self.f_albedo_blend2_color.append(self._io.read_f4le())
+            self.f_albedo_blend2_color = self._io.read_array("<f", 4)
 
-            self.f_detail_normal_u_v_scale = []
-            for i in range(2):
-                self.f_detail_normal_u_v_scale.append(self._io.read_f4le())
+            self.f_detail_normal_u_v_scale = self._io.read_array("<f", 2)
 
-            self.f_fresnel_legacy = []
-            for i in range(2):
-                self.f_fresnel_legacy.append(self._io.read_f4le())
+            self.f_fresnel_legacy = self._io.read_array("<f", 2)
 
-            self.f_normal_mask_pow0 = []
-            for i in range(4):
-                self.f_normal_mask_pow0.append(self._io.read_f4le())
+            self.f_normal_mask_pow0 = self._io.read_array("<f", 4)
 
-            self.f_normal_mask_pow1 = []
-            for i in range(4):
-                self.f_normal_mask_pow1.append(self._io.read_f4le())
+            self.f_normal_mask_pow1 = self._io.read_array("<f", 4)
 
-            self.f_normal_mask_pow2 = []
-            for i in range(4):
-                self.f_normal_mask_pow2.append(self._io.read_f4le())
+            self.f_normal_mask_pow2 = self._io.read_array("<f", 4)
 
-            self.f_texture_blend_rate = []
-            for i in range(4):
-                self.f_texture_blend_rate.append(self._io.read_f4le())
+            self.f_texture_blend_rate = self._io.read_array("<f", 4)
 
-            self.f_texture_blend_color = []
-            for i in range(4):
-                self.f_texture_blend_color.append(self._io.read_f4le())
+            self.f_texture_blend_color = self._io.read_array("<f", 4)
 
 
 
@@ -7435,13 +7005,9 @@ class Mrl(ReadWriteKaitaiStruct):
         def _write__seq(self, io=None):
             super(Mrl.CbGlobals2, self)._write__seq(io)
             self._io.write_f4le(self.f_alpha_clip_threshold)
-            for i in range(len(self.f_albedo_color)):
-                pass
-                self._io.write_f4le(self.f_albedo_color[i])
+            self._io.write_array("<f", self.f_albedo_color)
 
-            for i in range(len(self.f_albedo_blend_color)):
-                pass
-                self._io.write_f4le(self.f_albedo_blend_color[i])
+            self._io.write_array("<f", self.f_albedo_blend_color)
 
             self._io.write_f4le(self.f_detail_normal_power)
             self._io.write_f4le(self.f_detail_normal_uv_scale)
@@ -7452,131 +7018,73 @@ class Mrl(ReadWriteKaitaiStruct):
             self._io.write_f4le(self.f_parallax_factor)
             self._io.write_f4le(self.f_parallax_self_occlusion)
             self._io.write_f4le(self.f_parallax_min_sample)
-            for i in range(len(self.f_parallax_max_sample)):
-                pass
-                self._io.write_f4le(self.f_parallax_max_sample[i])
+            self._io.write_array("<f", self.f_parallax_max_sample)
 
-            for i in range(len(self.f_light_map_color)):
-                pass
-                self._io.write_f4le(self.f_light_map_color[i])
+            self._io.write_array("<f", self.f_light_map_color)
 
-            for i in range(len(self.f_thin_map_color)):
-                pass
-                self._io.write_f4le(self.f_thin_map_color[i])
+            self._io.write_array("<f", self.f_thin_map_color)
 
             self._io.write_f4le(self.f_thin_scattering)
-            for i in range(len(self.f_screen_uv_scale)):
-                pass
-                self._io.write_f4le(self.f_screen_uv_scale[i])
+            self._io.write_array("<f", self.f_screen_uv_scale)
 
-            for i in range(len(self.f_screen_uv_offset)):
-                pass
-                self._io.write_f4le(self.f_screen_uv_offset[i])
+            self._io.write_array("<f", self.f_screen_uv_offset)
 
-            for i in range(len(self.f_indirect_offset)):
-                pass
-                self._io.write_f4le(self.f_indirect_offset[i])
+            self._io.write_array("<f", self.f_indirect_offset)
 
-            for i in range(len(self.f_indirect_scale)):
-                pass
-                self._io.write_f4le(self.f_indirect_scale[i])
+            self._io.write_array("<f", self.f_indirect_scale)
 
             self._io.write_f4le(self.f_fresnel_schlick)
-            for i in range(len(self.f_fresnel_schlick_rgb)):
-                pass
-                self._io.write_f4le(self.f_fresnel_schlick_rgb[i])
+            self._io.write_array("<f", self.f_fresnel_schlick_rgb)
 
-            for i in range(len(self.f_specular_color)):
-                pass
-                self._io.write_f4le(self.f_specular_color[i])
+            self._io.write_array("<f", self.f_specular_color)
 
             self._io.write_f4le(self.f_shininess)
-            for i in range(len(self.f_emission_color)):
-                pass
-                self._io.write_f4le(self.f_emission_color[i])
+            self._io.write_array("<f", self.f_emission_color)
 
             self._io.write_f4le(self.f_emission_threshold)
-            for i in range(len(self.f_constant_color)):
-                pass
-                self._io.write_f4le(self.f_constant_color[i])
+            self._io.write_array("<f", self.f_constant_color)
 
             self._io.write_f4le(self.f_roughness)
-            for i in range(len(self.f_roughness_rgb)):
-                pass
-                self._io.write_f4le(self.f_roughness_rgb[i])
+            self._io.write_array("<f", self.f_roughness_rgb)
 
-            for i in range(len(self.f_anisotoropic_direction)):
-                pass
-                self._io.write_f4le(self.f_anisotoropic_direction[i])
+            self._io.write_array("<f", self.f_anisotoropic_direction)
 
             self._io.write_f4le(self.f_smoothness)
-            for i in range(len(self.f_anistropic_uv)):
-                pass
-                self._io.write_f4le(self.f_anistropic_uv[i])
+            self._io.write_array("<f", self.f_anistropic_uv)
 
             self._io.write_f4le(self.f_primary_expo)
             self._io.write_f4le(self.f_secondary_expo)
-            for i in range(len(self.f_primary_color)):
-                pass
-                self._io.write_f4le(self.f_primary_color[i])
+            self._io.write_array("<f", self.f_primary_color)
 
-            for i in range(len(self.f_secondary_color)):
-                pass
-                self._io.write_f4le(self.f_secondary_color[i])
+            self._io.write_array("<f", self.f_secondary_color)
 
-            for i in range(len(self.f_albedo_color2)):
-                pass
-                self._io.write_f4le(self.f_albedo_color2[i])
+            self._io.write_array("<f", self.f_albedo_color2)
 
-            for i in range(len(self.f_specular_color2)):
-                pass
-                self._io.write_f4le(self.f_specular_color2[i])
+            self._io.write_array("<f", self.f_specular_color2)
 
             self._io.write_f4le(self.f_fresnel_schlick2)
-            for i in range(len(self.f_shininess2)):
-                pass
-                self._io.write_f4le(self.f_shininess2[i])
+            self._io.write_array("<f", self.f_shininess2)
 
-            for i in range(len(self.f_transparency_clip_threshold)):
-                pass
-                self._io.write_f4le(self.f_transparency_clip_threshold[i])
+            self._io.write_array("<f", self.f_transparency_clip_threshold)
 
             self._io.write_f4le(self.f_blend_uv)
-            for i in range(len(self.f_normal_power)):
-                pass
-                self._io.write_f4le(self.f_normal_power[i])
+            self._io.write_array("<f", self.f_normal_power)
 
-            for i in range(len(self.f_albedo_blend2_color)):
-                pass
-                self._io.write_f4le(self.f_albedo_blend2_color[i])
+            self._io.write_array("<f", self.f_albedo_blend2_color)
 
-            for i in range(len(self.f_detail_normal_u_v_scale)):
-                pass
-                self._io.write_f4le(self.f_detail_normal_u_v_scale[i])
+            self._io.write_array("<f", self.f_detail_normal_u_v_scale)
 
-            for i in range(len(self.f_fresnel_legacy)):
-                pass
-                self._io.write_f4le(self.f_fresnel_legacy[i])
+            self._io.write_array("<f", self.f_fresnel_legacy)
 
-            for i in range(len(self.f_normal_mask_pow0)):
-                pass
-                self._io.write_f4le(self.f_normal_mask_pow0[i])
+            self._io.write_array("<f", self.f_normal_mask_pow0)
 
-            for i in range(len(self.f_normal_mask_pow1)):
-                pass
-                self._io.write_f4le(self.f_normal_mask_pow1[i])
+            self._io.write_array("<f", self.f_normal_mask_pow1)
 
-            for i in range(len(self.f_normal_mask_pow2)):
-                pass
-                self._io.write_f4le(self.f_normal_mask_pow2[i])
+            self._io.write_array("<f", self.f_normal_mask_pow2)
 
-            for i in range(len(self.f_texture_blend_rate)):
-                pass
-                self._io.write_f4le(self.f_texture_blend_rate[i])
+            self._io.write_array("<f", self.f_texture_blend_rate)
 
-            for i in range(len(self.f_texture_blend_color)):
-                pass
-                self._io.write_f4le(self.f_texture_blend_color[i])
+            self._io.write_array("<f", self.f_texture_blend_color)
 
 
 
@@ -7780,9 +7288,7 @@ class Mrl(ReadWriteKaitaiStruct):
             self.draw_pass = self._io.read_bits_int_le(5)
             self.layer_id = self._io.read_bits_int_le(2)
             self.deffered_lighting = self._io.read_bits_int_le(1) != 0
-            self.blend_factor = []
-            for i in range(4):
-                self.blend_factor.append(self._io.read_f4le())
+            self.blend_factor = self._io.read_array("<f", 4)
 
             self.anim_data_size = self._io.read_u4le()
             self.ofs_cmd = self._io.read_u4le()
@@ -7830,9 +7336,7 @@ class Mrl(ReadWriteKaitaiStruct):
             self._io.write_bits_int_le(5, self.draw_pass)
             self._io.write_bits_int_le(2, self.layer_id)
             self._io.write_bits_int_le(1, int(self.deffered_lighting))
-            for i in range(len(self.blend_factor)):
-                pass
-                self._io.write_f4le(self.blend_factor[i])
+            self._io.write_array("<f", self.blend_factor)
 
             self._io.write_u4le(self.anim_data_size)
             self._io.write_u4le(self.ofs_cmd)
@@ -7953,9 +7457,7 @@ class Mrl(ReadWriteKaitaiStruct):
 
         def _read(self):
             self.unk_00 = self._io.read_u4le()
-            self.unk_01 = []
-            for i in range(4):
-                self.unk_01.append(self._io.read_f4le())
+            self.unk_01 = self._io.read_array("<f", 4)
 
 
 
@@ -7969,9 +7471,7 @@ class Mrl(ReadWriteKaitaiStruct):
         def _write__seq(self, io=None):
             super(Mrl.AnimType1, self)._write__seq(io)
             self._io.write_u4le(self.unk_00)
-            for i in range(len(self.unk_01)):
-                pass
-                self._io.write_f4le(self.unk_01[i])
+            self._io.write_array("<f", self.unk_01)
 
 
 
@@ -7991,14 +7491,10 @@ class Mrl(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.f_plane_normal = []
-            for i in range(3):
-                self.f_plane_normal.append(self._io.read_f4le())
+            self.f_plane_normal = self._io.read_array("<f", 3)
 
             self.padding_1 = self._io.read_f4le()
-            self.f_plane_point = []
-            for i in range(3):
-                self.f_plane_point.append(self._io.read_f4le())
+            self.f_plane_point = self._io.read_array("<f", 3)
 
             self.padding_2 = self._io.read_f4le()
             self.f_app_clip_mask = self._io.read_f4le()
@@ -8017,14 +7513,10 @@ class Mrl(ReadWriteKaitaiStruct):
 
         def _write__seq(self, io=None):
             super(Mrl.CbAppClipPlane1, self)._write__seq(io)
-            for i in range(len(self.f_plane_normal)):
-                pass
-                self._io.write_f4le(self.f_plane_normal[i])
+            self._io.write_array("<f", self.f_plane_normal)
 
             self._io.write_f4le(self.padding_1)
-            for i in range(len(self.f_plane_point)):
-                pass
-                self._io.write_f4le(self.f_plane_point[i])
+            self._io.write_array("<f", self.f_plane_point)
 
             self._io.write_f4le(self.padding_2)
             self._io.write_f4le(self.f_app_clip_mask)
@@ -8062,15 +7554,9 @@ class Mrl(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.header = []
-            for i in range(4):
-                self.header.append(self._io.read_u1())
+            self.header = self._io.read_array("<B", 4)
 
-            self.values = []
-            for i in range(self._parent.info.num_entry):
-                _t_values = Mrl.AnimType6(self._io, self, self._root)
-                _t_values._read()
-                self.values.append(_t_values)
+            self.values = self._io.read_lazy_array(self._parent.info.num_entry, 24, Mrl.AnimType6, self._io, self, self._root)
 
 
 
@@ -8087,9 +7573,7 @@ class Mrl(ReadWriteKaitaiStruct):
 
         def _write__seq(self, io=None):
             super(Mrl.AnimSubEntry6, self)._write__seq(io)
-            for i in range(len(self.header)):
-                pass
-                self._io.write_u1(self.header[i])
+            self._io.write_array("<B", self.header)
 
             for i in range(len(self.values)):
                 pass
@@ -8122,21 +7606,15 @@ class Mrl(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.f_outline_outer_color = []
-            for i in range(4):
-                self.f_outline_outer_color.append(self._io.read_f4le())
+            self.f_outline_outer_color = self._io.read_array("<f", 4)
 
-            self.f_outline_inner_color = []
-            for i in range(4):
-                self.f_outline_inner_color.append(self._io.read_f4le())
+            self.f_outline_inner_color = self._io.read_array("<f", 4)
 
             self.f_outline_balance_offset = self._io.read_f4le()
             self.f_outline_balance_scale = self._io.read_f4le()
             self.f_outline_balance = self._io.read_f4le()
             self.padding = self._io.read_f4le()
-            self.f_outline_blend_mask = []
-            for i in range(4):
-                self.f_outline_blend_mask.append(self._io.read_f4le())
+            self.f_outline_blend_mask = self._io.read_array("<f", 4)
 
 
 
@@ -8155,21 +7633,15 @@ class Mrl(ReadWriteKaitaiStruct):
 
         def _write__seq(self, io=None):
             super(Mrl.CbOutlineEx1, self)._write__seq(io)
-            for i in range(len(self.f_outline_outer_color)):
-                pass
-                self._io.write_f4le(self.f_outline_outer_color[i])
+            self._io.write_array("<f", self.f_outline_outer_color)
 
-            for i in range(len(self.f_outline_inner_color)):
-                pass
-                self._io.write_f4le(self.f_outline_inner_color[i])
+            self._io.write_array("<f", self.f_outline_inner_color)
 
             self._io.write_f4le(self.f_outline_balance_offset)
             self._io.write_f4le(self.f_outline_balance_scale)
             self._io.write_f4le(self.f_outline_balance)
             self._io.write_f4le(self.padding)
-            for i in range(len(self.f_outline_blend_mask)):
-                pass
-                self._io.write_f4le(self.f_outline_blend_mask[i])
+            self._io.write_array("<f", self.f_outline_blend_mask)
 
 
 
@@ -8211,13 +7683,9 @@ class Mrl(ReadWriteKaitaiStruct):
         def _read(self):
             self.f_b_emission_factor = self._io.read_f4le()
             self.f_b_emission_alpha_band = self._io.read_f4le()
-            self.padding_1 = []
-            for i in range(2):
-                self.padding_1.append(self._io.read_f4le())
+            self.padding_1 = self._io.read_array("<f", 2)
 
-            self.f_burn_emission_color = []
-            for i in range(3):
-                self.f_burn_emission_color.append(self._io.read_f4le())
+            self.f_burn_emission_color = self._io.read_array("<f", 3)
 
             self.padding_2 = self._io.read_f4le()
 
@@ -8236,13 +7704,9 @@ class Mrl(ReadWriteKaitaiStruct):
             super(Mrl.CbBurnEmission1, self)._write__seq(io)
             self._io.write_f4le(self.f_b_emission_factor)
             self._io.write_f4le(self.f_b_emission_alpha_band)
-            for i in range(len(self.padding_1)):
-                pass
-                self._io.write_f4le(self.padding_1[i])
+            self._io.write_array("<f", self.padding_1)
 
-            for i in range(len(self.f_burn_emission_color)):
-                pass
-                self._io.write_f4le(self.f_burn_emission_color[i])
+            self._io.write_array("<f", self.f_burn_emission_color)
 
             self._io.write_f4le(self.padding_2)
 
@@ -8279,11 +7743,7 @@ class Mrl(ReadWriteKaitaiStruct):
 
         def _read(self):
             self.entry_count = self._io.read_u4le()
-            self.ofs_to_info = []
-            for i in range(self.entry_count):
-                _t_ofs_to_info = Mrl.AnimOfs(self._io, self, self._root)
-                _t_ofs_to_info._read()
-                self.ofs_to_info.append(_t_ofs_to_info)
+            self.ofs_to_info = self._io.read_lazy_array(self.entry_count, 4, Mrl.AnimOfs, self._io, self, self._root)
 
 
 
@@ -8548,21 +8008,13 @@ class Mrl(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.f_dd_material_blend_color = []
-            for i in range(4):
-                self.f_dd_material_blend_color.append(self._io.read_f4le())
+            self.f_dd_material_blend_color = self._io.read_array("<f", 4)
 
-            self.f_dd_material_color_blend_rate = []
-            for i in range(2):
-                self.f_dd_material_color_blend_rate.append(self._io.read_f4le())
+            self.f_dd_material_color_blend_rate = self._io.read_array("<f", 2)
 
-            self.f_dd_material_area_mask = []
-            for i in range(2):
-                self.f_dd_material_area_mask.append(self._io.read_f4le())
+            self.f_dd_material_area_mask = self._io.read_array("<f", 2)
 
-            self.f_dd_material_border_blend_mask = []
-            for i in range(4):
-                self.f_dd_material_border_blend_mask.append(self._io.read_f4le())
+            self.f_dd_material_border_blend_mask = self._io.read_array("<f", 4)
 
             self.f_dd_material_border_shade_band = self._io.read_f4le()
             self.f_dd_material_base_power = self._io.read_f4le()
@@ -8572,27 +8024,19 @@ class Mrl(ReadWriteKaitaiStruct):
             self.f_dd_material_specular_map_factor = self._io.read_f4le()
             self.f_dd_material_env_map_blend_color = self._io.read_f4le()
             self.f_dd_material_area_alpha = self._io.read_f4le()
-            self.f_dd_material_area_pos = []
-            for i in range(4):
-                self.f_dd_material_area_pos.append(self._io.read_f4le())
+            self.f_dd_material_area_pos = self._io.read_array("<f", 4)
 
             self.f_dd_material_albedo_uv_scale = self._io.read_f4le()
             self.f_dd_material_normal_uv_scale = self._io.read_f4le()
             self.f_dd_material_normal_power = self._io.read_f4le()
             self.f_dd_material_base_env_map_power = self._io.read_f4le()
-            self.f_dd_material_lantern_color = []
-            for i in range(3):
-                self.f_dd_material_lantern_color.append(self._io.read_f4le())
+            self.f_dd_material_lantern_color = self._io.read_array("<f", 3)
 
             self.padding_1 = self._io.read_f4le()
-            self.f_dd_material_lantern_pos = []
-            for i in range(3):
-                self.f_dd_material_lantern_pos.append(self._io.read_f4le())
+            self.f_dd_material_lantern_pos = self._io.read_array("<f", 3)
 
             self.padding_2 = self._io.read_f4le()
-            self.f_dd_material_lantern_param = []
-            for i in range(3):
-                self.f_dd_material_lantern_param.append(self._io.read_f4le())
+            self.f_dd_material_lantern_param = self._io.read_array("<f", 3)
 
             self.padding_3 = self._io.read_f4le()
 
@@ -8627,21 +8071,13 @@ class Mrl(ReadWriteKaitaiStruct):
 
         def _write__seq(self, io=None):
             super(Mrl.CbDdMaterialParam1, self)._write__seq(io)
-            for i in range(len(self.f_dd_material_blend_color)):
-                pass
-                self._io.write_f4le(self.f_dd_material_blend_color[i])
+            self._io.write_array("<f", self.f_dd_material_blend_color)
 
-            for i in range(len(self.f_dd_material_color_blend_rate)):
-                pass
-                self._io.write_f4le(self.f_dd_material_color_blend_rate[i])
+            self._io.write_array("<f", self.f_dd_material_color_blend_rate)
 
-            for i in range(len(self.f_dd_material_area_mask)):
-                pass
-                self._io.write_f4le(self.f_dd_material_area_mask[i])
+            self._io.write_array("<f", self.f_dd_material_area_mask)
 
-            for i in range(len(self.f_dd_material_border_blend_mask)):
-                pass
-                self._io.write_f4le(self.f_dd_material_border_blend_mask[i])
+            self._io.write_array("<f", self.f_dd_material_border_blend_mask)
 
             self._io.write_f4le(self.f_dd_material_border_shade_band)
             self._io.write_f4le(self.f_dd_material_base_power)
@@ -8651,27 +8087,19 @@ class Mrl(ReadWriteKaitaiStruct):
             self._io.write_f4le(self.f_dd_material_specular_map_factor)
             self._io.write_f4le(self.f_dd_material_env_map_blend_color)
             self._io.write_f4le(self.f_dd_material_area_alpha)
-            for i in range(len(self.f_dd_material_area_pos)):
-                pass
-                self._io.write_f4le(self.f_dd_material_area_pos[i])
+            self._io.write_array("<f", self.f_dd_material_area_pos)
 
             self._io.write_f4le(self.f_dd_material_albedo_uv_scale)
             self._io.write_f4le(self.f_dd_material_normal_uv_scale)
             self._io.write_f4le(self.f_dd_material_normal_power)
             self._io.write_f4le(self.f_dd_material_base_env_map_power)
-            for i in range(len(self.f_dd_material_lantern_color)):
-                pass
-                self._io.write_f4le(self.f_dd_material_lantern_color[i])
+            self._io.write_array("<f", self.f_dd_material_lantern_color)
 
             self._io.write_f4le(self.padding_1)
-            for i in range(len(self.f_dd_material_lantern_pos)):
-                pass
-                self._io.write_f4le(self.f_dd_material_lantern_pos[i])
+            self._io.write_array("<f", self.f_dd_material_lantern_pos)
 
             self._io.write_f4le(self.padding_2)
-            for i in range(len(self.f_dd_material_lantern_param)):
-                pass
-                self._io.write_f4le(self.f_dd_material_lantern_param[i])
+            self._io.write_array("<f", self.f_dd_material_lantern_param)
 
             self._io.write_f4le(self.padding_3)
 
@@ -8742,15 +8170,9 @@ class Mrl(ReadWriteKaitaiStruct):
             self.info._read()
             self.ofs_list_entry1 = self._io.read_u4le()
             self.unk_hash = self._io.read_u4le()
-            self.ofs_entry2 = []
-            for i in range(self.info.num_entry2):
-                _t_ofs_entry2 = Mrl.BlockOffset(self._io, self, self._root)
-                _t_ofs_entry2._read()
-                self.ofs_entry2.append(_t_ofs_entry2)
+            self.ofs_entry2 = self._io.read_lazy_array(self.info.num_entry2, 4, Mrl.BlockOffset, self._io, self, self._root)
 
-            self.set_buff_hash = []
-            for i in range(self.info.num_entry1):
-                self.set_buff_hash.append(self._io.read_u4le())
+            self.set_buff_hash = self._io.read_array("<I", self.info.num_entry1)
 
 
 
@@ -8776,9 +8198,7 @@ class Mrl(ReadWriteKaitaiStruct):
                 pass
                 self.ofs_entry2[i]._write__seq(self._io)
 
-            for i in range(len(self.set_buff_hash)):
-                pass
-                self._io.write_u4le(self.set_buff_hash[i])
+            self._io.write_array("<I", self.set_buff_hash)
 
 
 
@@ -9246,9 +8666,7 @@ class Mrl(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.f_app_reflect_shadow_dir = []
-            for i in range(3):
-                self.f_app_reflect_shadow_dir.append(self._io.read_f4le())
+            self.f_app_reflect_shadow_dir = self._io.read_array("<f", 3)
 
             self.padding = self._io.read_f4le()
 
@@ -9262,9 +8680,7 @@ class Mrl(ReadWriteKaitaiStruct):
 
         def _write__seq(self, io=None):
             super(Mrl.CbAppReflectShadowLight1, self)._write__seq(io)
-            for i in range(len(self.f_app_reflect_shadow_dir)):
-                pass
-                self._io.write_f4le(self.f_app_reflect_shadow_dir[i])
+            self._io.write_array("<f", self.f_app_reflect_shadow_dir)
 
             self._io.write_f4le(self.padding)
 
@@ -9295,13 +8711,9 @@ class Mrl(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.header = []
-            for i in range(24):
-                self.header.append(self._io.read_u1())
+            self.header = self._io.read_array("<B", 24)
 
-            self.values = []
-            for i in range((16 * (self._parent.info.num_entry - 1))):
-                self.values.append(self._io.read_u1())
+            self.values = self._io.read_array("<B", (16 * (self._parent.info.num_entry - 1)))
 
 
 
@@ -9317,13 +8729,9 @@ class Mrl(ReadWriteKaitaiStruct):
 
         def _write__seq(self, io=None):
             super(Mrl.AnimSubEntry3, self)._write__seq(io)
-            for i in range(len(self.header)):
-                pass
-                self._io.write_u1(self.header[i])
+            self._io.write_array("<B", self.header)
 
-            for i in range(len(self.values)):
-                pass
-                self._io.write_u1(self.values[i])
+            self._io.write_array("<B", self.values)
 
 
 
@@ -9436,13 +8844,9 @@ class Mrl(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.header = []
-            for i in range(12):
-                self.header.append(self._io.read_u1())
+            self.header = self._io.read_array("<B", 12)
 
-            self.values = []
-            for i in range((8 * self._parent.info.num_entry)):
-                self.values.append(self._io.read_u1())
+            self.values = self._io.read_array("<B", (8 * self._parent.info.num_entry))
 
 
 
@@ -9458,13 +8862,9 @@ class Mrl(ReadWriteKaitaiStruct):
 
         def _write__seq(self, io=None):
             super(Mrl.AnimSubEntry2, self)._write__seq(io)
-            for i in range(len(self.header)):
-                pass
-                self._io.write_u1(self.header[i])
+            self._io.write_array("<B", self.header)
 
-            for i in range(len(self.values)):
-                pass
-                self._io.write_u1(self.values[i])
+            self._io.write_array("<B", self.values)
 
 
 
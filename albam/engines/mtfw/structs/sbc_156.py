@@ -17,29 +17,13 @@ class Sbc156(ReadWriteKaitaiStruct):
     def _read(self):
         self.header = Sbc156.SbcHeader(self._io, self, self._root)
         self.header._read()
-        self.nodes = []
-        for i in range(self.header.num_nodes):
-            _t_nodes = Sbc156.BvhNode(self._io, self, self._root)
-            _t_nodes._read()
-            self.nodes.append(_t_nodes)
+        self.nodes = self._io.read_lazy_array(self.header.num_nodes, 80, Sbc156.BvhNode, self._io, self, self._root)
 
-        self.sbc_info = []
-        for i in range(self.header.num_infos):
-            _t_sbc_info = Sbc156.Info(self._io, self, self._root)
-            _t_sbc_info._read()
-            self.sbc_info.append(_t_sbc_info)
+        self.sbc_info = self._io.read_lazy_array(self.header.num_infos, 96, Sbc156.Info, self._io, self, self._root)
 
-        self.faces = []
-        for i in range(self.header.num_faces):
-            _t_faces = Sbc156.Face(self._io, self, self._root)
-            _t_faces._read()
-            self.faces.append(_t_faces)
+        self.faces = self._io.read_lazy_array(self.header.num_faces, 28, Sbc156.Face, self._io, self, self._root)
 
-        self.vertices = []
-        for i in range(self.header.num_vertices):
-            _t_vertices = Sbc156.Vec4(self._io, self, self._root)
-            _t_vertices._read()
-            self.vertices.append(_t_vertices)
+        self.vertices = self._io.read_lazy_array(self.header.num_vertices, 16, Sbc156.Vec4, self._io, self, self._root)
 
 
 
@@ -315,9 +299,7 @@ class Sbc156(ReadWriteKaitaiStruct):
                 _t_max._read()
                 self.max.append(_t_max)
 
-            self.child_index = []
-            for i in range(2):
-                self.child_index.append(self._io.read_u2le())
+            self.child_index = self._io.read_array("<H", 2)
 
 
 
@@ -353,9 +335,7 @@ class Sbc156(ReadWriteKaitaiStruct):
                 pass
                 self.max[i]._write__seq(self._io)
 
-            for i in range(len(self.child_index)):
-                pass
-                self._io.write_u2le(self.child_index[i])
+            self._io.write_array("<H", self.child_index)
 
 
 
@@ -434,18 +414,12 @@ class Sbc156(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.vert = []
-            for i in range(3):
-                self.vert.append(self._io.read_u2le())
+            self.vert = self._io.read_array("<H", 3)
 
-            self.unk_00 = []
-            for i in range(2):
-                self.unk_00.append(self._io.read_u1())
+            self.unk_00 = self._io.read_array("<B", 2)
 
             self.type = self._io.read_u4le()
-            self.attr = []
-            for i in range(4):
-                self.attr.append(self._io.read_u4le())
+            self.attr = self._io.read_array("<I", 4)
 
 
 
@@ -464,18 +438,12 @@ class Sbc156(ReadWriteKaitaiStruct):
 
         def _write__seq(self, io=None):
             super(Sbc156.Face, self)._write__seq(io)
-            for i in range(len(self.vert)):
-                pass
-                self._io.write_u2le(self.vert[i])
+            self._io.write_array("<H", self.vert)
 
-            for i in range(len(self.unk_00)):
-                pass
-                self._io.write_u1(self.unk_00[i])
+            self._io.write_array("<B", self.unk_00)
 
             self._io.write_u4le(self.type)
-            for i in range(len(self.attr)):
-                pass
-                self._io.write_u4le(self.attr[i])
+            self._io.write_array("<I", self.attr)
 
 
 
@@ -511,13 +479,9 @@ class Sbc156(ReadWriteKaitaiStruct):
             self.aabb_02._read()
             self.bit = self._io.read_u1()
             self.unk = self._io.read_u1()
-            self.child_index = []
-            for i in range(2):
-                self.child_index.append(self._io.read_u2le())
+            self.child_index = self._io.read_array("<H", 2)
 
-            self.nulls = []
-            for i in range(10):
-                self.nulls.append(self._io.read_u1())
+            self.nulls = self._io.read_array("<B", 10)
 
 
 
@@ -539,13 +503,9 @@ class Sbc156(ReadWriteKaitaiStruct):
             self.aabb_02._write__seq(self._io)
             self._io.write_u1(self.bit)
             self._io.write_u1(self.unk)
-            for i in range(len(self.child_index)):
-                pass
-                self._io.write_u2le(self.child_index[i])
+            self._io.write_array("<H", self.child_index)
 
-            for i in range(len(self.nulls)):
-                pass
-                self._io.write_u1(self.nulls[i])
+            self._io.write_array("<B", self.nulls)
 
 
 
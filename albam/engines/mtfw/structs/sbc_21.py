@@ -17,11 +17,7 @@ class Sbc21(ReadWriteKaitaiStruct):
     def _read(self):
         self.header = Sbc21.SbcHeader(self._io, self, self._root)
         self.header._read()
-        self.sbc_info = []
-        for i in range(self.header.object_count):
-            _t_sbc_info = Sbc21.Info(self._io, self, self._root)
-            _t_sbc_info._read()
-            self.sbc_info.append(_t_sbc_info)
+        self.sbc_info = self._io.read_lazy_array(self.header.object_count, 80, Sbc21.Info, self._io, self, self._root)
 
         self.sbc_bvhc = []
         for i in range(self.header.object_count):
@@ -31,29 +27,13 @@ class Sbc21(ReadWriteKaitaiStruct):
 
         self.bvh = Sbc21.BvhCollision(self._io, self, self._root)
         self.bvh._read()
-        self.faces = []
-        for i in range(self.header.face_count):
-            _t_faces = Sbc21.Face(self._io, self, self._root)
-            _t_faces._read()
-            self.faces.append(_t_faces)
+        self.faces = self._io.read_lazy_array(self.header.face_count, 32, Sbc21.Face, self._io, self, self._root)
 
-        self.vertices = []
-        for i in range(self.header.vertex_count):
-            _t_vertices = Sbc21.Vertex(self._io, self, self._root)
-            _t_vertices._read()
-            self.vertices.append(_t_vertices)
+        self.vertices = self._io.read_lazy_array(self.header.vertex_count, 16, Sbc21.Vertex, self._io, self, self._root)
 
-        self.collision_types = []
-        for i in range(self.header.stage_count):
-            _t_collision_types = Sbc21.CollisionType(self._io, self, self._root)
-            _t_collision_types._read()
-            self.collision_types.append(_t_collision_types)
+        self.collision_types = self._io.read_lazy_array(self.header.stage_count, 32, Sbc21.CollisionType, self._io, self, self._root)
 
-        self.pairs_collections = []
-        for i in range(self.header.pair_count):
-            _t_pairs_collections = Sbc21.SFacePair(self._io, self, self._root)
-            _t_pairs_collections._read()
-            self.pairs_collections.append(_t_pairs_collections)
+        self.pairs_collections = self._io.read_lazy_array(self.header.pair_count, 10, Sbc21.SFacePair, self._io, self, self._root)
 
 
 
@@ -218,13 +198,9 @@ class Sbc21(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.min = []
-            for i in range(4):
-                self.min.append(self._io.read_f4le())
+            self.min = self._io.read_array("<f", 4)
 
-            self.max = []
-            for i in range(4):
-                self.max.append(self._io.read_f4le())
+            self.max = self._io.read_array("<f", 4)
 
 
 
@@ -240,13 +216,9 @@ class Sbc21(ReadWriteKaitaiStruct):
 
         def _write__seq(self, io=None):
             super(Sbc21.Bbox, self)._write__seq(io)
-            for i in range(len(self.min)):
-                pass
-                self._io.write_f4le(self.min[i])
+            self._io.write_array("<f", self.min)
 
-            for i in range(len(self.max)):
-                pass
-                self._io.write_f4le(self.max[i])
+            self._io.write_array("<f", self.max)
 
 
 
@@ -274,13 +246,9 @@ class Sbc21(ReadWriteKaitaiStruct):
             self.unk_01 = self._io.read_f4le()
             self.unk_02 = self._io.read_u2le()
             self.unk_03 = self._io.read_u2le()
-            self.unk_04 = []
-            for i in range(3):
-                self.unk_04.append(self._io.read_u4le())
+            self.unk_04 = self._io.read_array("<I", 3)
 
-            self.jp_path = []
-            for i in range(12):
-                self.jp_path.append(self._io.read_u1())
+            self.jp_path = self._io.read_array("<B", 12)
 
 
 
@@ -299,13 +267,9 @@ class Sbc21(ReadWriteKaitaiStruct):
             self._io.write_f4le(self.unk_01)
             self._io.write_u2le(self.unk_02)
             self._io.write_u2le(self.unk_03)
-            for i in range(len(self.unk_04)):
-                pass
-                self._io.write_u4le(self.unk_04[i])
+            self._io.write_array("<I", self.unk_04)
 
-            for i in range(len(self.jp_path)):
-                pass
-                self._io.write_u1(self.jp_path[i])
+            self._io.write_array("<B", self.jp_path)
 
 
 
@@ -330,17 +294,11 @@ class Sbc21(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.x = []
-            for i in range(4):
-                self.x.append(self._io.read_f4le())
+            self.x = self._io.read_array("<f", 4)
 
-            self.y = []
-            for i in range(4):
-                self.y.append(self._io.read_f4le())
+            self.y = self._io.read_array("<f", 4)
 
-            self.z = []
-            for i in range(4):
-                self.z.append(self._io.read_f4le())
+            self.z = self._io.read_array("<f", 4)
 
 
 
@@ -359,17 +317,11 @@ class Sbc21(ReadWriteKaitaiStruct):
 
         def _write__seq(self, io=None):
             super(Sbc21.AabbBlock, self)._write__seq(io)
-            for i in range(len(self.x)):
-                pass
-                self._io.write_f4le(self.x[i])
+            self._io.write_array("<f", self.x)
 
-            for i in range(len(self.y)):
-                pass
-                self._io.write_f4le(self.y[i])
+            self._io.write_array("<f", self.y)
 
-            for i in range(len(self.z)):
-                pass
-                self._io.write_f4le(self.z[i])
+            self._io.write_array("<f", self.z)
 
 
 
@@ -402,9 +354,7 @@ class Sbc21(ReadWriteKaitaiStruct):
             self.bounding_box = Sbc21.Bbox(self._io, self, self._root)
             self.bounding_box._read()
             self.unk_01 = self._io.read_u4le()
-            self.nulls_01 = []
-            for i in range(2):
-                self.nulls_01.append(self._io.read_u4le())
+            self.nulls_01 = self._io.read_array("<I", 2)
 
             self.pairs_start = self._io.read_u4le()
             self.pairs_count = self._io.read_u4le()
@@ -413,9 +363,7 @@ class Sbc21(ReadWriteKaitaiStruct):
             self.vertex_start = self._io.read_u4le()
             self.vertex_count = self._io.read_u4le()
             self.index_id = self._io.read_u4le()
-            self.nulls_02 = []
-            for i in range(2):
-                self.nulls_02.append(self._io.read_u4le())
+            self.nulls_02 = self._io.read_array("<I", 2)
 
 
 
@@ -434,9 +382,7 @@ class Sbc21(ReadWriteKaitaiStruct):
             super(Sbc21.Info, self)._write__seq(io)
             self.bounding_box._write__seq(self._io)
             self._io.write_u4le(self.unk_01)
-            for i in range(len(self.nulls_01)):
-                pass
-                self._io.write_u4le(self.nulls_01[i])
+            self._io.write_array("<I", self.nulls_01)
 
             self._io.write_u4le(self.pairs_start)
             self._io.write_u4le(self.pairs_count)
@@ -445,9 +391,7 @@ class Sbc21(ReadWriteKaitaiStruct):
             self._io.write_u4le(self.vertex_start)
             self._io.write_u4le(self.vertex_count)
             self._io.write_u4le(self.index_id)
-            for i in range(len(self.nulls_02)):
-                pass
-                self._io.write_u4le(self.nulls_02[i])
+            self._io.write_array("<I", self.nulls_02)
 
 
 
@@ -478,9 +422,7 @@ class Sbc21(ReadWriteKaitaiStruct):
         def _read(self):
             self.face_01 = self._io.read_u2le()
             self.face_02 = self._io.read_u2le()
-            self.quad_order = []
-            for i in range(4):
-                self.quad_order.append(self._io.read_u1())
+            self.quad_order = self._io.read_array("<B", 4)
 
             self.type = self._io.read_u2le()
 
@@ -496,9 +438,7 @@ class Sbc21(ReadWriteKaitaiStruct):
             super(Sbc21.SFacePair, self)._write__seq(io)
             self._io.write_u2le(self.face_01)
             self._io.write_u2le(self.face_02)
-            for i in range(len(self.quad_order)):
-                pass
-                self._io.write_u1(self.quad_order[i])
+            self._io.write_array("<B", self.quad_order)
 
             self._io.write_u2le(self.type)
 
@@ -519,19 +459,13 @@ class Sbc21(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.normal = []
-            for i in range(3):
-                self.normal.append(self._io.read_f4le())
+            self.normal = self._io.read_array("<f", 3)
 
-            self.vert = []
-            for i in range(3):
-                self.vert.append(self._io.read_u2le())
+            self.vert = self._io.read_array("<H", 3)
 
             self.type = self._io.read_u2le()
             self.nulls = self._io.read_u4le()
-            self.adjacent = []
-            for i in range(3):
-                self.adjacent.append(self._io.read_u1())
+            self.adjacent = self._io.read_array("<B", 3)
 
             self.nulls_01 = self._io.read_u1()
             self.nulls_02 = self._io.read_u4le()
@@ -552,19 +486,13 @@ class Sbc21(ReadWriteKaitaiStruct):
 
         def _write__seq(self, io=None):
             super(Sbc21.Face, self)._write__seq(io)
-            for i in range(len(self.normal)):
-                pass
-                self._io.write_f4le(self.normal[i])
+            self._io.write_array("<f", self.normal)
 
-            for i in range(len(self.vert)):
-                pass
-                self._io.write_u2le(self.vert[i])
+            self._io.write_array("<H", self.vert)
 
             self._io.write_u2le(self.type)
             self._io.write_u4le(self.nulls)
-            for i in range(len(self.adjacent)):
-                pass
-                self._io.write_u1(self.adjacent[i])
+            self._io.write_array("<B", self.adjacent)
 
             self._io.write_u1(self.nulls_01)
             self._io.write_u4le(self.nulls_02)
@@ -596,13 +524,9 @@ class Sbc21(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.node_type = []
-            for i in range(4):
-                self.node_type.append(self._io.read_u1())
+            self.node_type = self._io.read_array("<B", 4)
 
-            self.node_id = []
-            for i in range(4):
-                self.node_id.append(self._io.read_u2le())
+            self.node_id = self._io.read_array("<H", 4)
 
             self.unk_05 = self._io.read_u4le()
             self.min_aabb = Sbc21.AabbBlock(self._io, self, self._root)
@@ -625,13 +549,9 @@ class Sbc21(ReadWriteKaitaiStruct):
 
         def _write__seq(self, io=None):
             super(Sbc21.BvhNode, self)._write__seq(io)
-            for i in range(len(self.node_type)):
-                pass
-                self._io.write_u1(self.node_type[i])
+            self._io.write_array("<B", self.node_type)
 
-            for i in range(len(self.node_id)):
-                pass
-                self._io.write_u2le(self.node_id[i])
+            self._io.write_array("<H", self.node_id)
 
             self._io.write_u4le(self.unk_05)
             self.min_aabb._write__seq(self._io)
@@ -667,24 +587,16 @@ class Sbc21(ReadWriteKaitaiStruct):
             self._root = _root
 
         def _read(self):
-            self.bvhc = []
-            for i in range(2):
-                self.bvhc.append(self._io.read_u4le())
+            self.bvhc = self._io.read_array("<I", 2)
 
             self.soh = self._io.read_u4le()
             self.unk_01 = self._io.read_u4le()
             self.bounding_box = Sbc21.Bbox(self._io, self, self._root)
             self.bounding_box._read()
             self.node_count = self._io.read_u4le()
-            self.nulls = []
-            for i in range(3):
-                self.nulls.append(self._io.read_u4le())
+            self.nulls = self._io.read_array("<I", 3)
 
-            self.nodes = []
-            for i in range(self.node_count):
-                _t_nodes = Sbc21.BvhNode(self._io, self, self._root)
-                _t_nodes._read()
-                self.nodes.append(_t_nodes)
+            self.nodes = self._io.read_lazy_array(self.node_count, 112, Sbc21.BvhNode, self._io, self, self._root)
 
 
 
@@ -705,17 +617,13 @@ class Sbc21(ReadWriteKaitaiStruct):
 
         def _write__seq(self, io=None):
             super(Sbc21.BvhCollision, self)._write__seq(io)
-            for i in range(len(self.bvhc)):
-                pass
-                self._io.write_u4le(self.bvhc[i])
+            self._io.write_array("<I", self.bvhc)
 
             self._io.write_u4le(self.soh)
             self._io.write_u4le(self.unk_01)
             self.bounding_box._write__seq(self._io)
             self._io.write_u4le(self.node_count)
-            for i in range(len(self.nulls)):
-                pass
-                self._io.write_u4le(self.nulls[i])
+            self._io.write_array("<I", self.nulls)
 
             for i in range(len(self.nodes)):
                 pass
@@ -768,9 +676,7 @@ class Sbc21(ReadWriteKaitaiStruct):
             self.pair_count = self._io.read_u4le()
             self.face_count = self._io.read_u4le()
             self.vertex_count = self._io.read_u4le()
-            self.nulls = []
-            for i in range(4):
-                self.nulls.append(self._io.read_u4le())
+            self.nulls = self._io.read_array("<I", 4)
 
             self.box = Sbc21.Bbox(self._io, self, self._root)
             self.box._read()
@@ -796,9 +702,7 @@ class Sbc21(ReadWriteKaitaiStruct):
             self._io.write_u4le(self.pair_count)
             self._io.write_u4le(self.face_count)
             self._io.write_u4le(self.vertex_count)
-            for i in range(len(self.nulls)):
-                pass
-                self._io.write_u4le(self.nulls[i])
+            self._io.write_array("<I", self.nulls)
 
             self.box._write__seq(self._io)
             self._io.write_u4le(self.bb_size)
@@ -44,9 +44,7 @@ class Tex112(ReadWriteKaitaiStruct):
                 self.cube_faces.append(_t_cube_faces)
 
 
-        self.mipmap_offsets = []
-        for i in range((self.num_mipmaps_per_image * self.num_images)):
-            self.mipmap_offsets.append(self._io.read_u4le())
+        self.mipmap_offsets = self._io.read_array("<I", (self.num_mipmaps_per_image * self.num_images))
 
         self.dds_data = self._io.read_bytes_full()
 
@@ -92,9 +90,7 @@ class Tex112(ReadWriteKaitaiStruct):
                 self.cube_faces[i]._write__seq(self._io)
 
 
-        for i in range(len(self.mipmap_offsets)):
-            pass
-            self._io.write_u4le(self.mipmap_offsets[i])
+        self._io.write_array("<I", self.mipmap_offsets)
 
         self._io.write_bytes(self.dds_data)
         if not self._io.is_eof():
@@ -135,17 +131,11 @@ class Tex112(ReadWriteKaitaiStruct):
 
         def _read(self):
             self.field_00 = self._io.read_f4le()
-            self.negative_co = []
-            for i in range(3):
-                self.negative_co.append(self._io.read_f4le())
+            self.negative_co = self._io.read_array("<f", 3)
 
-            self.positive_co = []
-            for i in range(3):
-                self.positive_co.append(self._io.read_f4le())
+            self.positive_co = self._io.read_array("<f", 3)
 
-            self.uv = []
-            for i in range(2):
-                self.uv.append(self._io.read_f4le())
+            self.uv = self._io.read_array("<f", 2)
 
 
 
@@ -165,17 +155,11 @@ class Tex112(ReadWriteKaitaiStruct):
         def _write__seq(self, io=None):
             super(Tex112.CubeFace, self)._write__seq(io)
             self._io.write_f4le(self.field_00)
-            for i in range(len(self.negative_co)):
-                pass
-                self._io.write_f4le(self.negative_co[i])
+            self._io.write_array("<f", self.negative_co)
 
-            for i in range(len(self.positive_co)):
-                pass
-                self._io.write_f4le(self.positive_co[i])
+            self._io.write_array("<f", self.positive_co)
 
-            for i in range(len(self.uv)):
-                pass
-                self._io.write_f4le(self.uv[i])
+            self._io.write_array("<f", self.uv)
 
 
 
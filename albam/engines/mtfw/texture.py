@@ -1,8 +1,12 @@
+from binascii import crc32
+from collections import namedtuple
 from enum import Enum
 import io
 import functools
+import os
 from pathlib import PureWindowsPath
 import math
+from types import SimpleNamespace
 
 import bpy
 from kaitaistruct import KaitaiStream
@@ -11,9 +15,17 @@ from albam.exceptions import AlbamCheckFailure
 from albam.lib.blender import (
     get_bl_teximage_nodes,
     get_bl_materials,
+    get_custom_properties_values,
     is_blimage_dds,
 )
 from albam.lib.dds import DDSHeader
+from albam.lib.export_cache import (
+    get_export_cache,
+    get_export_session_cache,
+    get_fingerprint,
+    is_export_cached,
+)
+from albam.lib.misc import map_in_pool
 from albam.registry import blender_registry
 from albam.vfs import VirtualFileData
 # from .defines import get_shader_objects
@@ -214,6 +226,7 @@ def build_blender_textures(app_id, context, parsed_mod, mrl=None):
         return textures
     TexCls = APPID_TEXCLS_MAP[app_id]
     RtexCls = APPID_RTEXCLS_MAP[app_id]
+    image_registry = _get_image_registry()
 
     for i, texture_slot in enumerate(src_textures):
         texture_path = getattr(texture_slot, "texture_path", None) or texture_slot
@@ -240,6 +253,10 @@ def build_blender_textures(app_id, context, parsed_mod, mrl=None):
             textures.append(None)
             # TODO: handle missing texture
             continue
+        image_key = (app_id, texture_path + (".rtex" if is_rtex else ".tex"), f"{crc32(tex_bytes):08x}")
+        if image_key in image_registry:
+            textures.append(image_registry[image_key])
+            continue
         if is_rtex:
             tex = RtexCls.from_bytes(tex_bytes)
         else:
@@ -283,6 +300,8 @@ def build_blender_textures(app_id, context, parsed_mod, mrl=None):
         custom_properties = bl_image.albam_custom_properties.get_custom_properties_for_appid(app_id)
         custom_properties.set_from_source(tex)
 
+        bl_image.albam_asset.content_hash = image_key[2]
+        image_registry[image_key] = bl_image
         textures.append(bl_image)
 
     if len(src_textures) != len(textures):
@@ -295,6 +314,17 @@ def build_blender_textures(app_id, context, parsed_mod, mrl=None):
     return textures
 
 
+def _get_image_registry():
+    """
+    Map (app_id, relative_path, content_hash) to the images already
+    imported, so textures shared by several models are only imported once
+    """
+    return {
+        (im.albam_asset.app_id, im.albam_asset.relative_path, im.albam_asset.content_hash): im
+        for im in bpy.data.images if im.albam_asset.content_hash
+    }
+
+
 def assign_textures(mtfw_material, bl_material, textures, mrl):
     if not mrl:
         old_assignment(mtfw_material, bl_material, textures)
@@ -501,13 +531,100 @@ def serialize_textures(app_id, bl_materials):
             "Go to Image -> tools -> Albam and select the proper app_id for each."
         )
 
+    export_settings = bpy.context.scene.albam.export_settings
+    # textures shared by the items of a multiple export are serialized once
+    session_textures = get_export_session_cache("tex")
+    # Blender data is read here, in the main thread, and the textures
+    # not reused from the caches are serialized in a thread pool
+    pending_textures = []
     for dict_tex in exported_textures.values():
-        vfile = serialize_func(app_id, dict_tex)
+        bl_im = dict_tex["image"]
+        session_key = (app_id, bl_im.name_full)
+        fingerprint = None
+        if session_textures is not None and session_key in session_textures:
+            dict_tex["serialized_vfile"] = session_textures[session_key]
+            continue
+        if export_settings.use_export_cache:
+            fingerprint = _get_texture_fingerprint(app_id, bl_im)
+            if is_export_cached("tex", bl_im.name_full, fingerprint):
+                dict_tex["serialized_vfile"] = get_export_cache("tex")[bl_im.name_full][1]
+                if session_textures is not None:
+                    session_textures[session_key] = dict_tex["serialized_vfile"]
+                continue
+        pending_textures.append((dict_tex, fingerprint, _gather_texture_export_data(app_id, bl_im)))
+
+    vfiles = map_in_pool(
+        lambda pending_texture: serialize_func(app_id, pending_texture[2]),
+        pending_textures, export_settings.export_workers)
+    for (dict_tex, fingerprint, _), vfile in zip(pending_textures, vfiles):
+        bl_im = dict_tex["image"]
+        if fingerprint is not None:
+            get_export_cache("tex")[bl_im.name_full] = (fingerprint, vfile)
+        if session_textures is not None:
+            session_textures[(app_id, bl_im.name_full)] = vfile
         dict_tex["serialized_vfile"] = vfile
 
     return exported_textures
 
 
+TextureExportData = namedtuple("TextureExportData", (
+    "name", "size", "render_target", "custom_properties", "packed_data", "filepath", "asset_path",
+))
+
+
+def _gather_texture_export_data(app_id, bl_im):
+    """
+    Read from `bl_im` everything the serialize functions need, so they
+    don't touch bpy and can run outside of the main thread. Custom
+    properties are copied as they would be set to the serialized texture
+    """
+    custom_properties = bl_im.albam_custom_properties.get_custom_properties_for_appid(app_id)
+    custom_values = SimpleNamespace()
+    custom_properties.set_to_dest(custom_values)
+    packed_data = bl_im.packed_file.data if bl_im.packed_file else None
+    return TextureExportData(
+        bl_im.name,
+        tuple(bl_im.size),
+        custom_properties.render_target,
+        custom_values,
+        packed_data,
+        None if packed_data is not None else bpy.path.abspath(bl_im.filepath),
+        bl_im.albam_asset.relative_path or bl_im.name,
+    )
+
+
+def _read_dds_header(texture_data):
+    data = texture_data.packed_data
+    if data is None:
+        with open(texture_data.filepath, "rb") as f:
+            data = f.read()
+    return DDSHeader.from_data(data, texture_data.name)
+
+
+def _set_custom_properties(texture_data, tex):
+    for name, value in vars(texture_data.custom_properties).items():
+        setattr(tex, name, value)
+
+
+def _get_texture_fingerprint(app_id, bl_im):
+    """
+    Digest of what a texture export reads from an image: its dds data,
+    or the modification time and size of its file when not packed
+    """
+    if bl_im.packed_file:
+        source = bl_im.packed_file.data
+    else:
+        filepath = bpy.path.abspath(bl_im.filepath)
+        try:
+            stat = os.stat(filepath)
+            source = (filepath, stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            source = filepath
+    return get_fingerprint(
+        app_id, source, bl_im.size[:], bl_im.name, bl_im.albam_asset.relative_path,
+        get_custom_properties_values(bl_im.albam_custom_properties, app_id))
+
+
 def _check_is_power_of_two(image):
     for i in range(2):
         if image.size[i] > 0 and image.size[i] & (image.size[i] - 1) != 0:
@@ -515,26 +632,24 @@ def _check_is_power_of_two(image):
             break
 
 
-def _serialize_texture_156(app_id, dict_tex):
-    bl_im = dict_tex["image"]
-    custom_properties = bl_im.albam_custom_properties.get_custom_properties_for_appid(app_id)
-    is_rtex = custom_properties.render_target
-    _check_is_power_of_two(bl_im)
+def _serialize_texture_156(app_id, texture_data):
+    is_rtex = texture_data.render_target
+    _check_is_power_of_two(texture_data)
 
     if is_rtex:
         tex = Rtex112()
         tex.id_magic = b"RTX\x00"
         tex.version = 112
         # tex.revision = 514
-        tex.num_mipmaps_per_image = int(math.log(max(bl_im.size[0], bl_im.size[1]), 2)) + 1
+        tex.num_mipmaps_per_image = int(math.log(max(texture_data.size[0], texture_data.size[1]), 2)) + 1
         tex.num_images = 1
-        tex.width = bl_im.size[0]
-        tex.height = bl_im.size[1]
+        tex.width = texture_data.size[0]
+        tex.height = texture_data.size[1]
         # tex.reserved = 0
         tex.compression_format = b"\x15\x00\x00\x00".decode("ascii")
         dds_data_len = 0
     else:
-        dds_header = DDSHeader.from_bl_image(bl_im)
+        dds_header = _read_dds_header(texture_data)
         tex = Tex112()
         tex.id_magic = b"TEX\x00"
         tex.version = 112
@@ -544,8 +659,9 @@ def _serialize_texture_156(app_id, dict_tex):
         # tex.revision = revision
         tex.num_mipmaps_per_image = dds_header.dwMipMapCount
         tex.num_images = dds_header.image_count
-        tex.width = bl_im.size[0]
-        tex.height = bl_im.size[1] // dds_header.image_count  # cubemaps are a vertical strip in Blender
+        tex.width = texture_data.size[0]
+        # cubemaps are a vertical strip in Blender
+        tex.height = texture_data.size[1] // dds_header.image_count
 
         fmt = dds_header.pixelfmt_dwFourCC.decode()
         if fmt == "":
@@ -556,22 +672,20 @@ def _serialize_texture_156(app_id, dict_tex):
         tex.dds_data = dds_header.data
         dds_data_len = len(tex.dds_data)
     tex.padding = 0
-    custom_properties.set_to_dest(tex)
+    _set_custom_properties(texture_data, tex)
 
     tex._check()
 
     final_size = tex.size_before_data_ + dds_data_len
     stream = KaitaiStream(io.BytesIO(bytearray(final_size)))
     tex._write(stream)
-    relative_path = _handle_relative_path(bl_im, custom_properties.render_target)
+    relative_path = _handle_relative_path(texture_data.asset_path, is_rtex)
     vf = VirtualFileData(app_id, relative_path, data_bytes=stream.to_byte_array())
     return vf
 
 
-def _serialize_texture_21(app_id, dict_tex):
-    bl_im = dict_tex["image"]
-    custom_properties = bl_im.albam_custom_properties.get_custom_properties_for_appid(app_id)
-    is_rtex = custom_properties.render_target
+def _serialize_texture_21(app_id, texture_data):
+    is_rtex = texture_data.render_target
     # compression_format = custom_properties.compression_format or _infer_compression_format(dict_tex)
 
     if is_rtex:
@@ -581,20 +695,21 @@ def _serialize_texture_21(app_id, dict_tex):
         tex.num_mipmaps_per_image = 1
         dds_data_size = 0
     else:
-        dds_header = DDSHeader.from_bl_image(bl_im)
+        dds_header = _read_dds_header(texture_data)
         tex = Tex157()
         tex.id_magic = b"TEX\x00"
 
-    tex.width = bl_im.size[0]
+    tex.width = texture_data.size[0]
     if is_rtex:
-        if custom_properties.type == "0x6":
+        if texture_data.custom_properties.type == 0x6:
             tex.num_images = 6
         else:
             tex.num_images = 1  # curently hardcoded
-        tex.height = bl_im.size[1]
+        tex.height = texture_data.size[1]
     else:
         tex.num_images = dds_header.image_count
-        tex.height = bl_im.size[1] // dds_header.image_count  # cubemaps are a vertical strip in Blender
+        # cubemaps are a vertical strip in Blender
+        tex.height = texture_data.size[1] // dds_header.image_count
         tex.num_mipmaps_per_image = dds_header.dwMipMapCount
 
     if not is_rtex:
@@ -603,13 +718,13 @@ def _serialize_texture_21(app_id, dict_tex):
         tex.dds_data = dds_header.data
         dds_data_size = len(tex.dds_data)
 
-    custom_properties.set_to_dest(tex)
+    _set_custom_properties(texture_data, tex)
     tex._check()
 
     final_size = tex.size_before_data_ + dds_data_size
     stream = KaitaiStream(io.BytesIO(bytearray(final_size)))
     tex._write(stream)
-    relative_path = _handle_relative_path(bl_im)
+    relative_path = _handle_relative_path(texture_data.asset_path)
     vf = VirtualFileData(app_id, relative_path, data_bytes=stream.to_byte_array())
     return vf
 
@@ -656,8 +771,7 @@ def _infer_compression_format(dict_tex):
     return tex_type.value
 
 
-def _handle_relative_path(bl_im, render_target=False):
-    path = bl_im.albam_asset.relative_path or bl_im.name
+def _handle_relative_path(path, render_target=False):
     before, _, after = path.rpartition(".")
     if render_target:
         ext = "rtex"
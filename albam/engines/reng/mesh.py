@@ -1,13 +1,12 @@
 import ctypes
 import io
-import struct
 import time
 
 import bpy
 from kaitaistruct import KaitaiStream
-from mathutils import Matrix
 import numpy as np
 
+from albam.lib.blender import add_vertex_group_weights, get_loop_vertex_indices
 from albam.lib.misc import chunks
 from albam.registry import blender_registry
 from .material import build_blender_materials
@@ -75,13 +74,10 @@ def build_blender_mesh(re_mesh, sub_mesh):
     # UVS ####
     uv_accessor = re_mesh.buffers_data.primitive_accessors[2]
     uv_offset = uv_accessor.offset + sub_mesh.pos_vertex_buffer * uv_accessor.size
-    uvs = struct.unpack_from(f"{num_vertices * 2}e", vertex_buffer, uv_offset)
+    uvs = np.frombuffer(vertex_buffer, dtype="<f2", count=num_vertices * 2, offset=uv_offset)
+    uvs = uvs.reshape(num_vertices, 2).astype(np.float32)
     uv_layer = bl_mesh.uv_layers.new(name='name-me')
-    per_loop_list = []
-    for loop in bl_mesh.loops:
-        offset = loop.vertex_index * 2
-        per_loop_list.extend((uvs[offset], uvs[offset + 1]))
-    uv_layer.data.foreach_set("uv", per_loop_list)
+    uv_layer.data.foreach_set("uv", uvs[get_loop_vertex_indices(bl_mesh)].ravel())
 
     # NORMALS ####
     normals_accessor = re_mesh.buffers_data.primitive_accessors[1]
@@ -106,8 +102,8 @@ def build_blender_armature(re_mesh, armature_name):
 
     if bpy.context.mode != "OBJECT":
         bpy.ops.object.mode_set(mode="OBJECT")
-    for i in bpy.context.scene.objects:
-        i.select_set(False)
+    for ob in bpy.context.selected_objects:
+        ob.select_set(False)
     bpy.context.collection.objects.link(armature_ob)
     bpy.context.view_layer.objects.active = armature_ob
     armature_ob.select_set(True)
@@ -117,6 +113,7 @@ def build_blender_armature(re_mesh, armature_name):
     # TODO: do it at blender level
     # non_deform_bone_indices = get_non_deform_bone_indices(mod)
     scale = 1
+    heads = (_get_bone_heads(re_mesh) * scale).tolist()
     name_offset = re_mesh.model_info.num_materials
     for i, bone in enumerate(re_mesh.bones_header.bones):
         bone_name = re_mesh.named_nodes[name_offset + i].value
@@ -124,39 +121,26 @@ def build_blender_armature(re_mesh, armature_name):
         valid_parent = bone.parent_idx != 0xFFFF
         blender_bone.parent = blender_bones[bone.parent_idx] if valid_parent else None
         # blender_bone.use_deform = False if i in non_deform_bone_indices else True
-        head = _name_me(re_mesh.bones_header.inverse_bind_matrices[i])
-        blender_bone.head = [head[0] * scale, -head[2] * scale, head[1] * scale]
-        blender_bone.tail = [head[0] * scale, -head[2] * scale, (head[1] * scale) + 0.01]
+        head = heads[i]
+        blender_bone.head = [head[0], -head[2], head[1]]
+        blender_bone.tail = [head[0], -head[2], head[1] + 0.01]
         blender_bones.append(blender_bone)
 
     bpy.ops.object.mode_set(mode="OBJECT")
     return armature_ob
 
 
-def _name_me(matrix):
-    m = matrix
-    row_1_x = m.row_1.x
-    row_2_y = m.row_2.y
-    row_3_z = m.row_3.z
-    row_4_x = m.row_4.x
-    row_4_y = m.row_4.y
-    row_4_z = m.row_4.z
-
-    head_vector = (
-        Matrix(
-            (
-                (row_1_x, m.row_1.y, m.row_1.z, m.row_1.w),
-                (m.row_2.x, row_2_y, m.row_2.z, m.row_2.w),
-                (m.row_3.x, m.row_3.y, row_3_z, m.row_3.w),
-                (row_4_x, row_4_y, row_4_z, m.row_4.w),
-            )
-        )
-        .inverted()
-        .transposed()
-        .to_translation()
-    )
-
-    return head_vector
+def _get_bone_heads(re_mesh):
+    """
+    Return a (num_bones, 3) array with the head of each bone,
+    computed from the inverse bind matrices of all bones at once
+    """
+    matrices = np.array([
+        [(r.x, r.y, r.z, r.w) for r in (m.row_1, m.row_2, m.row_3, m.row_4)]
+        for m in re_mesh.bones_header.inverse_bind_matrices
+    ], dtype=np.float64).reshape(-1, 4, 4)
+    # translation of the transposed inverse
+    return np.linalg.inv(matrices)[:, 3, :3]
 
 
 def _build_weights(re_mesh, sub_mesh, num_vertices, vertex_buffer, bl_mesh_ob):
@@ -165,27 +149,24 @@ def _build_weights(re_mesh, sub_mesh, num_vertices, vertex_buffer, bl_mesh_ob):
     assert skin_accessor, "No skin accessor but bones_offset?!"
     skin_accessor = skin_accessor[0]
     skin_offset = skin_accessor.offset + sub_mesh.pos_vertex_buffer * skin_accessor.size
-    skin = ((ctypes.c_ubyte * 16) * num_vertices).from_buffer_copy(vertex_buffer, skin_offset)
+    skin = np.frombuffer(vertex_buffer, dtype=np.uint8, count=num_vertices * 16, offset=skin_offset)
+    skin = skin.reshape(num_vertices, 16)
     name_offset = re_mesh.model_info.num_materials
 
-    for vertex_index, data in enumerate(skin):
-        joints_0 = data[0:4]
-        joints_1 = data[4:8]
-        weights_0 = data[8:12]
-        weights_1 = data[12:16]
-
-        for j, w in ((j, w) for j, w in zip(joints_0, weights_0) if w):
-            real_bone_index = re_mesh.bones_header.bone_maps[j]
-            bone_name = re_mesh.named_nodes[name_offset + real_bone_index].value
-            bone_data = weights_per_bone.setdefault(bone_name, [])
-            bone_data.append((vertex_index, w / 255))
-        for j, w in ((j, w) for j, w in zip(joints_1, weights_1) if w):
-            real_bone_index = re_mesh.bones_header.bone_maps[j]
-            bone_name = re_mesh.named_nodes[name_offset + real_bone_index].value
-            bone_data = weights_per_bone.setdefault(bone_name, [])
-            bone_data.append((vertex_index, w / 255))
-
-    for bone_index, data in weights_per_bone.items():
-        vg = bl_mesh_ob.vertex_groups.new(name=str(bone_index))
-        for vertex_index, weight_value in data:
-            vg.add((vertex_index,), weight_value, "ADD")
+    # joints_0, joints_1, weights_0, weights_1
+    joints = skin[:, :8].ravel()
+    weights = skin[:, 8:].ravel() / 255
+    vertex_indices = np.repeat(np.arange(num_vertices), 8)
+    used = weights > 0
+    joints, weights, vertex_indices = joints[used], weights[used], vertex_indices[used]
+
+    unique_joints, first_seen = np.unique(joints, return_index=True)
+    for j in unique_joints[np.argsort(first_seen)].tolist():
+        real_bone_index = re_mesh.bones_header.bone_maps[j]
+        bone_name = re_mesh.named_nodes[name_offset + real_bone_index].value
+        weights_per_bone.setdefault(bone_name, []).append(joints == j)
+
+    for bone_name, masks in weights_per_bone.items():
+        vg = bl_mesh_ob.vertex_groups.new(name=str(bone_name))
+        mask = np.logical_or.reduce(masks)
+        add_vertex_group_weights(vg, vertex_indices[mask], weights[mask])
@@ -4,6 +4,9 @@ from copy import deepcopy
 import math
 
 import bpy
+import numpy as np
+
+from albam.lib.export_cache import get_fingerprint
 
 
 BoundingBox = namedtuple('bounding_box', (
@@ -13,171 +16,436 @@ BoundingBox = namedtuple('bounding_box', (
 
 
 def strip_triangles_to_triangles_list(strip_indices_array):
-    indices = []
+    """
+    Convert a triangle strip to a flat array of triangle indices,
+    dropping degenerate triangles and flipping the winding of odd ones
+    """
+    strip = np.asarray(strip_indices_array)
+    if len(strip) < 3:
+        return strip.copy()
+
+    a = strip[:-2]
+    b = strip[1:-1]
+    c = strip[2:]
+    triangles = np.column_stack((a, b, c))
+    odd = np.arange(2, len(strip)) % 2 == 1
+    triangles[odd] = triangles[odd, ::-1]
+    triangles = triangles[(a != b) & (a != c) & (b != c)]
+    if not len(triangles):
+        return strip.copy()
+    return triangles.ravel()
+
+
+def triangles_list_to_triangles_strip(blender_mesh, vertex_cache_size=0):
+    """
+    Export triangle strips from a blender mesh.
+    It assumes the mesh is all triangulated.
+    See `triangles_to_strip`
+    """
+    return triangles_to_strip(get_triangles_array(blender_mesh.data), vertex_cache_size)
 
-    for i in range(2, len(strip_indices_array)):
-        a = strip_indices_array[i - 2]
-        b = strip_indices_array[i - 1]
-        c = strip_indices_array[i]
-        if a != b and a != c and b != c:
-            if i % 2 == 0:
-                indices.extend((a, b, c))
-            else:
-                indices.extend((c, b, a))
-    if not indices:
-        return list(strip_indices_array)
-    return indices
+
+def get_triangles_array(blender_mesh):
+    """
+    Return the vertex indices of the polygons of a triangulated mesh as a F×3 array
+    """
+    loop_starts = np.empty(len(blender_mesh.polygons), dtype=np.int32)
+    blender_mesh.polygons.foreach_get("loop_start", loop_starts)
+    loop_vertex_indices = get_loop_vertex_indices(blender_mesh)
+    return loop_vertex_indices[loop_starts[:, None] + np.arange(3)]
 
 
-def triangles_list_to_triangles_strip(blender_mesh):
+def get_triangles_adjacency(triangles):
     """
-    Export triangle strips from a blender mesh.
-    It assumes the mesh is all triangulated.
-    Based on a paper by Pierre Terdiman: http://www.codercorner.com/Strips.htm
-    """
-    # TODO: Fix changing of face orientation in some cases (see tests)
-    blender_mesh = blender_mesh.data
-    edges_faces = {}
-    current_strip = []
-    strips = []
-    joined_strips = []
-    faces_indices = deque(p.index for p in blender_mesh.polygons)
-    done_faces_indices = set()
-    current_face_index = faces_indices.popleft()
-    process_faces = True
-
-    for polygon in blender_mesh.polygons:
-        for edge in polygon.edge_keys:
-            edges_faces.setdefault(edge, set()).add(polygon.index)
-
-    while process_faces:
-        current_face = blender_mesh.polygons[current_face_index]
-        current_face_verts = current_face.vertices[:]
-        strip_indices = [v for v in current_face_verts if v not in current_strip[-2:]]
-        if current_strip:
-            face_to_add = tuple(current_strip[-2:]) + tuple(strip_indices)
-            if face_to_add != current_face_verts and face_to_add != tuple(reversed(current_face_verts)):
-                # we arrived here because the current face shares and edge with the face in the strip
-                # however, if we just add the verts, we would be changing the direction of the face
-                # so we create a degenerate triangle before adding to it to the strip
-                current_strip.append(current_strip[-2])
-        current_strip.extend(strip_indices)
-        done_faces_indices.add(current_face_index)
-
-        next_face_index = None
-        possible_face_indices = {}
-        for edge in current_face.edge_keys:
-            if edge not in edges_faces:
-                continue
-            checked_edge = {face_index: edge for face_index in edges_faces[edge]
-                            if face_index != current_face_index and face_index not in done_faces_indices}
-            possible_face_indices.update(checked_edge)
-        for face_index, edge in possible_face_indices.items():
-            if not current_strip:
-                next_face_index = face_index
-                break
-            elif edge == tuple(current_strip[-2:]) or edge == tuple(reversed(current_strip[-2:])):
-                next_face_index = face_index
+    Return a F×3 array with the triangle across each edge of each triangle,
+    edge `k` going from vertex `k` to vertex `k + 1`, or -1 on borders.
+    Only triangles sharing the edge in the opposite direction are
+    neighbours, so walking the adjacency keeps the winding
+    """
+    triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+    num_vertices = int(triangles.max(initial=-1)) + 1
+    edge_starts = triangles.ravel()
+    edge_ends = np.roll(triangles, -1, axis=1).ravel()
+    edges = edge_starts * num_vertices + edge_ends
+    order = np.argsort(edges, kind="stable")
+    sorted_edges = edges[order]
+    opposite_edges = edge_ends * num_vertices + edge_starts
+    positions = np.minimum(np.searchsorted(sorted_edges, opposite_edges), max(len(edges) - 1, 0))
+    found = sorted_edges[positions] == opposite_edges if len(edges) else np.zeros(0, dtype=bool)
+    return np.where(found, order[positions] // 3, -1).reshape(-1, 3)
+
+
+def triangles_to_strip(triangles, vertex_cache_size=0):
+    """
+    Build a single triangle strip, as decoded by `strip_triangles_to_triangles_list`,
+    from a F×3 array of triangles in O(F) using precomputed adjacency.
+    Strips are walked across shared edges, which keeps the winding of every
+    triangle, and started with the parity they need, so joining two strips
+    always takes two indices. New strips start at the triangles with fewer
+    neighbours or, with a `vertex_cache_size`, next to the vertices
+    still in a FIFO post-transform cache of that size
+    """
+    triangles_array = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+    num_triangles = len(triangles_array)
+    if not num_triangles:
+        return []
+    adjacency = get_triangles_adjacency(triangles_array).tolist()
+    num_neighbours = np.count_nonzero(np.asarray(adjacency) != -1, axis=1)
+    start_order = np.argsort(num_neighbours, kind="stable").tolist()
+    triangles = triangles_array.tolist()
+    visited = [False] * num_triangles
+    free_neighbours = num_neighbours.tolist()
+
+    if vertex_cache_size:
+        num_vertices = int(triangles_array.max()) + 1
+        vertex_triangles_order = np.argsort(triangles_array.ravel(), kind="stable")
+        vertex_triangles = (vertex_triangles_order // 3).tolist()
+        vertex_triangles_next = np.searchsorted(
+            triangles_array.ravel()[vertex_triangles_order], np.arange(num_vertices + 1)).tolist()
+        cache = deque(maxlen=vertex_cache_size)
+        cached = [False] * num_vertices
+
+    def visit(triangle_index):
+        visited[triangle_index] = True
+        for neighbour in adjacency[triangle_index]:
+            if neighbour != -1:
+                free_neighbours[neighbour] -= 1
+
+    def use_vertex(vertex_index):
+        if vertex_cache_size and not cached[vertex_index]:
+            if len(cache) == vertex_cache_size:
+                cached[cache[0]] = False
+            cache.append(vertex_index)
+            cached[vertex_index] = True
+
+    def next_start():
+        if vertex_cache_size:
+            for vertex_index in reversed(cache):
+                position = vertex_triangles_next[vertex_index]
+                end = vertex_triangles_next[vertex_index + 1]
+                while position < end and visited[vertex_triangles[position]]:
+                    position += 1
+                vertex_triangles_next[vertex_index] = position
+                if position < end:
+                    return vertex_triangles[position]
+        while start_order and visited[start_order[-1]]:
+            start_order.pop()
+        return start_order.pop() if start_order else None
+
+    start_order.reverse()
+    strip = []
+    start = next_start()
+    while start is not None:
+        # leave the triangle through the edge to the neighbour with less free neighbours
+        best_edge = 0
+        best_neighbours = 4
+        for k, neighbour in enumerate(adjacency[start]):
+            if neighbour != -1 and not visited[neighbour] and free_neighbours[neighbour] < best_neighbours:
+                best_edge = k
+                best_neighbours = free_neighbours[neighbour]
+        triangle = triangles[start]
+        # edge k is opposite to vertex k - 1
+        first, second, third = triangle[best_edge - 1], triangle[best_edge], triangle[(best_edge + 1) % 3]
+        if strip:
+            # join with degenerate triangles
+            strip.append(strip[-1])
+            strip.append(first)
+        if len(strip) % 2:
+            # odd triangles are flipped
+            second, third = third, second
+        strip.extend((first, second, third))
+        for vertex_index in (first, second, third):
+            use_vertex(vertex_index)
+        visit(start)
+
+        current = start
+        while True:
+            dropped, last_but_one, last = strip[-3], strip[-2], strip[-1]
+            current_triangle = triangles[current]
+            edge = (current_triangle.index(dropped) + 1) % 3
+            neighbour = adjacency[current][edge]
+            if neighbour == -1 or visited[neighbour]:
                 break
-            elif edge == (current_strip[-1], current_strip[-2]):
-                if len(current_strip) % 2 != 0:
-                    # create a degenerate triangle to join them
-                    current_strip.append(current_strip[-2])
-                next_face_index = face_index
-
-        if next_face_index:
-            faces_indices.remove(next_face_index)
-            current_face_index = next_face_index
-        else:
-            strips.append(current_strip)
-            current_strip = []
-            try:
-                current_face_index = faces_indices.popleft()
-            except IndexError:
-                process_faces = False
-
-    prev_strip_len = 0
-    # join strips with degenerate triangles
-    for strip in strips:
-        if not prev_strip_len:
-            joined_strips.extend(strip)
-            prev_strip_len = len(strip)
-        elif prev_strip_len % 2 == 0:
-            joined_strips.extend((joined_strips[-1], strip[0]))
-            joined_strips.extend(strip)
-            prev_strip_len = len(strip)
-        else:
-            joined_strips.extend((joined_strips[-1], strip[0], strip[0]))
-            joined_strips.extend(strip)
-            prev_strip_len = len(strip)
-
-    return joined_strips
+            new_vertex = sum(triangles[neighbour]) - last_but_one - last
+            strip.append(new_vertex)
+            use_vertex(new_vertex)
+            visit(neighbour)
+            current = neighbour
+        start = next_start()
+
+    return strip
+
+
+# Tom Forsyth's linear-speed vertex cache optimisation constants
+FORSYTH_CACHE_DECAY_POWER = 1.5
+FORSYTH_LAST_TRIANGLE_SCORE = 0.75
+FORSYTH_VALENCE_BOOST_SCALE = 2.0
+FORSYTH_VALENCE_BOOST_POWER = 0.5
+
+
+def optimize_vertex_cache(triangles, cache_size=32):
+    """
+    Reorder a F×3 array of triangles for a post-transform vertex cache with
+    Tom Forsyth's linear-speed vertex cache optimisation:
+    https://tomforsyth1000.github.io/papers/fast_vert_cache_opt.html
+    Triangles are added one by one picking the best scored triangle using
+    the vertices in a simulated LRU cache, scores only change for those
+    """
+    triangles_array = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+    num_triangles = len(triangles_array)
+    if not num_triangles:
+        return triangles_array.copy()
+    flat_triangles = triangles_array.ravel()
+    num_vertices = int(flat_triangles.max()) + 1
+    valence = np.bincount(flat_triangles, minlength=num_vertices)
+    # triangles of each vertex, the first `remaining[v]` are the ones not added yet
+    vertex_triangles = (np.argsort(flat_triangles, kind="stable") // 3).tolist()
+    first_triangle = (np.cumsum(valence) - valence).tolist()
+    remaining = valence.tolist()
+    triangles = triangles_array.tolist()
+
+    cache_scores = [FORSYTH_LAST_TRIANGLE_SCORE] * 3 + [
+        (1 - (position - 3) / (cache_size - 3)) ** FORSYTH_CACHE_DECAY_POWER
+        for position in range(3, cache_size)
+    ]
+    valence_scores = [0.0] + [
+        FORSYTH_VALENCE_BOOST_SCALE * n ** -FORSYTH_VALENCE_BOOST_POWER
+        for n in range(1, int(valence.max()) + 1)
+    ]
+    cache_positions = [-1] * num_vertices
+
+    def vertex_score(vertex_index):
+        if not remaining[vertex_index]:
+            return -1.0
+        position = cache_positions[vertex_index]
+        cache_score = cache_scores[position] if position != -1 else 0.0
+        return cache_score + valence_scores[remaining[vertex_index]]
+
+    vertex_scores = [vertex_score(v) for v in range(num_vertices)]
+    triangle_scores = [sum(vertex_scores[v] for v in triangle) for triangle in triangles]
+    added = [False] * num_triangles
+    best_triangle = max(range(num_triangles), key=triangle_scores.__getitem__)
+    next_unadded = 0
+    cache = []
+    optimized = []
+    for _ in range(num_triangles):
+        if best_triangle == -1:
+            while added[next_unadded]:
+                next_unadded += 1
+            best_triangle = next_unadded
+        triangle = triangles[best_triangle]
+        added[best_triangle] = True
+        optimized.append(triangle)
+        for vertex_index in triangle:
+            # swap the triangle out of the remaining ones of the vertex
+            start = first_triangle[vertex_index]
+            last = start + remaining[vertex_index] - 1
+            position = vertex_triangles.index(best_triangle, start, last + 1)
+            vertex_triangles[position], vertex_triangles[last] = vertex_triangles[last], best_triangle
+            remaining[vertex_index] -= 1
+
+        cache = triangle + [v for v in cache if v not in triangle]
+        evicted = cache[cache_size:]
+        del cache[cache_size:]
+        for vertex_index in evicted:
+            cache_positions[vertex_index] = -1
+        for position, vertex_index in enumerate(cache):
+            cache_positions[vertex_index] = position
+
+        for vertex_index in cache + evicted:
+            score = vertex_score(vertex_index)
+            delta = score - vertex_scores[vertex_index]
+            vertex_scores[vertex_index] = score
+            start = first_triangle[vertex_index]
+            for triangle_index in vertex_triangles[start:start + remaining[vertex_index]]:
+                triangle_scores[triangle_index] += delta
+
+        best_triangle = -1
+        best_score = -1.0
+        for vertex_index in cache:
+            start = first_triangle[vertex_index]
+            for triangle_index in vertex_triangles[start:start + remaining[vertex_index]]:
+                if triangle_scores[triangle_index] > best_score:
+                    best_triangle = triangle_index
+                    best_score = triangle_scores[triangle_index]
+
+    return np.array(optimized, dtype=triangles_array.dtype)
+
+
+def reorder_vertices_by_first_use(triangles, vertex_count):
+    """
+    Renumber the vertices of a F×3 array of triangles in the order they are first
+    used, unused vertices go last. Return the new triangles and the previous
+    index of each vertex, to reorder vertex data with it
+    """
+    triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+    flat_triangles = triangles.ravel()
+    _, first_uses = np.unique(flat_triangles, return_index=True)
+    used = flat_triangles[np.sort(first_uses)]
+    vertex_order = np.concatenate((used, np.setdiff1d(np.arange(vertex_count), used)))
+    new_indices = np.empty(vertex_count, dtype=np.int64)
+    new_indices[vertex_order] = np.arange(vertex_count)
+    return new_indices[triangles], vertex_order
+
+
+def get_vertex_cache_stats(triangles, cache_size=32):
+    """
+    Return the ACMR (average cache miss ratio, vertices transformed per triangle)
+    and ATVR (average transform to vertex ratio, vertices transformed per vertex
+    used) of drawing a triangle list with a FIFO post-transform cache
+    """
+    flat_triangles = np.asarray(triangles, dtype=np.int64).ravel()
+    if not len(flat_triangles):
+        return 0.0, 0.0
+    num_vertices = int(flat_triangles.max()) + 1
+    # the cache holds the vertices transformed in the last `cache_size` misses
+    transformed_at = [-cache_size - 1] * num_vertices
+    misses = 0
+    for vertex_index in flat_triangles.tolist():
+        if misses - transformed_at[vertex_index] > cache_size:
+            transformed_at[vertex_index] = misses
+            misses += 1
+    num_used_vertices = len(np.unique(flat_triangles))
+    return misses / (len(flat_triangles) / 3), misses / num_used_vertices
+
+
+def get_loop_vertex_indices(blender_mesh):
+    """
+    Return the vertex index of each loop of a mesh as an array,
+    to expand per-vertex data to per-loop data with a single gather
+    """
+    loop_vertex_indices = np.empty(len(blender_mesh.loops), dtype=np.int32)
+    blender_mesh.loops.foreach_get("vertex_index", loop_vertex_indices)
+    return loop_vertex_indices
+
+
+def add_vertex_group_weights(vertex_group, vertex_indices, weights):
+    """
+    Assign weights to a vertex group with one `add` call per distinct
+    weight value instead of one per vertex. Weights of repeated vertex
+    indices are summed first, as successive "ADD" calls would do
+    """
+    vertex_indices, inverse = np.unique(vertex_indices, return_inverse=True)
+    weights = np.minimum(np.bincount(inverse.ravel(), weights=weights), 1.0)
+    values, buckets = np.unique(weights, return_inverse=True)
+    buckets = buckets.ravel()
+    order = np.argsort(buckets, kind="stable")
+    splits = np.cumsum(np.bincount(buckets))[:-1]
+    for value, bucket in zip(values.tolist(), np.split(vertex_indices[order], splits)):
+        vertex_group.add(bucket.tolist(), value, "REPLACE")
+
+
+def get_vertices_array(blender_mesh):
+    """
+    Return the coordinates of the vertices of a mesh as a V×3 array
+    """
+    coordinates = np.empty(len(blender_mesh.vertices) * 3, dtype=np.float32)
+    blender_mesh.vertices.foreach_get("co", coordinates)
+    return coordinates.reshape(-1, 3)
+
+
+def get_bounds_per_group(positions, groups):
+    """
+    Given N×3 positions and the group of each one, return the arrays
+    `(group_ids, bbox_min, bbox_max, radius)` of every group, sorted by group.
+    The radius is that of the sphere centered in the bounding box
+    """
+    order = np.argsort(groups, kind="stable")
+    groups = groups[order]
+    positions = positions[order]
+    group_ids, starts = np.unique(groups, return_index=True)
+    bbox_min = np.minimum.reduceat(positions, starts, axis=0).astype(np.float64)
+    bbox_max = np.maximum.reduceat(positions, starts, axis=0).astype(np.float64)
+    centers = (bbox_min + bbox_max) / 2
+    offsets = positions - np.repeat(centers, np.diff(np.append(starts, len(groups))), axis=0)
+    radius = np.sqrt(np.maximum.reduceat((offsets * offsets).sum(axis=1), starts))
+    return group_ids, bbox_min, bbox_max, radius
+
+
+def _get_model_vertices_array(blender_objects):
+    arrays = [get_vertices_array(ob.data) for ob in blender_objects if ob.type == 'MESH']
+    return np.concatenate(arrays) if arrays else np.empty((0, 3), dtype=np.float32)
 
 
 def get_model_bounding_box(blender_objects):
-    meshes = (ob.data for ob in blender_objects if ob.type == 'MESH')
-    min_x = 99999999
-    min_y = 99999999
-    min_z = 99999999
-
-    max_x = -99999999
-    max_y = -99999999
-    max_z = -99999999
-
-    for mesh in meshes:
-        for vert in mesh.vertices:
-            x, y, z = vert.co[:]
-            if x > max_x:
-                max_x = x
-            if y > max_y:
-                max_y = y
-            if z > max_z:
-                max_z = z
-            if x < min_x:
-                min_x = x
-            if y < min_y:
-                min_y = y
-            if z < min_z:
-                min_z = z
-    return BoundingBox(
-        min_x, min_y, min_z,
-        max_x, max_y, max_z
-    )
+    positions = _get_model_vertices_array(blender_objects)
+    if not len(positions):
+        return BoundingBox(
+            99999999, 99999999, 99999999,
+            -99999999, -99999999, -99999999
+        )
+    return BoundingBox(*positions.min(axis=0).tolist(), *positions.max(axis=0).tolist())
 
 
 def get_model_bounding_sphere(blender_objects):
-    # TODO: optimize
+    positions = _get_model_vertices_array(blender_objects)
+    _, bbox_min, bbox_max, radius = get_bounds_per_group(positions, np.zeros(len(positions), dtype=np.int32))
+    center = ((bbox_min[0] + bbox_max[0]) / 2).tolist()
+    return center + radius.tolist()
 
-    bbox = get_model_bounding_box(blender_objects)
-    meshes = (ob.data for ob in blender_objects if ob.type == 'MESH')
-    vertices = (v.co for mesh in meshes for v in mesh.vertices)
 
-    center_x = (bbox.min_x + bbox.max_x) / 2
-    center_y = (bbox.min_y + bbox.max_y) / 2
-    center_z = (bbox.min_z + bbox.max_z) / 2
-    center = [center_x, center_y, center_z]
+def get_first_loop_per_vertex(blender_mesh):
+    """
+    Return the indices of the vertices used by loops and the index of
+    their first loop, where per-vertex data is taken from for loop data
+    """
+    return np.unique(get_loop_vertex_indices(blender_mesh), return_index=True)
 
-    radius = max(map(lambda vertex: get_dist(center, vertex), vertices))
-    return center + [radius]
 
+def get_loop_data_per_vertex(blender_mesh, loop_data, attr, width):
+    """
+    Gather the `attr` of the first loop of each vertex from a loop collection
+    as a V×`width` array. Vertices without loops are left zeroed
+    """
+    values_per_loop = np.empty(len(loop_data) * width, dtype=np.float32)
+    loop_data.foreach_get(attr, values_per_loop)
+    vertex_indices, first_loops = get_first_loop_per_vertex(blender_mesh)
+    values = np.zeros((len(blender_mesh.vertices), width), dtype=np.float32)
+    values[vertex_indices] = values_per_loop.reshape(-1, width)[first_loops]
+    return values
 
-def get_uvs_per_vertex(blender_mesh_object, layer_index):
-    vertices = {}  # vertex_index: (uv_x, uv_y)
+
+def get_uvs_array(blender_mesh_object, layer_index):
+    """
+    Return the uvs of a layer as a V×2 array, or None if the
+    mesh doesn't have that layer or it's empty
+    """
+    mesh = blender_mesh_object.data
     try:
-        uv_layer = blender_mesh_object.data.uv_layers[layer_index]
+        uv_layer = mesh.uv_layers[layer_index]
     except IndexError:
-        return vertices
-    uvs_per_loop = uv_layer.data
-    if not uvs_per_loop:
-        return vertices
-    for i, loop in enumerate(blender_mesh_object.data.loops):
-        vertex_index = loop.vertex_index
-        if vertex_index in vertices:
-            continue
-        else:
-            uvs = uvs_per_loop[i].uv
-            vertices[vertex_index] = (uvs[0], uvs[1])
-    return vertices
+        return None
+    if not len(uv_layer.data):
+        return None
+    return get_loop_data_per_vertex(mesh, uv_layer.data, "uv", 2)
+
+
+def get_uvs_per_vertex(blender_mesh_object, layer_index):
+    uvs = get_uvs_array(blender_mesh_object, layer_index)
+    if uvs is None:
+        return {}  # vertex_index: (uv_x, uv_y)
+    vertex_indices, _ = get_first_loop_per_vertex(blender_mesh_object.data)
+    return _array_to_dict(vertex_indices, uvs)
+
+
+def get_vertex_groups_arrays(bl_mesh):
+    """
+    Given a mesh object, return the vertex groups of its vertices as flat
+    arrays `(vertex_indices, group_indices, weights)`, sorted by vertex.
+    Vertex group elements can't be read with `foreach_get`, so they
+    are collected in a single pass over the vertices
+    """
+    num_groups = []
+    group_indices = []
+    weights = []
+    for vertex in bl_mesh.data.vertices:
+        vertex_groups = vertex.groups
+        num_groups.append(len(vertex_groups))
+        for group in vertex_groups:
+            group_indices.append(group.group)
+            weights.append(group.weight)
+    vertex_indices = np.repeat(np.arange(len(num_groups), dtype=np.int32), num_groups)
+    return vertex_indices, np.array(group_indices, dtype=np.int32), np.array(weights, dtype=np.float32)
 
 
 def get_mesh_vertex_groups(bl_mesh):
@@ -186,82 +454,186 @@ def get_mesh_vertex_groups(bl_mesh):
     with `vertex_group_index : [vertices...]
     """
     vertex_groups = {}  # index: vertices
-
-    for v in bl_mesh.data.vertices:
-        v_groups = {g.group for g in v.groups}
-        for v_group in v_groups:
-            vertex_groups.setdefault(v_group, []).append(v)
+    vertices = bl_mesh.data.vertices
+    vertex_indices, group_indices, _ = get_vertex_groups_arrays(bl_mesh)
+    for vertex_index, group_index in zip(vertex_indices.tolist(), group_indices.tolist()):
+        vertex_groups.setdefault(group_index, []).append(vertices[vertex_index])
 
     return vertex_groups
 
 
-def get_bone_indices_and_weights_per_vertex(blender_object):
+def _get_bone_influences(blender_object):
     """
-    Return {vertex_index: [(bone_index, weight_value), ...]}
+    Return the vertices in any vertex group and the flat arrays
+    `(vertex_indices, bone_indices, weights)` of the non-zero weights,
+    vertex groups being matched to the bones of the armature by name
     """
     vertex_groups = blender_object.vertex_groups
     modifiers = {m.type: m for m in blender_object.modifiers}
-    weights_per_vertex = {}
     if blender_object.type != 'MESH':
         raise TypeError('Blender object is not a mesh')
     if not vertex_groups or 'ARMATURE' not in modifiers:
-        return weights_per_vertex
+        no_vertices = np.empty(0, dtype=np.int32)
+        return no_vertices, no_vertices, no_vertices, np.empty(0, dtype=np.float32)
     armature = modifiers['ARMATURE'].object.data
     bone_names_to_index = {b.name: i for i, b in enumerate(armature.bones)}
-    # https://www.blender.org/api/blender_python_api_current/bpy.types.VertexGroupElement.html
-    vertex_groups = blender_object.vertex_groups
-    for vertex in blender_object.data.vertices:
-        for group in vertex.groups:
-            weights_per_vertex.setdefault(vertex.index, [])
-            if not group.weight:
-                continue
-            # avoiding list comprehensions for readability
-            # bones in blender are matched to vertex group only by name
-            vgroup_name = vertex_groups[group.group].name
-            try:
-                bone_index = bone_names_to_index[vgroup_name]
-            except KeyError:
-                raise AlbamCheckFailure(
-                    "The object includes a vertex group that doesn't match any bone in the armature",
-                    details=f" Object: {blender_object.name}, Vertex group: {vgroup_name}",
-                    solution="Please remove or rename the vertex group to match the existing bones in"
-                    " the armature")
-            pair = (bone_index, group.weight)
-            weights_per_vertex[vertex.index].append(pair)
-    return weights_per_vertex
+    # bones in blender are matched to vertex group only by name
+    group_to_bone = np.array([bone_names_to_index.get(vg.name, -1) for vg in vertex_groups], dtype=np.int32)
+
+    vertex_indices, group_indices, weights = get_vertex_groups_arrays(blender_object)
+    grouped_vertices = np.unique(vertex_indices)
+    used = weights != 0
+    vertex_indices = vertex_indices[used]
+    group_indices = group_indices[used]
+    weights = weights[used]
+    bone_indices = group_to_bone[group_indices]
+    unmatched = np.flatnonzero(bone_indices == -1)
+    if len(unmatched):
+        vgroup_name = vertex_groups[int(group_indices[unmatched[0]])].name
+        raise AlbamCheckFailure(
+            "The object includes a vertex group that doesn't match any bone in the armature",
+            details=f" Object: {blender_object.name}, Vertex group: {vgroup_name}",
+            solution="Please remove or rename the vertex group to match the existing bones in"
+            " the armature")
+    return grouped_vertices, vertex_indices, bone_indices, weights
+
+
+def get_bone_indices_and_weights_arrays(blender_object):
+    """
+    Return the bone influences of each vertex as `(num_influences, bone_indices, weights)`,
+    arrays of shape V, V×K and V×K, K being the most influences a vertex has.
+    Influences keep the order of the vertex groups of the vertex, unused ones are zero
+    """
+    vertex_count = len(blender_object.data.vertices)
+    _, vertex_indices, bone_indices, weights = _get_bone_influences(blender_object)
+    num_influences = np.bincount(vertex_indices, minlength=vertex_count)
+    first_influence = np.cumsum(num_influences) - num_influences
+    columns = np.arange(len(vertex_indices)) - first_influence[vertex_indices]
+    max_influences = num_influences.max(initial=0)
+    bone_indices_matrix = np.zeros((vertex_count, max_influences), dtype=np.int32)
+    weights_matrix = np.zeros((vertex_count, max_influences), dtype=np.float32)
+    bone_indices_matrix[vertex_indices, columns] = bone_indices
+    weights_matrix[vertex_indices, columns] = weights
+    return num_influences, bone_indices_matrix, weights_matrix
 
 
-def get_normals_per_vertex(blender_mesh):
-    normals = {}
+def get_bone_indices_and_weights_per_vertex(blender_object):
+    """
+    Return {vertex_index: [(bone_index, weight_value), ...]}
+    """
+    grouped_vertices, vertex_indices, bone_indices, weights = _get_bone_influences(blender_object)
+    weights_per_vertex = {vertex_index: [] for vertex_index in grouped_vertices.tolist()}
+    for vertex_index, pair in zip(vertex_indices.tolist(), zip(bone_indices.tolist(), weights.tolist())):
+        weights_per_vertex[vertex_index].append(pair)
+    return weights_per_vertex
+
 
+def get_normals_array(blender_mesh):
+    """
+    Return the normals of a mesh as a V×3 array, custom
+    normals are taken from the first loop of each vertex
+    """
     if blender_mesh.has_custom_normals:
         try:
             blender_mesh.calc_normals_split()
         except AttributeError:
             # blender 4.1+
             pass
-        for loop in blender_mesh.loops:
-            normals.setdefault(loop.vertex_index, loop.normal)
+        return get_loop_data_per_vertex(blender_mesh, blender_mesh.loops, "normal", 3)
+    normals = np.empty(len(blender_mesh.vertices) * 3, dtype=np.float32)
+    blender_mesh.vertices.foreach_get("normal", normals)
+    return normals.reshape(-1, 3)
+
+
+def get_normals_per_vertex(blender_mesh):
+    normals = get_normals_array(blender_mesh)
+    if blender_mesh.has_custom_normals:
+        vertex_indices, _ = get_first_loop_per_vertex(blender_mesh)
     else:
-        for vertex in blender_mesh.vertices:
-            normals[vertex.index] = vertex.normal
-    return normals
+        vertex_indices = np.arange(len(normals))
+    return _array_to_dict(vertex_indices, normals)
 
 
-def get_tangents_per_vertex(blender_mesh):
-    tangents = {}
+def get_tangents_array(blender_mesh):
+    """
+    Return the tangents of a mesh calculated with its first uv layer
+    as a V×3 array, or None if they can't be calculated
+    """
     try:
         uv_name = blender_mesh.uv_layers[0].name
     except IndexError:
-        return tangents
+        return None
     try:
         blender_mesh.calc_tangents(uvmap=uv_name)
     except RuntimeError:
         print("Mesh {} has no UV".format(blender_mesh.name))
-        return tangents
-    for loop in blender_mesh.loops:
-        tangents.setdefault(loop.vertex_index, loop.tangent)
-    return tangents
+        return None
+    return get_loop_data_per_vertex(blender_mesh, blender_mesh.loops, "tangent", 3)
+
+
+def get_tangents_per_vertex(blender_mesh):
+    tangents = get_tangents_array(blender_mesh)
+    if tangents is None:
+        return {}
+    vertex_indices, _ = get_first_loop_per_vertex(blender_mesh)
+    return _array_to_dict(vertex_indices, tangents)
+
+
+def get_mesh_fingerprint(blender_object, app_id):
+    """
+    Return a digest of what the export reads from a mesh object: geometry,
+    normals, uvs, colors, vertex groups and the bones they match, materials
+    and custom properties. Buffers are read with `foreach_get`, so it's
+    cheap next to serializing the mesh
+    """
+    mesh = blender_object.data
+    buffers = [
+        _get_collection_array(mesh.vertices, "co", np.float32, 3),
+        _get_collection_array(mesh.loops, "vertex_index", np.int32),
+        _get_collection_array(mesh.polygons, "loop_start", np.int32),
+        get_normals_array(mesh),
+    ]
+    buffers.extend(_get_collection_array(layer.data, "uv", np.float32, 2) for layer in mesh.uv_layers)
+    buffers.extend(_get_collection_array(layer.data, "color", np.float32, 4) for layer in mesh.vertex_colors)
+    buffers.extend(get_vertex_groups_arrays(blender_object))
+    armatures = [m.object for m in blender_object.modifiers if m.type == "ARMATURE" and m.object]
+    return get_fingerprint(
+        *buffers,
+        [vg.name for vg in blender_object.vertex_groups],
+        [[b.name for b in armature.data.bones] for armature in armatures],
+        [mat.name if mat else None for mat in mesh.materials],
+        [get_custom_properties_values(mat.albam_custom_properties, app_id) for mat in mesh.materials if mat],
+        get_custom_properties_values(mesh.albam_custom_properties, app_id),
+    )
+
+
+def get_custom_properties_values(albam_custom_properties, app_id):
+    """
+    Return the values of the custom properties for `app_id`, including
+    the secondary ones, as a list of `(name, value)`
+    """
+    property_groups = [albam_custom_properties.get_custom_properties_for_appid(app_id)]
+    property_groups.extend(albam_custom_properties.get_custom_properties_secondary_for_appid(app_id).values())
+    values = []
+    for property_group in property_groups:
+        for name in property_group.__annotations__:
+            value = getattr(property_group, name)
+            try:
+                value = value[:]
+            except TypeError:
+                pass
+            values.append((name, value))
+    return values
+
+
+def _get_collection_array(collection, attr, dtype, width=1):
+    values = np.empty(len(collection) * width, dtype=dtype)
+    collection.foreach_get(attr, values)
+    return values
+
+
+def _array_to_dict(vertex_indices, values):
+    return dict(zip(vertex_indices.tolist(), map(tuple, values[vertex_indices].tolist())))
 
 
 def get_bl_teximage_nodes(bl_materials):
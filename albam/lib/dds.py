@@ -201,16 +201,20 @@ class DDSHeader(Structure):
     def from_bl_image(cls, bl_im):
         from bpy.path import abspath
 
-        dds_header = cls()
-        header_size = sizeof(dds_header)
         if bl_im.packed_file:
             data = bl_im.packed_file.data
         else:
             with open(abspath(bl_im.filepath), "rb") as f:
                 data = f.read()
+        return cls.from_data(data, bl_im.name)
+
+    @classmethod
+    def from_data(cls, data, name):
+        dds_header = cls()
+        header_size = sizeof(dds_header)
         id_magic = data[:4]
         if not id_magic == b"DDS ":
-            raise TypeError(f"Image {bl_im.name} is not a dds image. Id: {id_magic}")
+            raise TypeError(f"Image {name} is not a dds image. Id: {id_magic}")
         header_data = io.BytesIO(data[:header_size])  # FIXME unnecessary copy
         header_data.readinto(dds_header)
         dds_header._dds_data = data[header_size:]
@@ -0,0 +1,85 @@
+from contextlib import contextmanager
+import hashlib
+
+import numpy as np
+
+
+_CACHES = {}
+_SESSION = None
+
+
+def get_export_cache(name):
+    """
+    Return the dict named `name` of the export cache, kept between exports
+    for the whole Blender session. Entries are `slot: (fingerprint, value)`,
+    each slot (e.g. an object name) holding only its latest export
+    """
+    return _CACHES.setdefault(name, {})
+
+
+def clear_export_cache():
+    _CACHES.clear()
+
+
+def get_fingerprint(*items):
+    """
+    Return a digest of the items given: arrays and bytes-like objects are
+    hashed by content, anything else by its repr
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for item in items:
+        if isinstance(item, np.ndarray):
+            digest.update(repr((item.dtype.str, item.shape)).encode())
+            digest.update(np.ascontiguousarray(item).tobytes())
+        elif isinstance(item, (bytes, bytearray, memoryview)):
+            digest.update(repr(("bytes", len(item))).encode())
+            digest.update(item)
+        else:
+            item = repr(item).encode()
+            digest.update(repr(("repr", len(item))).encode())
+            digest.update(item)
+    return digest.hexdigest()
+
+
+def is_export_cached(name, slot, fingerprint):
+    entry = get_export_cache(name).get(slot)
+    return entry is not None and entry[0] == fingerprint
+
+
+def export_cached(name, slot, fingerprint, func, *args):
+    """
+    Return `func(*args)`, reusing the value cached for `slot` when
+    its `fingerprint` hasn't changed since it was exported
+    """
+    cache = get_export_cache(name)
+    entry = cache.get(slot)
+    if entry is not None and entry[0] == fingerprint:
+        return entry[1]
+    value = func(*args)
+    cache[slot] = (fingerprint, value)
+    return value
+
+
+@contextmanager
+def export_session():
+    """
+    Share serialized data between all the exports run inside the block,
+    so e.g. a texture used by several exported models is serialized once
+    """
+    global _SESSION
+    previous = _SESSION
+    _SESSION = {} if previous is None else previous
+    try:
+        yield
+    finally:
+        _SESSION = previous
+
+
+def get_export_session_cache(name):
+    """
+    Return the dict named `name` of the current `export_session` block,
+    or None when not exporting inside one
+    """
+    if _SESSION is None:
+        return None
+    return _SESSION.setdefault(name, {})
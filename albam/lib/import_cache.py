@@ -0,0 +1,30 @@
+from contextlib import contextmanager
+
+
+_CACHES = None
+
+
+@contextmanager
+def import_cache():
+    """
+    Share caches between all the imports run inside the block, so data
+    referenced by several imported files (e.g. mrl files) is parsed
+    only once
+    """
+    global _CACHES
+    previous = _CACHES
+    _CACHES = {} if previous is None else previous
+    try:
+        yield
+    finally:
+        _CACHES = previous
+
+
+def get_import_cache(name):
+    """
+    Return the dict named `name` of the current `import_cache` block,
+    or None when not importing inside one
+    """
+    if _CACHES is None:
+        return None
+    return _CACHES.setdefault(name, {})
@@ -1,2 +1,16 @@
+from concurrent.futures import ThreadPoolExecutor
+
+
 def chunks(list_, n):
     return [list_[i : i + n] for i in range(0, len(list_), n)]
+
+
+def map_in_pool(func, items, workers):
+    """
+    Return `[func(item) for item in items]`, computed in a thread pool
+    when `workers` > 1. Exceptions are raised as in a plain loop
+    """
+    if workers <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items))
@@ -24,6 +24,7 @@ class VirtualFile(bpy.types.PropertyGroup):
     is_root: bpy.props.BoolProperty(default=False)
     is_expandable: bpy.props.BoolProperty(default=False)
     is_expanded: bpy.props.BoolProperty(default=False)
+    is_batch_selected: bpy.props.BoolProperty(default=False, description="Include in batch import")
     category: bpy.props.StringProperty()
     tree_node: bpy.props.PointerProperty(type=TreeNode)  # consider adding the attributes here directly
     # FIXME: consider strings, seems pretty inefficient
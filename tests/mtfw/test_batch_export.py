@@ -0,0 +1,99 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+
+def _grid_mesh_export_data(size, vertex_format="0xa7d7d036"):
+    from albam.engines.mtfw.mesh import MeshExportData
+
+    rng = np.random.default_rng(0)
+    num_vertices = size * size
+    xy = np.indices((size, size)).reshape(2, -1).T
+    locations = np.column_stack((xy, np.zeros(num_vertices))).astype(np.float32)
+    triangles = []
+    for row in range(size - 1):
+        for col in range(size - 1):
+            a = row * size + col
+            triangles.extend(((a, a + size, a + 1), (a + 1, a + size, a + size + 1)))
+    triangles = np.array(triangles, dtype=np.int64)[rng.permutation(2 * (size - 1) ** 2)]
+    normals = np.tile((0.0, 0.0, 1.0), (num_vertices, 1))
+    return MeshExportData(
+        name="grid",
+        triangles=triangles,
+        is_triangulated=True,
+        locations=locations,
+        normals=normals,
+        tangents=normals,
+        uvs=[rng.uniform(0, 1, (num_vertices, 2)), None, None, None],
+        vertex_colors=np.zeros((num_vertices, 4)),
+        num_influences=np.zeros(num_vertices, dtype=np.int64),
+        bone_indices=np.zeros((num_vertices, 4), dtype=np.int64),
+        weight_values=np.zeros((num_vertices, 4)),
+        vertex_format=vertex_format,
+        skin_function=None,
+        has_armature=False,
+    )
+
+
+def _sorted_triangles(triangles_locations):
+    # triangles as tuples of vertex locations, starting from a fixed corner to keep the winding
+    triangles = []
+    for triangle in np.round(triangles_locations, 4).tolist():
+        first = triangle.index(min(triangle))
+        triangles.append(tuple(map(tuple, triangle[first:] + triangle[:first])))
+    return sorted(triangles)
+
+
+def test_export_mesh_without_bpy():
+    from albam.engines.mtfw.mesh import VERTEX_FORMATS_DTYPES, _decode_vertices, _export_mesh
+    from albam.lib.misc import map_in_pool
+
+    mesh_data = _grid_mesh_export_data(8)
+    # triangles are gathered as an array only when they are reordered
+    polygons_mesh_data = mesh_data._replace(triangles=mesh_data.triangles.ravel().tolist())
+    dst_mod = SimpleNamespace(header=SimpleNamespace(version=211, num_bones=0))
+    export_args = [
+        ("re0", mesh_data if optimize_vertex_cache else polygons_mesh_data, None, dst_mod, None, None,
+         optimize_vertex_cache, weld_vertices)
+        for optimize_vertex_cache in (False, True) for weld_vertices in (False, True)
+    ]
+    results = map_in_pool(lambda args: _export_mesh(*args), export_args, 4)
+
+    assert results == [_export_mesh(*args) for args in export_args]
+    expected_triangles = _sorted_triangles(mesh_data.locations[mesh_data.triangles])
+    for triangles, vertices, _, vertex_format, *_ in results:
+        decoded = _decode_vertices(
+            dst_mod, vertex_format, np.frombuffer(vertices, dtype=VERTEX_FORMATS_DTYPES[vertex_format]), None)
+        triangles = np.asarray(triangles).reshape(-1, 3)
+        assert _sorted_triangles(decoded.locations[triangles]) == expected_triangles
+
+
+def test_export_all_collects_errors(monkeypatch):
+    from albam.blender_ui.export_panel import ALBAM_OT_ExportAll
+    from albam.registry import blender_registry
+    from albam.vfs import VirtualFileData
+
+    def export_fake(bl_obj):
+        if bl_obj.name == "broken":
+            raise ValueError("can't export")
+        return [VirtualFileData("re5", f"{bl_obj.name}.fake", data_bytes=b"")]
+
+    monkeypatch.setitem(blender_registry.export_registry, ("re5", "fake"), export_fake)
+    exported = []
+    vfs = SimpleNamespace(add_vfiles_as_tree=lambda app_id, root, vfiles: exported.extend(vfiles))
+    context = SimpleNamespace(scene=SimpleNamespace(albam=SimpleNamespace(
+        exported=vfs,
+        export_settings=SimpleNamespace(trusted_write=False),
+    )))
+    items = [
+        SimpleNamespace(
+            display_name=name,
+            bl_object=SimpleNamespace(name=name, albam_asset=SimpleNamespace(app_id="re5", extension="fake")),
+        )
+        for name in ("first", "broken", "last")
+    ]
+
+    failed = ALBAM_OT_ExportAll._execute(context, items)
+
+    assert failed == items[1:2]
+    assert [vfile.relative_path for vfile in exported] == ["first.fake", "last.fake"]
@@ -0,0 +1,96 @@
+from types import SimpleNamespace
+
+
+class _VirtualFile:
+    def __init__(self, data):
+        self.data = data
+
+    def get_bytes(self):
+        return self.data
+
+
+class _VirtualFileSystem:
+    def __init__(self, files):
+        self.files = files
+
+    def get_vfile(self, app_id, relative_path):
+        return _VirtualFile(self.files[(app_id, relative_path)])
+
+
+def _batch_item(app_id, extension, is_batch_selected=True):
+    return SimpleNamespace(app_id=app_id, extension=extension, is_batch_selected=is_batch_selected)
+
+
+def test_get_batch_items_applies_poll_funcs():
+    from albam.blender_ui.import_panel import ALBAM_OT_BatchImport
+    # register the mod and lmt import functions
+    import albam.engines.mtfw.animation  # noqa: F401
+    import albam.engines.mtfw.mesh  # noqa: F401
+
+    items = [
+        _batch_item("re5", "mod"),
+        _batch_item("re5", "lmt"),
+        _batch_item("re5", "mod", is_batch_selected=False),
+        _batch_item("re5", "not_importable"),
+    ]
+    context = SimpleNamespace(scene=SimpleNamespace(albam=SimpleNamespace(
+        vfs=SimpleNamespace(file_list=items),
+        import_options_lmt=SimpleNamespace(armature=None),
+    )))
+
+    # importing lmt files needs an armature selected
+    assert ALBAM_OT_BatchImport.get_batch_items(context) == items[:1]
+    context.scene.albam.import_options_lmt.armature = object()
+    assert ALBAM_OT_BatchImport.get_batch_items(context) == items[:2]
+
+
+def test_get_import_cache_scope():
+    from albam.lib.import_cache import get_import_cache, import_cache
+
+    assert get_import_cache("mrl") is None
+    with import_cache():
+        cache = get_import_cache("mrl")
+        cache["key"] = "value"
+        assert get_import_cache("mrl") is cache
+        assert get_import_cache("other") == {}
+        # nested blocks share the outer caches
+        with import_cache():
+            assert get_import_cache("mrl") is cache
+        assert get_import_cache("mrl") is cache
+    assert get_import_cache("mrl") is None
+    with import_cache():
+        assert get_import_cache("mrl") == {}
+
+
+def test_infer_mrl_reuse(monkeypatch):
+    from albam.engines.mtfw import material
+    from albam.lib.import_cache import import_cache
+
+    parsed = []
+
+    class Mrl:
+        def __init__(self, app_id, stream):
+            self.stream = stream
+            parsed.append(self)
+
+        def _read(self):
+            self.materials = self.textures = [self.stream.read_u1()]
+
+    monkeypatch.setattr(material, "Mrl", Mrl)
+    vfs = _VirtualFileSystem({("re5", "pl0000.mrl"): b"\x01"})
+    context = SimpleNamespace(scene=SimpleNamespace(albam=SimpleNamespace(vfs=vfs)))
+    mod_vfile = SimpleNamespace(relative_path_windows_no_ext="pl0000")
+
+    first = material._infer_mrl(context, mod_vfile, "re5")
+    assert material._infer_mrl(context, mod_vfile, "re5") is not first
+    assert len(parsed) == 2
+
+    with import_cache():
+        first = material._infer_mrl(context, mod_vfile, "re5")
+        assert material._infer_mrl(context, mod_vfile, "re5") is first
+        assert len(parsed) == 3
+        # same path with other contents, e.g. from another arc
+        vfs.files[("re5", "pl0000.mrl")] = b"\x02"
+        other = material._infer_mrl(context, mod_vfile, "re5")
+        assert other is not first and other.materials == [2]
+        assert len(parsed) == 4
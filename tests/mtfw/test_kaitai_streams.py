@@ -0,0 +1,303 @@
+import io
+import mmap
+import random
+
+import pytest
+
+
+NUMBER_READS = [
+    f"read_{kind}{size}{endian}"
+    for kind, sizes in (("s", (1, 2, 4, 8)), ("u", (1, 2, 4, 8)), ("f", (4, 8)))
+    for size in sizes
+    for endian in (("",) if size == 1 else ("be", "le"))
+]
+
+DATA = bytes(random.Random(0).randrange(256) for _ in range(61)) + b"\x00"
+
+
+@pytest.fixture(params=["bytes", "bytearray", "memoryview", "mmap"])
+def buffer_stream(request, tmp_path):
+    """
+    Factory of KaitaiBufferStream over each of the supported buffer types,
+    closed at the end of the test
+    """
+    from kaitaistruct import KaitaiBufferStream
+
+    streams = []
+
+    def _buffer_stream(data):
+        if request.param == "mmap":
+            filepath = tmp_path / f"{len(streams)}.bin"
+            filepath.write_bytes(data)
+            with open(filepath, "rb") as f:
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            buf = {"bytes": bytes, "bytearray": bytearray, "memoryview": memoryview}[request.param](data)
+        stream = KaitaiBufferStream(buf)
+        streams.append(stream)
+        return stream
+
+    yield _buffer_stream
+    for stream in streams:
+        stream.close()
+
+
+def _run(stream, ops):
+    """
+    Call each op with the stream and collect the results, or the errors
+    raised, along with the position after it
+    """
+    results = []
+    for op in ops:
+        try:
+            result = op(stream)
+        except Exception as err:
+            result = (type(err), str(err))
+        results.append((repr(result), stream.pos()))
+    return results
+
+
+def _check_same_as_io_stream(buffer_stream, ops, data=DATA):
+    from kaitaistruct import KaitaiStream
+
+    expected = _run(KaitaiStream(io.BytesIO(data)), ops)
+    assert _run(buffer_stream(data), ops) == expected
+
+
+@pytest.mark.parametrize("read_name", NUMBER_READS)
+def test_buffer_stream_read_numbers(buffer_stream, read_name):
+    ops = []
+    # up to past the end, to compare the EOF errors too
+    for pos in range(len(DATA) + 2):
+        ops.append(lambda stream, pos=pos: stream.seek(pos))
+        ops.append(lambda stream: getattr(stream, read_name)())
+        ops.append(lambda stream: stream.is_eof())
+
+    _check_same_as_io_stream(buffer_stream, ops)
+
+
+def test_buffer_stream_read_bytes(buffer_stream):
+    ops = [lambda stream: stream.size()]
+    for pos in (0, 1, len(DATA) - 3, len(DATA)):
+        for n in (-1, 0, 1, 3, 4, len(DATA)):
+            ops.append(lambda stream, pos=pos: stream.seek(pos))
+            ops.append(lambda stream, n=n: stream.read_bytes(n))
+        ops.append(lambda stream, pos=pos: stream.seek(pos))
+        ops.append(lambda stream: stream.read_bytes_full())
+        ops.append(lambda stream: stream.read_bytes_full())
+
+    _check_same_as_io_stream(buffer_stream, ops)
+
+
+@pytest.mark.parametrize("include_term", (False, True))
+@pytest.mark.parametrize("consume_term", (False, True))
+@pytest.mark.parametrize("eos_error", (False, True))
+def test_buffer_stream_read_bytes_term(buffer_stream, include_term, consume_term, eos_error):
+    ops = []
+    # one terminator found, the last byte and one that's not in the data
+    terms = (DATA[10], 0, next(b for b in range(256) if b not in DATA))
+    for pos in (0, 11, len(DATA) - 1, len(DATA)):
+        for term in terms:
+            ops.append(lambda stream, pos=pos: stream.seek(pos))
+            ops.append(lambda stream, term=term: stream.read_bytes_term(
+                term, include_term, consume_term, eos_error))
+
+    _check_same_as_io_stream(buffer_stream, ops)
+
+
+@pytest.mark.parametrize("read_bits_name", ("read_bits_int_be", "read_bits_int_le"))
+def test_buffer_stream_read_bits(buffer_stream, read_bits_name):
+    ops = []
+    for num_bits in (1, 3, 4, 7, 9, 16, 33, 1, 64):
+        ops.append(lambda stream, num_bits=num_bits: getattr(stream, read_bits_name)(num_bits))
+        ops.append(lambda stream: stream.is_eof())
+    # byte aligned reads drop the bits left
+    ops.append(lambda stream: getattr(stream, read_bits_name)(3))
+    ops.append(lambda stream: stream.read_u2le())
+    ops.append(lambda stream: getattr(stream, read_bits_name)(5))
+    ops.append(lambda stream: stream.read_bytes(1))
+    ops.append(lambda stream: stream.seek(len(DATA) - 1))
+    ops.append(lambda stream: getattr(stream, read_bits_name)(8))
+    ops.append(lambda stream: getattr(stream, read_bits_name)(1))
+
+    _check_same_as_io_stream(buffer_stream, ops)
+
+
+def test_buffer_stream_random_reads(buffer_stream):
+    rng = random.Random(1)
+    choices = (
+        lambda: lambda stream, name=rng.choice(NUMBER_READS): getattr(stream, name)(),
+        lambda: lambda stream, n=rng.randrange(10): stream.read_bytes(n),
+        lambda: lambda stream, n=rng.randrange(1, 12): stream.read_bits_int_be(n),
+        lambda: lambda stream, n=rng.randrange(1, 12): stream.read_bits_int_le(n),
+        lambda: lambda stream, term=rng.randrange(256): stream.read_bytes_term(term, False, True, False),
+        lambda: lambda stream, pos=rng.randrange(70): stream.seek(pos),
+        lambda: lambda stream: stream.is_eof(),
+    )
+    for _ in range(50):
+        data = bytes(rng.randrange(256) for _ in range(rng.randrange(1, 64)))
+        ops = [rng.choice(choices)() for _ in range(20)]
+        _check_same_as_io_stream(buffer_stream, ops, data)
+
+
+def test_arc_wrapper_close_releases_mapping(tmp_path):
+    from albam.engines.mtfw.archive import ArcWrapper
+
+    # an arc without files: header and padding up to the first 32k block
+    filepath = tmp_path / "empty.arc"
+    filepath.write_bytes(b"ARC\x00" + (7).to_bytes(2, "little") + bytes(2) + bytes(32760))
+
+    arc = ArcWrapper(str(filepath))
+    buf = arc.parsed._io._source
+    assert isinstance(buf, mmap.mmap)
+    assert arc.get_file_entries() == []
+
+    arc.close()
+    assert buf.closed
+    with pytest.raises(ValueError):
+        arc.parsed._io.read_u1()
+
+
+ARRAY_FORMATS = [
+    (f"{byte_order}{fmt}", f"{kind}{size}{endian if size > 1 else ''}")
+    for byte_order, endian in (("<", "le"), (">", "be"))
+    for fmt, kind, size in (
+        ("b", "s", 1), ("B", "u", 1), ("h", "s", 2), ("H", "u", 2), ("i", "s", 4), ("I", "u", 4),
+        ("q", "s", 8), ("Q", "u", 8), ("f", "f", 4), ("d", "f", 8),
+    )
+]
+
+
+@pytest.mark.parametrize("fmt,kind", ARRAY_FORMATS)
+def test_read_array(buffer_stream, fmt, kind):
+    from kaitaistruct import KaitaiStream
+
+    for stream_factory in (lambda: KaitaiStream(io.BytesIO(DATA)), lambda: buffer_stream(DATA)):
+        for pos in (0, 3, len(DATA), len(DATA) + 2):
+            for n in (0, 1, 5, len(DATA)):
+                array_stream = stream_factory()
+                array_stream.seek(pos)
+                elements_stream = stream_factory()
+                elements_stream.seek(pos)
+                try:
+                    expected = [getattr(elements_stream, f"read_{kind}")() for _ in range(n)]
+                except EOFError:
+                    with pytest.raises(EOFError):
+                        array_stream.read_array(fmt, n)
+                    continue
+                assert repr(array_stream.read_array(fmt, n)) == repr(expected)
+                assert array_stream.pos() == elements_stream.pos()
+
+
+@pytest.mark.parametrize("fmt,kind", ARRAY_FORMATS)
+def test_write_array(fmt, kind):
+    from kaitaistruct import KaitaiStream
+
+    values = KaitaiStream(io.BytesIO(DATA * 8)).read_array(fmt, 6)
+    for n in (0, 1, 6):
+        size = n * int(kind[1])
+        array_stream = KaitaiStream(io.BytesIO(bytearray(size)))
+        array_stream.write_array(fmt, values[:n])
+        elements_stream = KaitaiStream(io.BytesIO(bytearray(size)))
+        for value in values[:n]:
+            getattr(elements_stream, f"write_{kind}")(value)
+        assert array_stream.to_byte_array() == elements_stream.to_byte_array()
+        assert array_stream.pos() == elements_stream.pos() == size
+
+
+# as generated by kaitai-struct-compiler, arrays of primitives and structs
+GENERATED_SOURCE = '''
+class Arrays(ReadWriteKaitaiStruct):
+    def __init__(self, _io=None, _parent=None, _root=None):
+        self._io = _io
+        self._parent = _parent
+        self._root = _root if _root else self
+
+    def _read(self):
+        self.num_values = self._io.read_u1()
+        self.values = []
+        for i in range(self.num_values):
+            self.values.append(self._io.read_s2be())
+
+        self.floats = []
+        for i in range(2):
+            self.floats.append(self._io.read_f4le())
+
+        self.entries = []
+        for i in range(self.num_values):
+            _t_entries = Arrays.Entry(self._io, self, self._root)
+            _t_entries._read()
+            self.entries.append(_t_entries)
+
+
+    def _write__seq(self, io=None):
+        super(Arrays, self)._write__seq(io)
+        self._io.write_u1(self.num_values)
+        for i in range(len(self.values)):
+            pass
+            self._io.write_s2be(self.values[i])
+
+        for i in range(len(self.floats)):
+            pass
+            self._io.write_f4le(self.floats[i])
+
+        for i in range(len(self.entries)):
+            pass
+            self.entries[i]._write__seq(self._io)
+
+
+    def _fetch_instances(self):
+        pass
+
+    class Entry(ReadWriteKaitaiStruct):
+        def __init__(self, _io=None, _parent=None, _root=None):
+            self._io = _io
+            self._parent = _parent
+            self._root = _root
+
+        def _read(self):
+            self.value = self._io.read_u1()
+
+
+        def _write__seq(self, io=None):
+            super(Arrays.Entry, self)._write__seq(io)
+            self._io.write_u1(self.value)
+
+
+        def _fetch_instances(self):
+            pass
+'''
+
+
+def _exec_generated(source):
+    import kaitaistruct
+
+    namespace = {"ReadWriteKaitaiStruct": kaitaistruct.ReadWriteKaitaiStruct}
+    exec(source, namespace)
+    return namespace["Arrays"]
+
+
+def test_bulk_arrays():
+    from kaitaistruct import KaitaiBufferStream, KaitaiStream
+    from albam.engines.mtfw.scripts.bulk_arrays import bulk_arrays
+
+    source, num_reads, num_writes = bulk_arrays(GENERATED_SOURCE)
+
+    assert (num_reads, num_writes) == (2, 2)
+    assert 'self.values = self._io.read_array(">h", self.num_values)\n' in source
+    assert 'self.floats = self._io.read_array("<f", 2)\n' in source
+    assert 'self._io.write_array(">h", self.values)\n' in source
+    assert 'self._io.write_array("<f", self.floats)\n' in source
+    assert "_t_entries._read()" in source
+    assert bulk_arrays(source) == (source, 0, 0)
+
+    data = b"\x03" + DATA[:6] + DATA[6:14] + DATA[14:17]
+    parsed = []
+    for cls in (_exec_generated(GENERATED_SOURCE), _exec_generated(source)):
+        arrays = cls(KaitaiBufferStream(data))
+        arrays._read()
+        out = KaitaiStream(io.BytesIO(bytearray(len(data))))
+        arrays._write(out)
+        assert out.to_byte_array() == data
+        parsed.append(repr((arrays.values, arrays.floats, [entry.value for entry in arrays.entries])))
+    assert parsed[0] == parsed[1]
@@ -0,0 +1,255 @@
+import io
+import random
+import struct
+import time
+from pathlib import Path
+
+import pytest
+
+
+def _bone_palettes_data(num_palettes, seed=0):
+    rng = random.Random(seed)
+    palettes = [
+        (rng.randrange(33), bytes(rng.randrange(256) for _ in range(32))) for _ in range(num_palettes)
+    ]
+    data = b"".join(struct.pack("<I", unk_01) + indices for unk_01, indices in palettes)
+    return data, [(unk_01, list(indices)) for unk_01, indices in palettes]
+
+
+def test_lazy_array_threads():
+    from kaitaistruct import KaitaiBufferStream
+    from albam.engines.mtfw.structs.mod_156 import Mod156
+    from albam.lib.misc import map_in_pool
+
+    class BonePalette(Mod156.BonePalette):
+        def _read(self):
+            self.unk_01 = self._io.read_u4le()
+            # let other threads read in the middle of the element
+            time.sleep(0.001)
+            self.indices = self._io.read_array("<B", 32)
+
+    num_palettes = 32
+    first_data, first_expected = _bone_palettes_data(num_palettes, seed=0)
+    second_data, second_expected = _bone_palettes_data(num_palettes, seed=1)
+    stream = KaitaiBufferStream(first_data + second_data)
+    # two arrays of the same stream, as the ones of a mod
+    arrays = [stream.read_lazy_array(num_palettes, 36, BonePalette, stream, None, None) for _ in range(2)]
+    assert stream.pos() == len(first_data) + len(second_data)
+
+    indices = [(a, i) for a in range(2) for i in range(num_palettes)] * 2
+    random.Random(2).shuffle(indices)
+    read = map_in_pool(lambda index: arrays[index[0]][index[1]], indices, 8)
+
+    expected = [first_expected, second_expected]
+    assert [(palette.unk_01, palette.indices) for palette in read] == [expected[a][i] for a, i in indices]
+    # each element is parsed once, threads get the same object
+    assert all(palette is arrays[a][i] for palette, (a, i) in zip(read, indices))
+    assert stream.pos() == len(first_data) + len(second_data)
+
+
+# as generated by kaitai-struct-compiler, an array of a fixed size struct
+GENERATED_SOURCE = '''
+class Entries(ReadWriteKaitaiStruct):
+    def __init__(self, _io=None, _parent=None, _root=None):
+        self._io = _io
+        self._parent = _parent
+        self._root = _root if _root else self
+
+    def _read(self):
+        self.num_entries = self._io.read_u2le()
+        self.entries = []
+        for i in range(self.num_entries):
+            _t_entries = Entries.Entry(self._io, self, self._root)
+            _t_entries._read()
+            self.entries.append(_t_entries)
+
+        self.end = self._io.read_u1()
+
+
+    def _write__seq(self, io=None):
+        super(Entries, self)._write__seq(io)
+        self._io.write_u2le(self.num_entries)
+        for i in range(len(self.entries)):
+            pass
+            self.entries[i]._write__seq(self._io)
+
+        self._io.write_u1(self.end)
+
+
+    def _fetch_instances(self):
+        pass
+
+    class Entry(ReadWriteKaitaiStruct):
+        def __init__(self, _io=None, _parent=None, _root=None):
+            self._io = _io
+            self._parent = _parent
+            self._root = _root
+
+        def _read(self):
+            self.index = self._io.read_u2le()
+            self.weight = self._io.read_f4le()
+
+
+        def _write__seq(self, io=None):
+            super(Entries.Entry, self)._write__seq(io)
+            self._io.write_u2le(self.index)
+            self._io.write_f4le(self.weight)
+
+
+        def _fetch_instances(self):
+            pass
+'''
+
+
+def _exec_generated(source):
+    import kaitaistruct
+
+    namespace = {"ReadWriteKaitaiStruct": kaitaistruct.ReadWriteKaitaiStruct}
+    exec(source, namespace)
+    return namespace["Entries"]
+
+
+def _entries_data(num_entries):
+    entries = b"".join(struct.pack("<Hf", i, i / 4) for i in range(num_entries))
+    return struct.pack("<H", num_entries) + entries + b"\xff"
+
+
+def _parse_entries(cls, data):
+    from kaitaistruct import KaitaiBufferStream
+
+    entries = cls(KaitaiBufferStream(data))
+    entries._read()
+    return entries
+
+
+def test_lazy_arrays_generated():
+    from kaitaistruct import LazyArray
+    from albam.engines.mtfw.scripts.lazy_arrays import get_fixed_sizes, lazy_arrays
+
+    source, num_arrays = lazy_arrays(GENERATED_SOURCE)
+
+    assert get_fixed_sizes(GENERATED_SOURCE) == {"Entries.Entry": 6}
+    assert num_arrays == 1
+    assert ("self.entries = self._io.read_lazy_array("
+            "self.num_entries, 6, Entries.Entry, self._io, self, self._root)\n") in source
+    assert lazy_arrays(source) == (source, 0)
+
+    data = _entries_data(5)
+    eager = _parse_entries(_exec_generated(GENERATED_SOURCE), data)
+    lazy = _parse_entries(_exec_generated(source), data)
+    assert isinstance(lazy.entries, LazyArray)
+    # the array is skipped, the fields after it are read as usual
+    assert (lazy.num_entries, lazy.end) == (eager.num_entries, eager.end)
+    assert lazy.entries._items.count(LazyArray._NOT_READ) == 5
+    assert [(e.index, e.weight) for e in lazy.entries] == [(e.index, e.weight) for e in eager.entries]
+    assert lazy.entries[-1]._io is lazy._io
+
+
+def test_lazy_arrays_write():
+    from kaitaistruct import KaitaiStream
+    from albam.engines.mtfw.scripts.lazy_arrays import lazy_arrays
+
+    cls = _exec_generated(lazy_arrays(GENERATED_SOURCE)[0])
+    data = _entries_data(4)
+    for read_first in (False, True):
+        entries = _parse_entries(cls, data)
+        if read_first:
+            entries.entries[1]
+        out = KaitaiStream(io.BytesIO(bytearray(len(data))))
+        entries._write(out)
+        assert out.to_byte_array() == data
+
+
+def test_lazy_arrays_truncated():
+    from albam.engines.mtfw.scripts.lazy_arrays import lazy_arrays
+
+    data = _entries_data(4)
+    for cls in (_exec_generated(GENERATED_SOURCE), _exec_generated(lazy_arrays(GENERATED_SOURCE)[0])):
+        # the last entry is cut
+        with pytest.raises(EOFError):
+            _parse_entries(cls, data[:-4])
+
+
+def test_lazy_array_mutations():
+    from kaitaistruct import KaitaiBufferStream
+    from albam.engines.mtfw.structs.mod_156 import Mod156
+
+    data, expected = _bone_palettes_data(6)
+
+    def lazy_array():
+        stream = KaitaiBufferStream(data)
+        return stream.read_lazy_array(6, 36, Mod156.BonePalette, stream, None, None)
+
+    def as_tuples(palettes):
+        return [(p.unk_01, p.indices) if isinstance(p, Mod156.BonePalette) else p for p in palettes]
+
+    palettes = lazy_array()
+    assert len(palettes) == 6
+    assert as_tuples(palettes[-2:]) == expected[-2:]
+    assert as_tuples(palettes[::-2]) == expected[::-2]
+    assert palettes[-1] is palettes[5]
+    assert as_tuples([palettes[-6]]) == expected[:1]
+    with pytest.raises(IndexError):
+        palettes[6]
+    with pytest.raises(IndexError):
+        palettes[-7]
+
+    mutations = (
+        lambda items: items.__setitem__(1, "set"),
+        lambda items: items.__setitem__(-1, "set last"),
+        lambda items: items.__setitem__(slice(1, 3), ["a", "b", "c"]),
+        lambda items: items.insert(2, "inserted"),
+        lambda items: items.insert(-1, "inserted before last"),
+        lambda items: items.append("appended"),
+        lambda items: items.__delitem__(0),
+        lambda items: items.__delitem__(-2),
+        lambda items: items.__delitem__(slice(None, None, 2)),
+        lambda items: items.extend(["x", "y"]),
+        lambda items: items.reverse(),
+        lambda items: items.remove(items[3]),
+        lambda items: items.pop(),
+    )
+    for mutation in mutations:
+        palettes = lazy_array()
+        items = list(palettes)
+        mutation(palettes)
+        mutation(items)
+        assert as_tuples(palettes) == as_tuples(items)
+        assert palettes == items
+
+
+def test_read_lazy_array_io_stream():
+    from kaitaistruct import KaitaiStream, LazyArray
+    from albam.engines.mtfw.structs.mod_156 import Mod156
+
+    data, expected = _bone_palettes_data(3)
+    stream = KaitaiStream(io.BytesIO(data + b"\x01"))
+    palettes = stream.read_lazy_array(3, 36, Mod156.BonePalette, stream, None, None)
+    assert isinstance(palettes, LazyArray)
+    assert stream.read_u1() == 1
+    assert [(p.unk_01, p.indices) for p in palettes] == expected
+
+    # the first element would start with the bits left, read as usual
+    stream = KaitaiStream(io.BytesIO(b"\x00" + data))
+    stream.read_bits_int_be(4)
+    palettes = stream.read_lazy_array(2, 36, Mod156.BonePalette, stream, None, None)
+    assert isinstance(palettes, list)
+    assert stream.pos() == 1 + 2 * 36
+
+    # an empty array at the end
+    stream = KaitaiStream(io.BytesIO(data))
+    stream.seek(len(data))
+    assert stream.read_lazy_array(0, 36, Mod156.BonePalette, stream, None, None) == []
+    with pytest.raises(EOFError):
+        stream.read_lazy_array(1, 36, Mod156.BonePalette, stream, None, None)
+
+
+def test_lazy_arrays_committed_structs():
+    from albam.engines.mtfw.scripts.lazy_arrays import lazy_arrays
+
+    structs_dir = Path(__file__).parents[2] / "albam" / "engines" / "mtfw" / "structs"
+    filepaths = sorted(structs_dir.glob("*.py"))
+    assert filepaths
+    for filepath in filepaths:
+        source = filepath.read_text()
+        assert lazy_arrays(source) == (source, 0), filepath.name
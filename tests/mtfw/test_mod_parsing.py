@@ -1,3 +1,9 @@
+from struct import unpack
+
+import numpy as np
+import pytest
+
+
 SUPPORTED_MOD_VERSIONS = (156, 210, 211, 212)
 
 KNOWN_CONNECT = {
@@ -179,3 +185,315 @@ def test_mod(parsed_mod_from_arc):
     assert mod.header.version in SUPPORTED_MOD_VERSIONS
     assert not vertex_formats.difference(KNOWN_VERTEX_FORMATS)
     assert total_num_weight_bounds == num_weight_bounds == len(mod.meshes_data.weight_bounds)
+
+
+def _kaitai_vertex_field_values(value):
+    if isinstance(value, int):
+        return [value]
+    if isinstance(value, bytes):
+        return list(unpack(f"{len(value) // 2}e", value))
+    if isinstance(value, list):
+        return [x for v in value for x in _kaitai_vertex_field_values(v)]
+    if hasattr(value, "u"):
+        return _kaitai_vertex_field_values([value.u, value.v])
+    return [getattr(value, c) for c in "xyzw" if hasattr(value, c)]
+
+
+def test_mod_vertices_decoding(parsed_mod_from_arc, subtests):
+    from albam.engines.mtfw.mesh import _read_vertices
+
+    mod = parsed_mod_from_arc
+    for mi, mesh in enumerate(mod.meshes_data.meshes):
+        vertices = _read_vertices(mod._src_bytes, mod, mesh)
+        kaitai_vertices = mesh.vertices
+        with subtests.test(mesh_index=mi):
+            assert len(vertices) == len(kaitai_vertices)
+            for name in vertices.dtype.names:
+                # morph targets are split in several fields in kaitai
+                if name.startswith("morph_") or not hasattr(kaitai_vertices[0], name):
+                    continue
+                expected = [x for v in kaitai_vertices
+                            for x in _kaitai_vertex_field_values(getattr(v, name))]
+                assert np.array_equal(vertices[name].ravel(), expected, equal_nan=True)
+
+
+def test_mod_raw_buffers(parsed_mod_from_arc, subtests):
+    from albam.engines.mtfw.mesh import parse_mod
+
+    mod = parsed_mod_from_arc
+    mod_raw = parse_mod(mod._src_bytes, raw_buffers=True)
+    meshes = mod.meshes_data.meshes
+    meshes_raw = mod_raw.meshes_data.meshes
+    assert len(meshes) == len(meshes_raw)
+    for mi, (mesh, mesh_raw) in enumerate(zip(meshes, meshes_raw)):
+        with subtests.test(mesh_index=mi):
+            assert mesh_raw.indices.tolist() == mesh.indices
+            assert len(mesh_raw.vertices) == len(mesh.vertices)
+
+
+def _strip_to_triangles_reference(strip):
+    indices = []
+    for i in range(2, len(strip)):
+        a, b, c = strip[i - 2], strip[i - 1], strip[i]
+        if a != b and a != c and b != c:
+            indices.extend((a, b, c) if i % 2 == 0 else (c, b, a))
+    return indices or list(strip)
+
+
+def test_strip_triangles_to_triangles_list(parsed_mod_from_arc, subtests):
+    from albam.lib.blender import strip_triangles_to_triangles_list
+
+    mod = parsed_mod_from_arc
+    if mod.header.version not in (156, 212):
+        pytest.skip("Mod version doesn't use triangle strips")
+    for mi, mesh in enumerate(mod.meshes_data.meshes):
+        with subtests.test(mesh_index=mi):
+            indices = strip_triangles_to_triangles_list(mesh.indices)
+            assert indices.tolist() == _strip_to_triangles_reference(mesh.indices)
+
+
+def test_strip_triangles_to_triangles_list_random():
+    from albam.lib.blender import strip_triangles_to_triangles_list
+
+    rng = np.random.default_rng(0)
+    for length in list(range(12)) + [100, 1000]:
+        for _ in range(50):
+            strip = rng.integers(0, length // 3 + 2, length).tolist()
+            indices = strip_triangles_to_triangles_list(strip)
+            assert indices.tolist() == _strip_to_triangles_reference(strip)
+
+
+def _sorted_triangles(indices):
+    """Triangles rotated to start at their lowest index, keeping the winding"""
+    triangles = np.asarray(indices).reshape(-1, 3)
+    rotations = np.argmin(triangles, axis=1)[:, None]
+    triangles = np.take_along_axis(triangles, (rotations + np.arange(3)) % 3, axis=1)
+    return sorted(map(tuple, triangles.tolist()))
+
+
+def test_triangles_to_strip(parsed_mod_from_arc, subtests):
+    from albam.lib.blender import strip_triangles_to_triangles_list, triangles_to_strip
+
+    mod = parsed_mod_from_arc
+    if mod.header.version not in (156, 212):
+        pytest.skip("Mod version doesn't use triangle strips")
+    for mi, mesh in enumerate(mod.meshes_data.meshes):
+        with subtests.test(mesh_index=mi):
+            triangles = strip_triangles_to_triangles_list(mesh.indices)
+            if len(triangles) % 3:
+                continue
+            for vertex_cache_size in (0, 16):
+                strip = triangles_to_strip(triangles.reshape(-1, 3), vertex_cache_size)
+                restripped = strip_triangles_to_triangles_list(strip)
+                assert _sorted_triangles(restripped) == _sorted_triangles(triangles)
+
+
+def test_triangles_to_strip_random():
+    from albam.lib.blender import strip_triangles_to_triangles_list, triangles_to_strip
+
+    rng = np.random.default_rng(0)
+    for rows, columns in ((1, 1), (1, 7), (5, 5), (20, 30)):
+        quads = np.arange((rows + 1) * (columns + 1)).reshape(rows + 1, columns + 1)
+        a, b = quads[:-1, :-1].ravel(), quads[:-1, 1:].ravel()
+        c, d = quads[1:, :-1].ravel(), quads[1:, 1:].ravel()
+        triangles = np.concatenate((np.column_stack((a, b, d)), np.column_stack((a, d, c))))
+        for _ in range(10):
+            shuffled = rng.permutation(triangles)
+            shuffled = shuffled[rng.random(len(shuffled)) < 0.8]
+            for vertex_cache_size in (0, 16):
+                strip = triangles_to_strip(shuffled, vertex_cache_size)
+                restripped = strip_triangles_to_triangles_list(strip)
+                assert _sorted_triangles(restripped) == _sorted_triangles(shuffled)
+
+
+def _check_optimize_triangles(triangles, vertex_count):
+    from albam.engines.mtfw.mesh import _optimize_triangles
+
+    optimized, vertex_order, (stats, optimized_stats) = _optimize_triangles(triangles, vertex_count)
+    if vertex_order is None:
+        assert optimized is triangles
+    else:
+        assert optimized_stats[0] < stats[0]
+        assert sorted(vertex_order.tolist()) == list(range(vertex_count))
+        assert _sorted_triangles(vertex_order[optimized]) == _sorted_triangles(triangles)
+    return vertex_order
+
+
+def test_optimize_vertex_cache(parsed_mod_from_arc, subtests):
+    mod = parsed_mod_from_arc
+    if mod.header.version not in (210, 211):
+        pytest.skip("Mod version doesn't use triangle lists")
+    for mi, mesh in enumerate(mod.meshes_data.meshes):
+        with subtests.test(mesh_index=mi):
+            triangles = np.asarray(mesh.indices, dtype=np.int64).reshape(-1, 3)
+            _check_optimize_triangles(triangles, int(triangles.max(initial=-1)) + 1)
+
+
+def test_optimize_vertex_cache_grid():
+    # row by row scan of a 8x8 quads grid, already cache friendly
+    size = 9
+    triangles = []
+    for row in range(size - 1):
+        for col in range(size - 1):
+            a = row * size + col
+            triangles.extend(((a, a + size, a + 1), (a + 1, a + size, a + size + 1)))
+    triangles = np.array(triangles, dtype=np.int64)
+    _check_optimize_triangles(triangles, size * size)
+
+    rng = np.random.default_rng(0)
+    shuffled = triangles[rng.permutation(len(triangles))]
+    assert _check_optimize_triangles(shuffled, size * size) is not None
+
+
+def test_plan_bone_palettes(parsed_mod_from_arc):
+    from albam.engines.mtfw.mesh import (
+        MAX_BONE_PALETTE_SIZE,
+        _plan_bone_palettes,
+        _plan_bone_palettes_greedy,
+    )
+
+    mod = parsed_mod_from_arc
+    if mod.header.version != 156:
+        pytest.skip("Mod version doesn't use bone palettes")
+    bone_sets = []
+    for mesh in mod.meshes_data.meshes:
+        bone_palette = mod.bones_data.bone_palettes[mesh.idx_bone_palette]
+        bone_sets.append(frozenset(bone_palette.indices[:bone_palette.unk_01]))
+
+    bone_palettes = _plan_bone_palettes(bone_sets)
+    mesh_indices = sorted(mi for palette_meshes, _ in bone_palettes for mi in palette_meshes)
+
+    assert mesh_indices == list(range(len(bone_sets)))
+    assert len(bone_palettes) <= len(_plan_bone_palettes_greedy(bone_sets))
+    for palette_meshes, bone_indices in bone_palettes:
+        assert len(bone_indices) <= MAX_BONE_PALETTE_SIZE
+        assert all(bone_sets[mi] <= bone_indices for mi in palette_meshes)
+
+
+def test_get_bounds_per_group():
+    from albam.lib.blender import get_bounds_per_group
+
+    rng = np.random.default_rng(0)
+    positions = rng.uniform(-10, 10, (500, 3)).astype(np.float32)
+    groups = rng.integers(0, 20, 500)
+    group_ids, bbox_min, bbox_max, radius = get_bounds_per_group(positions, groups)
+
+    assert group_ids.tolist() == sorted(set(groups.tolist()))
+    for i, group_id in enumerate(group_ids):
+        group_positions = positions[groups == group_id].astype(np.float64)
+        center = (group_positions.min(axis=0) + group_positions.max(axis=0)) / 2
+        assert np.array_equal(bbox_min[i], group_positions.min(axis=0))
+        assert np.array_equal(bbox_max[i], group_positions.max(axis=0))
+        assert np.isclose(radius[i], np.linalg.norm(group_positions - center, axis=1).max())
+
+
+def test_weld_vertices():
+    from albam.engines.mtfw.mesh import _weld_vertices
+
+    rng = np.random.default_rng(0)
+    unique_vertices = rng.integers(0, 256, (50, 32), dtype=np.uint8)
+    unique_vertices_2 = rng.integers(0, 256, (50, 8), dtype=np.uint8)
+    vertex_ids = rng.integers(0, 50, 200)
+    indices = rng.integers(0, 200, 300).tolist()
+
+    welded_indices, vertices, vertices_2 = _weld_vertices(
+        indices, unique_vertices[vertex_ids].tobytes(), unique_vertices_2[vertex_ids].tobytes(), 32, 8)
+    vertices = np.frombuffer(vertices, dtype=np.uint8).reshape(-1, 32)
+    vertices_2 = np.frombuffer(vertices_2, dtype=np.uint8).reshape(-1, 8)
+
+    assert len(vertices) == len(np.unique(vertex_ids))
+    assert np.array_equal(vertices[welded_indices], unique_vertices[vertex_ids][indices])
+    assert np.array_equal(vertices_2[welded_indices], unique_vertices_2[vertex_ids][indices])
+
+
+def test_decode_meshes_out_of_range():
+    from albam.engines.mtfw.mesh import _create_bbox_data, _decode_meshes, parse_mod
+
+    num_vertices = 10
+    mod_bytes = _mod_211_bytes([
+        dict(vertex_position=0, num_vertices=4, face_position=0, num_indices=3),
+        dict(vertex_position=4, num_vertices=6, face_position=3, num_indices=3),
+        # right after the other ones in the vertex buffer, past the end of the file
+        dict(vertex_position=8, num_vertices=4, face_position=0, num_indices=3),
+        # same vertices as the first mesh, indices past the end of the file
+        dict(vertex_position=0, num_vertices=4, face_position=1000, num_indices=3),
+    ], num_vertices=num_vertices, num_indices=6)
+    mod = parse_mod(mod_bytes, raw_buffers=True)
+    meshes = list(mod.meshes_data.meshes)
+
+    decoded_meshes, bytes_decoded, _ = _decode_meshes(
+        mod_bytes, mod, meshes, _create_bbox_data(mod), False, workers=2)
+
+    first, second, vertices_out, indices_out = decoded_meshes
+    # locations are scaled to meters, x is the index of the vertex
+    assert np.allclose(first.vertices.locations[:, 0] * 100, np.arange(4))
+    assert first.indices.tolist() == [0, 1, 2]
+    assert np.allclose(second.vertices.locations[:, 0] * 100, np.arange(4, 10))
+    assert second.indices.tolist() == [3, 4, 5]
+    assert isinstance(vertices_out, ValueError) and str(vertices_out).startswith("Vertices out of range")
+    assert isinstance(indices_out, ValueError) and str(indices_out).startswith("Indices out of range")
+    # the shared region stops at the meshes that fit
+    assert bytes_decoded == num_vertices * meshes[0].vertex_stride
+
+
+def _mod_211_bytes(meshes, num_vertices, num_indices):
+    """
+    Build a mod 211 with the given meshes, as dicts of the fields of `Mod21.Mesh`
+    that locate its buffers, IANonSkinTBN vertices whose x is their index and
+    indices 0, 1, 2, ...
+    """
+    from struct import pack
+    from albam.engines.mtfw.mesh import VERTEX_FORMATS_DTYPES
+
+    vertex_format = 0x5e7f202c  # IANonSkinTBN
+    dtype = VERTEX_FORMATS_DTYPES[vertex_format]
+    vertices = np.zeros(num_vertices, dtype=dtype)
+    vertices["position"][:, 0] = np.arange(num_vertices)
+    vertex_buffer = vertices.tobytes()
+    index_buffer = np.arange(num_indices, dtype="<u2").tobytes()
+
+    offset_meshes_data = 128
+    offset_vertex_buffer = offset_meshes_data + 48 * len(meshes) + 4
+    offset_index_buffer = offset_vertex_buffer + len(vertex_buffer)
+    size_file = offset_index_buffer + len(index_buffer)
+    header = pack(
+        "<4sBBHHH13I", b"MOD\x00", 211, 0, 0, len(meshes), 0, num_vertices, num_indices, 0,
+        len(vertex_buffer), 0, 0, 0, 0, 0, offset_meshes_data, offset_vertex_buffer,
+        offset_index_buffer, size_file,
+    )
+    bounds = pack("<12f", 0, 0, 0, 1, 0, 0, 0, 0, 1, 1, 1, 0)
+    model_info = pack("<iiIBBH", 0, 0, 0, 0, 0, 0)
+    meshes_data = b"".join(
+        pack(
+            "<HH4xH2B6I2BH2HI", 0, mesh["num_vertices"], 0, dtype.itemsize, 0,
+            mesh["vertex_position"], 0, vertex_format, mesh["face_position"], mesh["num_indices"], 0,
+            0, 0, 0, 0, mesh["num_vertices"] - 1, 0,
+        )
+        for mesh in meshes
+    ) + pack("<I", 0)
+    return header + bounds + model_info + meshes_data + vertex_buffer + index_buffer
+
+
+def test_parse_mod_raw_buffers_out_of_range():
+    from albam.engines.mtfw.mesh import parse_mod
+
+    mod_bytes = _mod_211_bytes([
+        dict(vertex_position=0, num_vertices=4, face_position=0, num_indices=3),
+        # vertices past the end of the file
+        dict(vertex_position=1000, num_vertices=4, face_position=3, num_indices=3),
+        # indices past the end of the file
+        dict(vertex_position=4, num_vertices=4, face_position=1000, num_indices=3),
+    ], num_vertices=8, num_indices=6)
+
+    mod = parse_mod(mod_bytes, raw_buffers=True)
+
+    first, vertices_out, indices_out = mod.meshes_data.meshes
+    assert first.vertices["position"][:, 0].tolist() == [0, 1, 2, 3]
+    assert first.indices.tolist() == [0, 1, 2]
+    assert vertices_out.indices.tolist() == [3, 4, 5]
+    assert indices_out.vertices["position"][:, 0].tolist() == [4, 5, 6, 7]
+    # the buffers that don't fit keep the kaitai attributes
+    assert not hasattr(vertices_out, "_m_vertices")
+    assert not hasattr(indices_out, "_m_indices")
+    with pytest.raises(EOFError):
+        indices_out.indices
@@ -1,3 +1,6 @@
+import pytest
+
+
 SBC_MAGIC_ID = [49, 255]
 KNOWN_TYPE_ID = [256, 512, 1024, 2048, 3072, 3584, 4096, 4352, 5120, 7168, 9216, 8192, 11264, 11776, 16384,
                  17408, 32768, 33280, 33792, 34304, 34816, 35840, 40960, 40448, 41984, 42496, 42752, 44032,
@@ -43,3 +46,46 @@ def test_parsed_sbc(parsed_sbc_from_arc):
             assert node.bit in KNOWN_NODE_BIT
         # for face in sbc.faces:
         #     assert face.type in KNOWN_TYPE_ID
+
+
+def _sbc_layout():
+    from types import SimpleNamespace as Namespace
+
+    def bvhc(type_mask, node_id):
+        return Namespace(node_count=1, nodes=[Namespace(node_type=[type_mask] * 4, node_id=node_id)])
+
+    # one object with a quad, as a pair of two triangles
+    return Namespace(
+        header=Namespace(object_count=1, face_count=2, vertex_count=4, stage_count=0, pair_count=1),
+        sbc_info=[Namespace(faces_start=0, face_count=2, vertex_start=0, vertex_count=4,
+                            pairs_start=0, pairs_count=1)],
+        sbc_bvhc=[bvhc(0b10000, [0, 0, 0, 0])],
+        bvh=bvhc(0b10000, [0, 0, 0, 0]),
+        faces=[Namespace(vert=[0, 1, 2]), Namespace(vert=[2, 1, 3])],
+        vertices=[Namespace()] * 4,
+        collision_types=[],
+        pairs_collections=[Namespace(face_01=0, face_02=1)],
+    )
+
+
+@pytest.mark.parametrize("break_layout", [
+    lambda sbc: setattr(sbc.header, "vertex_count", 5),
+    lambda sbc: setattr(sbc.sbc_info[0], "pairs_count", 2),
+    lambda sbc: setattr(sbc.faces[1], "vert", [2, 1, 4]),
+    lambda sbc: setattr(sbc.pairs_collections[0], "face_02", 2),
+    lambda sbc: setattr(sbc.sbc_bvhc[0].nodes[0], "node_id", [1, 0, 0, 0]),
+    lambda sbc: setattr(sbc.sbc_bvhc[0].nodes[0], "node_type", [0b1] * 4),
+    lambda sbc: setattr(sbc.bvh, "node_count", 2),
+])
+def test_check_sbc_layout(break_layout):
+    from kaitaistruct import ConsistencyError
+    from albam.engines.mtfw.collision import _check_sbc_layout
+
+    sbc = _sbc_layout()
+    _check_sbc_layout(sbc)
+    sbc.pairs_collections[0].face_02 = 0xFFFF
+    _check_sbc_layout(sbc)
+
+    break_layout(sbc)
+    with pytest.raises(ConsistencyError):
+        _check_sbc_layout(sbc)